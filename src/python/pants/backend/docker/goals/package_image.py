@@ -35,8 +35,10 @@ from pants.backend.docker.target_types import (
 )
 from pants.backend.docker.util_rules.docker_binary import DockerBinary
 from pants.backend.docker.util_rules.docker_build_context import (
+    INCREMENTAL_BUILD_CONTEXT_PLACEHOLDER,
     DockerBuildContext,
     DockerBuildContextRequest,
+    IncrementalDockerBuildRequest,
 )
 from pants.backend.docker.utils import format_rename_suggestion
 from pants.core.goals.package import BuiltPackage, OutputPathField, PackageFieldSet
@@ -437,11 +439,14 @@ async def build_docker_image(
         "__UPSTREAM_IMAGE_IDS": ",".join(context.upstream_image_ids),
     }
     context_root = field_set.get_context_root(options.default_context_root)
+    # The persistent copy of an incremental build context is not in the sandbox, so the context is
+    # referred to through a placeholder that is replaced with its path when the process runs.
+    context_dir = INCREMENTAL_BUILD_CONTEXT_PLACEHOLDER if options.incremental_build_context else ""
     process = docker.build_image(
         build_args=context.build_args,
         digest=context.digest,
-        dockerfile=context.dockerfile,
-        context_root=context_root,
+        dockerfile=os.path.join(context_dir, context.dockerfile),
+        context_root=os.path.join(context_dir, context_root),
         env=env,
         tags=tags,
         use_buildx=options.use_buildx,
@@ -457,6 +462,10 @@ async def build_docker_image(
             )
         ),
     )
+    if options.incremental_build_context:
+        process = await Get(
+            Process, IncrementalDockerBuildRequest(process, field_set.address, context_root)
+        )
     result = await Get(FallibleProcessResult, Process, process)
 
     if result.exit_code != 0:
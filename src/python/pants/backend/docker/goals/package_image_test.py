@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import dataclasses
 import json
 import logging
 import os.path
@@ -42,6 +43,7 @@ from pants.backend.docker.util_rules.docker_build_args import rules as build_arg
 from pants.backend.docker.util_rules.docker_build_context import (
     DockerBuildContext,
     DockerBuildContextRequest,
+    IncrementalDockerBuildRequest,
 )
 from pants.backend.docker.util_rules.docker_build_env import (
     DockerBuildEnvironment,
@@ -176,6 +178,7 @@ def assert_build(
         opts.setdefault("build_verbose", False)
         opts.setdefault("build_no_cache", False)
         opts.setdefault("use_buildx", False)
+        opts.setdefault("incremental_build_context", False)
         opts.setdefault("env_vars", [])
 
         docker_options = create_subsystem(
@@ -215,6 +218,14 @@ def assert_build(
                 input_types=(DockerImageTagsRequestPlugin,),
                 mock=lambda _: DockerImageTags(plugin_tags),
             ),
+            MockGet(
+                output_type=Process,
+                input_types=(IncrementalDockerBuildRequest,),
+                mock=lambda request: dataclasses.replace(
+                    request.process,
+                    argv=("/dummy/incremental", request.context_root, *request.process.argv),
+                ),
+            ),
             MockGet(
                 output_type=FallibleProcessResult,
                 input_types=(Process,),
@@ -1148,6 +1159,39 @@ def test_docker_cache_to_option(rule_runner: RuleRunner) -> None:
     )
 
 
+def test_docker_incremental_build_context_option(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "docker/test/BUILD": dedent(
+                """\
+                docker_image(name="img1")
+                """
+            ),
+        }
+    )
+
+    def check_docker_proc(process: Process):
+        assert process.argv == (
+            "/dummy/incremental",
+            ".",
+            "/dummy/docker",
+            "build",
+            "--pull=False",
+            "--tag",
+            "img1:latest",
+            "--file",
+            "__PANTS_DOCKER_BUILD_CONTEXT__/docker/test/Dockerfile",
+            "__PANTS_DOCKER_BUILD_CONTEXT__/.",
+        )
+
+    assert_build(
+        rule_runner,
+        Address("docker/test", target_name="img1"),
+        process_assertions=check_docker_proc,
+        options=dict(incremental_build_context=True),
+    )
+
+
 def test_docker_cache_from_option(rule_runner: RuleRunner) -> None:
     rule_runner.write_files(
         {
@@ -205,6 +205,25 @@ class DockerOptions(Subsystem):
         default=False,
         help="Do not use the Docker cache when building images.",
     )
+    incremental_build_context = BoolOption(
+        default=False,
+        advanced=True,
+        help=softwrap(
+            """
+            Build images from a persistent copy of their build context, which is updated
+            incrementally between builds, rather than from a new sandbox for each build.
+
+            The build context is split into groups of files, one for each source of the `COPY`
+            instructions in the `Dockerfile`, and one for the remaining files. Only the groups
+            which changed since the last build of the image are copied again, so large packages
+            which did not change (such as PEX files) are not rewritten, and Docker sees the same
+            files at the same paths between builds.
+
+            The copies are kept in `[GLOBAL].pants_workdir`, so this mode only applies to local
+            builds.
+            """
+        ),
+    )
     build_verbose = BoolOption(
         default=False,
         help="Whether to log the Docker output to the console. If false, only the image ID is logged.",
@@ -3,7 +3,9 @@
 
 from __future__ import annotations
 
+import dataclasses
 import logging
+import os
 import re
 import shlex
 from abc import ABC
@@ -25,11 +27,21 @@ from pants.backend.docker.util_rules.docker_build_env import (
 from pants.backend.docker.utils import image_ref_regexp, suggest_renames
 from pants.backend.docker.value_interpolation import DockerBuildArgsInterpolationValue
 from pants.backend.shell.target_types import ShellSourceField
+from pants.base.build_root import get_buildroot
 from pants.core.goals.package import BuiltPackage, EnvironmentAwarePackageRequest, PackageFieldSet
 from pants.core.target_types import FileSourceField
 from pants.core.util_rules.source_files import SourceFiles, SourceFilesRequest
+from pants.core.util_rules.system_binaries import (
+    BashBinary,
+    BinaryPathRequest,
+    BinaryPaths,
+    BinaryShims,
+    BinaryShimsRequest,
+    SystemBinariesSubsystem,
+)
 from pants.engine.addresses import Address, Addresses, UnparsedAddressInputs
-from pants.engine.fs import Digest, MergeDigests, Snapshot
+from pants.engine.fs import EMPTY_DIGEST, Digest, DigestSubset, MergeDigests, PathGlobs, Snapshot
+from pants.engine.process import Process
 from pants.engine.rules import Get, MultiGet, collect_rules, rule
 from pants.engine.target import (
     Dependencies,
@@ -44,6 +56,7 @@ from pants.engine.target import (
     TransitiveTargetsRequest,
 )
 from pants.engine.unions import UnionRule
+from pants.option.global_options import GlobalOptions
 from pants.util.strutil import softwrap, stable_hash
 from pants.util.value_interpolation import InterpolationContext, InterpolationValue
 
@@ -418,6 +431,242 @@ async def fill_args_from_copy(
     return copy_arg_as_build_args
 
 
+@dataclass(frozen=True)
+class DockerBuildContextGroupsRequest:
+    address: Address
+    digest: Digest
+    context_root: str
+
+
+@dataclass(frozen=True)
+class DockerBuildContextGroups:
+    """The files of a Docker build context, split in disjoint groups.
+
+    There is one group for the files of each `COPY` instruction source, in the order of the
+    `Dockerfile`, and a last group for the remaining files, so that each group only changes when
+    the files it copies change.
+    """
+
+    digests: tuple[Digest, ...]
+
+
+@rule
+async def group_docker_build_context(
+    request: DockerBuildContextGroupsRequest,
+) -> DockerBuildContextGroups:
+    context, dockerfile_info = await MultiGet(
+        Get(Snapshot, Digest, request.digest),
+        Get(DockerfileInfo, DockerfileInfoRequest(request.address)),
+    )
+
+    copy_source_paths = []
+    for copy_source_path in dockerfile_info.copy_source_paths:
+        path = os.path.normpath(os.path.join(request.context_root, copy_source_path))
+        # Sources outside of the context root can't be copied, and copying all of it leaves
+        # nothing to group.
+        if path != os.path.normpath(request.context_root) and not path.startswith(("..", "/")):
+            copy_source_paths.append(path)
+
+    copy_sources = await MultiGet(
+        Get(Snapshot, DigestSubset(request.digest, PathGlobs([path, os.path.join(path, "**")])))
+        for path in copy_source_paths
+    )
+
+    grouped_files: set[str] = set()
+    groups: list[tuple[str, ...]] = []
+    for files in (*(snapshot.files for snapshot in copy_sources), context.files):
+        group = tuple(file for file in files if file not in grouped_files)
+        if group:
+            grouped_files.update(group)
+            groups.append(group)
+
+    digests = await MultiGet(
+        Get(Digest, DigestSubset(request.digest, PathGlobs(group))) for group in groups
+    )
+    return DockerBuildContextGroups(digests)
+
+
+@dataclass(frozen=True)
+class IncrementalDockerBuildRequest:
+    """Run a `docker build` process from a persistent copy of its build context.
+
+    The `process` must refer to its build context through `INCREMENTAL_BUILD_CONTEXT_PLACEHOLDER`,
+    which is replaced with the path of the persistent copy before running it.
+    """
+
+    process: Process
+    address: Address
+    context_root: str
+
+
+INCREMENTAL_BUILD_CONTEXT_PLACEHOLDER = "__PANTS_DOCKER_BUILD_CONTEXT__"
+
+_INCREMENTAL_BUILD_CONTEXT_GROUP_PREFIX = "__docker_build_context_group_"
+
+# Arguments: the directory for the image under the `pants_workdir`, then `<directory>:<fingerprint>`
+# of each group of the build context, then `--` followed by the `docker build` command line.
+#
+# Each group that was copied into the persistent context is recorded in a state file named after
+# its fingerprint and listing its files, so that groups that are no longer part of the context can
+# be removed, and unchanged groups are not copied again.
+#
+# Concurrent builds of the same image share its directory, so it is locked while its context is
+# updated and built. The lock is taken with `flock`, which is released when this script exits no
+# matter how. Where `flock` is not available, the lock is instead a directory holding the pid of
+# its owner, which is taken over if that process no longer exists.
+_INCREMENTAL_BUILD_CONTEXT_SCRIPT = """\
+set -euo pipefail
+
+mkdir -p "$1"
+if command -v flock >/dev/null 2>&1; then
+  exec 9>"$1/lock"
+  flock 9
+else
+  lock_dir="$1/lock.d"
+  until mkdir "${lock_dir}" 2>/dev/null; do
+    owner=""
+    read -r owner < "${lock_dir}/pid" 2>/dev/null || true
+    if [ -n "${owner}" ] && ! kill -0 "${owner}" 2>/dev/null; then
+      rm -rf "${lock_dir}"
+    else
+      sleep 1
+    fi
+  done
+  echo "$$" > "${lock_dir}/pid"
+  trap 'rm -rf "${lock_dir}"' EXIT
+fi
+
+context_dir="$1/context"
+state_dir="$1/state"
+shift
+mkdir -p "${context_dir}" "${state_dir}"
+
+groups=()
+while [ "$1" != "--" ]; do
+  groups+=("$1")
+  shift
+done
+shift
+
+remove_files() {
+  while IFS= read -r file; do
+    rm -f "${context_dir}/${file}"
+  done < "$1"
+}
+
+for state_file in "${state_dir}"/*; do
+  [ -e "${state_file}" ] || continue
+  keep=false
+  for group in ${groups[@]+"${groups[@]}"}; do
+    if [ "${state_file##*/}" = "${group##*:}" ]; then
+      keep=true
+    fi
+  done
+  if [ "${keep}" = false ]; then
+    remove_files "${state_file}"
+    rm -f "${state_file}"
+  fi
+done
+find "${context_dir}" -mindepth 1 -depth -type d -empty -delete
+
+for group in ${groups[@]+"${groups[@]}"}; do
+  group_dir="${group%:*}"
+  state_file="${state_dir}/${group##*:}"
+  if [ ! -e "${state_file}" ]; then
+    (cd "${group_dir}" && find . ! -type d) > "${state_file}.tmp"
+    remove_files "${state_file}.tmp"
+    cp -R "${group_dir}/." "${context_dir}/"
+    chmod -R u+w "${context_dir}"
+    mv "${state_file}.tmp" "${state_file}"
+  fi
+done
+
+context_dir="$(cd "${context_dir}" && pwd -P)"
+args=()
+for arg in "$@"; do
+  args+=("${arg//__PANTS_DOCKER_BUILD_CONTEXT__/${context_dir}}")
+done
+# Not `exec`, so that the lock is held until the build is done, but without passing the lock on.
+"${args[@]}" 9>&-
+"""
+
+
+@rule
+async def incremental_docker_build_process(
+    request: IncrementalDockerBuildRequest,
+    bash: BashBinary,
+    system_binaries: SystemBinariesSubsystem.EnvironmentAware,
+    global_options: GlobalOptions,
+) -> Process:
+    flock_paths = await Get(
+        BinaryPaths,
+        BinaryPathRequest(binary_name="flock", search_path=system_binaries.system_binary_paths),
+    )
+    groups, tools = await MultiGet(
+        Get(
+            DockerBuildContextGroups,
+            DockerBuildContextGroupsRequest(
+                request.address, request.process.input_digest, request.context_root
+            ),
+        ),
+        Get(
+            BinaryShims,
+            BinaryShimsRequest,
+            dataclasses.replace(
+                BinaryShimsRequest.for_binaries(
+                    "chmod",
+                    "cp",
+                    "find",
+                    "mkdir",
+                    "mv",
+                    "rm",
+                    "sleep",
+                    rationale="update the persistent Docker build context",
+                    search_path=system_binaries.system_binary_paths,
+                ),
+                paths=(flock_paths.first_path,) if flock_paths.first_path else (),
+            ),
+        ),
+    )
+
+    group_dirs = {
+        f"{_INCREMENTAL_BUILD_CONTEXT_GROUP_PREFIX}{idx}": digest
+        for idx, digest in enumerate(groups.digests)
+    }
+    env = dict(request.process.env)
+    env["PATH"] = os.pathsep.join(p for p in (tools.path_component, env.get("PATH")) if p)
+
+    return dataclasses.replace(
+        request.process,
+        argv=(
+            bash.path,
+            "-c",
+            _INCREMENTAL_BUILD_CONTEXT_SCRIPT,
+            "docker-build-context",
+            os.path.join(
+                get_buildroot(),
+                global_options.pants_workdir,
+                "docker",
+                "build_context",
+                request.address.path_safe_spec,
+            ),
+            *(
+                f"{group_dir}:{digest.fingerprint}"
+                for group_dir, digest in zip(group_dirs, groups.digests)
+            ),
+            "--",
+            *request.process.argv,
+        ),
+        env=env,
+        input_digest=EMPTY_DIGEST,
+        immutable_input_digests={
+            **request.process.immutable_input_digests,
+            **group_dirs,
+            **tools.immutable_input_digests,
+        },
+    )
+
+
 def rules():
     return (
         *collect_rules(),
@@ -26,6 +26,8 @@ from pants.backend.docker.util_rules import (
 from pants.backend.docker.util_rules.docker_build_args import DockerBuildArgs
 from pants.backend.docker.util_rules.docker_build_context import (
     DockerBuildContext,
+    DockerBuildContextGroups,
+    DockerBuildContextGroupsRequest,
     DockerBuildContextRequest,
 )
 from pants.backend.docker.util_rules.docker_build_env import DockerBuildEnvironment
@@ -70,6 +72,7 @@ def create_rule_runner() -> RuleRunner:
             package.find_all_packageable_targets,
             QueryRule(BuiltPackage, [PexBinaryFieldSet]),
             QueryRule(DockerBuildContext, (DockerBuildContextRequest,)),
+            QueryRule(DockerBuildContextGroups, (DockerBuildContextGroupsRequest,)),
         ],
         target_types=[
             PythonRequirementTarget,
@@ -223,6 +226,52 @@ def test_file_dependencies(rule_runner: RuleRunner) -> None:
     )
 
 
+def test_group_build_context_by_copy_instruction(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "src/a/BUILD": dedent(
+                """\
+                docker_image(name="img_A", dependencies=[":files_A"])
+                files(name="files_A", sources=["files/**"])
+                """
+            ),
+            "src/a/Dockerfile": dedent(
+                """\
+                FROM base
+                COPY src/a/files/a01 /app/
+                COPY src/a/files /files
+                """
+            ),
+            "src/a/files/a01": "",
+            "src/a/files/a02": "",
+            "src/a/files/sub/a03": "",
+        }
+    )
+
+    address = Address("src/a", target_name="img_A")
+    context = assert_build_context(
+        rule_runner,
+        address,
+        expected_files=[
+            "src/a/Dockerfile",
+            "src/a/files/a01",
+            "src/a/files/a02",
+            "src/a/files/sub/a03",
+        ],
+    )
+    groups = rule_runner.request(
+        DockerBuildContextGroups,
+        [DockerBuildContextGroupsRequest(address, context.digest, context_root="")],
+    )
+
+    # Each file is in the group of the first `COPY` instruction that copies it.
+    assert [rule_runner.request(Snapshot, [digest]).files for digest in groups.digests] == [
+        ("src/a/files/a01",),
+        ("src/a/files/a02", "src/a/files/sub/a03"),
+        ("src/a/Dockerfile",),
+    ]
+
+
 def test_from_image_build_arg_dependency(rule_runner: RuleRunner) -> None:
     rule_runner.write_files(
         {
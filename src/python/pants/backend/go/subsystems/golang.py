@@ -283,3 +283,38 @@ class GolangSubsystem(Subsystem):
         ),
         advanced=True,
     )
+
+    immutable_dependency_archives = BoolOption(
+        default=False,
+        help=softwrap(
+            """
+            If true, the compiled archives of the dependencies of a package are mounted into the
+            sandbox in which it is compiled as immutable, content-addressed inputs, rather than being
+            copied into the sandbox.
+
+            Each archive is then materialized on disk only once, and compiling a package with many
+            transitive dependencies only needs to create one symlink per dependency. This can
+            substantially reduce the time spent setting up sandboxes in repositories with deep
+            package graphs.
+            """
+        ),
+        advanced=True,
+    )
+
+    batch_package_analysis = BoolOption(
+        default=False,
+        help=softwrap(
+            """
+            If true, first-party packages are analyzed in batches: all of the packages in the
+            sibling directories of a package (i.e. `parent/*/`) are analyzed by a single process,
+            rather than each package being analyzed by its own process.
+
+            This reduces the number of processes started when analyzing many packages with a cold
+            cache (e.g. for `dependencies` or `check`). The result of each package is recorded in
+            the `[GLOBAL].pants_workdir`, keyed by the package's own `.go` files, and only the
+            packages without a recorded result are analyzed, so editing one package only analyzes
+            that package again.
+            """
+        ),
+        advanced=True,
+    )
@@ -10,6 +10,7 @@ from dataclasses import dataclass
 from pathlib import PurePath
 from typing import Iterable, Mapping
 
+from pants.backend.go.subsystems.golang import GolangSubsystem
 from pants.backend.go.util_rules import cgo, coverage
 from pants.backend.go.util_rules.assembly import (
     AssembleGoAssemblyFilesRequest,
@@ -285,11 +286,15 @@ class BuiltGoPackage:
     """A package and its dependencies compiled as `__pkg__.a` files.
 
     The packages are arranged into `__pkgs__/{path_safe(import_path)}/__pkg__.a`.
+
+    `import_paths_to_pkg_dir_digests` holds the digest of each of those `__pkgs__/*` directories on
+    its own, so that they can be used as immutable inputs.
     """
 
     digest: Digest
     import_paths_to_pkg_a_files: FrozenDict[str, str]
     coverage_metadata: BuiltGoPackageCodeCoverageMetadata | None = None
+    import_paths_to_pkg_dir_digests: FrozenDict[str, Digest] = FrozenDict()
 
 
 @dataclass(frozen=True)
@@ -500,7 +505,7 @@ async def _gather_transitive_prebuilt_object_files(
 # (triggered by `FallibleBuiltGoPackage` subclassing `EngineAwareReturnType`).
 @rule(desc="Compile with Go", level=LogLevel.DEBUG)
 async def build_go_package(
-    request: BuildGoPackageRequest, go_root: GoRoot
+    request: BuildGoPackageRequest, go_root: GoRoot, golang: GolangSubsystem
 ) -> FallibleBuiltGoPackage:
     maybe_built_deps = await MultiGet(
         Get(FallibleBuiltGoPackage, BuildGoPackageRequest, build_request)
@@ -508,6 +513,7 @@ async def build_go_package(
     )
 
     import_paths_to_pkg_a_files: dict[str, str] = {}
+    import_paths_to_pkg_dir_digests: dict[str, Digest] = {}
     dep_digests = []
     for maybe_dep in maybe_built_deps:
         if maybe_dep.output is None:
@@ -519,9 +525,24 @@ async def build_go_package(
             if dep_import_path not in import_paths_to_pkg_a_files:
                 import_paths_to_pkg_a_files[dep_import_path] = pkg_archive_path
                 dep_digests.append(dep.digest)
+                pkg_dir_digest = dep.import_paths_to_pkg_dir_digests.get(dep_import_path)
+                if pkg_dir_digest is not None:
+                    import_paths_to_pkg_dir_digests[dep_import_path] = pkg_dir_digest
+
+    # Rather than merging the (transitive) closure of dependency archives into the input digest,
+    # which materializes all of them in every compile sandbox, optionally mount each archive's
+    # directory as an immutable input, which is materialized once and then symlinked.
+    dep_archive_immutable_inputs: dict[str, Digest] = {}
+    if golang.immutable_dependency_archives and len(import_paths_to_pkg_dir_digests) == len(
+        import_paths_to_pkg_a_files
+    ):
+        dep_archive_immutable_inputs = {
+            os.path.dirname(import_paths_to_pkg_a_files[dep_import_path]): pkg_dir_digest
+            for dep_import_path, pkg_dir_digest in import_paths_to_pkg_dir_digests.items()
+        }
 
     merged_deps_digest, import_config, embedcfg, action_id_result = await MultiGet(
-        Get(Digest, MergeDigests(dep_digests)),
+        Get(Digest, MergeDigests(() if dep_archive_immutable_inputs else dep_digests)),
         Get(
             ImportConfig,
             ImportConfigRequest(
@@ -826,6 +847,7 @@ async def build_go_package(
             description=f"Compile Go package: {request.import_path}",
             output_files=("__pkg__.a", *([asm_header_path] if asm_header_path else [])),
             env={"__PANTS_GO_COMPILE_ACTION_ID": action_id_result.action_id},
+            immutable_input_digests=dep_archive_immutable_inputs,
         ),
     )
     if compile_result.exit_code != 0:
@@ -899,6 +921,7 @@ async def build_go_package(
 
     path_prefix = os.path.join("__pkgs__", path_safe(request.import_path))
     import_paths_to_pkg_a_files[request.import_path] = os.path.join(path_prefix, "__pkg__.a")
+    import_paths_to_pkg_dir_digests[request.import_path] = compilation_digest
     output_digest = await Get(Digest, AddPrefix(compilation_digest, path_prefix))
     merged_result_digest = await Get(Digest, MergeDigests([*dep_digests, output_digest]))
 
@@ -925,6 +948,7 @@ async def build_go_package(
         digest=merged_result_digest,
         import_paths_to_pkg_a_files=FrozenDict(import_paths_to_pkg_a_files),
         coverage_metadata=coverage_metadata,
+        import_paths_to_pkg_dir_digests=FrozenDict(import_paths_to_pkg_dir_digests),
     )
     return FallibleBuiltGoPackage(output, request.import_path)
 
@@ -65,9 +65,15 @@ def assert_built(
     }
     assert dict(built_package.import_paths_to_pkg_a_files) == expected
     assert sorted(result_files) == sorted(expected.values())
+    assert set(built_package.import_paths_to_pkg_dir_digests) == set(expected)
 
 
-def test_build_pkg(rule_runner: RuleRunner) -> None:
+@pytest.mark.parametrize("immutable_dependency_archives", [False, True])
+def test_build_pkg(rule_runner: RuleRunner, immutable_dependency_archives: bool) -> None:
+    rule_runner.set_options(
+        [f"--golang-immutable-dependency-archives={immutable_dependency_archives}"],
+        env_inherit={"PATH"},
+    )
     transitive_dep = BuildGoPackageRequest(
         import_path="example.com/foo/dep/transitive",
         pkg_name="transitive",
@@ -3,13 +3,16 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import os
 from dataclasses import dataclass
+from typing import Any, Mapping
 
 from pants.backend.go.go_sources import load_go_binary
 from pants.backend.go.go_sources.load_go_binary import LoadedGoBinary, LoadedGoBinaryRequest
+from pants.backend.go.subsystems.golang import GolangSubsystem
 from pants.backend.go.target_types import GoPackageSourcesField
 from pants.backend.go.util_rules import pkg_analyzer
 from pants.backend.go.util_rules.build_opts import GoBuildOptions
@@ -27,7 +30,16 @@ from pants.core.target_types import ResourceSourceField
 from pants.core.util_rules import source_files
 from pants.core.util_rules.source_files import SourceFiles, SourceFilesRequest
 from pants.engine.engine_aware import EngineAwareParameter
-from pants.engine.fs import AddPrefix, CreateDigest, Digest, FileContent, MergeDigests
+from pants.engine.fs import (
+    AddPrefix,
+    CreateDigest,
+    Digest,
+    DigestSubset,
+    FileContent,
+    MergeDigests,
+    PathGlobs,
+    Snapshot,
+)
 from pants.engine.process import FallibleProcessResult, Process
 from pants.engine.rules import Get, MultiGet, collect_rules, rule
 from pants.engine.target import (
@@ -40,8 +52,12 @@ from pants.engine.target import (
     WrappedTarget,
     WrappedTargetRequest,
 )
+from pants.option.global_options import GlobalOptions
 from pants.util.dirutil import fast_relpath
+from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
+from pants.util.result_store import ResultStore
+from pants.util.strutil import pluralize
 
 logger = logging.getLogger(__name__)
 
@@ -149,6 +165,23 @@ class FallibleFirstPartyPkgAnalysis:
                 stderr=f"Failed to decode JSON document from analysis: {ex}",
             )
 
+        return cls.from_metadata(
+            metadata,
+            dir_path=dir_path,
+            import_path=import_path,
+            minimum_go_version=minimum_go_version,
+        )
+
+    @classmethod
+    def from_metadata(
+        cls,
+        metadata: Mapping[str, Any],
+        *,
+        dir_path: str,
+        import_path: str,
+        minimum_go_version: str,
+    ) -> FallibleFirstPartyPkgAnalysis:
+        """Create an analysis from the JSON metadata which the analyzer emitted for a package."""
         if "Error" in metadata or "InvalidGoFiles" in metadata:
             error = metadata.get("Error", "")
             if error:
@@ -205,6 +238,26 @@ class FirstPartyPkgAnalysisRequest(EngineAwareParameter):
         return self.address.spec
 
 
+@dataclass(frozen=True)
+class FirstPartyPkgAnalysisBatchRequest:
+    """Analyze every package directory with `.go` files in a digest with one analyzer process.
+
+    The metadata of each directory is recorded in the `pants_workdir`, keyed by the content of the
+    directory, and only the directories without a recorded result are analyzed.
+    """
+
+    digest: Digest
+    cgo_enabled: bool
+    extra_build_tags: tuple[str, ...] = ()
+
+
+class FirstPartyPkgAnalysisBatch(FrozenDict[str, FrozenDict[str, Any]]):
+    """The metadata emitted by the analyzer for each directory in a batch, keyed by its path.
+
+    Use `FallibleFirstPartyPkgAnalysis.from_metadata` to convert it to an analysis.
+    """
+
+
 @dataclass(frozen=True)
 class FirstPartyPkgDigest:
     """The source files needed to build the package."""
@@ -252,10 +305,117 @@ async def compute_first_party_package_import_path(
     return FirstPartyPkgImportPath(import_path, dir_path_rel_to_gomod)
 
 
+def _analyzer_env(cgo_enabled: bool, extra_build_tags: tuple[str, ...]) -> dict[str, str]:
+    env = {"CGO_ENABLED": "1" if cgo_enabled else "0"}
+    if extra_build_tags:
+        env["EXTRA_BUILD_TAGS"] = ",".join(extra_build_tags)
+    return env
+
+
+def _analysis_store(global_options: GlobalOptions) -> ResultStore:
+    return ResultStore(os.path.join(global_options.pants_workdir, "go", "package_analysis"))
+
+
+def _analysis_key(
+    analyzer: PackageAnalyzerSetup,
+    cgo_enabled: bool,
+    extra_build_tags: tuple[str, ...],
+    dir_path: str,
+    dir_digest: Digest,
+) -> str:
+    """The key of the analysis of the `.go` files in `dir_digest` in `_analysis_store`."""
+    return hashlib.sha256(
+        json.dumps(
+            [
+                analyzer.digest.fingerprint,
+                cgo_enabled,
+                extra_build_tags,
+                dir_path,
+                dir_digest.fingerprint,
+            ]
+        ).encode()
+    ).hexdigest()
+
+
+@rule
+async def analyze_first_party_packages_batch(
+    request: FirstPartyPkgAnalysisBatchRequest,
+    analyzer: PackageAnalyzerSetup,
+    global_options: GlobalOptions,
+) -> FirstPartyPkgAnalysisBatch:
+    snapshot = await Get(Snapshot, Digest, request.digest)
+    dir_paths = sorted({os.path.dirname(f) for f in snapshot.files if f.endswith(".go")})
+    if not dir_paths:
+        return FirstPartyPkgAnalysisBatch()
+
+    dir_digests = await MultiGet(
+        Get(Digest, DigestSubset(request.digest, PathGlobs([os.path.join(dir_path, "*")])))
+        for dir_path in dir_paths
+    )
+    keys = {
+        dir_path: _analysis_key(
+            analyzer, request.cgo_enabled, request.extra_build_tags, dir_path, dir_digest
+        )
+        for dir_path, dir_digest in zip(dir_paths, dir_digests)
+    }
+    store = _analysis_store(global_options)
+    stored = store.get(keys.values())
+    metadatas: dict[str, FrozenDict[str, Any]] = {
+        dir_path: FrozenDict.deep_freeze(stored[key])
+        for dir_path, key in keys.items()
+        if key in stored
+    }
+    missing = [
+        (dir_path, dir_digest)
+        for dir_path, dir_digest in zip(dir_paths, dir_digests)
+        if dir_path not in metadatas
+    ]
+    if not missing:
+        return FirstPartyPkgAnalysisBatch(metadatas)
+
+    input_digest = await Get(
+        Digest, MergeDigests([*(dir_digest for _, dir_digest in missing), analyzer.digest])
+    )
+    result = await Get(
+        FallibleProcessResult,
+        Process(
+            (analyzer.path, *(dir_path or "." for dir_path, _ in missing)),
+            input_digest=input_digest,
+            description=f"Determine metadata for {pluralize(len(missing), 'Go package')}",
+            level=LogLevel.DEBUG,
+            env=_analyzer_env(request.cgo_enabled, request.extra_build_tags),
+        ),
+    )
+    if result.exit_code != 0:
+        # The remaining packages will be analyzed on their own instead.
+        logger.debug(
+            f"Batched Go package analysis failed: {result.stderr.decode(errors='replace')}"
+        )
+        return FirstPartyPkgAnalysisBatch(metadatas)
+
+    # The analyzer emits one JSON document per directory, in the order of its arguments.
+    stdout = result.stdout.decode()
+    decoder = json.JSONDecoder()
+    analyzed: dict[str, Any] = {}
+    position = 0
+    for dir_path, _ in missing:
+        try:
+            analyzed[dir_path], position = decoder.raw_decode(stdout, position)
+        except json.JSONDecodeError:
+            break
+    store.put({keys[dir_path]: metadata for dir_path, metadata in analyzed.items()})
+    metadatas.update(
+        (dir_path, FrozenDict.deep_freeze(metadata)) for dir_path, metadata in analyzed.items()
+    )
+    return FirstPartyPkgAnalysisBatch(metadatas)
+
+
 @rule
 async def analyze_first_party_package(
     request: FirstPartyPkgAnalysisRequest,
     analyzer: PackageAnalyzerSetup,
+    golang: GolangSubsystem,
+    global_options: GlobalOptions,
 ) -> FallibleFirstPartyPkgAnalysis:
     wrapped_target, import_path_info, owning_go_mod = await MultiGet(
         Get(
@@ -274,9 +434,48 @@ async def analyze_first_party_package(
         HydrateSourcesRequest(wrapped_target.target[GoPackageSourcesField]),
     )
 
-    extra_build_tags_env = {}
-    if request.extra_build_tags:
-        extra_build_tags_env = {"EXTRA_BUILD_TAGS": ",".join(request.extra_build_tags)}
+    # If enabled, rather than running the analyzer for each package on its own, we analyze the
+    # packages in the sibling directories of this package together: the batch request below is
+    # identical for each of those packages, so the engine memoizes it, and analyzing many packages
+    # costs one analyzer process per parent directory rather than one per package. The result of
+    # each package is recorded under a key of its own content, so a package whose sources did not
+    # change is not analyzed again, even if one of its siblings changed.
+    dir_path = request.address.spec_path
+    if golang.batch_package_analysis and dir_path:
+        siblings_digest = await Get(
+            Digest, PathGlobs([os.path.join(os.path.dirname(dir_path), "*", "*.go")])
+        )
+        pkg_in_siblings_digest = await Get(
+            Digest, DigestSubset(siblings_digest, PathGlobs([os.path.join(dir_path, "*")]))
+        )
+        # NB: The batch only contains the `.go` files on disk, which may differ from the sources of
+        # the package, e.g. if it sets `sources` explicitly.
+        if pkg_in_siblings_digest == pkg_sources.snapshot.digest:
+            key = _analysis_key(
+                analyzer,
+                request.build_opts.cgo_enabled,
+                request.extra_build_tags,
+                dir_path,
+                pkg_in_siblings_digest,
+            )
+            metadata = _analysis_store(global_options).get([key]).get(key)
+            if metadata is None:
+                batch = await Get(
+                    FirstPartyPkgAnalysisBatch,
+                    FirstPartyPkgAnalysisBatchRequest(
+                        siblings_digest,
+                        cgo_enabled=request.build_opts.cgo_enabled,
+                        extra_build_tags=request.extra_build_tags,
+                    ),
+                )
+                metadata = batch.get(dir_path)
+            if metadata is not None:
+                return FallibleFirstPartyPkgAnalysis.from_metadata(
+                    metadata,
+                    dir_path=dir_path,
+                    import_path=import_path_info.import_path,
+                    minimum_go_version=go_mod_info.minimum_go_version or "",
+                )
 
     input_digest = await Get(Digest, MergeDigests([pkg_sources.snapshot.digest, analyzer.digest]))
     result = await Get(
@@ -286,10 +485,7 @@ async def analyze_first_party_package(
             input_digest=input_digest,
             description=f"Determine metadata for {request.address}",
             level=LogLevel.DEBUG,
-            env={
-                "CGO_ENABLED": "1" if request.build_opts.cgo_enabled else "0",
-                **extra_build_tags_env,
-            },
+            env=_analyzer_env(request.build_opts.cgo_enabled, request.extra_build_tags),
         ),
     )
     return FallibleFirstPartyPkgAnalysis.from_process_result(
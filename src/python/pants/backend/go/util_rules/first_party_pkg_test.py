@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import os.path
+from pathlib import Path
 from textwrap import dedent
 
 import pytest
@@ -24,6 +25,8 @@ from pants.backend.go.util_rules.embedcfg import EmbedConfig
 from pants.backend.go.util_rules.first_party_pkg import (
     FallibleFirstPartyPkgAnalysis,
     FallibleFirstPartyPkgDigest,
+    FirstPartyPkgAnalysisBatch,
+    FirstPartyPkgAnalysisBatchRequest,
     FirstPartyPkgAnalysisRequest,
     FirstPartyPkgDigestRequest,
     FirstPartyPkgImportPath,
@@ -31,7 +34,7 @@ from pants.backend.go.util_rules.first_party_pkg import (
 )
 from pants.core.target_types import ResourcesGeneratorTarget
 from pants.engine.addresses import Address
-from pants.engine.fs import PathGlobs, Snapshot
+from pants.engine.fs import Digest, PathGlobs, Snapshot
 from pants.engine.rules import QueryRule
 from pants.testutil.rule_runner import RuleRunner, engine_error
 
@@ -51,6 +54,8 @@ def rule_runner() -> RuleRunner:
             QueryRule(FallibleFirstPartyPkgAnalysis, [FirstPartyPkgAnalysisRequest]),
             QueryRule(FallibleFirstPartyPkgDigest, [FirstPartyPkgDigestRequest]),
             QueryRule(FirstPartyPkgImportPath, [FirstPartyPkgImportPathRequest]),
+            QueryRule(FirstPartyPkgAnalysisBatch, [FirstPartyPkgAnalysisBatchRequest]),
+            QueryRule(Digest, [PathGlobs]),
         ],
         target_types=[
             GoModTarget,
@@ -238,6 +243,66 @@ def test_invalid_package(rule_runner) -> None:
     assert "bad.go:1:1: expected 'package', found invalid\n" in maybe_analysis.stderr
 
 
+def test_batched_package_analysis(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "BUILD": "go_mod(name='mod')",
+            "go.mod": "module go.example.com/foo\ngo 1.17\n",
+            "pkg/a/BUILD": "go_package()",
+            "pkg/a/f.go": 'package a\nimport "fmt"\n',
+            "pkg/b/BUILD": "go_package(sources=['f.go'])",
+            "pkg/b/f.go": 'package b\nimport "go.example.com/foo/pkg/a"\n',
+            "pkg/b/excluded.go": 'package b\nimport "os"\n',
+            "pkg/bad/BUILD": "go_package()",
+            "pkg/bad/bad.go": "invalid!!!",
+        }
+    )
+
+    digest = rule_runner.request(Digest, [PathGlobs(["pkg/*/*.go"])])
+    batch = rule_runner.request(
+        FirstPartyPkgAnalysisBatch, [FirstPartyPkgAnalysisBatchRequest(digest, cgo_enabled=False)]
+    )
+    assert set(batch) == {"pkg/a", "pkg/b", "pkg/bad"}
+    assert batch["pkg/a"]["Imports"] == ("fmt",)
+
+    # The result of each package is recorded, so after editing one package, only it is analyzed.
+    store_dir = Path(rule_runner.pants_workdir, "go", "package_analysis")
+    assert len(list(store_dir.glob("*/*"))) == 3
+    rule_runner.write_files({"pkg/a/f.go": 'package a\nimport "os"\n'})
+    digest = rule_runner.request(Digest, [PathGlobs(["pkg/*/*.go"])])
+    batch = rule_runner.request(
+        FirstPartyPkgAnalysisBatch, [FirstPartyPkgAnalysisBatchRequest(digest, cgo_enabled=False)]
+    )
+    assert set(batch) == {"pkg/a", "pkg/b", "pkg/bad"}
+    assert batch["pkg/a"]["Imports"] == ("os",)
+    assert len(list(store_dir.glob("*/*"))) == 4
+
+    rule_runner.set_options(["--golang-batch-package-analysis"], env_inherit={"PATH"})
+
+    def analyze(dir_path: str) -> FallibleFirstPartyPkgAnalysis:
+        return rule_runner.request(
+            FallibleFirstPartyPkgAnalysis,
+            [FirstPartyPkgAnalysisRequest(Address(dir_path), build_opts=GoBuildOptions())],
+        )
+
+    analysis = analyze("pkg/a").analysis
+    assert analysis is not None
+    assert analysis.import_path == "go.example.com/foo/pkg/a"
+    assert analysis.imports == ("os",)
+    assert analysis.minimum_go_version == "1.17"
+
+    # The sources of this package differ from the batch, so it is analyzed on its own.
+    analysis = analyze("pkg/b").analysis
+    assert analysis is not None
+    assert analysis.go_files == ("f.go",)
+    assert analysis.imports == ("go.example.com/foo/pkg/a",)
+
+    maybe_analysis = analyze("pkg/bad")
+    assert maybe_analysis.analysis is None
+    assert maybe_analysis.stderr is not None
+    assert "bad.go:1:1: expected 'package', found invalid\n" in maybe_analysis.stderr
+
+
 @pytest.mark.xfail(reason="cgo is ignored")
 def test_cgo_not_supported(rule_runner: RuleRunner) -> None:
     rule_runner.write_files(
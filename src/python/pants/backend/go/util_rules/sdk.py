@@ -30,6 +30,7 @@ class GoSdkProcess:
     working_dir: str | None
     output_files: tuple[str, ...]
     output_directories: tuple[str, ...]
+    immutable_input_digests: FrozenDict[str, Digest]
     replace_sandbox_root_in_args: bool
 
     def __init__(
@@ -42,6 +43,7 @@ class GoSdkProcess:
         working_dir: str | None = None,
         output_files: Iterable[str] = (),
         output_directories: Iterable[str] = (),
+        immutable_input_digests: Mapping[str, Digest] | None = None,
         allow_downloads: bool = False,
         replace_sandbox_root_in_args: bool = False,
     ) -> None:
@@ -60,6 +62,9 @@ class GoSdkProcess:
         object.__setattr__(self, "working_dir", working_dir)
         object.__setattr__(self, "output_files", tuple(output_files))
         object.__setattr__(self, "output_directories", tuple(output_directories))
+        object.__setattr__(
+            self, "immutable_input_digests", FrozenDict(immutable_input_digests or {})
+        )
         object.__setattr__(self, "replace_sandbox_root_in_args", replace_sandbox_root_in_args)
 
 
@@ -130,7 +135,7 @@ async def setup_go_sdk_process(
         "__PANTS_GO_SDK_CACHE_KEY": f"{goroot.full_version}/{goroot.goos}/{goroot.goarch}",
     }
 
-    immutable_input_digests: dict[str, Digest] = {}
+    immutable_input_digests: dict[str, Digest] = dict(request.immutable_input_digests)
 
     # Add path to additional tools, such as git, that may be needed by the go tool
     if golang_env_aware.extra_tools:
@@ -39,7 +39,7 @@ from pants.engine.fs import (
 from pants.engine.process import FallibleProcessResult, Process, ProcessResult
 from pants.engine.rules import Get, MultiGet, collect_rules, rule
 from pants.util.dirutil import group_by_dir
-from pants.util.frozendict import FrozenDict
+from pants.util.frozendict import FrozenDict, LargeFrozenDict
 from pants.util.logging import LogLevel
 from pants.util.ordered_set import FrozenOrderedSet
 
@@ -609,7 +609,7 @@ async def download_and_analyze_third_party_packages(
         for pkg in analyzed_module.packages
     }
 
-    return AllThirdPartyPackages(EMPTY_DIGEST, FrozenDict(import_path_to_info))
+    return AllThirdPartyPackages(EMPTY_DIGEST, LargeFrozenDict(import_path_to_info))
 
 
 @rule
@@ -7,12 +7,15 @@ import dataclasses
 import logging
 import os
 import re
+import shlex
 from collections import defaultdict
 from dataclasses import dataclass
 from enum import Enum
 from itertools import chain
 from typing import Any, Iterable
 
+import yaml
+
 from pants.backend.helm.subsystems import post_renderer
 from pants.backend.helm.subsystems.post_renderer import HelmPostRenderer
 from pants.backend.helm.target_types import (
@@ -24,13 +27,14 @@ from pants.backend.helm.util_rules import chart, tool
 from pants.backend.helm.util_rules.chart import FindHelmDeploymentChart, HelmChart, HelmChartRequest
 from pants.backend.helm.util_rules.tool import HelmProcess
 from pants.core.util_rules.source_files import SourceFiles, SourceFilesRequest
+from pants.core.util_rules.system_binaries import BashBinary
 from pants.engine.addresses import Address
 from pants.engine.engine_aware import EngineAwareParameter, EngineAwareReturnType
 from pants.engine.fs import (
     EMPTY_DIGEST,
-    EMPTY_SNAPSHOT,
     CreateDigest,
     Digest,
+    DigestContents,
     DigestSubset,
     Directory,
     FileContent,
@@ -99,6 +103,10 @@ class _HelmDeploymentProcessWrapper(EngineAwareParameter, EngineAwareReturnType)
 
     The encapsulated `process` will be side-effecting depending on the `cmd` that was originally requested.
 
+    When rendering, the `process` never runs the post-renderer, so it only depends on the chart, the
+    value files and the value overrides, and it is shared by all the consumers of the same
+    deployment. The `post_renderer` is then applied on top of its output.
+
     This is meant to only be used internally by this module.
     """
 
@@ -107,6 +115,7 @@ class _HelmDeploymentProcessWrapper(EngineAwareParameter, EngineAwareReturnType)
     process: HelmProcess
     address: Address
     output_directory: str | None
+    post_renderer: HelmPostRenderer | None = None
 
     @property
     def is_side_effect(self) -> bool:
@@ -114,9 +123,7 @@ class _HelmDeploymentProcessWrapper(EngineAwareParameter, EngineAwareReturnType)
 
     @property
     def uses_post_renderer(self) -> bool:
-        if self.output_directory:
-            return False
-        return True
+        return self.post_renderer is not None
 
     def debug_hint(self) -> str | None:
         return self.address.spec
@@ -128,7 +135,7 @@ class _HelmDeploymentProcessWrapper(EngineAwareParameter, EngineAwareReturnType)
         msg = softwrap(
             f"""
             Built deployment process for {self.address} using chart {self.chart.address}
-            with{'out' if not self.output_directory else ''} a post-renderer stage
+            with{'' if self.uses_post_renderer else 'out'} a post-renderer stage
             """
         )
         if self.output_directory:
@@ -270,10 +277,12 @@ async def setup_render_helm_deployment_process(
 
     logger.debug(f"Using Helm chart {chart.address} in deployment {request.field_set.address}.")
 
+    # Rendered files are always written into an output directory so the rendering process doesn't
+    # depend on the post-renderer, which is applied afterwards by `run_renderer`.
     output_dir = None
     output_digest = EMPTY_DIGEST
     output_directories = None
-    if not request.post_renderer:
+    if request.cmd == HelmDeploymentCmd.RENDER:
         output_dir = "__out"
         output_digest = await Get(Digest, CreateDigest([Directory(output_dir)]))
         output_directories = [output_dir]
@@ -296,7 +305,7 @@ async def setup_render_helm_deployment_process(
         value_files_prefix: value_files.snapshot.digest,
     }
     append_only_caches: dict[str, str] = {}
-    if request.post_renderer:
+    if request.post_renderer and not output_dir:
         logger.debug(f"Using post-renderer stage in deployment {request.field_set.address}")
         input_digests.append(request.post_renderer.digest)
         env.update(request.post_renderer.env)
@@ -321,7 +330,7 @@ async def setup_render_helm_deployment_process(
     # sensitive values that may have been added in by the post-renderer.
     process_cache = (
         ProcessCacheScope.PER_RESTART_SUCCESSFUL
-        if request.post_renderer
+        if request.post_renderer and not output_dir
         else ProcessCacheScope.SUCCESSFUL
     )
 
@@ -346,7 +355,7 @@ async def setup_render_helm_deployment_process(
             *(("--enable-dns",) if request.field_set.enable_dns.value else ()),
             *(
                 ("--post-renderer", os.path.join(".", request.post_renderer.exe))
-                if request.post_renderer
+                if request.post_renderer and not output_dir
                 else ()
             ),
             *(("--values", ",".join(sorted_value_files)) if sorted_value_files else ()),
@@ -376,64 +385,166 @@ async def setup_render_helm_deployment_process(
         process=process,
         address=request.field_set.address,
         output_directory=output_dir,
+        post_renderer=request.post_renderer if output_dir else None,
     )
 
 
 _YAML_FILE_SEPARATOR = "---"
 _HELM_OUTPUT_FILE_MARKER = "# Source: "
+_HELM_HOOK_ANNOTATION = "helm.sh/hook"
+_POST_RENDERER_INPUT_FILE = "__helm_manifests.yaml"
 
 
-@rule(desc="Render Helm deployment", level=LogLevel.DEBUG)
-async def run_renderer(process_wrapper: _HelmDeploymentProcessWrapper) -> RenderedHelmFiles:
-    assert not process_wrapper.is_side_effect
+def _rendered_file_content(file_name: str, lines: Iterable[str]) -> FileContent:
+    sanitised_lines = list(lines)
+    if len(sanitised_lines) == 0:
+        return FileContent(file_name, b"")
+    if sanitised_lines[len(sanitised_lines) - 1] == _YAML_FILE_SEPARATOR:
+        sanitised_lines = sanitised_lines[:-1]
+    if sanitised_lines[0] != _YAML_FILE_SEPARATOR:
+        sanitised_lines = [_YAML_FILE_SEPARATOR, *sanitised_lines]
+
+    content = "\n".join(sanitised_lines) + "\n"
+    return FileContent(file_name, content.encode("utf-8"))
+
+
+def _parse_rendered_files(rendered_files_contents: str) -> dict[str, list[str]]:
+    """Groups the lines of a stream of rendered manifests by their source file."""
+
+    rendered_files: dict[str, list[str]] = defaultdict(list)
+
+    curr_file_name = None
+    for line in rendered_files_contents.splitlines():
+        if not line:
+            continue
+
+        if line.startswith(_HELM_OUTPUT_FILE_MARKER):
+            curr_file_name = line[len(_HELM_OUTPUT_FILE_MARKER) :]
 
-    def file_content(file_name: str, lines: Iterable[str]) -> FileContent:
-        sanitised_lines = list(lines)
-        if len(sanitised_lines) == 0:
-            return FileContent(file_name, b"")
-        if sanitised_lines[len(sanitised_lines) - 1] == _YAML_FILE_SEPARATOR:
-            sanitised_lines = sanitised_lines[:-1]
-        if sanitised_lines[0] != _YAML_FILE_SEPARATOR:
-            sanitised_lines = [_YAML_FILE_SEPARATOR, *sanitised_lines]
+        if not curr_file_name:
+            continue
 
-        content = "\n".join(sanitised_lines) + "\n"
-        return FileContent(file_name, content.encode("utf-8"))
+        rendered_files[curr_file_name].append(line)
 
-    def parse_renderer_output(result: ProcessResult) -> list[FileContent]:
-        rendered_files_contents = result.stdout.decode("utf-8")
-        rendered_files: dict[str, list[str]] = defaultdict(list)
+    return rendered_files
+
+
+def _split_yaml_documents(content: str) -> list[str]:
+    documents: list[list[str]] = [[]]
+    for line in content.splitlines():
+        if line == _YAML_FILE_SEPARATOR:
+            documents.append([])
+        else:
+            documents[-1].append(line)
+    return ["\n".join(lines) for lines in documents if any(lines)]
+
+
+def _is_helm_hook(document: str) -> bool:
+    try:
+        parsed = yaml.safe_load(document)
+    except yaml.YAMLError:
+        return False
+    metadata = parsed.get("metadata") if isinstance(parsed, dict) else None
+    annotations = metadata.get("annotations") if isinstance(metadata, dict) else None
+    return isinstance(annotations, dict) and _HELM_HOOK_ANNOTATION in annotations
+
+
+async def _post_render(
+    process_wrapper: _HelmDeploymentProcessWrapper, rendered: Snapshot, bash: BashBinary
+) -> Snapshot:
+    """Runs the post-renderer of the given process wrapper over already rendered files.
+
+    The manifests are fed into the post-renderer the same way Helm would do it, as a single stream.
+    Helm doesn't post-render hooks, so those are added back into their files without changes.
+    """
+
+    assert process_wrapper.post_renderer
+    post_renderer = process_wrapper.post_renderer
+
+    rendered_contents = await Get(DigestContents, Digest, rendered.digest)
+    manifests: list[str] = []
+    hooks: dict[str, list[str]] = defaultdict(list)
+    for file in sorted(rendered_contents, key=lambda file: file.path):
+        for document in _split_yaml_documents(file.content.decode("utf-8")):
+            if _is_helm_hook(document):
+                hooks[file.path].append(document)
+            else:
+                manifests.append(document)
+
+    manifests_digest = await Get(
+        Digest,
+        CreateDigest(
+            [
+                FileContent(
+                    _POST_RENDERER_INPUT_FILE,
+                    "".join(
+                        f"{_YAML_FILE_SEPARATOR}\n{manifest}\n" for manifest in manifests
+                    ).encode("utf-8"),
+                )
+            ]
+        ),
+    )
+    input_digest = await Get(Digest, MergeDigests([manifests_digest, post_renderer.digest]))
 
-        curr_file_name = None
-        for line in rendered_files_contents.splitlines():
-            if not line:
-                continue
+    # Only keep the post-renderer output cached in memory to prevent storing in disk, either
+    # locally or remotely, secrets or other sensitive values that it may have added in.
+    result = await Get(
+        ProcessResult,
+        Process(
+            argv=[
+                bash.path,
+                "-c",
+                f"{shlex.quote(os.path.join('.', post_renderer.exe))}"
+                f" < {_POST_RENDERER_INPUT_FILE}",
+            ],
+            input_digest=input_digest,
+            immutable_input_digests=post_renderer.immutable_input_digests,
+            append_only_caches=post_renderer.append_only_caches,
+            env=post_renderer.env,
+            description=f"Post-rendering Helm deployment {process_wrapper.address}",
+            level=LogLevel.DEBUG,
+            cache_scope=ProcessCacheScope.PER_RESTART_SUCCESSFUL,
+        ),
+    )
 
-            if line.startswith(_HELM_OUTPUT_FILE_MARKER):
-                curr_file_name = line[len(_HELM_OUTPUT_FILE_MARKER) :]
+    rendered_files = _parse_rendered_files(result.stdout.decode("utf-8"))
+    for file_name, documents in hooks.items():
+        for document in documents:
+            rendered_files[file_name].extend(
+                [_YAML_FILE_SEPARATOR, *(line for line in document.splitlines() if line)]
+            )
 
-            if not curr_file_name:
-                continue
+    return await Get(
+        Snapshot,
+        CreateDigest(
+            [
+                _rendered_file_content(file_name, lines)
+                for file_name, lines in rendered_files.items()
+            ]
+        ),
+    )
 
-            rendered_files[curr_file_name].append(line)
 
-        return [file_content(file_name, lines) for file_name, lines in rendered_files.items()]
+@rule(desc="Render Helm deployment", level=LogLevel.DEBUG)
+async def run_renderer(
+    process_wrapper: _HelmDeploymentProcessWrapper, bash: BashBinary
+) -> RenderedHelmFiles:
+    assert not process_wrapper.is_side_effect
+    assert process_wrapper.output_directory
 
     logger.debug(f"Rendering Helm files for {process_wrapper.address}")
     result = await Get(ProcessResult, HelmProcess, process_wrapper.process)
 
-    output_snapshot = EMPTY_SNAPSHOT
-    if not process_wrapper.output_directory:
-        logger.debug(
-            f"Parsing Helm rendered files from the process' output of {process_wrapper.address}."
-        )
-        output_snapshot = await Get(Snapshot, CreateDigest(parse_renderer_output(result)))
-    else:
-        logger.debug(
-            f"Obtaining Helm rendered files from the process' output directory of {process_wrapper.address}."
-        )
-        output_snapshot = await Get(
-            Snapshot, RemovePrefix(result.output_digest, process_wrapper.output_directory)
-        )
+    logger.debug(
+        f"Obtaining Helm rendered files from the process' output directory of {process_wrapper.address}."
+    )
+    output_snapshot = await Get(
+        Snapshot, RemovePrefix(result.output_digest, process_wrapper.output_directory)
+    )
+
+    if process_wrapper.post_renderer:
+        logger.debug(f"Post-rendering Helm files for {process_wrapper.address}")
+        output_snapshot = await _post_render(process_wrapper, output_snapshot, bash)
 
     return RenderedHelmFiles(
         address=process_wrapper.address,
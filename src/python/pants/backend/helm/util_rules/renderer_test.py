@@ -8,23 +8,30 @@ from textwrap import dedent
 import pytest
 import yaml
 
+from pants.backend.helm.subsystems.post_renderer import HelmPostRenderer
 from pants.backend.helm.target_types import (
     HelmChartFieldSet,
     HelmChartTarget,
     HelmDeploymentFieldSet,
     HelmDeploymentTarget,
 )
-from pants.backend.helm.testutil import HELM_CHART_FILE, HELM_TEMPLATE_HELPERS_FILE
+from pants.backend.helm.testutil import (
+    HELM_BATCH_HOOK_TEMPLATE,
+    HELM_CHART_FILE,
+    HELM_TEMPLATE_HELPERS_FILE,
+)
 from pants.backend.helm.util_rules import renderer
 from pants.backend.helm.util_rules.renderer import (
     HelmDeploymentCmd,
     HelmDeploymentRequest,
     RenderedHelmFiles,
     RenderHelmChartRequest,
+    _HelmDeploymentProcessWrapper,
 )
 from pants.backend.helm.util_rules.testutil import _read_file_from_digest
 from pants.core.util_rules import external_tool, source_files
 from pants.engine.addresses import Address
+from pants.engine.fs import CreateDigest, Digest, FileContent
 from pants.engine.process import InteractiveProcess
 from pants.engine.rules import QueryRule
 from pants.engine.target import Target
@@ -42,6 +49,8 @@ def rule_runner() -> RuleRunner:
             QueryRule(InteractiveProcess, (HelmDeploymentRequest,)),
             QueryRule(RenderedHelmFiles, (HelmDeploymentRequest,)),
             QueryRule(RenderedHelmFiles, (RenderHelmChartRequest,)),
+            QueryRule(_HelmDeploymentProcessWrapper, (HelmDeploymentRequest,)),
+            QueryRule(Digest, (CreateDigest,)),
         ],
     )
     source_root_patterns = ("src/*",)
@@ -250,6 +259,74 @@ def test_renders_files_using_deployment_values(rule_runner: RuleRunner) -> None:
     assert template_output == expected_rendered_config_map
 
 
+def test_post_renders_shared_rendered_files(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            **_COMMON_WORKSPACE_FILES,
+            "src/mychart/templates/hook.yaml": HELM_BATCH_HOOK_TEMPLATE,
+            "src/deployment/BUILD": "helm_deployment(name='foo', chart='//src/mychart')",
+        }
+    )
+
+    tgt = rule_runner.get_target(Address("src/deployment", target_name="foo"))
+    field_set = HelmDeploymentFieldSet.create(tgt)
+
+    post_renderer_digest = rule_runner.request(
+        Digest,
+        [
+            CreateDigest(
+                [
+                    FileContent(
+                        "post_renderer.sh",
+                        b"#!/bin/bash\nsed -e 's/_value/_post_rendered/' -e 's/Never/Always/'\n",
+                        is_executable=True,
+                    )
+                ]
+            )
+        ],
+    )
+    post_renderer = HelmPostRenderer(
+        exe="post_renderer.sh", digest=post_renderer_digest, description_of_origin="test"
+    )
+
+    render_request = HelmDeploymentRequest(
+        cmd=HelmDeploymentCmd.RENDER,
+        field_set=field_set,
+        description="Test template rendering",
+    )
+    post_render_request = HelmDeploymentRequest(
+        cmd=HelmDeploymentCmd.RENDER,
+        field_set=field_set,
+        description="Test template post-rendering",
+        post_renderer=post_renderer,
+    )
+
+    # The post-renderer is not part of the rendering process, so both requests share it.
+    render_process, post_render_process = (
+        rule_runner.request(_HelmDeploymentProcessWrapper, [request]).process
+        for request in (render_request, post_render_request)
+    )
+    assert render_process == post_render_process
+
+    rendered = rule_runner.request(RenderedHelmFiles, [post_render_request])
+    assert rendered.post_processed
+
+    template_output = _read_file_from_digest(
+        rule_runner,
+        digest=rendered.snapshot.digest,
+        filename="mychart/templates/configmap.yaml",
+    )
+    assert template_output == _DEFAULT_CONFIG_MAP.replace("_value", "_post_rendered")
+
+    # Helm doesn't post-render hooks.
+    hook_output = _read_file_from_digest(
+        rule_runner,
+        digest=rendered.snapshot.digest,
+        filename="mychart/templates/hook.yaml",
+    )
+    assert "restartPolicy: Never" in hook_output
+
+
 def test_ignore_missing_interpolated_keys_during_render(rule_runner: RuleRunner) -> None:
     rule_runner.write_files(
         {
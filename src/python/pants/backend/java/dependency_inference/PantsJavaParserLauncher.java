@@ -27,6 +27,7 @@ import com.github.javaparser.ast.type.WildcardType;
 import java.io.File;
 import java.util.ArrayList;
 import java.util.HashSet;
+import java.util.LinkedHashMap;
 import java.util.List;
 import java.util.Optional;
 import java.util.function.Consumer;
@@ -115,17 +116,8 @@ public class PantsJavaParserLauncher {
     return new ArrayList<>();
   }
 
-  public static void main(String[] args) throws Exception {
-    String analysisOutputPath = args[0];
-    String sourceToAnalyze = args[1];
-
-    // NB: We hardcode the most permissive language level in order to capture all potential
-    // sources of symbols. If certain syntax ends up deprecated in future versions, we may need to
-    // allow this to be configured.
-    StaticJavaParser.setConfiguration(
-        new ParserConfiguration()
-            .setLanguageLevel(ParserConfiguration.LanguageLevel.JAVA_17_PREVIEW));
-    CompilationUnit cu = StaticJavaParser.parse(new File(sourceToAnalyze));
+  private static CompilationUnitAnalysis analyze(File sourceToAnalyze) throws Exception {
+    CompilationUnit cu = StaticJavaParser.parse(sourceToAnalyze);
 
     // Get the source's declare package.
     Optional<String> declaredPackage =
@@ -227,11 +219,47 @@ public class PantsJavaParserLauncher {
 
     ArrayList<String> consumedTypes = new ArrayList<>(consumedIdentifiers);
     ArrayList<String> exportTypes = new ArrayList<>(exportIdentifiers);
-    CompilationUnitAnalysis analysis =
-        new CompilationUnitAnalysis(
-            declaredPackage, imports, topLevelTypes, consumedTypes, exportTypes);
+    return new CompilationUnitAnalysis(
+        declaredPackage, imports, topLevelTypes, consumedTypes, exportTypes);
+  }
+
+  /**
+   * Usage:
+   *
+   * <pre>
+   *   PantsJavaParserLauncher ANALYSIS_OUTPUT_PATH SOURCE
+   *   PantsJavaParserLauncher --batch ANALYSIS_OUTPUT_PATH SOURCE...
+   * </pre>
+   *
+   * <p>In batch mode, the output is an object mapping the path of each source to its analysis.
+   * Sources which fail to parse are reported on stderr and omitted, so that the caller can analyze
+   * them on their own in order to report the error.
+   */
+  public static void main(String[] args) throws Exception {
+    // NB: We hardcode the most permissive language level in order to capture all potential
+    // sources of symbols. If certain syntax ends up deprecated in future versions, we may need to
+    // allow this to be configured.
+    StaticJavaParser.setConfiguration(
+        new ParserConfiguration()
+            .setLanguageLevel(ParserConfiguration.LanguageLevel.JAVA_17_PREVIEW));
     ObjectMapper mapper = new ObjectMapper();
     mapper.registerModule(new Jdk8Module());
-    mapper.writeValue(new File(analysisOutputPath), analysis);
+
+    if (args[0].equals("--batch")) {
+      String analysisOutputPath = args[1];
+      LinkedHashMap<String, CompilationUnitAnalysis> analyses = new LinkedHashMap<>();
+      for (int i = 2; i < args.length; i++) {
+        try {
+          analyses.put(args[i], analyze(new File(args[i])));
+        } catch (Exception e) {
+          System.err.println("Failed to analyze " + args[i] + ": " + e.getMessage());
+        }
+      }
+      mapper.writeValue(new File(analysisOutputPath), analyses);
+    } else {
+      String analysisOutputPath = args[0];
+      String sourceToAnalyze = args[1];
+      mapper.writeValue(new File(analysisOutputPath), analyze(new File(sourceToAnalyze)));
+    }
   }
 }
@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import os.path
@@ -11,9 +12,21 @@ from dataclasses import dataclass
 import pkg_resources
 
 from pants.backend.java.dependency_inference.types import JavaSourceDependencyAnalysis
+from pants.backend.java.subsystems.java_infer import JavaInferSubsystem
 from pants.core.goals.resolves import ExportableTool
 from pants.core.util_rules.source_files import SourceFiles
-from pants.engine.fs import AddPrefix, CreateDigest, Digest, DigestContents, Directory, FileContent
+from pants.engine.fs import (
+    AddPrefix,
+    CreateDigest,
+    Digest,
+    DigestContents,
+    DigestEntries,
+    DigestSubset,
+    Directory,
+    FileContent,
+    FileEntry,
+    PathGlobs,
+)
 from pants.engine.internals.native_engine import MergeDigests, RemovePrefix
 from pants.engine.process import FallibleProcessResult, ProcessResult, ProductDescription
 from pants.engine.rules import Get, MultiGet, collect_rules, rule
@@ -21,12 +34,19 @@ from pants.engine.unions import UnionRule
 from pants.jvm.jdk_rules import InternalJdk, JvmProcess
 from pants.jvm.resolve.coursier_fetch import ToolClasspath, ToolClasspathRequest
 from pants.jvm.resolve.jvm_tool import GenerateJvmLockfileFromTool, JvmToolBase
+from pants.option.global_options import GlobalOptions
+from pants.util.dirutil import fast_relpath
+from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
+from pants.util.result_store import ResultStore
+from pants.util.strutil import pluralize
 
 logger = logging.getLogger(__name__)
 
 
 _LAUNCHER_BASENAME = "PantsJavaParserLauncher.java"
+_SOURCE_PREFIX = "__source_to_analyze"
+_ANALYSIS_OUTPUT_PATH = "__source_analysis.json"
 
 
 class JavaParser(JvmToolBase):
@@ -49,6 +69,24 @@ class JavaSourceDependencyAnalysisRequest:
     source_files: SourceFiles
 
 
+@dataclass(frozen=True)
+class JavaSourceDependencyAnalysisBatchRequest:
+    """Analyze every Java file in a digest with a single invocation of the parser.
+
+    The analysis of each file is recorded in the `pants_workdir`, keyed by the path and content of
+    the file, and only the files without a recorded analysis are parsed.
+    """
+
+    digest: Digest
+
+
+class JavaSourceDependencyAnalysisBatch(FrozenDict[str, JavaSourceDependencyAnalysis]):
+    """The analysis of each file in a batch, keyed by its path.
+
+    Files that could not be parsed are omitted.
+    """
+
+
 @dataclass(frozen=True)
 class FallibleJavaSourceDependencyAnalysisResult:
     process_result: FallibleProcessResult
@@ -59,10 +97,83 @@ class JavaParserCompiledClassfiles:
     digest: Digest
 
 
+def _analysis_store(global_options: GlobalOptions) -> ResultStore:
+    return ResultStore(os.path.join(global_options.pants_workdir, "java", "source_analysis"))
+
+
+async def _analysis_keys(
+    processor_classfiles: JavaParserCompiledClassfiles, tool: JavaParser, digest: Digest
+) -> dict[str, str]:
+    """The `_analysis_store` key of each file in `digest`.
+
+    The key captures the parser, and the path and content of the file.
+    """
+    tool_classpath, entries = await MultiGet(
+        Get(
+            ToolClasspath,
+            ToolClasspathRequest(lockfile=(GenerateJvmLockfileFromTool.create(tool))),
+        ),
+        Get(DigestEntries, Digest, digest),
+    )
+    return {
+        entry.path: hashlib.sha256(
+            json.dumps(
+                [
+                    processor_classfiles.digest.fingerprint,
+                    tool_classpath.digest.fingerprint,
+                    entry.path,
+                    entry.file_digest.fingerprint,
+                ]
+            ).encode()
+        ).hexdigest()
+        for entry in entries
+        if isinstance(entry, FileEntry)
+    }
+
+
 @rule(level=LogLevel.DEBUG)
-async def resolve_fallible_result_to_analysis(
-    fallible_result: FallibleJavaSourceDependencyAnalysisResult,
+async def resolve_analysis_request(
+    request: JavaSourceDependencyAnalysisRequest,
+    java_infer_subsystem: JavaInferSubsystem,
+    processor_classfiles: JavaParserCompiledClassfiles,
+    tool: JavaParser,
+    global_options: GlobalOptions,
 ) -> JavaSourceDependencyAnalysis:
+    # With `[java-infer].batch_by_directory`, the analysis of each file is recorded under a key of
+    # its own content, so a file which did not change is not parsed again. Otherwise, rather than
+    # invoking the parser for the file on its own, we analyze the Java files in its directory
+    # together: the batch request below is identical for every file in the directory, so the engine
+    # memoizes it, and inferring the dependencies of many targets costs one parser invocation per
+    # directory rather than one per file.
+    if java_infer_subsystem.batch_by_directory and len(request.source_files.files) == 1:
+        file_path = request.source_files.files[0]
+        keys = await _analysis_keys(
+            processor_classfiles, tool, request.source_files.snapshot.digest
+        )
+        key = keys[file_path]
+        stored = _analysis_store(global_options).get([key])
+        if key in stored:
+            return JavaSourceDependencyAnalysis.from_json_dict(stored[key])
+
+        siblings_digest = await Get(
+            Digest, PathGlobs([os.path.join(os.path.dirname(file_path), "*.java")])
+        )
+        batch, file_in_siblings_digest = await MultiGet(
+            Get(
+                JavaSourceDependencyAnalysisBatch,
+                JavaSourceDependencyAnalysisBatchRequest(siblings_digest),
+            ),
+            Get(Digest, DigestSubset(siblings_digest, PathGlobs([file_path]))),
+        )
+        # NB: The source may have been generated, in which case its content is not on disk.
+        if file_path in batch and file_in_siblings_digest == request.source_files.snapshot.digest:
+            return batch[file_path]
+
+    # The file was not in the batch, either because it was generated, or because it failed to
+    # parse. Analyze it on its own, which will surface any error.
+    fallible_result = await Get(
+        FallibleJavaSourceDependencyAnalysisResult, JavaSourceDependencyAnalysisRequest, request
+    )
     desc = ProductDescription("Java source dependency analysis failed.")
     result = await Get(
         ProcessResult,
@@ -80,24 +191,14 @@ async def make_analysis_request_from_source_files(
     return JavaSourceDependencyAnalysisRequest(source_files=source_files)
 
 
-@rule(level=LogLevel.DEBUG)
-async def analyze_java_source_dependencies(
+async def _run_java_parser(
     processor_classfiles: JavaParserCompiledClassfiles,
     jdk: InternalJdk,
     tool: JavaParser,
-    request: JavaSourceDependencyAnalysisRequest,
-) -> FallibleJavaSourceDependencyAnalysisResult:
-    source_files = request.source_files
-    if len(source_files.files) > 1:
-        raise ValueError(
-            f"parse_java_package expects sources with exactly 1 source file, but found {len(source_files.files)}."
-        )
-    elif len(source_files.files) == 0:
-        raise ValueError(
-            "parse_java_package expects sources with exactly 1 source file, but found none."
-        )
-    source_prefix = "__source_to_analyze"
-    source_path = os.path.join(source_prefix, source_files.files[0])
+    source_files_digest: Digest,
+    args: tuple[str, ...],
+    description: str,
+) -> FallibleProcessResult:
     processorcp_relpath = "__processorcp"
     toolcp_relpath = "__toolcp"
 
@@ -106,7 +207,7 @@ async def analyze_java_source_dependencies(
             ToolClasspath,
             ToolClasspathRequest(lockfile=(GenerateJvmLockfileFromTool.create(tool))),
         ),
-        Get(Digest, AddPrefix(source_files.snapshot.digest, source_prefix)),
+        Get(Digest, AddPrefix(source_files_digest, _SOURCE_PREFIX)),
     )
 
     extra_immutable_input_digests = {
@@ -114,9 +215,7 @@ async def analyze_java_source_dependencies(
         processorcp_relpath: processor_classfiles.digest,
     }
 
-    analysis_output_path = "__source_analysis.json"
-
-    process_result = await Get(
+    return await Get(
         FallibleProcessResult,
         JvmProcess(
             jdk=jdk,
@@ -124,20 +223,94 @@ async def analyze_java_source_dependencies(
                 *tool_classpath.classpath_entries(toolcp_relpath),
                 processorcp_relpath,
             ],
-            argv=[
-                "org.pantsbuild.javaparser.PantsJavaParserLauncher",
-                analysis_output_path,
-                source_path,
-            ],
+            argv=["org.pantsbuild.javaparser.PantsJavaParserLauncher", *args],
             input_digest=prefixed_source_files_digest,
             extra_immutable_input_digests=extra_immutable_input_digests,
-            output_files=(analysis_output_path,),
+            output_files=(_ANALYSIS_OUTPUT_PATH,),
             extra_nailgun_keys=extra_immutable_input_digests,
-            description=f"Analyzing {source_files.files[0]}",
+            description=description,
             level=LogLevel.DEBUG,
         ),
     )
 
+
+@rule(level=LogLevel.DEBUG)
+async def analyze_java_source_dependencies_batch(
+    processor_classfiles: JavaParserCompiledClassfiles,
+    jdk: InternalJdk,
+    tool: JavaParser,
+    request: JavaSourceDependencyAnalysisBatchRequest,
+    global_options: GlobalOptions,
+) -> JavaSourceDependencyAnalysisBatch:
+    keys = await _analysis_keys(processor_classfiles, tool, request.digest)
+    store = _analysis_store(global_options)
+    stored = store.get(keys.values())
+    analyses = {
+        path: JavaSourceDependencyAnalysis.from_json_dict(stored[key])
+        for path, key in keys.items()
+        if key in stored
+    }
+    missing = tuple(path for path in keys if path not in analyses)
+    if not missing:
+        return JavaSourceDependencyAnalysisBatch(analyses)
+
+    missing_digest = await Get(Digest, DigestSubset(request.digest, PathGlobs(missing)))
+    process_result = await _run_java_parser(
+        processor_classfiles,
+        jdk,
+        tool,
+        missing_digest,
+        (
+            "--batch",
+            _ANALYSIS_OUTPUT_PATH,
+            *(os.path.join(_SOURCE_PREFIX, file) for file in missing),
+        ),
+        f"Analyzing {pluralize(len(missing), 'Java source file')}",
+    )
+    if process_result.exit_code != 0:
+        # The remaining files will be analyzed on their own instead.
+        stderr = process_result.stderr.decode(errors="replace")
+        logger.debug(f"Batched Java source analysis failed: {stderr}")
+        return JavaSourceDependencyAnalysisBatch(analyses)
+
+    analysis_contents = await Get(DigestContents, Digest, process_result.output_digest)
+    parsed = {
+        fast_relpath(path, _SOURCE_PREFIX): analysis
+        for path, analysis in json.loads(analysis_contents[0].content).items()
+    }
+    store.put({keys[path]: analysis for path, analysis in parsed.items() if path in keys})
+    analyses.update(
+        (path, JavaSourceDependencyAnalysis.from_json_dict(analysis))
+        for path, analysis in parsed.items()
+    )
+    return JavaSourceDependencyAnalysisBatch(analyses)
+
+
+@rule(level=LogLevel.DEBUG)
+async def analyze_java_source_dependencies(
+    processor_classfiles: JavaParserCompiledClassfiles,
+    jdk: InternalJdk,
+    tool: JavaParser,
+    request: JavaSourceDependencyAnalysisRequest,
+) -> FallibleJavaSourceDependencyAnalysisResult:
+    source_files = request.source_files
+    if len(source_files.files) > 1:
+        raise ValueError(
+            f"parse_java_package expects sources with exactly 1 source file, but found {len(source_files.files)}."
+        )
+    elif len(source_files.files) == 0:
+        raise ValueError(
+            "parse_java_package expects sources with exactly 1 source file, but found none."
+        )
+    process_result = await _run_java_parser(
+        processor_classfiles,
+        jdk,
+        tool,
+        source_files.snapshot.digest,
+        (_ANALYSIS_OUTPUT_PATH, os.path.join(_SOURCE_PREFIX, source_files.files[0])),
+        f"Analyzing {source_files.files[0]}",
+    )
+
     return FallibleJavaSourceDependencyAnalysisResult(process_result=process_result)
 
 
@@ -3,12 +3,15 @@
 
 from __future__ import annotations
 
+from pathlib import Path
 from textwrap import dedent
 
 import pytest
 
 from pants.backend.java.dependency_inference.java_parser import (
     FallibleJavaSourceDependencyAnalysisResult,
+    JavaSourceDependencyAnalysisBatch,
+    JavaSourceDependencyAnalysisBatchRequest,
 )
 from pants.backend.java.dependency_inference.java_parser import rules as java_parser_rules
 from pants.backend.java.dependency_inference.types import JavaImport, JavaSourceDependencyAnalysis
@@ -16,6 +19,7 @@ from pants.backend.java.target_types import JavaSourceField, JavaSourceTarget
 from pants.build_graph.address import Address
 from pants.core.util_rules import source_files
 from pants.core.util_rules.source_files import SourceFiles, SourceFilesRequest
+from pants.engine.fs import Digest, PathGlobs
 from pants.engine.internals.scheduler import ExecutionError
 from pants.engine.process import ProcessExecutionFailure
 from pants.engine.target import SourcesField
@@ -39,6 +43,10 @@ def rule_runner() -> RuleRunner:
             QueryRule(FallibleJavaSourceDependencyAnalysisResult, (SourceFiles,)),
             QueryRule(JavaSourceDependencyAnalysis, (SourceFiles,)),
             QueryRule(SourceFiles, (SourceFilesRequest,)),
+            QueryRule(
+                JavaSourceDependencyAnalysisBatch, (JavaSourceDependencyAnalysisBatchRequest,)
+            ),
+            QueryRule(Digest, (PathGlobs,)),
         ],
         target_types=[JavaSourceTarget],
     )
@@ -191,6 +199,41 @@ def test_java_parser_fallible_error(rule_runner: RuleRunner) -> None:
     assert isinstance(exc_info.value.wrapped_exceptions[0], ProcessExecutionFailure)
 
 
+@maybe_skip_jdk_test
+def test_java_parser_batch(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "src/A.java": "package org.pantsbuild.a;\nimport java.util.List;\npublic class A {}\n",
+            "src/B.java": "package org.pantsbuild.a;\npublic class B extends A {}\n",
+            "src/Broken.java": "package org.pantsbuild.a;\npublic class {\n",
+        }
+    )
+    digest = rule_runner.request(Digest, [PathGlobs(["src/*.java"])])
+    batch = rule_runner.request(
+        JavaSourceDependencyAnalysisBatch, [JavaSourceDependencyAnalysisBatchRequest(digest)]
+    )
+
+    # Files which fail to parse are omitted, to be analyzed (and fail) on their own.
+    assert set(batch) == {"src/A.java", "src/B.java"}
+    assert batch["src/A.java"].imports == (JavaImport(name="java.util.List"),)
+    assert batch["src/A.java"].top_level_types == ("org.pantsbuild.a.A",)
+    assert batch["src/B.java"].top_level_types == ("org.pantsbuild.a.B",)
+    assert batch["src/B.java"].export_types == ("A",)
+
+    # The analysis of each file is recorded, so after editing a file, only it is analyzed again.
+    store_dir = Path(rule_runner.pants_workdir, "java", "source_analysis")
+    assert len(list(store_dir.glob("*/*"))) == 2
+    rule_runner.write_files({"src/B.java": "package org.pantsbuild.a;\npublic class B {}\n"})
+    digest = rule_runner.request(Digest, [PathGlobs(["src/*.java"])])
+    rebatch = rule_runner.request(
+        JavaSourceDependencyAnalysisBatch, [JavaSourceDependencyAnalysisBatchRequest(digest)]
+    )
+    assert set(rebatch) == {"src/A.java", "src/B.java"}
+    assert rebatch["src/A.java"] == batch["src/A.java"]
+    assert rebatch["src/B.java"].export_types == ()
+    assert len(list(store_dir.glob("*/*"))) == 3
+
+
 @maybe_skip_jdk_test
 def test_java_parser_unnamed_package(rule_runner: RuleRunner) -> None:
     rule_runner.write_files(
@@ -8,14 +8,15 @@ from typing import Iterable
 
 from pants.backend.javascript import nodejs_project_environment
 from pants.backend.javascript.dependency_inference.rules import rules as dependency_inference_rules
+from pants.backend.javascript.nodejs_project import NodeJSProject
 from pants.backend.javascript.nodejs_project_environment import (
     NodeJsProjectEnvironment,
     NodeJsProjectEnvironmentProcess,
     NodeJSProjectEnvironmentRequest,
 )
 from pants.backend.javascript.package_json import (
-    NodePackageNameField,
-    NodePackageVersionField,
+    FirstPartyNodePackageTargets,
+    PackageJson,
     PackageJsonSourceField,
 )
 from pants.backend.javascript.package_manager import PackageManager
@@ -24,12 +25,20 @@ from pants.backend.javascript.target_types import JSRuntimeSourceField
 from pants.build_graph.address import Address
 from pants.core.target_types import FileSourceField, ResourceSourceField
 from pants.core.util_rules.source_files import SourceFiles, SourceFilesRequest
-from pants.engine.internals.native_engine import AddPrefix, Digest, MergeDigests
-from pants.engine.internals.selectors import Get
+from pants.engine.fs import PathGlobs
+from pants.engine.internals.native_engine import (
+    EMPTY_DIGEST,
+    AddPrefix,
+    Digest,
+    DigestSubset,
+    MergeDigests,
+)
+from pants.engine.internals.selectors import Get, MultiGet
 from pants.engine.process import ProcessResult
 from pants.engine.rules import Rule, collect_rules, rule
 from pants.engine.target import SourcesField, Target, TransitiveTargets, TransitiveTargetsRequest
 from pants.engine.unions import UnionMembership, UnionRule
+from pants.util.dirutil import fast_relpath
 
 
 @dataclass(frozen=True)
@@ -63,6 +72,31 @@ class InstalledNodePackageWithSource(InstalledNodePackage):
     pass
 
 
+@dataclass(frozen=True)
+class InstalledNodeProjectRequest:
+    project: NodeJSProject
+
+
+@dataclass(frozen=True)
+class InstalledNodeProject:
+    """The `node_modules` directories of every workspace in a project, installed by a single
+    invocation of the package manager."""
+
+    project_env: NodeJsProjectEnvironment
+    digest: Digest
+
+    @staticmethod
+    def node_modules_directories(project: NodeJSProject) -> tuple[str, ...]:
+        return (
+            "node_modules",
+            *sorted(
+                os.path.join(fast_relpath(workspace.root_dir, project.root_dir), "node_modules")
+                for workspace in project.workspaces
+                if workspace.root_dir != project.root_dir
+            ),
+        )
+
+
 async def _get_relevant_source_files(
     sources: Iterable[SourcesField], with_js: bool = False
 ) -> SourceFiles:
@@ -77,13 +111,66 @@ async def _get_relevant_source_files(
     )
 
 
+# The lifecycle scripts which package managers run for workspace packages during an install.
+_INSTALL_SCRIPTS = ("preinstall", "install", "postinstall", "prepare")
+
+
+def _has_install_scripts(package_json: PackageJson) -> bool:
+    scripts = package_json.content.get("scripts") or {}
+    return any(script in scripts for script in _INSTALL_SCRIPTS)
+
+
+@rule
+async def install_node_project(
+    req: InstalledNodeProjectRequest, all_first_party: FirstPartyNodePackageTargets
+) -> InstalledNodeProject:
+    project = req.project
+    # The install only needs the lockfile and the `package.json` of every workspace, which the
+    # process always includes, so that it is only re-run when those change. The file sources of
+    # a package are only included if it has lifecycle scripts which run during the install, and
+    # which might read them.
+    install_script_dirs = {
+        workspace.root_dir for workspace in project.workspaces if _has_install_scripts(workspace)
+    }
+    input_digest = EMPTY_DIGEST
+    if install_script_dirs:
+        transitive_tgts = await Get(
+            TransitiveTargets,
+            TransitiveTargetsRequest(
+                tgt.address for tgt in all_first_party if tgt.residence_dir in install_script_dirs
+            ),
+        )
+        source_files = await _get_relevant_source_files(
+            (tgt[SourcesField] for tgt in transitive_tgts.closure if tgt.has_field(SourcesField)),
+            with_js=False,
+        )
+        input_digest = source_files.snapshot.digest
+
+    project_env = NodeJsProjectEnvironment.from_root(project)
+    install_result = await Get(
+        ProcessResult,
+        NodeJsProjectEnvironmentProcess(
+            project_env,
+            project.immutable_install_args,
+            description=f"Installing NodeJS project {project.default_resolve_name}.",
+            input_digest=input_digest,
+            output_directories=InstalledNodeProject.node_modules_directories(project),
+        ),
+    )
+    node_modules = await Get(Digest, AddPrefix(install_result.output_digest, project.root_dir))
+    return InstalledNodeProject(project_env, node_modules)
+
+
 @rule
 async def install_node_packages_for_address(
     req: InstalledNodePackageRequest, union_membership: UnionMembership
 ) -> InstalledNodePackage:
     project_env = await Get(NodeJsProjectEnvironment, NodeJSProjectEnvironmentRequest(req.address))
     target = project_env.ensure_target()
-    transitive_tgts = await Get(TransitiveTargets, TransitiveTargetsRequest([target.address]))
+    transitive_tgts, installed_project = await MultiGet(
+        Get(TransitiveTargets, TransitiveTargetsRequest([target.address])),
+        Get(InstalledNodeProject, InstalledNodeProjectRequest(project_env.project)),
+    )
 
     source_files = await _get_relevant_source_files(
         (tgt[SourcesField] for tgt in transitive_tgts.closure if tgt.has_field(SourcesField)),
@@ -91,17 +178,18 @@ async def install_node_packages_for_address(
     )
     package_digest = source_files.snapshot.digest
 
-    install_result = await Get(
-        ProcessResult,
-        NodeJsProjectEnvironmentProcess(
-            project_env,
-            project_env.project.immutable_install_args,
-            description=f"Installing {target[NodePackageNameField].value}@{target[NodePackageVersionField].value}.",
-            input_digest=package_digest,
-            output_directories=tuple(project_env.node_modules_directories),
+    # The whole project is installed once, and shared by all of its packages: each package only
+    # sees the root `node_modules`, and its own.
+    node_modules = await Get(
+        Digest,
+        DigestSubset(
+            installed_project.digest,
+            PathGlobs(
+                os.path.join(project_env.root_dir, directory, "**")
+                for directory in project_env.node_modules_directories
+            ),
         ),
     )
-    node_modules = await Get(Digest, AddPrefix(install_result.output_digest, project_env.root_dir))
 
     return InstalledNodePackage(
         project_env,
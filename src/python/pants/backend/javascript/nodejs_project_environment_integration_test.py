@@ -8,6 +8,12 @@ import pytest
 from _pytest.tmpdir import TempPathFactory
 
 from pants.backend.javascript import install_node_package, package_json
+from pants.backend.javascript.install_node_package import (
+    InstalledNodePackage,
+    InstalledNodePackageRequest,
+    InstalledNodeProject,
+    InstalledNodeProjectRequest,
+)
 from pants.backend.javascript.nodejs_project_environment import (
     NodeJsProjectEnvironment,
     NodeJsProjectEnvironmentProcess,
@@ -15,6 +21,8 @@ from pants.backend.javascript.nodejs_project_environment import (
 )
 from pants.backend.javascript.package_json import PackageJsonTarget
 from pants.build_graph.address import Address
+from pants.engine.fs import DigestEntries
+from pants.engine.internals.native_engine import Digest
 from pants.engine.process import Process, ProcessCacheScope, ProcessResult
 from pants.engine.rules import QueryRule
 from pants.testutil.rule_runner import RuleRunner
@@ -33,6 +41,9 @@ def rule_runner(named_caches_dir: Path) -> RuleRunner:
             QueryRule(NodeJsProjectEnvironment, (NodeJSProjectEnvironmentRequest,)),
             QueryRule(Process, (NodeJsProjectEnvironmentProcess,)),
             QueryRule(ProcessResult, (Process,)),
+            QueryRule(InstalledNodeProject, (InstalledNodeProjectRequest,)),
+            QueryRule(InstalledNodePackage, (InstalledNodePackageRequest,)),
+            QueryRule(DigestEntries, (Digest,)),
         ],
         target_types=[PackageJsonTarget],
         objects=dict(package_json.build_file_aliases().objects),
@@ -75,3 +86,61 @@ def test_pnpm_project_sandbox_provides_append_only_cache_at_expected_location(
     )  # Disable caches for this process to avoid flakiness
     rule_runner.request(ProcessResult, [process])
     assert (named_caches_dir / "pnpm_home/marker.txt").is_file()
+
+
+def test_workspace_packages_share_project_installation(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "src/js/BUILD": "package_json()",
+            "src/js/package.json": json.dumps(
+                {"name": "root", "version": "0.0.1", "workspaces": ["a", "b"], "private": True}
+            ),
+            "src/js/package-lock.json": json.dumps(
+                {
+                    "name": "root",
+                    "version": "0.0.1",
+                    "lockfileVersion": 3,
+                    "requires": True,
+                    "packages": {
+                        "": {"name": "root", "version": "0.0.1", "workspaces": ["a", "b"]},
+                        "a": {"name": "a", "version": "0.0.1"},
+                        "b": {"name": "b", "version": "0.0.1"},
+                        "node_modules/a": {"resolved": "a", "link": True},
+                        "node_modules/b": {"resolved": "b", "link": True},
+                    },
+                }
+            ),
+            "src/js/a/BUILD": "package_json()",
+            "src/js/a/package.json": json.dumps({"name": "a", "version": "0.0.1"}),
+            "src/js/b/BUILD": "package_json()",
+            "src/js/b/package.json": json.dumps({"name": "b", "version": "0.0.1"}),
+        }
+    )
+    project_env = rule_runner.request(
+        NodeJsProjectEnvironment,
+        [NodeJSProjectEnvironmentRequest(Address("src/js/a", generated_name="a"))],
+    )
+    assert InstalledNodeProject.node_modules_directories(project_env.project) == (
+        "node_modules",
+        "a/node_modules",
+        "b/node_modules",
+    )
+
+    def node_modules_paths(digest: Digest) -> set[str]:
+        entries = rule_runner.request(DigestEntries, [digest])
+        return {entry.path for entry in entries if "node_modules" in entry.path}
+
+    installed_project = rule_runner.request(
+        InstalledNodeProject, [InstalledNodeProjectRequest(project_env.project)]
+    )
+    project_paths = node_modules_paths(installed_project.digest)
+    assert "src/js/node_modules/a" in project_paths
+
+    for name in ("a", "b"):
+        installed_package = rule_runner.request(
+            InstalledNodePackage,
+            [InstalledNodePackageRequest(Address(f"src/js/{name}", generated_name=name))],
+        )
+        package_paths = node_modules_paths(installed_package.digest)
+        assert package_paths
+        assert package_paths <= project_paths
@@ -73,6 +73,24 @@ def test_count_loc(rule_runner: RuleRunner) -> None:
     assert_counts(result.stdout, "Elixir", comment=1, code=1)
 
 
+def test_count_loc_in_batches(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "src/py/foo.py": '# A comment.\n\nprint("some code")\n# Another comment.',
+            "src/py/bar.py": '# A comment.\n\nprint("some more code")',
+            "src/py/baz.py": 'print("even more code")',
+            "src/elixir/foo.ex": 'IO.puts("Some elixir")\n# A comment',
+        }
+    )
+    result = rule_runner.run_goal_rule(
+        CountLinesOfCode, args=["--count-loc-batch-size=2", "src/py/*.py", "src/elixir/*.ex"]
+    )
+    assert result.exit_code == 0
+    assert_counts(result.stdout, "Python", num_files=3, blank=2, comment=3, code=3)
+    assert_counts(result.stdout, "Elixir", comment=1, code=1)
+    assert_counts(result.stdout, "Total", num_files=4, blank=2, comment=4, code=4)
+
+
 def test_passthrough_args(rule_runner: RuleRunner) -> None:
     rule_runner.write_files(
         {"foo.py": "print('hello world!')\n", "BUILD": "python_sources(name='foo')"}
@@ -1,26 +1,42 @@
 # Copyright 2020 Pants project contributors (see CONTRIBUTORS.md).
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
+import bisect
+import hashlib
 import json
+import logging
+import os
 from collections import defaultdict
 from dataclasses import dataclass
 from enum import Enum
-from typing import Iterable, Set
+from typing import Dict, Iterable, Mapping, Optional, Set, Tuple
 
+from pants.base.build_environment import get_buildroot
 from pants.engine.addresses import Address, Addresses
 from pants.engine.collection import DeduplicatedCollection
 from pants.engine.console import Console
+from pants.engine.fs import DigestContents, DigestEntries, FileEntry, PathGlobs
 from pants.engine.goal import Goal, GoalSubsystem, LineOriented
+from pants.engine.internals.build_files import BuildFileOptions
 from pants.engine.rules import Get, MultiGet, collect_rules, goal_rule, rule
 from pants.engine.target import (
     AllUnexpandedTargets,
     AlwaysTraverseDeps,
     Dependencies,
     DependenciesRequest,
+    MultipleSourcesField,
+    SourcesField,
+    Target,
 )
-from pants.option.option_types import BoolOption, EnumOption
-from pants.util.frozendict import FrozenDict
+from pants.option.global_options import GlobalOptions
+from pants.option.option_types import BoolOption, EnumOption, StrOption
+from pants.util.dirutil import fast_relpath_optional, safe_file_dump
+from pants.util.frozendict import FrozenDict, LargeFrozenDict
 from pants.util.logging import LogLevel
 from pants.util.ordered_set import FrozenOrderedSet
+from pants.util.strutil import softwrap
+from pants.version import VERSION
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass(frozen=True)
@@ -39,8 +55,263 @@ class DependentsOutputFormat(Enum):
     json = "json"
 
 
-@rule(desc="Map all targets to their dependents", level=LogLevel.DEBUG)
-async def map_addresses_to_dependents(all_targets: AllUnexpandedTargets) -> AddressToDependents:
+class DependentsSubsystem(LineOriented, GoalSubsystem):
+    name = "dependents"
+    help = "List all targets that depend on any of the input files/targets."
+
+    transitive = BoolOption(
+        default=False,
+        help="List all transitive dependents. If unspecified, list direct dependents only.",
+    )
+    closed = BoolOption(
+        default=False,
+        help="Include the input targets in the output, along with the dependents.",
+    )
+    format = EnumOption(
+        default=DependentsOutputFormat.text,
+        help="Output format for listing dependents.",
+    )
+    index_file = StrOption(
+        default=None,
+        advanced=True,
+        help=softwrap(
+            """
+            If set, persist the dependencies of every target to this file (relative to the build
+            root), and use it to compute dependents in later runs, including for
+            `--changed-dependents`.
+
+            On later runs, only the dependencies of targets whose own source files have changed
+            are resolved again, which avoids resolving the dependencies of every target in the
+            repository when Pants runs without a warm `pantsd`. The whole index is invalidated if
+            any BUILD file or config file (see `[GLOBAL].pants_config_files`) changes, if any
+            target is added or removed, if any source file is added, removed or renamed (which
+            may change the owners of imports), or if the Pants version changes.
+
+            The index does not track options set on the command line or through environment
+            variables, or the contents of files owned by _other_ targets (used, for example, when
+            inferring JVM dependencies from symbols). Delete the file when changing those.
+
+            The file is read through the engine, so it must not be ignored by
+            `[GLOBAL].pants_ignore` (which by default includes the patterns in `.gitignore`).
+            """
+        ),
+    )
+
+
+class DependentsGoal(Goal):
+    subsystem_cls = DependentsSubsystem
+    environment_behavior = Goal.EnvironmentBehavior.LOCAL_ONLY
+
+
+@dataclass(frozen=True)
+class DependenciesIndexEntry:
+    # A fingerprint of the source files owned by the target.
+    key: str
+    dependencies: Tuple[Address, ...]
+
+
+@dataclass(frozen=True)
+class DependenciesIndex:
+    """The dependencies of every target, which may be persisted between runs.
+
+    An entry is only reused from a persisted index if its `key` still matches, and if the
+    `fingerprint` of the whole index (which covers all BUILD and config files, the set of all
+    targets, and the set of all source files) still matches.
+    """
+
+    fingerprint: str
+    entries: LargeFrozenDict[Address, DependenciesIndexEntry]
+    # Whether any entries differ from the persisted index that this index was computed from.
+    changed: bool = True
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "version": 1,
+                "fingerprint": self.fingerprint,
+                "entries": {
+                    address.spec: {
+                        "key": entry.key,
+                        "dependencies": [dep.spec for dep in entry.dependencies],
+                    }
+                    for address, entry in self.entries.items()
+                },
+            }
+        )
+
+    @classmethod
+    def from_json(
+        cls, content: str, addresses_by_spec: Mapping[str, Address]
+    ) -> Optional["DependenciesIndex"]:
+        """Parse a persisted index, skipping any entries which refer to unknown addresses."""
+        data = json.loads(content)
+        if data.get("version") != 1:
+            return None
+        entries = {}
+        for spec, entry in data["entries"].items():
+            if spec not in addresses_by_spec or any(
+                dep not in addresses_by_spec for dep in entry["dependencies"]
+            ):
+                continue
+            entries[addresses_by_spec[spec]] = DependenciesIndexEntry(
+                entry["key"], tuple(addresses_by_spec[dep] for dep in entry["dependencies"])
+            )
+        return cls(data["fingerprint"], LargeFrozenDict(entries), changed=False)
+
+    def write(self, index_file: str) -> None:
+        if not self.changed:
+            return
+        path = os.path.join(get_buildroot(), index_file)
+        # Write to a temporary file and then rename it, so that concurrent runs never observe a
+        # partially written index.
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        safe_file_dump(tmp_path, self.to_json(), makedirs=True)
+        os.replace(tmp_path, path)
+
+
+def _parse_dependencies_index(
+    index_file: str, contents: DigestContents, addresses_by_spec: Mapping[str, Address]
+) -> Optional[DependenciesIndex]:
+    if not contents:
+        return None
+    try:
+        return DependenciesIndex.from_json(contents[0].content.decode(), addresses_by_spec)
+    except (ValueError, KeyError, TypeError, AttributeError) as e:
+        logger.warning(f"Ignoring the invalid dependencies index at {index_file}: {e!r}")
+        return None
+
+
+def _fingerprint(items: Iterable[str]) -> str:
+    hasher = hashlib.sha256()
+    for item in items:
+        hasher.update(item.encode())
+        hasher.update(b"\0")
+    return hasher.hexdigest()
+
+
+def _source_keys(targets: Iterable[Target], file_digests: Mapping[str, str]) -> Dict[Address, str]:
+    """Fingerprint the source files owned by each target."""
+    sorted_paths = sorted(file_digests)
+    keys = {}
+    for tgt in targets:
+        sources = tgt.get(SourcesField)
+        if isinstance(sources, MultipleSourcesField):
+            # Only consider the files below the target's directory as candidates for its globs.
+            prefix = f"{tgt.address.spec_path}/" if tgt.address.spec_path else ""
+            start = bisect.bisect_left(sorted_paths, prefix)
+            end = bisect.bisect_left(sorted_paths, f"{prefix}\U0010ffff")
+            paths = sources.filespec_matcher.matches(sorted_paths[start:end])
+        else:
+            paths = [
+                os.path.join(tgt.address.spec_path, glob)
+                for glob in sources.globs
+                if os.path.join(tgt.address.spec_path, glob) in file_digests
+            ]
+        keys[tgt.address] = _fingerprint(f"{path}={file_digests[path]}" for path in paths)
+    return keys
+
+
+@rule(desc="Resolve the dependencies of all targets", level=LogLevel.DEBUG)
+async def resolve_dependencies_index(
+    all_targets: AllUnexpandedTargets,
+    build_file_options: BuildFileOptions,
+    global_options: GlobalOptions,
+    dependents_subsystem: DependentsSubsystem,
+) -> DependenciesIndex:
+    index_file = dependents_subsystem.index_file
+    if not index_file:
+        dependencies_per_target = await MultiGet(
+            Get(
+                Addresses,
+                DependenciesRequest(
+                    tgt.get(Dependencies), should_traverse_deps_predicate=AlwaysTraverseDeps()
+                ),
+            )
+            for tgt in all_targets
+        )
+        return DependenciesIndex(
+            "",
+            LargeFrozenDict(
+                (tgt.address, DependenciesIndexEntry("", tuple(dependencies)))
+                for tgt, dependencies in zip(all_targets, dependencies_per_target)
+            ),
+        )
+
+    # Capture the digests of all BUILD files, config files and owned source files in a single pass,
+    # along with the persisted index. NB: The index is read through the engine so that this rule is
+    # invalidated when it changes.
+    source_globs = {
+        glob
+        for tgt in all_targets
+        if tgt.has_field(SourcesField)
+        for glob in tgt[SourcesField].filespec["includes"]
+    }
+    build_file_globs = [
+        *(f"**/{pattern}" for pattern in build_file_options.patterns),
+        *build_file_options.prelude_globs,
+    ]
+    # Config files outside of the build root (such as pantsrc files) cannot be captured.
+    buildroot = get_buildroot()
+    config_files = [
+        relpath
+        for relpath in (
+            fast_relpath_optional(path, buildroot) for path in global_options.pants_config_files
+        )
+        if relpath is not None
+    ]
+    build_entries, source_entries, index_contents = await MultiGet(
+        Get(
+            DigestEntries,
+            PathGlobs(
+                [
+                    *build_file_globs,
+                    *config_files,
+                    *(f"!{ignore}" for ignore in build_file_options.ignores),
+                ]
+            ),
+        ),
+        Get(DigestEntries, PathGlobs(sorted(source_globs))),
+        Get(DigestContents, PathGlobs([index_file])),
+    )
+    file_digests = {
+        entry.path: entry.file_digest.fingerprint
+        for entry in source_entries
+        if isinstance(entry, FileEntry)
+    }
+    # Besides the sources of each target, dependency inference may depend on the set of all
+    # source files (e.g. to map imports to their owners), so adding or removing any file
+    # invalidates the whole index.
+    fingerprint = _fingerprint(
+        [
+            VERSION,
+            *sorted(tgt.address.spec for tgt in all_targets),
+            *sorted(
+                f"{entry.path}={entry.file_digest.fingerprint}"
+                for entry in build_entries
+                if isinstance(entry, FileEntry)
+            ),
+            *sorted(file_digests),
+        ]
+    )
+    keys = _source_keys(all_targets, file_digests)
+
+    addresses_by_spec = {tgt.address.spec: tgt.address for tgt in all_targets}
+    prior_index = _parse_dependencies_index(index_file, index_contents, addresses_by_spec)
+    prior_entries: LargeFrozenDict[Address, DependenciesIndexEntry] = (
+        prior_index.entries
+        if prior_index is not None and prior_index.fingerprint == fingerprint
+        else LargeFrozenDict()
+    )
+
+    def is_valid(tgt: Target) -> bool:
+        prior_entry = prior_entries.get(tgt.address)
+        return prior_entry is not None and prior_entry.key == keys[tgt.address]
+
+    invalidated = [tgt for tgt in all_targets if not is_valid(tgt)]
+    logger.debug(
+        f"Resolving the dependencies of {len(invalidated)} of {len(all_targets)} targets which "
+        f"are not up to date in the dependencies index at {index_file}."
+    )
     dependencies_per_target = await MultiGet(
         Get(
             Addresses,
@@ -48,15 +319,31 @@ async def map_addresses_to_dependents(all_targets: AllUnexpandedTargets) -> Addr
                 tgt.get(Dependencies), should_traverse_deps_predicate=AlwaysTraverseDeps()
             ),
         )
-        for tgt in all_targets
+        for tgt in invalidated
     )
+    # Update the prior index rather than rebuilding it, since most of its entries are usually valid.
+    entries = prior_entries.updated(
+        {
+            tgt.address: DependenciesIndexEntry(keys[tgt.address], tuple(dependencies))
+            for tgt, dependencies in zip(invalidated, dependencies_per_target)
+        },
+        removed=[address for address in prior_entries if address not in keys],
+    )
+    return DependenciesIndex(
+        fingerprint,
+        entries,
+        changed=bool(invalidated) or len(entries) != len(prior_entries),
+    )
+
 
+@rule(desc="Map all targets to their dependents", level=LogLevel.DEBUG)
+async def map_addresses_to_dependents(index: DependenciesIndex) -> AddressToDependents:
     address_to_dependents = defaultdict(set)
-    for tgt, dependencies in zip(all_targets, dependencies_per_target):
-        for dependency in dependencies:
-            address_to_dependents[dependency].add(tgt.address)
+    for address, entry in index.entries.items():
+        for dependency in entry.dependencies:
+            address_to_dependents[dependency].add(address)
     return AddressToDependents(
-        FrozenDict(
+        LargeFrozenDict(
             {
                 addr: FrozenOrderedSet(dependents)
                 for addr, dependents in address_to_dependents.items()
@@ -105,29 +392,6 @@ def find_dependents(
         known_dependents = dependents
 
 
-class DependentsSubsystem(LineOriented, GoalSubsystem):
-    name = "dependents"
-    help = "List all targets that depend on any of the input files/targets."
-
-    transitive = BoolOption(
-        default=False,
-        help="List all transitive dependents. If unspecified, list direct dependents only.",
-    )
-    closed = BoolOption(
-        default=False,
-        help="Include the input targets in the output, along with the dependents.",
-    )
-    format = EnumOption(
-        default=DependentsOutputFormat.text,
-        help="Output format for listing dependents.",
-    )
-
-
-class DependentsGoal(Goal):
-    subsystem_cls = DependentsSubsystem
-    environment_behavior = Goal.EnvironmentBehavior.LOCAL_ONLY
-
-
 async def list_dependents_as_plain_text(
     addresses: Addresses, dependents_subsystem: DependentsSubsystem, console: Console
 ) -> None:
@@ -173,6 +437,9 @@ async def list_dependents_as_json(
 async def dependents_goal(
     specified_addresses: Addresses, dependents_subsystem: DependentsSubsystem, console: Console
 ) -> DependentsGoal:
+    if dependents_subsystem.index_file:
+        index = await Get(DependenciesIndex)
+        index.write(dependents_subsystem.index_file)
     if DependentsOutputFormat.text == dependents_subsystem.format:
         await list_dependents_as_plain_text(
             addresses=specified_addresses,
@@ -2,6 +2,7 @@
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 import json
 from functools import partial
+from pathlib import Path
 from typing import Dict, List, Optional, Union
 
 import pytest
@@ -47,6 +48,7 @@ def assert_dependents(
     output_file: Optional[str] = None,
     closed: bool = False,
     output_format: DependentsOutputFormat = DependentsOutputFormat.text,
+    index_file: Optional[str] = None,
 ) -> None:
     args = []
     if transitive:
@@ -55,6 +57,8 @@ def assert_dependents(
         args.extend([f"--output-file={output_file}"])
     if closed:
         args.append("--closed")
+    if index_file:
+        args.append(f"--index-file={index_file}")
     args.append(f"--format={output_format.value}")
     result = rule_runner.run_goal_rule(DependentsGoal, args=[*args, *targets])
 
@@ -244,3 +248,45 @@ def test_dependents_as_json_transitive_deps(rule_runner: RuleRunner) -> None:
             "special:special": ["special:special"],
         },
     )
+
+
+def test_index_file(rule_runner: RuleRunner) -> None:
+    index_file = "dependents-index.json"
+    assert_dependents(
+        rule_runner, targets=["base"], index_file=index_file, expected=["intermediate:intermediate"]
+    )
+    index_path = Path(rule_runner.build_root, index_file)
+    index = json.loads(index_path.read_text())
+    assert set(index["entries"]) == {"base:base", "intermediate:intermediate", "leaf:leaf"}
+    assert index["entries"]["leaf:leaf"]["dependencies"] == ["intermediate:intermediate"]
+
+    # The dependencies of unchanged targets are read from the index rather than being resolved
+    # again, so tampering with the index is observable.
+    index["entries"]["leaf:leaf"]["dependencies"] = ["base:base"]
+    rule_runner.write_files({index_file: json.dumps(index)})
+    assert_dependents(
+        rule_runner,
+        targets=["base"],
+        index_file=index_file,
+        closed=True,
+        expected=["base:base", "intermediate:intermediate", "leaf:leaf"],
+    )
+
+    # Changing any BUILD file invalidates the whole index.
+    rule_runner.write_files({"special/BUILD": "tgt()"})
+    assert_dependents(
+        rule_runner, targets=["base"], index_file=index_file, expected=["intermediate:intermediate"]
+    )
+    index = json.loads(index_path.read_text())
+    assert index["entries"]["leaf:leaf"]["dependencies"] == ["intermediate:intermediate"]
+
+    # An invalid index is ignored, and replaced.
+    rule_runner.write_files({index_file: "not json"})
+    assert_dependents(
+        rule_runner, targets=["base"], index_file=index_file, expected=["intermediate:intermediate"]
+    )
+    assert set(json.loads(index_path.read_text())["entries"]) == {
+        "base:base",
+        "intermediate:intermediate",
+        "leaf:leaf",
+    }
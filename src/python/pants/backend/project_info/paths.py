@@ -3,14 +3,16 @@
 
 from __future__ import annotations
 
+import itertools
 import json
-from collections import deque
+from collections import defaultdict, deque
 from dataclasses import dataclass
-from typing import Iterable
+from textwrap import indent
+from typing import Iterable, Iterator, Mapping, Optional, Tuple
 
 from pants.base.specs import Specs
 from pants.base.specs_parser import SpecsParser
-from pants.engine.addresses import Address
+from pants.engine.addresses import Address, Addresses
 from pants.engine.console import Console
 from pants.engine.goal import Goal, GoalSubsystem, Outputting
 from pants.engine.rules import Get, MultiGet, collect_rules, goal_rule, rule
@@ -18,12 +20,12 @@ from pants.engine.target import (
     AlwaysTraverseDeps,
     Dependencies,
     DependenciesRequest,
-    Target,
     Targets,
     TransitiveTargets,
     TransitiveTargetsRequest,
 )
-from pants.option.option_types import StrOption
+from pants.option.option_types import BoolOption, IntOption, StrOption
+from pants.util.frozendict import FrozenDict
 
 
 class PathsSubsystem(Outputting, GoalSubsystem):
@@ -43,19 +45,52 @@ class PathsSubsystem(Outputting, GoalSubsystem):
         help="The path end address",
     )
 
+    max_ = IntOption(
+        default=None,
+        help=(
+            "The maximum number of paths to list between each pair of start and end targets. "
+            "The shortest paths are listed first."
+        ),
+    )
+
+    shortest_only = BoolOption(
+        default=False,
+        help=(
+            "List only a single shortest path between each pair of start and end targets, found "
+            "with a bidirectional breadth-first search. This is much faster than listing all "
+            "paths for dense dependency graphs."
+        ),
+    )
+
 
 class PathsGoal(Goal):
     subsystem_cls = PathsSubsystem
     environment_behavior = Goal.EnvironmentBehavior.LOCAL_ONLY
 
 
+_PathNode = Tuple[Address, Optional["_PathNode"]]
+
+
+def _path_to(node: _PathNode) -> list[Address]:
+    path = []
+    cur: _PathNode | None = node
+    while cur is not None:
+        path.append(cur[0])
+        cur = cur[1]
+    path.reverse()
+    return path
+
+
 def find_paths_breadth_first(
-    adjacency_lists: dict[Address, Targets], from_target: Address, to_target: Address
-) -> Iterable[list[Address]]:
+    adjacency_lists: Mapping[Address, Iterable[Address]], from_target: Address, to_target: Address
+) -> Iterator[list[Address]]:
     """Yields the paths between from_target to to_target if they exist.
 
     The paths are returned ordered by length, shortest first. If there are cycles, it checks visited
     edges to prevent recrossing them.
+
+    Paths under construction are stored as linked `(address, parent)` nodes rather than as lists,
+    so that extending a path does not copy it, and paths are yielded as soon as they are found.
     """
 
     if from_target == to_target:
@@ -63,62 +98,118 @@ def find_paths_breadth_first(
         return
 
     visited_edges = set()
-    to_walk_paths = deque([[from_target]])
-
-    while len(to_walk_paths) > 0:
-        cur_path = to_walk_paths.popleft()
-        target = cur_path[-1]
+    to_walk: deque[_PathNode] = deque([(from_target, None)])
 
-        if len(cur_path) > 1:
-            prev_target: Address | None = cur_path[-2]
-        else:
-            prev_target = None
-        current_edge = (prev_target, target)
+    while len(to_walk) > 0:
+        node = to_walk.popleft()
+        target, parent = node
+        current_edge = (parent[0] if parent is not None else None, target)
 
         if current_edge not in visited_edges:
-            for dep in adjacency_lists.get(target, []):
-                dep_path = cur_path + [dep.address]
-                if dep.address == to_target:
-                    yield dep_path
+            for dep in adjacency_lists.get(target, ()):
+                dep_node = (dep, node)
+                if dep == to_target:
+                    yield _path_to(dep_node)
                 else:
-                    to_walk_paths.append(dep_path)
+                    to_walk.append(dep_node)
             visited_edges.add(current_edge)
 
 
-@dataclass
-class SpecsPaths:
-    paths: list[list[str]]
+def find_shortest_path_bidirectional(
+    adjacency_lists: Mapping[Address, Iterable[Address]], from_target: Address, to_target: Address
+) -> Iterator[list[Address]]:
+    """Yields a single shortest path between from_target and to_target, if one exists.
 
+    Searches breadth first from both ends at once, one whole level at a time, always expanding the
+    smaller frontier. Each visited address records only its distance and parent, rather than a
+    copy of the path to it.
+    """
 
-@dataclass
-class SpecsPathsCollection:
-    spec_paths: list[SpecsPaths]
+    if from_target == to_target:
+        yield [from_target]
+        return
+
+    reverse_adjacency_lists: dict[Address, list[Address]] = defaultdict(list)
+    for address, deps in adjacency_lists.items():
+        for dep in deps:
+            reverse_adjacency_lists[dep].append(address)
+
+    # Maps each visited address to its distance from the respective end, and its parent.
+    forward: dict[Address, tuple[int, Address | None]] = {from_target: (0, None)}
+    backward: dict[Address, tuple[int, Address | None]] = {to_target: (0, None)}
+    forward_frontier = [from_target]
+    backward_frontier = [to_target]
+
+    def expand(
+        frontier: list[Address],
+        edges: Mapping[Address, Iterable[Address]],
+        visited: dict[Address, tuple[int, Address | None]],
+        other_visited: dict[Address, tuple[int, Address | None]],
+    ) -> tuple[list[Address], Address | None]:
+        next_frontier = []
+        meeting: Address | None = None
+        meeting_distance = 0
+        for address in frontier:
+            distance = visited[address][0] + 1
+            for neighbor in edges.get(address, ()):
+                if neighbor in visited:
+                    continue
+                visited[neighbor] = (distance, address)
+                next_frontier.append(neighbor)
+                if neighbor in other_visited:
+                    total = distance + other_visited[neighbor][0]
+                    if meeting is None or total < meeting_distance:
+                        meeting, meeting_distance = neighbor, total
+        return next_frontier, meeting
+
+    while forward_frontier and backward_frontier:
+        if len(forward_frontier) <= len(backward_frontier):
+            forward_frontier, meeting = expand(forward_frontier, adjacency_lists, forward, backward)
+        else:
+            backward_frontier, meeting = expand(
+                backward_frontier, reverse_adjacency_lists, backward, forward
+            )
+        if meeting is None:
+            continue
+
+        path = []
+        cur: Address | None = meeting
+        while cur is not None:
+            path.append(cur)
+            cur = forward[cur][1]
+        path.reverse()
+        cur = backward[meeting][1]
+        while cur is not None:
+            path.append(cur)
+            cur = backward[cur][1]
+        yield path
+        return
 
 
 @dataclass(frozen=True)
-class RootDestinationPair:
-    root: Target
-    destination: Target
+class DependencyGraphRequest:
+    root: Address
 
 
 @dataclass(frozen=True)
-class RootDestinationsPair:
-    root: Target
-    destinations: Targets
+class DependencyGraph:
+    """The dependencies of each target in the transitive closure of a root target."""
 
+    adjacency_lists: FrozenDict[Address, tuple[Address, ...]]
 
-@rule(desc="Get paths between root and destination.")
-async def get_paths_between_root_and_destination(pair: RootDestinationPair) -> SpecsPaths:
+
+@rule(desc="Get the dependency graph of a root.")
+async def get_dependency_graph(request: DependencyGraphRequest) -> DependencyGraph:
     transitive_targets = await Get(
         TransitiveTargets,
         TransitiveTargetsRequest(
-            [pair.root.address], should_traverse_deps_predicate=AlwaysTraverseDeps()
+            [request.root], should_traverse_deps_predicate=AlwaysTraverseDeps()
         ),
     )
 
-    adjacent_targets_per_target = await MultiGet(
+    adjacent_addresses_per_target = await MultiGet(
         Get(
-            Targets,
+            Addresses,
             DependenciesRequest(
                 tgt.get(Dependencies), should_traverse_deps_predicate=AlwaysTraverseDeps()
             ),
@@ -126,32 +217,12 @@ async def get_paths_between_root_and_destination(pair: RootDestinationPair) -> S
         for tgt in transitive_targets.closure
     )
 
-    transitive_targets_closure_addresses = (t.address for t in transitive_targets.closure)
-    adjacency_lists = dict(zip(transitive_targets_closure_addresses, adjacent_targets_per_target))
-
-    spec_paths = []
-    for path in find_paths_breadth_first(
-        adjacency_lists, pair.root.address, pair.destination.address
-    ):
-        spec_path = [address.spec for address in path]
-        spec_paths.append(spec_path)
-
-    return SpecsPaths(paths=spec_paths)
-
-
-@rule("Get paths between root and multiple destinations.")
-async def get_paths_between_root_and_destinations(
-    pair: RootDestinationsPair,
-) -> SpecsPathsCollection:
-    spec_paths = await MultiGet(
-        Get(
-            SpecsPaths,
-            RootDestinationPair,
-            RootDestinationPair(destination=destination, root=pair.root),
+    return DependencyGraph(
+        FrozenDict(
+            (tgt.address, tuple(addresses))
+            for tgt, addresses in zip(transitive_targets.closure, adjacent_addresses_per_target)
         )
-        for destination in pair.destinations
     )
-    return SpecsPathsCollection(spec_paths=list(spec_paths))
 
 
 @goal_rule
@@ -165,6 +236,9 @@ async def paths(console: Console, paths_subsystem: PathsSubsystem) -> PathsGoal:
     if path_to is None:
         raise ValueError("Must set --to")
 
+    if paths_subsystem.max_ is not None and paths_subsystem.max_ < 1:
+        raise ValueError("--max must be a positive integer")
+
     specs_parser = SpecsParser()
 
     from_tgts, to_tgts = await MultiGet(
@@ -186,22 +260,28 @@ async def paths(console: Console, paths_subsystem: PathsSubsystem) -> PathsGoal:
         ),
     )
 
-    all_spec_paths = []
-    spec_paths = await MultiGet(
-        Get(
-            SpecsPathsCollection,
-            RootDestinationsPair,
-            RootDestinationsPair(root=root, destinations=to_tgts),
-        )
-        for root in from_tgts
+    graphs = await MultiGet(
+        Get(DependencyGraph, DependencyGraphRequest(root.address)) for root in from_tgts
+    )
+    find_paths = (
+        find_shortest_path_bidirectional
+        if paths_subsystem.shortest_only
+        else find_paths_breadth_first
     )
-
-    for spec_path in spec_paths:
-        for path in (p.paths for p in spec_path.spec_paths):
-            all_spec_paths.extend(path)
 
     with paths_subsystem.output(console) as write_stdout:
-        write_stdout(json.dumps(all_spec_paths, indent=2) + "\n")
+        # Write each path as soon as it is found, formatted as if the whole list of paths had been
+        # passed to `json.dumps(..., indent=2)`.
+        write_stdout("[")
+        found_any = False
+        for root, graph in zip(from_tgts, graphs):
+            for destination in to_tgts:
+                found_paths = find_paths(graph.adjacency_lists, root.address, destination.address)
+                for path in itertools.islice(found_paths, paths_subsystem.max_):
+                    spec_path = json.dumps([address.spec for address in path], indent=2)
+                    write_stdout(("," if found_any else "") + "\n" + indent(spec_path, "  "))
+                    found_any = True
+        write_stdout("\n]\n" if found_any else "]\n")
 
     return PathsGoal(exit_code=0)
 
@@ -9,11 +9,16 @@ from typing import ClassVar, List
 
 import pytest
 
-from pants.backend.project_info.paths import PathsGoal
+from pants.backend.project_info.paths import (
+    PathsGoal,
+    find_paths_breadth_first,
+    find_shortest_path_bidirectional,
+)
 from pants.backend.project_info.paths import rules as paths_rules
 from pants.backend.python.macros import python_requirements
 from pants.backend.python.macros.python_requirements import PythonRequirementsTargetGenerator
 from pants.backend.python.target_types import PexBinary
+from pants.engine.addresses import Address
 from pants.engine.internals.scheduler import ExecutionError
 from pants.engine.target import Dependencies, OptionalSingleSourceField, Target
 from pants.testutil.rule_runner import RuleRunner
@@ -87,18 +92,22 @@ def assert_paths(
     path_from: str,
     path_to: str,
     expected: List[List[str]] | None = None,
-) -> None:
+    extra_args: List[str] | None = None,
+) -> List[List[str]]:
     args = []
     if path_from:
         args += [f"--paths-from={path_from}"]
     if path_to:
         args += [f"--paths-to={path_to}"]
+    args += extra_args or []
 
     result = rule_runner.run_goal_rule(PathsGoal, args=[*args])
 
+    paths = json.loads(result.stdout)
     if expected is not None:
-        print(sorted(json.loads(result.stdout)))
-        assert sorted(json.loads(result.stdout)) == sorted(expected)
+        print(sorted(paths))
+        assert sorted(paths) == sorted(expected)
+    return paths
 
 
 def test_no_from(rule_runner: RuleRunner) -> None:
@@ -204,3 +213,67 @@ def test_excluded_paths(rule_runner: RuleRunner) -> None:
         path_to="src/prj/b",
         expected=[],
     )
+
+
+def test_max_paths(rule_runner: RuleRunner) -> None:
+    paths = assert_paths(
+        rule_runner, path_from="leaf:leaf", path_to="base:base", extra_args=["--paths-max=1"]
+    )
+    assert len(paths) == 1
+    assert paths[0] in (
+        ["leaf:leaf", "intermediate:intermediate", "base:base"],
+        ["leaf:leaf", "intermediate2:intermediate2", "base:base"],
+    )
+
+    # The limit applies to each pair of start and end targets.
+    assert_paths(
+        rule_runner,
+        path_from="leaf::",
+        path_to="base:base",
+        extra_args=["--paths-max=1"],
+        expected=[
+            ["leaf/subdir:subdir", "base:base"],
+            paths[0],
+        ],
+    )
+
+    with pytest.raises(ExecutionError):
+        assert_paths(
+            rule_runner, path_from="leaf:leaf", path_to="base:base", extra_args=["--paths-max=0"]
+        )
+
+
+def test_shortest_only(rule_runner: RuleRunner) -> None:
+    assert_paths(
+        rule_runner,
+        path_from="leaf/subdir:subdir",
+        path_to="base::",
+        extra_args=["--paths-shortest-only"],
+        expected=[
+            ["leaf/subdir:subdir", "base/subdir:subdir"],
+            ["leaf/subdir:subdir", "base:base"],
+        ],
+    )
+    assert_paths(
+        rule_runner,
+        path_from="src/prj/a",
+        path_to="src/prj/b",
+        extra_args=["--paths-shortest-only"],
+        expected=[],
+    )
+
+
+def test_find_paths() -> None:
+    a, b, c, d, e = (Address("", target_name=name) for name in "abcde")
+    adjacency_lists = {
+        a: (b, c),
+        b: (d,),
+        c: (b, e),
+        d: (a, e),
+    }
+
+    assert list(find_paths_breadth_first(adjacency_lists, a, e)) == [[a, c, e], [a, b, d, e]]
+    assert list(find_shortest_path_bidirectional(adjacency_lists, a, e)) == [[a, c, e]]
+    assert list(find_shortest_path_bidirectional(adjacency_lists, d, c)) == [[d, a, c]]
+    assert list(find_shortest_path_bidirectional(adjacency_lists, a, a)) == [[a]]
+    assert list(find_shortest_path_bidirectional(adjacency_lists, e, a)) == []
@@ -9,10 +9,10 @@ import itertools
 import logging
 import os
 from collections import defaultdict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import total_ordering
 from pathlib import PurePath
-from typing import DefaultDict, Iterable, Mapping, Tuple
+from typing import DefaultDict, Iterable, Mapping, Sequence, Tuple
 
 from packaging.utils import canonicalize_name as canonicalize_project_name
 
@@ -37,7 +37,7 @@ from pants.engine.environment import EnvironmentName
 from pants.engine.rules import Get, MultiGet, collect_rules, rule
 from pants.engine.target import AllTargets, Target
 from pants.engine.unions import UnionMembership, UnionRule, union
-from pants.util.frozendict import FrozenDict
+from pants.util.frozendict import FrozenDict, LargeFrozenDict
 from pants.util.logging import LogLevel
 from pants.util.strutil import softwrap
 
@@ -122,7 +122,7 @@ class FirstPartyPythonMappingImpl(
         return FirstPartyPythonMappingImpl(
             (
                 resolve,
-                FrozenDict(
+                LargeFrozenDict(
                     (mod, tuple(sorted(providers))) for mod, providers in sorted(mapping.items())
                 ),
             )
@@ -220,7 +220,7 @@ async def merge_first_party_module_mappings(
         FrozenDict(
             (
                 resolve,
-                FrozenDict(
+                LargeFrozenDict(
                     (mod, tuple(sorted(providers))) for mod, providers in sorted(mapping.items())
                 ),
             )
@@ -400,7 +400,7 @@ async def map_third_party_modules_to_addresses(
         FrozenDict(
             (
                 resolve,
-                FrozenDict(
+                LargeFrozenDict(
                     (mod, tuple(sorted(providers))) for mod, providers in sorted(mapping.items())
                 ),
             )
@@ -409,6 +409,156 @@ async def map_third_party_modules_to_addresses(
     )
 
 
+# -----------------------------------------------------------------------------------------------
+# Module ownership trie
+# -----------------------------------------------------------------------------------------------
+
+
+class _ModuleTrieNode:
+    __slots__ = ("children", "third_party", "first_party")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _ModuleTrieNode] = {}
+        self.third_party: tuple[ModuleProvider, ...] = ()
+        self.first_party: tuple[ModuleProvider, ...] = ()
+
+
+def _build_module_trie(
+    resolves_to_modules_to_providers: Mapping[
+        ResolveName, Mapping[str, Tuple[ModuleProvider, ...]]
+    ],
+    roots: dict[ResolveName, _ModuleTrieNode],
+    attr: str,
+) -> None:
+    for resolve, modules_to_providers in resolves_to_modules_to_providers.items():
+        root = roots.setdefault(resolve, _ModuleTrieNode())
+        for module, providers in modules_to_providers.items():
+            node = root
+            for part in module.split("."):
+                child = node.children.get(part)
+                if child is None:
+                    child = node.children[part] = _ModuleTrieNode()
+                node = child
+            setattr(node, attr, providers)
+
+
+@dataclass(frozen=True)
+class PythonModuleOwnershipTrie:
+    """The first-party and third-party module mappings, merged into a trie per resolve.
+
+    Each lookup walks the components of the module once, rather than probing each mapping for the
+    module and then for each of its ancestors. The results are identical to those of
+    `ThirdPartyPythonModuleMapping.providers_for_module()` followed by
+    `FirstPartyPythonModuleMapping.providers_for_module()`.
+    """
+
+    first_party_mapping: FirstPartyPythonModuleMapping
+    third_party_mapping: ThirdPartyPythonModuleMapping
+    _roots: dict[ResolveName, _ModuleTrieNode] = field(
+        init=False, compare=False, hash=False, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        roots: dict[ResolveName, _ModuleTrieNode] = {}
+        _build_module_trie(
+            self.third_party_mapping.resolves_to_modules_to_providers, roots, "third_party"
+        )
+        _build_module_trie(
+            self.first_party_mapping.resolves_to_modules_to_providers, roots, "first_party"
+        )
+        object.__setattr__(self, "_roots", roots)
+
+    @staticmethod
+    def _providers_for_resolve(
+        root: _ModuleTrieNode, parts: Sequence[str]
+    ) -> tuple[tuple[PossibleModuleProvider, ...], tuple[PossibleModuleProvider, ...]]:
+        # Find the deepest node along the module's path, and the closest ancestor (or the module
+        # itself) with third-party providers.
+        node = root
+        parent = None
+        depth = 0
+        third_party: tuple[ModuleProvider, ...] = ()
+        third_party_depth = 0
+        for part in parts:
+            child = node.children.get(part)
+            if child is None:
+                break
+            parent, node = node, child
+            depth += 1
+            if child.third_party:
+                third_party = child.third_party
+                third_party_depth = depth
+
+        third_party_result = tuple(
+            PossibleModuleProvider(provider, len(parts) - third_party_depth)
+            for provider in third_party
+        )
+
+        # First-party providers are only considered for the module itself or its direct parent.
+        # See `FirstPartyPythonModuleMapping._providers_for_resolve()`.
+        first_party: tuple[ModuleProvider, ...] = ()
+        ancestry = 0
+        if depth == len(parts) and node.first_party:
+            first_party = node.first_party
+        elif len(parts) > 1:
+            ancestor = node if depth == len(parts) - 1 else parent
+            if depth >= len(parts) - 1 and ancestor is not None:
+                first_party = ancestor.first_party
+                ancestry = 1
+        first_party_result = tuple(
+            PossibleModuleProvider(provider, ancestry) for provider in first_party
+        )
+        return third_party_result, first_party_result
+
+    def providers_for_module(
+        self, module: str, resolve: str | None
+    ) -> tuple[PossibleModuleProvider, ...]:
+        """Find all third-party and then first-party providers for the module.
+
+        If `resolve` is None, will not consider resolves. Otherwise, providers can only come from
+        targets with the resolve.
+        """
+        parts = module.split(".")
+        if resolve:
+            root = self._roots.get(resolve)
+            if root is None:
+                return ()
+            third_party, first_party = self._providers_for_resolve(root, parts)
+            return (*third_party, *first_party)
+
+        results = {
+            resolve: self._providers_for_resolve(root, parts)
+            for resolve, root in self._roots.items()
+        }
+        return (
+            *itertools.chain.from_iterable(
+                results[resolve][0]
+                for resolve in self.third_party_mapping.resolves_to_modules_to_providers
+            ),
+            *itertools.chain.from_iterable(
+                results[resolve][1]
+                for resolve in self.first_party_mapping.resolves_to_modules_to_providers
+            ),
+        )
+
+    def owners_for_modules(
+        self, modules: Iterable[str], resolve: str | None, locality: str | None = None
+    ) -> dict[str, PythonModuleOwners]:
+        """Find the owners of each of the modules, as `map_module_to_address` would."""
+        return {
+            module: _owners_for_providers(self.providers_for_module(module, resolve), locality)
+            for module in modules
+        }
+
+
+@rule(desc="Creating trie of Python module owners", level=LogLevel.DEBUG)
+async def build_python_module_ownership_trie(
+    first_party_mapping: FirstPartyPythonModuleMapping,
+    third_party_mapping: ThirdPartyPythonModuleMapping,
+) -> PythonModuleOwnershipTrie:
+    return PythonModuleOwnershipTrie(first_party_mapping, third_party_mapping)
+
+
 # -----------------------------------------------------------------------------------------------
 # module -> owners
 # -----------------------------------------------------------------------------------------------
@@ -449,17 +599,22 @@ class PythonModuleOwnersRequest:
     locality: str | None = None
 
 
-@rule
-async def map_module_to_address(
-    request: PythonModuleOwnersRequest,
-    first_party_mapping: FirstPartyPythonModuleMapping,
-    third_party_mapping: ThirdPartyPythonModuleMapping,
-) -> PythonModuleOwners:
-    possible_providers: tuple[PossibleModuleProvider, ...] = (
-        *third_party_mapping.providers_for_module(request.module, resolve=request.resolve),
-        *first_party_mapping.providers_for_module(request.module, resolve=request.resolve),
-    )
+@dataclass(frozen=True)
+class PythonModuleOwnersBatchRequest:
+    """Find the owners of many modules at once, as `PythonModuleOwnersRequest` would for each."""
+
+    modules: tuple[str, ...]
+    resolve: str | None
+    locality: str | None = None
 
+
+class PythonModuleOwnersBatch(FrozenDict[str, PythonModuleOwners]):
+    """The owners of each module in a `PythonModuleOwnersBatchRequest`."""
+
+
+def _owners_for_providers(
+    possible_providers: Iterable[PossibleModuleProvider], locality: str | None
+) -> PythonModuleOwners:
     # We first attempt to disambiguate conflicting providers by taking - for each provider type -
     # the providers of the closest ancestors to the requested modules.
     # E.g., if we have a provider for foo.bar and for foo.bar.baz, prefer the latter.
@@ -479,7 +634,7 @@ async def map_module_to_address(
         if possible_provider.ancestry == val[0]:
             val[1].append(possible_provider.provider)
 
-    if request.locality:
+    if locality:
         # For each provider type, if we have more than one provider left, prefer
         # the one with the closest common ancestor to the requester.
         for val in type_to_closest_providers.values():
@@ -489,9 +644,7 @@ async def map_module_to_address(
             providers_with_closest_common_ancestor: list[ModuleProvider] = []
             closest_common_ancestor_len = 0
             for provider in providers:
-                common_ancestor_len = len(
-                    os.path.commonpath([request.locality, provider.addr.spec_path])
-                )
+                common_ancestor_len = len(os.path.commonpath([locality, provider.addr.spec_path]))
                 if common_ancestor_len > closest_common_ancestor_len:
                     closest_common_ancestor_len = common_ancestor_len
                     providers_with_closest_common_ancestor = []
@@ -511,6 +664,24 @@ async def map_module_to_address(
     return PythonModuleOwners(addresses)
 
 
+@rule
+async def map_module_to_address(
+    request: PythonModuleOwnersRequest, trie: PythonModuleOwnershipTrie
+) -> PythonModuleOwners:
+    return _owners_for_providers(
+        trie.providers_for_module(request.module, resolve=request.resolve), request.locality
+    )
+
+
+@rule
+async def map_modules_to_addresses(
+    request: PythonModuleOwnersBatchRequest, trie: PythonModuleOwnershipTrie
+) -> PythonModuleOwnersBatch:
+    return PythonModuleOwnersBatch(
+        trie.owners_for_modules(request.modules, request.resolve, request.locality)
+    )
+
+
 def rules():
     return (
         *collect_rules(),
@@ -33,6 +33,9 @@ from pants.backend.python.dependency_inference.module_mapper import (
     ModuleProviderType,
     PossibleModuleProvider,
     PythonModuleOwners,
+    PythonModuleOwnersBatch,
+    PythonModuleOwnersBatchRequest,
+    PythonModuleOwnershipTrie,
     PythonModuleOwnersRequest,
     ThirdPartyPythonModuleMapping,
     generate_mappings_from_pattern,
@@ -256,6 +259,65 @@ def test_third_party_modules_mapping() -> None:
     assert_addresses("two_resolves", (pants_provider0,), resolve="another-resolve")
 
 
+def test_module_ownership_trie() -> None:
+    stub_provider = ModuleProvider(Address("", target_name="stubs"), ModuleProviderType.TYPE_STUB)
+    req_provider = ModuleProvider(Address("", target_name="req"), ModuleProviderType.IMPL)
+    other_req_provider = ModuleProvider(Address("", target_name="other"), ModuleProviderType.IMPL)
+    app_provider = ModuleProvider(
+        Address("src/ns", relative_file_path="app.py"), ModuleProviderType.IMPL
+    )
+    util_provider = ModuleProvider(
+        Address("src/ns/app", relative_file_path="util.py"), ModuleProviderType.IMPL
+    )
+    first_party = FirstPartyPythonModuleMapping(
+        FrozenDict(
+            {
+                "a": FrozenDict({"ns.app": (app_provider,), "ns.app.util": (util_provider,)}),
+                "b": FrozenDict({"req": (util_provider,)}),
+            }
+        )
+    )
+    third_party = ThirdPartyPythonModuleMapping(
+        FrozenDict(
+            {
+                "a": FrozenDict({"ns": (req_provider, stub_provider), "req": (req_provider,)}),
+                "c": FrozenDict({"req.sub": (other_req_provider,)}),
+            }
+        )
+    )
+    trie = PythonModuleOwnershipTrie(first_party, third_party)
+
+    # The trie must agree with the mappings it was built from.
+    for module in (
+        "ns",
+        "ns.app",
+        "ns.app.App",
+        "ns.app.util",
+        "ns.app.util.func",
+        "ns.app.util.func.attr",
+        "ns.other",
+        "req",
+        "req.sub",
+        "req.sub.Class",
+        "unknown",
+        "unknown.ns",
+    ):
+        for resolve in ("a", "b", "c", "missing", None):
+            assert trie.providers_for_module(module, resolve) == (
+                *third_party.providers_for_module(module, resolve),
+                *first_party.providers_for_module(module, resolve),
+            )
+
+    assert trie.owners_for_modules(["ns.app.App", "req.sub", "unknown"], "a") == {
+        "ns.app.App": PythonModuleOwners((app_provider.addr, stub_provider.addr)),
+        "req.sub": PythonModuleOwners((req_provider.addr,)),
+        "unknown": PythonModuleOwners(()),
+    }
+    assert trie.owners_for_modules(["req.sub"], None) == {
+        "req.sub": PythonModuleOwners((), ambiguous=(req_provider.addr, other_req_provider.addr)),
+    }
+
+
 @pytest.fixture
 def rule_runner() -> RuleRunner:
     return RuleRunner(
@@ -269,6 +331,7 @@ def rule_runner() -> RuleRunner:
             QueryRule(FirstPartyPythonModuleMapping, []),
             QueryRule(ThirdPartyPythonModuleMapping, []),
             QueryRule(PythonModuleOwners, [PythonModuleOwnersRequest]),
+            QueryRule(PythonModuleOwnersBatch, [PythonModuleOwnersBatchRequest]),
         ],
         target_types=[
             PythonSourceTarget,
@@ -927,6 +990,17 @@ def test_map_module_considers_resolves(rule_runner: RuleRunner) -> None:
         Address("", target_name="dep2"),
     )
 
+    batch = rule_runner.request(
+        PythonModuleOwnersBatch, [PythonModuleOwnersBatchRequest(("dep", "dep.sub", "other"), "a")]
+    )
+    assert batch == PythonModuleOwnersBatch(
+        {
+            "dep": PythonModuleOwners((Address("", target_name="dep1"),)),
+            "dep.sub": PythonModuleOwners((Address("", target_name="dep1"),)),
+            "other": PythonModuleOwners(()),
+        }
+    )
+
 
 def test_issue_15111(rule_runner: RuleRunner) -> None:
     """Ensure we can handle when a single address provides multiple modules.
@@ -10,11 +10,13 @@ import pytest
 from pants.backend.python.dependency_inference import parse_python_dependencies
 from pants.backend.python.dependency_inference.parse_python_dependencies import (
     ParsedPythonDependencies,
+    ParsedPythonDependenciesBatch,
 )
 from pants.backend.python.dependency_inference.parse_python_dependencies import (
     ParsedPythonImportInfo as ImpInfo,
 )
 from pants.backend.python.dependency_inference.parse_python_dependencies import (
+    ParsePythonDependenciesBatchRequest,
     ParsePythonDependenciesRequest,
 )
 from pants.backend.python.target_types import PythonSourceField, PythonSourceTarget
@@ -37,6 +39,7 @@ def rule_runner() -> RuleRunner:
             *stripped_source_files.rules(),
             *pex.rules(),
             QueryRule(ParsedPythonDependencies, [ParsePythonDependenciesRequest]),
+            QueryRule(ParsedPythonDependenciesBatch, [ParsePythonDependenciesBatchRequest]),
         ],
         target_types=[PythonSourceTarget],
     )
@@ -434,6 +437,35 @@ def test_gracefully_handle_syntax_errors(rule_runner: RuleRunner) -> None:
     assert_deps_parsed(rule_runner, "x =", expected_imports={})
 
 
+def test_unparseable_sibling(rule_runner: RuleRunner) -> None:
+    # Files in the same directory are parsed in a batch, which must not fail because of them.
+    rule_runner.write_files({"project/bad.py": b"\xff\xfe"})
+    assert_deps_parsed(
+        rule_runner, "import foo", expected_imports={"foo": ImpInfo(lineno=1, weak=False)}
+    )
+
+
+def test_parse_batch(rule_runner: RuleRunner) -> None:
+    rule_runner.set_options(["--python-infer-assets", "--python-infer-use-rust-parser"])
+    digest = rule_runner.make_snapshot(
+        {
+            "pkg/a.py": "import os\nfrom . import b\n",
+            "pkg/b.py": "from .a import c\nx = 'data/b.json'\n",
+            "pkg/bad.py": b"\xff\xfe",
+        }
+    ).digest
+    result = rule_runner.request(
+        ParsedPythonDependenciesBatch, [ParsePythonDependenciesBatchRequest(digest)]
+    )
+    assert set(result) == {"pkg/a.py", "pkg/b.py"}
+    assert dict(result["pkg/a.py"].imports) == {
+        "os": ImpInfo(lineno=1, weak=False),
+        "pkg.b": ImpInfo(lineno=2, weak=False),
+    }
+    assert dict(result["pkg/b.py"].imports) == {"pkg.a.c": ImpInfo(lineno=1, weak=False)}
+    assert list(result["pkg/b.py"].assets) == ["data/b.json"]
+
+
 def test_handle_unicode(rule_runner: RuleRunner) -> None:
     assert_deps_parsed(rule_runner, "x = 'äbç'", expected_imports={})
 
@@ -16,6 +16,8 @@ from pants.backend.python.dependency_inference.default_unowned_dependencies impo
 )
 from pants.backend.python.dependency_inference.module_mapper import (
     PythonModuleOwners,
+    PythonModuleOwnersBatch,
+    PythonModuleOwnersBatchRequest,
     PythonModuleOwnersRequest,
     ResolveName,
 )
@@ -412,13 +414,13 @@ async def resolve_parsed_dependencies(
         locality = source_root.path
 
     if parsed_imports:
-        owners_per_import = await MultiGet(
-            Get(
-                PythonModuleOwners,
-                PythonModuleOwnersRequest(imported_module, request.resolve, locality),
-            )
-            for imported_module in parsed_imports
+        owners_by_import = await Get(
+            PythonModuleOwnersBatch,
+            PythonModuleOwnersBatchRequest(tuple(parsed_imports), request.resolve, locality),
         )
+        owners_per_import = [
+            owners_by_import[imported_module] for imported_module in parsed_imports
+        ]
         resolve_results = _get_imports_info(
             address=request.field_set.address,
             owners_per_import=owners_per_import,
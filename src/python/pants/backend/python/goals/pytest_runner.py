@@ -8,7 +8,7 @@ import re
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import Optional, Tuple
+from typing import Iterable, Mapping, Optional, Tuple
 
 from packaging.utils import canonicalize_name as canonicalize_project_name
 
@@ -45,12 +45,15 @@ from pants.core.goals.test import (
     BuildPackageDependenciesRequest,
     BuiltPackageDependencies,
     RuntimePackageDependenciesField,
+    TestBatching,
     TestDebugAdapterRequest,
     TestDebugRequest,
+    TestDurations,
     TestExtraEnv,
     TestRequest,
     TestResult,
     TestSubsystem,
+    load_test_durations,
 )
 from pants.core.subsystems.debug_adapter import DebugAdapterSubsystem
 from pants.core.util_rules.config_files import ConfigFiles, ConfigFilesRequest
@@ -67,6 +70,7 @@ from pants.engine.fs import (
     DigestContents,
     DigestSubset,
     Directory,
+    FileContent,
     MergeDigests,
     PathGlobs,
     RemovePrefix,
@@ -89,11 +93,13 @@ from pants.engine.target import (
 )
 from pants.engine.unions import UnionMembership, UnionRule, union
 from pants.option.global_options import GlobalOptions
+from pants.util.collections import partition_by_weight_target
 from pants.util.docutil import doc_url
 from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
 from pants.util.ordered_set import OrderedSet
 from pants.util.pip_requirement import PipRequirement
+from pants.util.resources import read_resource
 from pants.util.strutil import softwrap
 
 logger = logging.getLogger()
@@ -218,12 +224,42 @@ class TestSetup:
 
 
 _TEST_PATTERN = re.compile(b"def\\s+test_")
+_PYTEST_WORKER_SCRIPT = "__pants_pytest_worker.py"
 
 
 def _count_pytest_tests(contents: DigestContents) -> int:
     return sum(len(_TEST_PATTERN.findall(file.content)) for file in contents)
 
 
+def _estimate_test_runtimes(
+    field_sets: Iterable[PythonTestFieldSet],
+    test_counts: Mapping[str, int],
+    durations: TestDurations,
+) -> dict[Address, float]:
+    """Estimate the runtime of each test file.
+
+    Files with a recorded duration use it. Other files are assumed to take as long per test as the
+    files with recorded durations do on average.
+    """
+    field_sets = tuple(field_sets)
+    recorded_secs = 0.0
+    recorded_tests = 0
+    for field_set in field_sets:
+        secs = durations.durations.get(field_set.address.spec)
+        if secs is not None:
+            recorded_secs += secs
+            recorded_tests += test_counts.get(field_set.source.file_path, 0)
+    secs_per_test = recorded_secs / recorded_tests if recorded_tests else durations.default
+
+    return {
+        field_set.address: durations.durations.get(
+            field_set.address.spec,
+            max(1, test_counts.get(field_set.source.file_path, 0)) * secs_per_test,
+        )
+        for field_set in field_sets
+    }
+
+
 async def validate_pytest_cov_included(_pytest: PyTest):
     if _pytest.requirements:
         # We'll only be using this subset of the lockfile.
@@ -279,6 +315,21 @@ async def setup_pytest_for_target(
     # Ensure that the empty extra output dir exists.
     extra_output_directory_digest_get = Get(Digest, CreateDigest([Directory(_EXTRA_OUTPUT_DIR)]))
 
+    use_persistent_worker = pytest.experimental_persistent_workers and not request.is_debug
+    worker_script_digest_get = Get(
+        Digest,
+        CreateDigest(
+            [
+                FileContent(
+                    _PYTEST_WORKER_SCRIPT,
+                    read_resource(__name__, "scripts/pytest_worker.py"),
+                )
+            ]
+            if use_persistent_worker
+            else []
+        ),
+    )
+
     prepared_sources_get = Get(
         PythonSourceFiles, PythonSourceFilesRequest(all_targets, include_files=True)
     )
@@ -300,6 +351,7 @@ async def setup_pytest_for_target(
         field_set_source_files,
         field_set_extra_env,
         extra_output_directory_digest,
+        worker_script_digest,
     ) = await MultiGet(
         pytest_pex_get,
         requirements_pex_get,
@@ -307,6 +359,7 @@ async def setup_pytest_for_target(
         field_set_source_files_get,
         field_set_extra_env_get,
         extra_output_directory_digest_get,
+        worker_script_digest_get,
     )
 
     local_dists = await Get(
@@ -356,6 +409,7 @@ async def setup_pytest_for_target(
                 local_dists.remaining_sources.source_files.snapshot.digest,
                 pytest_config_digest,
                 extra_output_directory_digest,
+                worker_script_digest,
                 *(plugin_setup.digest for plugin_setup in plugin_setups),
             )
         ),
@@ -421,6 +475,18 @@ async def setup_pytest_for_target(
         **field_set_extra_env,
     }
 
+    worker_argv: tuple[str, ...] = ()
+    if use_persistent_worker:
+        # Run the worker script with the interpreter of the venv, rather than running Pytest.
+        extra_env["PEX_INTERPRETER"] = "1"
+        worker_argv = (
+            _PYTEST_WORKER_SCRIPT,
+            "--idle-timeout",
+            str(pytest.persistent_worker_idle_timeout),
+            *(arg for module in pytest.persistent_worker_preload for arg in ("--preload", module)),
+            "--",
+        )
+
     # Cache test runs only if they are successful, or not at all if `--test-force`.
     cache_scope = (
         ProcessCacheScope.PER_SESSION if test_subsystem.force else ProcessCacheScope.SUCCESSFUL
@@ -451,6 +517,7 @@ async def setup_pytest_for_target(
         VenvPexProcess(
             pytest_runner_pex,
             argv=(
+                *worker_argv,
                 *request.prepend_argv,
                 *pytest.args,
                 *(("-c", pytest.config) if pytest.config else ()),
@@ -487,6 +554,7 @@ class PyTestRequest(TestRequest):
 async def partition_python_tests(
     request: PyTestRequest.PartitionRequest[PythonTestFieldSet],
     python_setup: PythonSetup,
+    test_subsystem: TestSubsystem,
 ) -> Partitions[PythonTestFieldSet, TestMetadata]:
     partitions = []
     compatible_tests = defaultdict(list)
@@ -510,8 +578,39 @@ async def partition_python_tests(
             # Group tests by their common metadata.
             compatible_tests[metadata].append(field_set)
 
+    if test_subsystem.batching != TestBatching.RUNTIME:
+        for metadata, field_sets in compatible_tests.items():
+            partitions.append(Partition(tuple(field_sets), metadata))
+        return Partitions(partitions)
+
+    # Size batches of compatible tests by their expected runtime, so that large partitions of slow
+    # tests are split, and small fast test files share the cost of setting up a test process.
+    batchable_field_sets = [
+        field_set for field_sets in compatible_tests.values() for field_set in field_sets
+    ]
+    durations, batchable_sources = await MultiGet(
+        Get(TestDurations),
+        Get(
+            SourceFiles,
+            SourceFilesRequest(field_set.source for field_set in batchable_field_sets),
+        ),
+    )
+    contents = await Get(DigestContents, Digest, batchable_sources.snapshot.digest)
+    test_counts = {
+        file_content.path: _count_pytest_tests(DigestContents([file_content]))
+        for file_content in contents
+    }
+    expected_runtimes = _estimate_test_runtimes(batchable_field_sets, test_counts, durations)
+
     for metadata, field_sets in compatible_tests.items():
-        partitions.append(Partition(tuple(field_sets), metadata))
+        for batch in partition_by_weight_target(
+            field_sets,
+            key=lambda field_set: field_set.address.spec,
+            weight=lambda field_set: expected_runtimes[field_set.address],
+            weight_target=test_subsystem.batch_runtime_target,
+            size_max=2 * test_subsystem.batch_size,
+        ):
+            partitions.append(Partition(tuple(batch), metadata))
 
     return Partitions(partitions)
 
@@ -652,6 +751,7 @@ def rules():
     return [
         *collect_rules(),
         *pytest.rules(),
+        load_test_durations,
         UnionRule(PytestPluginSetupRequest, RuntimePackagesPluginRequest),
         *PyTestRequest.rules(),
     ]
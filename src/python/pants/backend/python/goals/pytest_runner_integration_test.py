@@ -359,6 +359,48 @@ def test_xdist_enabled_noninteractive(rule_runner: PythonRuleRunner) -> None:
     assert result.exit_code == 0
 
 
+def test_persistent_workers(rule_runner: PythonRuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            f"{PACKAGE}/test_leak.py": dedent(
+                """\
+                import json
+
+                def test_leak():
+                    json.leaked = True
+                """
+            ),
+            f"{PACKAGE}/test_isolated.py": dedent(
+                """\
+                import json
+
+                def test_isolated():
+                    assert not hasattr(json, "leaked")
+                """
+            ),
+            f"{PACKAGE}/test_failing.py": "def test_failing():\n    assert False\n",
+            f"{PACKAGE}/BUILD": "python_tests()",
+        }
+    )
+    extra_args = [
+        "--pytest-experimental-persistent-workers",
+        "--pytest-persistent-worker-preload=['json']",
+        "--pytest-persistent-worker-idle-timeout=10",
+    ]
+
+    def run(path: str) -> TestResult:
+        tgt = rule_runner.get_target(Address(PACKAGE, relative_file_path=path))
+        return run_pytest_noninteractive(rule_runner, tgt, extra_args=extra_args)
+
+    assert run("test_leak.py").exit_code == 0
+    # State modified by one batch is not visible to the next one, even though the module that it
+    # modified was preloaded by the worker.
+    result = run("test_isolated.py")
+    assert result.exit_code == 0
+    assert f"{PACKAGE}/test_isolated.py ." in result.stdout_simplified_str
+    assert run("test_failing.py").exit_code == 1
+
+
 def test_xdist_enabled_but_disabled_for_target(rule_runner: PythonRuleRunner) -> None:
     rule_runner.write_files(
         {
@@ -929,6 +971,35 @@ def test_partition(
     assert sorted_partitions == expected_partitions
 
 
+def test_partition_by_runtime(rule_runner: PythonRuleRunner) -> None:
+    _configure_pytest_runner(
+        rule_runner, extra_args=["--test-batching=runtime", "--test-batch-runtime-target=2.5"]
+    )
+    rule_runner.write_files(
+        {
+            f"{PACKAGE}/test_1.py": "def test_a(): pass\n",
+            f"{PACKAGE}/test_2.py": "def test_a(): pass\ndef test_b(): pass\n",
+            f"{PACKAGE}/test_3.py": "def test_a(): pass\ndef test_b(): pass\ndef test_c(): pass\n",
+            f"{PACKAGE}/BUILD": "python_tests(batch_compatibility_tag='default')",
+        }
+    )
+
+    field_sets = tuple(
+        PythonTestFieldSet.create(rule_runner.get_target(Address(PACKAGE, relative_file_path=path)))
+        for path in ("test_1.py", "test_2.py", "test_3.py")
+    )
+    partitions = rule_runner.request(
+        Partitions[PythonTestFieldSet, TestMetadata], [PyTestRequest.PartitionRequest(field_sets)]
+    )
+
+    # Without any recorded durations, each test is expected to take a second: files are combined
+    # until a batch reaches the target.
+    assert sorted(
+        sorted(field_set.address.spec for field_set in partition.elements)
+        for partition in partitions
+    ) == [[f"{PACKAGE}/test_1.py", f"{PACKAGE}/test_2.py"], [f"{PACKAGE}/test_3.py"]]
+
+
 @pytest.mark.platform_specific_behavior
 @pytest.mark.parametrize(
     "major_minor_interpreter",
@@ -0,0 +1,364 @@
+# Copyright 2024 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+# NB: This runs in the interpreter of the tests, so it must be compatible with Python 3.7+, and
+#  should import as little as possible: its startup time is paid by every batch of tests.
+"""Runs Pytest in a warm, persistent worker.
+
+Invoked as:
+
+    pytest_worker.py [--idle-timeout SECS] [--preload MODULE]... -- PYTEST_ARGS...
+
+this connects to (starting it if necessary) a long-lived server for the interpreter and venv that
+it is running in. The server has already imported Pytest and the preloaded modules, and forks a
+child for each run. The child adopts the working directory, environment, `sys.path` and standard
+streams of the client and then runs Pytest, so nothing is shared between runs except for the
+modules which were imported before forking.
+
+If the server cannot be reached, Pytest runs in this process instead.
+"""
+
+import array
+import fcntl
+import hashlib
+import json
+import os
+import socket
+import stat
+import struct
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import traceback
+
+_STARTUP_TIMEOUT_SECS = 60.0
+_DEFAULT_IDLE_TIMEOUT_SECS = 600
+_STD_FDS = (0, 1, 2)
+# The only variables which the server inherits from the client which starts it. The server imports
+# the preloaded modules in this environment and is shared by every client with the same socket key,
+# so it must not see the environment of a particular test run (e.g. `extra_env_vars`), which the
+# forked children adopt instead.
+_SERVER_ENV_VARS = (
+    "HOME",
+    "LANG",
+    "LANGUAGE",
+    "LC_ALL",
+    "LC_CTYPE",
+    "PATH",
+    "TMPDIR",
+)
+
+
+def _send_message(sock, message):
+    payload = json.dumps(message).encode("utf-8")
+    sock.sendall(struct.pack("!I", len(payload)) + payload)
+
+
+def _recv_exactly(sock, size):
+    chunks = []
+    while size:
+        chunk = sock.recv(size)
+        if not chunk:
+            raise EOFError("The connection was closed.")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def _recv_message(sock):
+    (size,) = struct.unpack("!I", _recv_exactly(sock, 4))
+    return json.loads(_recv_exactly(sock, size).decode("utf-8"))
+
+
+def _send_fds(sock, fds):
+    sock.sendmsg([b"\0"], [(socket.SOL_SOCKET, socket.SCM_RIGHTS, array.array("i", fds))])
+
+
+def _recv_fds(sock, count):
+    fds = array.array("i")
+    _, ancdata, _, _ = sock.recvmsg(1, socket.CMSG_LEN(count * fds.itemsize))
+    for level, kind, data in ancdata:
+        if level == socket.SOL_SOCKET and kind == socket.SCM_RIGHTS:
+            fds.frombytes(data[: len(data) - (len(data) % fds.itemsize)])
+    return list(fds)
+
+
+# -----------------------------------------------------------------------------------------
+# Server
+# -----------------------------------------------------------------------------------------
+
+
+def _run_child(conn):
+    """Run a single request in a freshly forked child of the server."""
+    try:
+        fds = _recv_fds(conn, len(_STD_FDS))
+        request = _recv_message(conn)
+    except (EOFError, OSError, ValueError):
+        return 1
+
+    for target_fd, fd in zip(_STD_FDS, fds):
+        os.dup2(fd, target_fd)
+        os.close(fd)
+    os.chdir(request["cwd"])
+    os.environ.clear()
+    os.environ.update(request["env"])
+    sys.path[:] = request["sys_path"]
+    sys.argv[:] = ["pytest", *request["args"]]
+    # Recompute the temporary directory from the environment of the request.
+    tempfile.tempdir = None
+
+    _send_message(conn, {"started": True})
+
+    def exit_when_client_goes_away():
+        # The client never sends anything else, so this only returns once it has exited (e.g.
+        # because it was killed due to a timeout).
+        try:
+            conn.recv(1)
+        finally:
+            os._exit(1)
+
+    threading.Thread(target=exit_when_client_goes_away, daemon=True).start()
+
+    try:
+        import pytest
+
+        exit_code = int(pytest.main(request["args"]))
+    except SystemExit as e:
+        exit_code = e.code if isinstance(e.code, int) else 1
+    except BaseException:
+        traceback.print_exc()
+        exit_code = 1
+    sys.stdout.flush()
+    sys.stderr.flush()
+    _send_message(conn, {"exit_code": exit_code})
+    return 0
+
+
+def _serve(socket_path, idle_timeout, preload):
+    import pytest  # noqa: F401
+
+    for module in preload:
+        try:
+            __import__(module)
+        except Exception:
+            # The tests which need the module will fail to import it with a useful error.
+            pass
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(socket_path)
+    server.listen(64)
+    server.settimeout(1.0)
+
+    children = set()
+    last_active = time.time()
+    try:
+        while True:
+            for pid in list(children):
+                try:
+                    reaped, _ = os.waitpid(pid, os.WNOHANG)
+                except ChildProcessError:
+                    reaped = pid
+                if reaped:
+                    children.discard(pid)
+            if children:
+                last_active = time.time()
+
+            try:
+                conn, _ = server.accept()
+            except socket.timeout:
+                if time.time() - last_active > idle_timeout:
+                    return
+                continue
+
+            pid = os.fork()
+            if pid == 0:
+                # The child must never return into the server loop.
+                exit_code = 1
+                try:
+                    server.close()
+                    exit_code = _run_child(conn)
+                finally:
+                    os._exit(exit_code)
+            conn.close()
+            children.add(pid)
+            last_active = time.time()
+    finally:
+        # Unlink before closing, so that new clients start a new server rather than connecting to
+        # this one while it shuts down.
+        os.unlink(socket_path)
+        server.close()
+
+
+# -----------------------------------------------------------------------------------------
+# Client
+# -----------------------------------------------------------------------------------------
+
+
+def _server_env():
+    return {k: os.environ[k] for k in _SERVER_ENV_VARS if k in os.environ}
+
+
+def _socket_path(idle_timeout, preload, server_env):
+    with open(__file__, "rb") as fp:
+        script_digest = hashlib.sha256(fp.read()).hexdigest()
+    key = json.dumps(
+        [
+            sys.executable,
+            sys.prefix,
+            sys.version,
+            idle_timeout,
+            preload,
+            sorted(server_env.items()),
+            script_digest,
+        ]
+    )
+    return os.path.join(
+        _workers_dir(), hashlib.sha256(key.encode("utf-8")).hexdigest()[:16] + ".sock"
+    )
+
+
+def _workers_dir():
+    """Returns the directory of the servers' sockets, scripts and locks.
+
+    Clients send their environment and stdio to the server of a socket and servers run the script
+    next to it, so the directory, which has a predictable name in the shared temporary directory,
+    must not be usable by any other user. Raises OSError if it is.
+    """
+    workers_dir = os.path.join(tempfile.gettempdir(), "pants-pytest-workers-%d" % os.getuid())
+    try:
+        os.mkdir(workers_dir, 0o700)
+    except FileExistsError:
+        pass
+    st = os.lstat(workers_dir)
+    if (
+        not stat.S_ISDIR(st.st_mode)
+        or st.st_uid != os.getuid()
+        or stat.S_IMODE(st.st_mode) != 0o700
+    ):
+        raise OSError(
+            "Not using persistent Pytest workers: %s must be a directory owned by the current "
+            "user with mode 0700." % workers_dir
+        )
+    return workers_dir
+
+
+def _connect(socket_path):
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path)
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def _start_server(socket_path, idle_timeout, preload, server_env):
+    # The server outlives the sandbox of this client, so it runs a copy of this script.
+    server_script = socket_path[: -len(".sock")] + ".py"
+    with open(__file__, "rb") as src, open(server_script + ".tmp", "wb") as dst:
+        dst.write(src.read())
+    os.replace(server_script + ".tmp", server_script)
+
+    server_argv = [sys.executable, server_script, "--serve", socket_path]
+    server_argv.extend(("--idle-timeout", str(idle_timeout)))
+    for module in preload:
+        server_argv.extend(("--preload", module))
+    subprocess.Popen(
+        server_argv,
+        cwd="/",
+        env=server_env,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        close_fds=True,
+        start_new_session=True,
+    )
+
+
+def _acquire_server(idle_timeout, preload):
+    server_env = _server_env()
+    socket_path = _socket_path(idle_timeout, preload, server_env)
+    sock = _connect(socket_path)
+    if sock is not None:
+        return sock
+
+    with open(socket_path[: -len(".sock")] + ".lock", "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        sock = _connect(socket_path)
+        if sock is not None:
+            return sock
+        if os.path.exists(socket_path):
+            # Left behind by a server which did not exit cleanly.
+            os.unlink(socket_path)
+        _start_server(socket_path, idle_timeout, preload, server_env)
+        deadline = time.time() + _STARTUP_TIMEOUT_SECS
+        while sock is None and time.time() < deadline:
+            time.sleep(0.05)
+            sock = _connect(socket_path)
+        return sock
+
+
+def _run_in_worker(sock, args):
+    """Returns the exit code of the run, or None if the worker did not start running it."""
+    env = dict(os.environ)
+    env.pop("PEX_INTERPRETER", None)
+    request = {
+        "cwd": os.getcwd(),
+        "env": env,
+        "sys_path": [os.path.abspath(entry) if entry else entry for entry in sys.path],
+        "args": args,
+    }
+    with sock:
+        try:
+            _send_fds(sock, _STD_FDS)
+            _send_message(sock, request)
+            _recv_message(sock)
+        except (EOFError, OSError):
+            return None
+        try:
+            return _recv_message(sock)["exit_code"]
+        except (EOFError, OSError):
+            sys.stderr.write("The persistent Pytest worker exited without a result.\n")
+            return 1
+
+
+def main(argv):
+    idle_timeout = _DEFAULT_IDLE_TIMEOUT_SECS
+    preload = []
+    serve = None
+    while argv and argv[0] != "--":
+        flag, value, argv = argv[0], argv[1], argv[2:]
+        if flag == "--idle-timeout":
+            idle_timeout = int(value)
+        elif flag == "--preload":
+            preload.append(value)
+        elif flag == "--serve":
+            serve = value
+        else:
+            raise ValueError("Unknown flag: %s" % flag)
+    args = argv[1:]
+
+    if serve is not None:
+        _serve(serve, idle_timeout, preload)
+        return 0
+
+    exit_code = None
+    if hasattr(os, "fork") and hasattr(socket, "AF_UNIX"):
+        try:
+            sock = _acquire_server(idle_timeout, preload)
+        except OSError as e:
+            sys.stderr.write("%s\n" % e)
+            sock = None
+        if sock is not None:
+            exit_code = _run_in_worker(sock, args)
+    if exit_code is None:
+        import pytest
+
+        exit_code = pytest.main(args)
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
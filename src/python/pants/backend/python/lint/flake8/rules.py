@@ -4,7 +4,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from typing import Tuple
+from typing import Iterable, Tuple
 
 from pants.backend.python.lint.flake8.subsystem import (
     Flake8,
@@ -16,7 +16,16 @@ from pants.backend.python.util_rules import pex
 from pants.backend.python.util_rules.interpreter_constraints import InterpreterConstraints
 from pants.backend.python.util_rules.pex import PexRequest, VenvPex, VenvPexProcess
 from pants.base.glob_match_error_behavior import GlobMatchErrorBehavior
-from pants.core.goals.lint import REPORT_DIR, LintResult, LintTargetsRequest, Partitions
+from pants.core.goals.lint import (
+    REPORT_DIR,
+    LintFileCache,
+    LintOutputSplitter,
+    LintResult,
+    LintTargetsRequest,
+    Partitions,
+    lint_file_cache_keys,
+    load_lint_file_cache,
+)
 from pants.core.util_rules.config_files import ConfigFiles, ConfigFilesRequest
 from pants.core.util_rules.partitions import Partition
 from pants.core.util_rules.source_files import SourceFiles, SourceFilesRequest
@@ -32,13 +41,17 @@ class Flake8Request(LintTargetsRequest):
     tool_subsystem = Flake8
 
 
-def generate_argv(source_files: SourceFiles, flake8: Flake8) -> Tuple[str, ...]:
+# Lines of `--count` and `--statistics` output, which summarize all files.
+_OUTPUT_SPLITTER = LintOutputSplitter(ignored=(r"\d+$", r"\d+\s+\w+\d+ "))
+
+
+def generate_argv(files: Iterable[str], flake8: Flake8) -> Tuple[str, ...]:
     args = []
     if flake8.config:
         args.append(f"--config={flake8.config}")
     args.append("--jobs={pants_concurrency}")
     args.extend(flake8.args)
-    args.extend(source_files.files)
+    args.extend(files)
     return tuple(args)
 
 
@@ -71,6 +84,7 @@ async def run_flake8(
     request: Flake8Request.Batch[Flake8FieldSet, InterpreterConstraints],
     flake8: Flake8,
     first_party_plugins: Flake8FirstPartyPlugins,
+    lint_file_cache: LintFileCache,
 ) -> LintResult:
     interpreter_constraints = request.partition_metadata
     flake8_pex_get = Get(
@@ -103,6 +117,25 @@ async def run_flake8(
         extra_files_get,
     )
 
+    files = source_files.files
+    lookup = None
+    if lint_file_cache.enabled:
+        file_cache_keys = await lint_file_cache_keys(
+            request,
+            source_files.snapshot.digest,
+            context=(
+                flake8_pex.digest.fingerprint,
+                first_party_plugins.sources_digest.fingerprint,
+                config_files.snapshot.digest.fingerprint,
+                extra_files.fingerprint,
+                *generate_argv((), flake8),
+            ),
+        )
+        lookup = lint_file_cache.lookup(Flake8Request.tool_id, file_cache_keys, _OUTPUT_SPLITTER)
+        files = lookup.files_to_run
+        if not files:
+            return lookup.result(request, None)
+
     input_digest = await Get(
         Digest,
         MergeDigests(
@@ -120,16 +153,18 @@ async def run_flake8(
         FallibleProcessResult,
         VenvPexProcess(
             flake8_pex,
-            argv=generate_argv(source_files, flake8),
+            argv=generate_argv(files, flake8),
             input_digest=input_digest,
             output_directories=(REPORT_DIR,),
             extra_env={"PEX_EXTRA_SYS_PATH": first_party_plugins.PREFIX},
-            concurrency_available=len(request.elements),
-            description=f"Run Flake8 on {pluralize(len(request.elements), 'file')}.",
+            concurrency_available=len(files),
+            description=f"Run Flake8 on {pluralize(len(files), 'file')}.",
             level=LogLevel.DEBUG,
         ),
     )
     report = await Get(Digest, RemovePrefix(result.output_digest, REPORT_DIR))
+    if lookup is not None:
+        return lookup.result(request, result, report=report)
     return LintResult.create(request, result, report=report)
 
 
@@ -138,4 +173,5 @@ def rules():
         *collect_rules(),
         *Flake8Request.rules(),
         *pex.rules(),
+        load_lint_file_cache,
     ]
@@ -3,6 +3,8 @@
 
 from __future__ import annotations
 
+import dataclasses
+import os
 from typing import Any
 
 import pytest
@@ -14,7 +16,7 @@ from pants.backend.python.lint.flake8.subsystem import Flake8FieldSet
 from pants.backend.python.lint.flake8.subsystem import rules as flake8_subsystem_rules
 from pants.backend.python.target_types import PythonSourcesGeneratorTarget
 from pants.backend.python.util_rules import python_sources
-from pants.core.goals.lint import LintResult, Partitions
+from pants.core.goals.lint import LintFileCache, LintResult, Partitions
 from pants.core.util_rules import config_files
 from pants.engine.addresses import Address
 from pants.engine.fs import EMPTY_DIGEST, DigestContents
@@ -116,6 +118,38 @@ def test_multiple_targets(rule_runner: PythonRuleRunner) -> None:
     assert "bad.py:1:1: F401" in result[0].stdout
 
 
+def test_per_file_caching(rule_runner: PythonRuleRunner) -> None:
+    rule_runner.write_files(
+        {"good.py": GOOD_FILE, "bad.py": BAD_FILE, "BUILD": "python_sources(name='t')"}
+    )
+    tgts = [
+        rule_runner.get_target(Address("", target_name="t", relative_file_path="good.py")),
+        rule_runner.get_target(Address("", target_name="t", relative_file_path="bad.py")),
+    ]
+    result = run_flake8(rule_runner, tgts, extra_args=["--lint-per-file-caching"])
+    assert len(result) == 1
+    assert result[0].exit_code == 1
+    assert sorted(r.exit_code for r in result[0].file_results.values()) == [0, 1]
+
+    # Record the results as the `lint` goal would, and mark the bad file's result so that it is
+    # possible to tell that it was replayed rather than recomputed.
+    cache = LintFileCache(os.path.join(rule_runner.pants_workdir, "lint", "file_results"))
+    cache.save(
+        Flake8Request.tool_id,
+        {
+            key: dataclasses.replace(r, output=r.output.replace("F401", "REPLAYED"))
+            for key, r in result[0].file_results.items()
+        },
+    )
+
+    rule_runner.write_files({"good.py": BAD_FILE})
+    result = run_flake8(rule_runner, tgts, extra_args=["--lint-per-file-caching"])
+    assert len(result) == 1
+    assert result[0].exit_code == 1
+    assert "good.py:1:1: F401" in result[0].stdout
+    assert "bad.py:1:1: REPLAYED" in result[0].stdout
+
+
 @pytest.mark.parametrize(
     "config_path,extra_args",
     ([".flake8", []], ["custom_config.ini", ["--flake8-config=custom_config.ini"]]),
@@ -4,7 +4,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Tuple
+from typing import Iterable, Tuple
 
 import packaging
 
@@ -33,7 +33,16 @@ from pants.backend.python.util_rules.python_sources import (
     PythonSourceFiles,
     PythonSourceFilesRequest,
 )
-from pants.core.goals.lint import REPORT_DIR, LintResult, LintTargetsRequest, Partitions
+from pants.core.goals.lint import (
+    REPORT_DIR,
+    LintFileCache,
+    LintOutputSplitter,
+    LintResult,
+    LintTargetsRequest,
+    Partitions,
+    lint_file_cache_keys,
+    load_lint_file_cache,
+)
 from pants.core.util_rules.config_files import ConfigFiles, ConfigFilesRequest
 from pants.core.util_rules.partitions import Partition
 from pants.engine.fs import CreateDigest, Digest, Directory, MergeDigests, RemovePrefix
@@ -62,13 +71,20 @@ class PylintRequest(LintTargetsRequest):
     tool_subsystem = Pylint
 
 
-def generate_argv(field_sets: tuple[PylintFieldSet, ...], pylint: Pylint) -> Tuple[str, ...]:
+# The default `text` output format precedes the messages for each file with a header naming its
+# module, and ends with a score for all of the files.
+_OUTPUT_SPLITTER = LintOutputSplitter(
+    ignored=(r"\*+ Module ", r"-+$", r"Your code has been rated at ")
+)
+
+
+def generate_argv(files: Iterable[str], pylint: Pylint) -> Tuple[str, ...]:
     args = []
     if pylint.config is not None:
         args.append(f"--rcfile={pylint.config}")
     args.append("--jobs={pants_concurrency}")
     args.extend(pylint.args)
-    args.extend(field_set.source.file_path for field_set in field_sets)
+    args.extend(files)
     return tuple(args)
 
 
@@ -120,6 +136,7 @@ async def run_pylint(
     pylint: Pylint,
     first_party_plugins: PylintFirstPartyPlugins,
     pex_environment: PexEnvironment,
+    lint_file_cache: LintFileCache,
 ) -> LintResult:
     assert request.partition_metadata is not None
 
@@ -205,6 +222,45 @@ async def run_pylint(
     if first_party_plugins:
         pythonpath.append(first_party_plugins.PREFIX)
 
+    files = tuple(field_set.source.file_path for field_set in request.elements)
+    lookup = None
+    if lint_file_cache.enabled:
+        # The result for each file also depends on the sources of its transitive dependencies.
+        closure_sources_per_field_set = await MultiGet(
+            Get(
+                PythonSourceFiles,
+                PythonSourceFilesRequest(
+                    tuple(
+                        CoarsenedTargets([all_coarsened_targets_by_address[fs.address]]).closure()
+                    )
+                ),
+            )
+            for fs in request.elements
+        )
+        file_cache_keys = await lint_file_cache_keys(
+            request,
+            sources.source_files.snapshot.digest,
+            context=(
+                pylint_runner_pex.digest.fingerprint,
+                pylint_pex.digest.fingerprint,
+                requirements_pex.digest.fingerprint,
+                first_party_plugins.sources_digest.fingerprint,
+                config_files.snapshot.digest.fingerprint,
+                *generate_argv((), pylint),
+                *pythonpath,
+            ),
+            dependency_fingerprints={
+                fs.source.file_path: closure_sources.source_files.snapshot.digest.fingerprint
+                for fs, closure_sources in zip(request.elements, closure_sources_per_field_set)
+            },
+        )
+        lookup = lint_file_cache.lookup(
+            PylintRequest.tool_id, {file: file_cache_keys[file] for file in files}, _OUTPUT_SPLITTER
+        )
+        files = lookup.files_to_run
+        if not files:
+            return lookup.result(request, None)
+
     input_digest = await Get(
         Digest,
         MergeDigests(
@@ -221,16 +277,18 @@ async def run_pylint(
         FallibleProcessResult,
         VenvPexProcess(
             pylint_runner_pex,
-            argv=generate_argv(request.elements, pylint),
+            argv=generate_argv(files, pylint),
             input_digest=input_digest,
             output_directories=(REPORT_DIR,),
             extra_env={"PEX_EXTRA_SYS_PATH": ":".join(pythonpath)},
-            concurrency_available=len(request.elements),
-            description=f"Run Pylint on {pluralize(len(request.elements), 'target')}.",
+            concurrency_available=len(files),
+            description=f"Run Pylint on {pluralize(len(files), 'target')}.",
             level=LogLevel.DEBUG,
         ),
     )
     report = await Get(Digest, RemovePrefix(result.output_digest, REPORT_DIR))
+    if lookup is not None:
+        return lookup.result(request, result, report=report)
     return LintResult.create(request, result, report=report)
 
 
@@ -239,4 +297,5 @@ def rules():
         *collect_rules(),
         *PylintRequest.rules(),
         *pex_from_targets.rules(),
+        load_lint_file_cache,
     ]
@@ -16,15 +16,35 @@ from pants.backend.python.target_types import (
     PythonSourceField,
 )
 from pants.backend.python.util_rules import pex
+from pants.backend.python.util_rules.pex import PexRequest, VenvPex
 from pants.core.goals.fix import FixResult, FixTargetsRequest
-from pants.core.goals.lint import LintResult, LintTargetsRequest
+from pants.core.goals.lint import (
+    LintFileCache,
+    LintOutputSplitter,
+    LintResult,
+    LintTargetsRequest,
+    lint_file_cache_keys,
+    load_lint_file_cache,
+)
+from pants.core.util_rules.config_files import ConfigFiles, ConfigFilesRequest
 from pants.core.util_rules.partitions import PartitionerType
 from pants.core.util_rules.source_files import SourceFiles, SourceFilesRequest
-from pants.engine.rules import Get, collect_rules, rule
+from pants.engine.fs import DigestSubset, PathGlobs, Snapshot
+from pants.engine.rules import Get, MultiGet, collect_rules, rule
 from pants.engine.target import FieldSet, Target
 from pants.util.logging import LogLevel
 from pants.util.meta import classproperty
 
+# Lines which summarize the results of all files.
+_OUTPUT_SPLITTER = LintOutputSplitter(
+    ignored=(
+        r"Found \d+ error",
+        r"\[\*\] \d+ fixable",
+        r"No fixes available",
+        r"All checks passed!",
+    )
+)
+
 
 @dataclass(frozen=True)
 class RuffCheckFieldSet(FieldSet):
@@ -82,16 +102,43 @@ async def ruff_fix(request: RuffFixRequest.Batch, ruff: Ruff) -> FixResult:
 
 @rule(desc="Lint with `ruff check`", level=LogLevel.DEBUG)
 async def ruff_lint(
-    request: RuffLintRequest.Batch[RuffCheckFieldSet, Any], ruff: Ruff
+    request: RuffLintRequest.Batch[RuffCheckFieldSet, Any],
+    ruff: Ruff,
+    lint_file_cache: LintFileCache,
 ) -> LintResult:
     source_files = await Get(
         SourceFiles, SourceFilesRequest(field_set.source for field_set in request.elements)
     )
-    result = await run_ruff(
-        RunRuffRequest(snapshot=source_files.snapshot, mode=RuffMode.LINT),
-        ruff,
+    if not lint_file_cache.enabled:
+        result = await run_ruff(
+            RunRuffRequest(snapshot=source_files.snapshot, mode=RuffMode.LINT),
+            ruff,
+        )
+        return LintResult.create(request, result)
+
+    # NB: These are the same requests as `run_ruff` makes, so they are memoized.
+    ruff_pex, config_files = await MultiGet(
+        Get(VenvPex, PexRequest, ruff.to_pex_request()),
+        Get(ConfigFiles, ConfigFilesRequest, ruff.config_request(source_files.snapshot.dirs)),
+    )
+    file_cache_keys = await lint_file_cache_keys(
+        request,
+        source_files.snapshot.digest,
+        context=(
+            ruff_pex.digest.fingerprint,
+            config_files.snapshot.digest.fingerprint,
+            ruff.config or "",
+            *ruff.args,
+        ),
+    )
+    lookup = lint_file_cache.lookup(RuffLintRequest.tool_id, file_cache_keys, _OUTPUT_SPLITTER)
+    if not lookup.files_to_run:
+        return lookup.result(request, None)
+    snapshot = await Get(
+        Snapshot, DigestSubset(source_files.snapshot.digest, PathGlobs(lookup.files_to_run))
     )
-    return LintResult.create(request, result)
+    result = await run_ruff(RunRuffRequest(snapshot=snapshot, mode=RuffMode.LINT), ruff)
+    return lookup.result(request, result)
 
 
 def rules():
@@ -100,4 +147,5 @@ def rules():
         *RuffFixRequest.rules(),
         *RuffLintRequest.rules(),
         *pex.rules(),
+        load_lint_file_cache,
     ]
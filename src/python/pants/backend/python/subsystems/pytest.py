@@ -26,7 +26,15 @@ from pants.core.util_rules.environments import EnvironmentField
 from pants.engine.rules import collect_rules
 from pants.engine.target import Target
 from pants.engine.unions import UnionRule
-from pants.option.option_types import ArgsListOption, BoolOption, FileOption, SkipOption, StrOption
+from pants.option.option_types import (
+    ArgsListOption,
+    BoolOption,
+    FileOption,
+    IntOption,
+    SkipOption,
+    StrListOption,
+    StrOption,
+)
 from pants.util.strutil import softwrap
 
 
@@ -131,6 +139,46 @@ class PyTest(PythonToolBase):
         ),
     )
 
+    experimental_persistent_workers = BoolOption(
+        default=False,
+        advanced=True,
+        help=softwrap(
+            """
+            If true, run Pytest in persistent worker processes, which have already imported
+            Pytest and the modules listed in `--persistent-worker-preload`.
+
+            A worker is started on demand for each combination of interpreter and venv (i.e.
+            for each resolve, set of interpreter constraints and set of requirements), and forks
+            a fresh child process to run each batch of tests. The child adopts the sandbox,
+            environment variables and `sys.path` of the batch, so nothing is shared between
+            batches other than the modules imported before forking. Workers themselves only
+            inherit a fixed set of environment variables (such as `PATH`, `HOME` and the locale),
+            so preloaded modules never see the environment of a particular batch. Workers exit after
+            `--persistent-worker-idle-timeout` seconds without any work.
+
+            Only modules whose import has no side effects that depend on the environment of a
+            particular test run should be preloaded.
+
+            This mode is only useful for local execution, and has no effect under
+            `--debug` or `--debug-adapter`.
+            """
+        ),
+    )
+    persistent_worker_preload = StrListOption(
+        advanced=True,
+        help=softwrap(
+            """
+            Third-party modules to import in each persistent worker before it forks to run tests,
+            e.g. `['django', 'numpy']`, when `--experimental-persistent-workers` is set.
+            """
+        ),
+    )
+    persistent_worker_idle_timeout = IntOption(
+        default=600,
+        advanced=True,
+        help="How many seconds a persistent worker waits for work before exiting.",
+    )
+
     skip = SkipOption("test")
 
     def config_request(self, dirs: Iterable[str]) -> ConfigFilesRequest:
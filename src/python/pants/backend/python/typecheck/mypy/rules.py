@@ -8,7 +8,7 @@ import itertools
 from dataclasses import dataclass
 from hashlib import sha256
 from textwrap import dedent  # noqa: PNT20
-from typing import Iterable, Optional, Tuple
+from typing import Iterable, Iterator, Optional, Tuple
 
 import packaging
 
@@ -50,11 +50,12 @@ from pants.engine.collection import Collection
 from pants.engine.fs import CreateDigest, Digest, FileContent, MergeDigests, RemovePrefix
 from pants.engine.process import FallibleProcessResult, Process
 from pants.engine.rules import Get, MultiGet, collect_rules, rule
-from pants.engine.target import CoarsenedTargets, CoarsenedTargetsRequest
+from pants.engine.target import CoarsenedTarget, CoarsenedTargets, CoarsenedTargetsRequest
 from pants.engine.unions import UnionRule
 from pants.option.global_options import GlobalOptions
 from pants.util.logging import LogLevel
 from pants.util.ordered_set import FrozenOrderedSet, OrderedSet
+from pants.util.resources import read_resource
 from pants.util.strutil import pluralize, shell_quote
 
 
@@ -64,10 +65,15 @@ class MyPyPartition:
     root_targets: CoarsenedTargets
     resolve_description: str | None
     interpreter_constraints: InterpreterConstraints
+    # The 1-based index of this chunk, and the number of chunks, if `[mypy].chunk_size` is set.
+    chunk: tuple[int, int] | None = None
 
     def description(self) -> str:
         ics = str(sorted(str(c) for c in self.interpreter_constraints))
-        return f"{self.resolve_description}, {ics}" if self.resolve_description else ics
+        description = f"{self.resolve_description}, {ics}" if self.resolve_description else ics
+        if self.chunk:
+            description += f", chunk {self.chunk[0]} of {self.chunk[1]}"
+        return description
 
 
 class MyPyPartitions(Collection[MyPyPartition]):
@@ -228,6 +234,26 @@ async def mypy_typecheck_partition(
     py_version = config_file.python_version_to_autoset(
         partition.interpreter_constraints, python_setup.interpreter_versions_universe
     )
+    if mypy.experimental_daemon:
+        return await _mypy_daemon_check(
+            partition,
+            mypy,
+            mypy_pex=mypy_pex,
+            requirements_venv_pex=requirements_venv_pex,
+            py_version=py_version,
+            input_digests=(
+                file_list_digest,
+                first_party_plugins.sources_digest,
+                closure_sources.source_files.snapshot.digest,
+                requirements_venv_pex.digest,
+                config_file.digest,
+            ),
+            env=_mypy_env(first_party_plugins, closure_sources),
+            file_list_path=file_list_path,
+            build_root=build_root,
+            global_options=global_options,
+        )
+
     named_cache_dir = ".cache/mypy_cache"
     mypy_cache_dir = f"{named_cache_dir}/{sha256(build_root.path.encode()).hexdigest()}"
     run_cache_dir = ".tmp_cache/mypy_cache"
@@ -330,10 +356,36 @@ async def mypy_typecheck_partition(
         ),
     )
 
+    process = await Get(
+        Process,
+        VenvPexProcess(
+            mypy_pex,
+            input_digest=merged_input_files,
+            extra_env=_mypy_env(first_party_plugins, closure_sources),
+            output_directories=(REPORT_DIR,),
+            description=f"Run MyPy on {pluralize(len(python_files), 'file')}.",
+            level=LogLevel.DEBUG,
+            append_only_caches={"mypy_cache": named_cache_dir},
+        ),
+    )
+    process = dataclasses.replace(process, argv=("__mypy_runner.sh",))
+    result = await Get(FallibleProcessResult, Process, process)
+    report = await Get(Digest, RemovePrefix(result.output_digest, REPORT_DIR))
+    return CheckResult.from_fallible_process_result(
+        result,
+        partition_description=partition.description(),
+        report=report,
+        output_simplifier=global_options.output_simplifier(),
+    )
+
+
+def _mypy_env(
+    first_party_plugins: MyPyFirstPartyPlugins, closure_sources: PythonSourceFiles
+) -> dict[str, str]:
     all_used_source_roots = sorted(
         set(itertools.chain(first_party_plugins.source_roots, closure_sources.source_roots))
     )
-    env = {
+    return {
         "PEX_EXTRA_SYS_PATH": ":".join(all_used_source_roots),
         "MYPYPATH": ":".join(all_used_source_roots),
         # Always emit colors to improve cache hit rates, the results are post-processed to match the
@@ -350,29 +402,124 @@ async def mypy_typecheck_partition(
         "MYPY_FORCE_TERMINAL_WIDTH": "642092230765939",
     }
 
+
+_MYPY_DAEMON_SCRIPT = "__mypy_daemon.py"
+
+
+async def _mypy_daemon_check(
+    partition: MyPyPartition,
+    mypy: MyPy,
+    *,
+    mypy_pex: VenvPex,
+    requirements_venv_pex: VenvPex,
+    py_version: str | None,
+    input_digests: Iterable[Digest],
+    env: dict[str, str],
+    file_list_path: str,
+    build_root: BuildRoot,
+    global_options: GlobalOptions,
+) -> CheckResult:
+    """Check the partition in a long-lived `dmypy` daemon: see `scripts/mypy_daemon.py`."""
+    # The daemon keeps its own cache next to its workspace, so there is no need for the shared
+    # SQLite cache dance of `__mypy_runner.sh`.
+    argv = await _generate_argv(
+        mypy,
+        pex=mypy_pex,
+        venv_python=requirements_venv_pex.python.argv0,
+        cache_dir=".mypy_cache",
+        file_list_path=file_list_path,
+        python_version=py_version,
+    )
+    script_digest = await Get(
+        Digest,
+        CreateDigest(
+            [
+                FileContent(
+                    _MYPY_DAEMON_SCRIPT,
+                    read_resource(__name__, "scripts/mypy_daemon.py"),
+                )
+            ]
+        ),
+    )
+    input_digest = await Get(Digest, MergeDigests([*input_digests, script_digest]))
+
+    # One daemon (and workspace) per partition of each repository.
+    workspace_key = sha256(f"{build_root.path}:{partition.description()}".encode()).hexdigest()
+    named_cache_dir = ".cache/mypy_daemon"
     process = await Get(
         Process,
         VenvPexProcess(
             mypy_pex,
-            input_digest=merged_input_files,
-            extra_env=env,
-            output_directories=(REPORT_DIR,),
-            description=f"Run MyPy on {pluralize(len(python_files), 'file')}.",
+            argv=(
+                _MYPY_DAEMON_SCRIPT,
+                "--workspace",
+                f"{named_cache_dir}/{workspace_key[:16]}",
+                "--timeout",
+                str(mypy.daemon_idle_timeout),
+                "--",
+                # Skip the MyPy entry point, since the script runs `dmypy` itself.
+                *argv[1:],
+            ),
+            input_digest=input_digest,
+            # Run the script with the interpreter of the MyPy venv, rather than running MyPy.
+            extra_env={**env, "PEX_INTERPRETER": "1"},
+            description=f"Run MyPy daemon on {partition.description()}.",
             level=LogLevel.DEBUG,
-            append_only_caches={"mypy_cache": named_cache_dir},
+            append_only_caches={"mypy_daemon": named_cache_dir},
         ),
     )
-    process = dataclasses.replace(process, argv=("__mypy_runner.sh",))
     result = await Get(FallibleProcessResult, Process, process)
-    report = await Get(Digest, RemovePrefix(result.output_digest, REPORT_DIR))
     return CheckResult.from_fallible_process_result(
         result,
         partition_description=partition.description(),
-        report=report,
         output_simplifier=global_options.output_simplifier(),
     )
 
 
+def _dependency_ordered(roots: Iterable[CoarsenedTarget]) -> list[CoarsenedTarget]:
+    """Order the roots so that each comes after those of its transitive dependencies which are
+    also roots, keeping the roots which are reached through the same dependencies together."""
+    root_set = set(roots)
+    visited: set[CoarsenedTarget] = set()
+    result = []
+    for root in roots:
+        if root in visited:
+            continue
+        visited.add(root)
+        stack: list[tuple[CoarsenedTarget, Iterator[CoarsenedTarget]]] = [
+            (root, iter(root.dependencies))
+        ]
+        while stack:
+            current, dependencies = stack[-1]
+            dependency = next(dependencies, None)
+            if dependency is None:
+                stack.pop()
+                if current in root_set:
+                    result.append(current)
+            elif dependency not in visited:
+                visited.add(dependency)
+                stack.append((dependency, iter(dependency.dependencies)))
+    return result
+
+
+def _chunk_partition(partition: MyPyPartition, chunk_size: int) -> Iterator[MyPyPartition]:
+    roots = _dependency_ordered(partition.root_targets)
+    chunks = [roots[i : i + chunk_size] for i in range(0, len(roots), chunk_size)]
+    if len(chunks) <= 1:
+        yield partition
+        return
+    for i, chunk in enumerate(chunks):
+        addresses = {t.address for ct in chunk for t in ct.members}
+        yield dataclasses.replace(
+            partition,
+            field_sets=FrozenOrderedSet(
+                fs for fs in partition.field_sets if fs.address in addresses
+            ),
+            root_targets=CoarsenedTargets(chunk),
+            chunk=(i + 1, len(chunks)),
+        )
+
+
 @rule(desc="Determine if necessary to partition MyPy input", level=LogLevel.DEBUG)
 async def mypy_determine_partitions(
     request: MyPyRequest, mypy: MyPy, python_setup: PythonSetup
@@ -386,7 +533,7 @@ async def mypy_determine_partitions(
     )
     coarsened_targets_by_address = coarsened_targets.by_address()
 
-    return MyPyPartitions(
+    partitions = (
         MyPyPartition(
             FrozenOrderedSet(field_sets),
             CoarsenedTargets(
@@ -401,9 +548,15 @@ async def mypy_determine_partitions(
             resolve_and_interpreter_constraints_to_field_sets.items()
         )
     )
+    if mypy.chunk_size > 0 and not mypy.experimental_daemon:
+        return MyPyPartitions(
+            chunk
+            for partition in partitions
+            for chunk in _chunk_partition(partition, mypy.chunk_size)
+        )
+    return MyPyPartitions(partitions)
 
 
-# TODO(#10864): Improve performance, e.g. by leveraging the MyPy cache.
 @rule(desc="Typecheck using MyPy", level=LogLevel.DEBUG)
 async def mypy_typecheck(request: MyPyRequest, mypy: MyPy) -> CheckResults:
     if mypy.skip:
@@ -688,6 +688,55 @@ def test_partition_targets(rule_runner: PythonRuleRunner) -> None:
     )
 
 
+def test_chunk_partitions(rule_runner: PythonRuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            f"{PACKAGE}/a.py": "",
+            f"{PACKAGE}/b.py": "",
+            f"{PACKAGE}/c.py": "",
+            f"{PACKAGE}/d.py": "",
+            f"{PACKAGE}/BUILD": dedent(
+                """\
+                python_sources(
+                    overrides={
+                        "a.py": {"dependencies": ["./c.py"]},
+                        "b.py": {"dependencies": ["./d.py"]},
+                        "c.py": {"dependencies": ["./d.py"]},
+                    },
+                )
+                """
+            ),
+        }
+    )
+    rule_runner.set_options(["--mypy-chunk-size=2"], env_inherit={"PATH", "PYENV_ROOT", "HOME"})
+    addresses = [Address(PACKAGE, relative_file_path=f) for f in ("a.py", "b.py", "c.py", "d.py")]
+    request = MyPyRequest(MyPyFieldSet.create(rule_runner.get_target(a)) for a in addresses)
+
+    partitions = rule_runner.request(MyPyPartitions, [request])
+    assert [partition.chunk for partition in partitions] == [(1, 2), (2, 2)]
+    # Targets come after their dependencies.
+    assert [{fs.address for fs in partition.field_sets} for partition in partitions] == [
+        {addresses[2], addresses[3]},
+        {addresses[0], addresses[1]},
+    ]
+    assert partitions[1].description().endswith(", chunk 2 of 2")
+
+
+def test_daemon(rule_runner: PythonRuleRunner) -> None:
+    rule_runner.write_files({f"{PACKAGE}/f.py": BAD_FILE, f"{PACKAGE}/BUILD": "python_sources()"})
+    tgt = rule_runner.get_target(Address(PACKAGE, relative_file_path="f.py"))
+    extra_args = ["--mypy-experimental-daemon", "--mypy-daemon-idle-timeout=30"]
+    result = run_mypy(rule_runner, [tgt], extra_args=extra_args)
+    assert len(result) == 1
+    assert result[0].exit_code == 1
+    assert f"{PACKAGE}/f.py:4" in result[0].stdout
+    assert "Daemon started" not in result[0].stdout
+
+    # The warm daemon must notice the change.
+    rule_runner.write_files({f"{PACKAGE}/f.py": GOOD_FILE})
+    assert_success(rule_runner, tgt, extra_args=extra_args)
+
+
 def test_determine_python_files() -> None:
     assert determine_python_files([]) == ()
     assert determine_python_files(["f.py"]) == ("f.py",)
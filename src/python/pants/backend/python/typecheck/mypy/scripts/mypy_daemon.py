@@ -0,0 +1,158 @@
+# Copyright 2024 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+# NB: This runs in the interpreter of MyPy, so it must be compatible with Python 3.7+.
+"""Runs MyPy in a long-lived `dmypy` daemon.
+
+Invoked as:
+
+    mypy_daemon.py --workspace DIR [--timeout SECS] -- MYPY_ARGS...
+
+from the root of a sandbox. Every sandbox has a different path, which would defeat the daemon's
+incremental state, so the inputs of the sandbox are first synced into the stable workspace
+directory: only files whose content changed are rewritten, and named caches are linked rather
+than copied. The daemon for the workspace then runs in it, and only rechecks the modules affected
+by the files which changed since its previous run.
+
+The daemon cannot generate reports, so any report options are ignored.
+"""
+
+import fcntl
+import os
+import shutil
+import subprocess
+import sys
+import time
+
+_STATUS_FILE = ".dmypy.json"
+# Files in the workspace which belong to the daemon, rather than to the synced sandbox.
+_WORKSPACE_ONLY = frozenset((_STATUS_FILE, ".mypy_cache"))
+# Lines which `dmypy` prints about the lifecycle of the daemon, rather than about the code.
+_DAEMON_NOISE = (b"Daemon started", b"Daemon stopped", b"Restarting: ", b"dmypy: Ignoring report")
+
+
+def _entries(root, workspace=None):
+    """Yields (relative path, symlink target or None) for each file or symlink below the root.
+
+    Symlinks (which are how named caches are mounted into a sandbox) are not followed.
+    """
+    for dirpath, dirnames, filenames in os.walk(root):
+        rel_dir = os.path.relpath(dirpath, root)
+        if rel_dir == ".":
+            rel_dir = ""
+            dirnames[:] = [d for d in dirnames if d not in _WORKSPACE_ONLY]
+            filenames = [f for f in filenames if f not in _WORKSPACE_ONLY]
+        for name in dirnames + filenames:
+            path = os.path.join(dirpath, name)
+            if os.path.islink(path):
+                target = os.path.realpath(path)
+                # Don't link the named cache which contains the workspace into itself.
+                if workspace is None or not workspace.startswith(target + os.sep):
+                    yield os.path.join(rel_dir, name), target
+            elif name in filenames:
+                yield os.path.join(rel_dir, name), None
+
+
+def _same_content(src, dst):
+    if os.path.islink(dst) or not os.path.isfile(dst):
+        return False
+    if os.path.getsize(src) != os.path.getsize(dst):
+        return False
+    with open(src, "rb") as s, open(dst, "rb") as d:
+        return s.read() == d.read()
+
+
+def _sync(sandbox, workspace):
+    """Mirror the sandbox into the workspace, leaving unchanged files untouched."""
+    script = os.path.relpath(os.path.abspath(sys.argv[0]), sandbox)
+    expected = set()
+    for rel_path, link_target in _entries(sandbox, workspace):
+        if rel_path == script:
+            continue
+        expected.add(rel_path)
+        src = os.path.join(sandbox, rel_path)
+        dst = os.path.join(workspace, rel_path)
+        if link_target is not None:
+            if os.path.islink(dst) and os.readlink(dst) == link_target:
+                continue
+            _remove(dst)
+            os.makedirs(os.path.dirname(dst), exist_ok=True)
+            os.symlink(link_target, dst)
+        else:
+            if _same_content(src, dst):
+                continue
+            previous_mtime = os.lstat(dst).st_mtime if os.path.lexists(dst) else 0
+            _remove(dst)
+            os.makedirs(os.path.dirname(dst), exist_ok=True)
+            shutil.copyfile(src, dst)
+            shutil.copymode(src, dst)
+            # The daemon only notices a change to a file if its size or its modification time in
+            # whole seconds changed, so ensure that the latter does.
+            mtime = max(int(time.time()), int(previous_mtime) + 1)
+            os.utime(dst, (mtime, mtime))
+
+    for rel_path, _ in list(_entries(workspace)):
+        if rel_path not in expected:
+            os.unlink(os.path.join(workspace, rel_path))
+    # Remove directories which no longer contain anything, since MyPy would otherwise still find
+    # them as namespace packages.
+    for dirpath, _, _ in os.walk(workspace, topdown=False):
+        if dirpath != workspace and not os.listdir(dirpath):
+            os.rmdir(dirpath)
+
+
+def _remove(path):
+    if os.path.islink(path) or os.path.isfile(path):
+        os.unlink(path)
+    elif os.path.isdir(path):
+        shutil.rmtree(path)
+
+
+def _dmypy(workspace, args):
+    return subprocess.run(
+        [sys.executable, "-m", "mypy.dmypy", "--status-file", _STATUS_FILE, *args],
+        cwd=workspace,
+        env={k: v for k, v in os.environ.items() if k != "PEX_INTERPRETER"},
+        stdout=subprocess.PIPE,
+    )
+
+
+def main(argv):
+    workspace = None
+    timeout = 3600
+    while argv and argv[0] != "--":
+        flag, value, argv = argv[0], argv[1], argv[2:]
+        if flag == "--workspace":
+            workspace = value
+        elif flag == "--timeout":
+            timeout = int(value)
+        else:
+            raise ValueError("Unknown flag: %s" % flag)
+    if workspace is None:
+        raise ValueError("The --workspace flag is required.")
+    mypy_args = argv[1:]
+
+    sandbox = os.getcwd()
+    workspace = os.path.realpath(workspace)
+    os.makedirs(workspace, exist_ok=True)
+    with open(workspace + ".lock", "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+
+        _sync(sandbox, workspace)
+        # This starts the daemon if necessary, and restarts it if the options changed. Otherwise,
+        # the daemon only reprocesses the files whose size or modification time changed, which
+        # are exactly the files which the sync rewrote.
+        result = _dmypy(workspace, ["run", "--timeout", str(timeout), "--", *mypy_args])
+
+    output = b"".join(
+        line
+        for line in result.stdout.splitlines(keepends=True)
+        if not line.startswith(_DAEMON_NOISE)
+    )
+    sys.stdout.buffer.write(output)
+    sys.stdout.flush()
+    return result.returncode
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -35,6 +35,7 @@ from pants.option.option_types import (
     ArgsListOption,
     BoolOption,
     FileOption,
+    IntOption,
     SkipOption,
     TargetListOption,
 )
@@ -120,6 +121,49 @@ class MyPy(PythonToolBase):
         ),
     )
 
+    chunk_size = IntOption(
+        default=0,
+        advanced=True,
+        help=softwrap(
+            """
+            If greater than zero, split each partition into chunks of roughly this many root
+            targets, and check the chunks in concurrent MyPy processes.
+
+            The targets of a partition are ordered so that they come after their dependencies,
+            before being chunked, so that targets which depend on one another tend to be checked
+            together, which keeps the transitive dependencies of each chunk small. Since each
+            chunk must still analyze those, this trades some redundant work for parallelism,
+            which is most useful for cold runs (e.g. in CI) of large partitions.
+
+            Ignored if `--experimental-daemon` is set.
+            """
+        ),
+    )
+    experimental_daemon = BoolOption(
+        default=False,
+        advanced=True,
+        help=softwrap(
+            """
+            If true, check each partition in a long-lived MyPy daemon (`dmypy`), which keeps
+            the results of previous checks in memory and only rechecks what is affected by the
+            files that changed.
+
+            Each partition is synced into a stable directory under the named caches, where a
+            daemon is started on demand. Daemons restart if the MyPy options change, and exit
+            after `--daemon-idle-timeout` seconds without any work. A daemon holds the whole
+            partition in memory, so this mode is intended for local, incremental use, rather
+            than for CI.
+
+            MyPy does not support generating reports in this mode.
+            """
+        ),
+    )
+    daemon_idle_timeout = IntOption(
+        default=3600,
+        advanced=True,
+        help="How many seconds a MyPy daemon waits for work before exiting.",
+    )
+
     @property
     def config_request(self) -> ConfigFilesRequest:
         # Refer to https://mypy.readthedocs.io/en/stable/config_file.html.
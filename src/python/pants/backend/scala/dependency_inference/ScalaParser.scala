@@ -567,16 +567,41 @@ object ScalaParser {
     analysisTraverser.toAnalysis
   }
 
+  /** Usage:
+    *
+    * {{{
+    *   ScalaParser ANALYSIS_OUTPUT_PATH SOURCE SCALA_VERSION SOURCE3
+    *   ScalaParser --batch ANALYSIS_OUTPUT_PATH SCALA_VERSION SOURCE3 SOURCE...
+    * }}}
+    *
+    * In batch mode, the output is an object mapping the path of each source to its analysis.
+    * Sources which fail to parse are reported on stderr and omitted, so that the caller can analyze
+    * them on their own in order to report the error.
+    */
   def main(args: Array[String]): Unit = {
-    val outputPath = java.nio.file.Paths.get(args(0))
-    val pathStr = args(1)
-    val scalaVersion = args(2)
-    val source3 = args(3).toBoolean
-    val analysis = analyze(pathStr, scalaVersion, source3)
+    val (outputPath, json) =
+      if (args(0) == "--batch") {
+        val scalaVersion = args(2)
+        val source3 = args(3).toBoolean
+        val analyses = args.drop(4).toVector.flatMap { pathStr =>
+          try {
+            Some(pathStr -> analyze(pathStr, scalaVersion, source3))
+          } catch {
+            case scala.util.control.NonFatal(e) =>
+              System.err.println(s"Failed to analyze $pathStr: ${e.getMessage}")
+              None
+          }
+        }
+        (args(1), analyses.toMap.asJson.noSpaces)
+      } else {
+        val pathStr = args(1)
+        val scalaVersion = args(2)
+        val source3 = args(3).toBoolean
+        (args(0), analyze(pathStr, scalaVersion, source3).asJson.noSpaces)
+      }
 
-    val json = analysis.asJson.noSpaces
     java.nio.file.Files.write(
-      outputPath,
+      java.nio.file.Paths.get(outputPath),
       json.getBytes(),
       java.nio.file.StandardOpenOption.CREATE_NEW,
       java.nio.file.StandardOpenOption.WRITE
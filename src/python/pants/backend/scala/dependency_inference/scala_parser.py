@@ -2,6 +2,7 @@
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import os
@@ -9,6 +10,7 @@ from dataclasses import dataclass
 from typing import Any, Iterator, Mapping
 
 from pants.backend.scala.subsystems.scala import ScalaSubsystem
+from pants.backend.scala.subsystems.scala_infer import ScalaInferSubsystem
 from pants.backend.scala.subsystems.scalac import Scalac
 from pants.backend.scala.util_rules.versions import (
     ScalaArtifactsForVersionRequest,
@@ -23,9 +25,13 @@ from pants.engine.fs import (
     CreateDigest,
     Digest,
     DigestContents,
+    DigestEntries,
+    DigestSubset,
     Directory,
     FileContent,
+    FileEntry,
     MergeDigests,
+    PathGlobs,
     RemovePrefix,
 )
 from pants.engine.internals.selectors import Get, MultiGet
@@ -41,10 +47,14 @@ from pants.jvm.resolve.coursier_fetch import ToolClasspath, ToolClasspathRequest
 from pants.jvm.resolve.jvm_tool import GenerateJvmLockfileFromTool, JvmToolBase
 from pants.jvm.subsystems import JvmSubsystem
 from pants.jvm.target_types import JvmResolveField
+from pants.option.global_options import GlobalOptions
+from pants.util.dirutil import fast_relpath
 from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
 from pants.util.ordered_set import FrozenOrderedSet
 from pants.util.resources import read_resource
+from pants.util.result_store import ResultStore
+from pants.util.strutil import pluralize
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +62,9 @@ logger = logging.getLogger(__name__)
 _PARSER_SCALA_VERSION = ScalaVersion.parse("2.13.8")
 _PARSER_SCALA_BINARY_VERSION = _PARSER_SCALA_VERSION.binary
 
+_SOURCE_PREFIX = "__source_to_analyze"
+_ANALYSIS_OUTPUT_PATH = "__source_analysis.json"
+
 
 class ScalaParser(JvmToolBase):
     options_scope = "scala-parser"
@@ -239,6 +252,13 @@ class ScalaSourceDependencyAnalysis:
         }
 
 
+class ScalaSourceDependencyAnalysisBatch(FrozenDict[str, ScalaSourceDependencyAnalysis]):
+    """The analysis of each file in a batch, keyed by its path.
+
+    Files that could not be parsed are omitted.
+    """
+
+
 @dataclass(frozen=True)
 class FallibleScalaSourceDependencyAnalysisResult:
     process_result: FallibleProcessResult
@@ -255,6 +275,19 @@ class AnalyzeScalaSourceRequest:
     source3: bool
 
 
+@dataclass(frozen=True)
+class AnalyzeScalaSourcesBatchRequest:
+    """Analyze every Scala file in a digest with a single invocation of the parser.
+
+    The analysis of each file is recorded in the `pants_workdir`, keyed by the path and content of
+    the file, and only the files without a recorded analysis are parsed.
+    """
+
+    digest: Digest
+    scala_version: ScalaVersion
+    source3: bool
+
+
 @rule(level=LogLevel.DEBUG)
 async def create_analyze_scala_source_request(
     scala_subsystem: ScalaSubsystem, jvm: JvmSubsystem, scalac: Scalac, request: SourceFilesRequest
@@ -279,25 +312,14 @@ async def create_analyze_scala_source_request(
     return AnalyzeScalaSourceRequest(source_files, scala_version, source3)
 
 
-@rule(level=LogLevel.DEBUG)
-async def analyze_scala_source_dependencies(
+async def _run_scala_parser(
     jdk: InternalJdk,
     processor_classfiles: ScalaParserCompiledClassfiles,
     tool: ScalaParser,
-    request: AnalyzeScalaSourceRequest,
-) -> FallibleScalaSourceDependencyAnalysisResult:
-    source_files = request.source_files
-
-    if len(source_files.files) > 1:
-        raise ValueError(
-            f"analyze_scala_source_dependencies expects sources with exactly 1 source file, but found {len(source_files.snapshot.files)}."
-        )
-    elif len(source_files.files) == 0:
-        raise ValueError(
-            "analyze_scala_source_dependencies expects sources with exactly 1 source file, but found none."
-        )
-    source_prefix = "__source_to_analyze"
-    source_path = os.path.join(source_prefix, source_files.files[0])
+    source_files_digest: Digest,
+    args: tuple[str, ...],
+    description: str,
+) -> FallibleProcessResult:
     processorcp_relpath = "__processorcp"
     toolcp_relpath = "__toolcp"
 
@@ -306,7 +328,7 @@ async def analyze_scala_source_dependencies(
             ToolClasspath,
             ToolClasspathRequest(lockfile=GenerateJvmLockfileFromTool.create(tool)),
         ),
-        Get(Digest, AddPrefix(source_files.snapshot.digest, source_prefix)),
+        Get(Digest, AddPrefix(source_files_digest, _SOURCE_PREFIX)),
     )
 
     extra_immutable_input_digests = {
@@ -314,9 +336,7 @@ async def analyze_scala_source_dependencies(
         processorcp_relpath: processor_classfiles.digest,
     }
 
-    analysis_output_path = "__source_analysis.json"
-
-    process_result = await Get(
+    return await Get(
         FallibleProcessResult,
         JvmProcess(
             jdk=jdk,
@@ -324,29 +344,197 @@ async def analyze_scala_source_dependencies(
                 *tool_classpath.classpath_entries(toolcp_relpath),
                 processorcp_relpath,
             ],
-            argv=[
-                "org.pantsbuild.backend.scala.dependency_inference.ScalaParser",
-                analysis_output_path,
-                source_path,
-                str(request.scala_version),
-                str(request.source3),
-            ],
+            argv=["org.pantsbuild.backend.scala.dependency_inference.ScalaParser", *args],
             input_digest=prefixed_source_files_digest,
             extra_immutable_input_digests=extra_immutable_input_digests,
-            output_files=(analysis_output_path,),
+            output_files=(_ANALYSIS_OUTPUT_PATH,),
             extra_nailgun_keys=extra_immutable_input_digests,
-            description=f"Analyzing {source_files.files[0]}",
+            description=description,
             level=LogLevel.DEBUG,
         ),
     )
 
+
+def _analysis_store(global_options: GlobalOptions) -> ResultStore:
+    return ResultStore(os.path.join(global_options.pants_workdir, "scala", "source_analysis"))
+
+
+async def _analysis_keys(
+    processor_classfiles: ScalaParserCompiledClassfiles,
+    tool: ScalaParser,
+    digest: Digest,
+    scala_version: ScalaVersion,
+    source3: bool,
+) -> dict[str, str]:
+    """The `_analysis_store` key of each file in `digest`.
+
+    The key captures the parser and its arguments, and the path and content of the file.
+    """
+    tool_classpath, entries = await MultiGet(
+        Get(
+            ToolClasspath,
+            ToolClasspathRequest(lockfile=GenerateJvmLockfileFromTool.create(tool)),
+        ),
+        Get(DigestEntries, Digest, digest),
+    )
+    return {
+        entry.path: hashlib.sha256(
+            json.dumps(
+                [
+                    processor_classfiles.digest.fingerprint,
+                    tool_classpath.digest.fingerprint,
+                    str(scala_version),
+                    source3,
+                    entry.path,
+                    entry.file_digest.fingerprint,
+                ]
+            ).encode()
+        ).hexdigest()
+        for entry in entries
+        if isinstance(entry, FileEntry)
+    }
+
+
+@rule(level=LogLevel.DEBUG)
+async def analyze_scala_source_dependencies_batch(
+    jdk: InternalJdk,
+    processor_classfiles: ScalaParserCompiledClassfiles,
+    tool: ScalaParser,
+    request: AnalyzeScalaSourcesBatchRequest,
+    global_options: GlobalOptions,
+) -> ScalaSourceDependencyAnalysisBatch:
+    keys = await _analysis_keys(
+        processor_classfiles, tool, request.digest, request.scala_version, request.source3
+    )
+    store = _analysis_store(global_options)
+    stored = store.get(keys.values())
+    analyses = {
+        path: ScalaSourceDependencyAnalysis.from_json_dict(stored[key])
+        for path, key in keys.items()
+        if key in stored
+    }
+    missing = tuple(path for path in keys if path not in analyses)
+    if not missing:
+        return ScalaSourceDependencyAnalysisBatch(analyses)
+
+    missing_digest = await Get(Digest, DigestSubset(request.digest, PathGlobs(missing)))
+    process_result = await _run_scala_parser(
+        jdk,
+        processor_classfiles,
+        tool,
+        missing_digest,
+        (
+            "--batch",
+            _ANALYSIS_OUTPUT_PATH,
+            str(request.scala_version),
+            str(request.source3),
+            *(os.path.join(_SOURCE_PREFIX, file) for file in missing),
+        ),
+        f"Analyzing {pluralize(len(missing), 'Scala source file')}",
+    )
+    if process_result.exit_code != 0:
+        # The remaining files will be analyzed on their own instead.
+        stderr = process_result.stderr.decode(errors="replace")
+        logger.debug(f"Batched Scala source analysis failed: {stderr}")
+        return ScalaSourceDependencyAnalysisBatch(analyses)
+
+    analysis_contents = await Get(DigestContents, Digest, process_result.output_digest)
+    parsed = {
+        fast_relpath(path, _SOURCE_PREFIX): analysis
+        for path, analysis in json.loads(analysis_contents[0].content).items()
+    }
+    store.put({keys[path]: analysis for path, analysis in parsed.items() if path in keys})
+    analyses.update(
+        (path, ScalaSourceDependencyAnalysis.from_json_dict(analysis))
+        for path, analysis in parsed.items()
+    )
+    return ScalaSourceDependencyAnalysisBatch(analyses)
+
+
+@rule(level=LogLevel.DEBUG)
+async def analyze_scala_source_dependencies(
+    jdk: InternalJdk,
+    processor_classfiles: ScalaParserCompiledClassfiles,
+    tool: ScalaParser,
+    request: AnalyzeScalaSourceRequest,
+) -> FallibleScalaSourceDependencyAnalysisResult:
+    source_files = request.source_files
+
+    if len(source_files.files) > 1:
+        raise ValueError(
+            f"analyze_scala_source_dependencies expects sources with exactly 1 source file, but found {len(source_files.snapshot.files)}."
+        )
+    elif len(source_files.files) == 0:
+        raise ValueError(
+            "analyze_scala_source_dependencies expects sources with exactly 1 source file, but found none."
+        )
+
+    process_result = await _run_scala_parser(
+        jdk,
+        processor_classfiles,
+        tool,
+        source_files.snapshot.digest,
+        (
+            _ANALYSIS_OUTPUT_PATH,
+            os.path.join(_SOURCE_PREFIX, source_files.files[0]),
+            str(request.scala_version),
+            str(request.source3),
+        ),
+        f"Analyzing {source_files.files[0]}",
+    )
+
     return FallibleScalaSourceDependencyAnalysisResult(process_result=process_result)
 
 
 @rule(level=LogLevel.DEBUG)
-async def resolve_fallible_result_to_analysis(
-    fallible_result: FallibleScalaSourceDependencyAnalysisResult,
+async def resolve_analysis_request(
+    request: AnalyzeScalaSourceRequest,
+    scala_infer_subsystem: ScalaInferSubsystem,
+    processor_classfiles: ScalaParserCompiledClassfiles,
+    tool: ScalaParser,
+    global_options: GlobalOptions,
 ) -> ScalaSourceDependencyAnalysis:
+    # With `[scala-infer].batch_by_directory`, the analysis of each file is recorded under a key of
+    # its own content, so a file which did not change is not parsed again. Otherwise, rather than
+    # invoking the parser for the file on its own, we analyze the Scala files in its directory
+    # together: the batch request below is identical for every file in the directory (with the same
+    # Scala version), so the engine memoizes it, and inferring the dependencies of many targets
+    # costs one parser invocation per directory rather than one per file.
+    if scala_infer_subsystem.batch_by_directory and len(request.source_files.files) == 1:
+        file_path = request.source_files.files[0]
+        keys = await _analysis_keys(
+            processor_classfiles,
+            tool,
+            request.source_files.snapshot.digest,
+            request.scala_version,
+            request.source3,
+        )
+        key = keys[file_path]
+        stored = _analysis_store(global_options).get([key])
+        if key in stored:
+            return ScalaSourceDependencyAnalysis.from_json_dict(stored[key])
+
+        siblings_digest = await Get(
+            Digest, PathGlobs([os.path.join(os.path.dirname(file_path), "*.scala")])
+        )
+        batch, file_in_siblings_digest = await MultiGet(
+            Get(
+                ScalaSourceDependencyAnalysisBatch,
+                AnalyzeScalaSourcesBatchRequest(
+                    siblings_digest, request.scala_version, request.source3
+                ),
+            ),
+            Get(Digest, DigestSubset(siblings_digest, PathGlobs([file_path]))),
+        )
+        # NB: The source may have been generated, in which case its content is not on disk.
+        if file_path in batch and file_in_siblings_digest == request.source_files.snapshot.digest:
+            return batch[file_path]
+
+    # The file was not in the batch, either because it was generated, or because it failed to
+    # parse. Analyze it on its own, which will surface any error.
+    fallible_result = await Get(
+        FallibleScalaSourceDependencyAnalysisResult, AnalyzeScalaSourceRequest, request
+    )
     description = ProductDescription("Scala source dependency analysis failed.")
     result = await Get(
         ProcessResult,
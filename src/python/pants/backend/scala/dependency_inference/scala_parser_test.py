@@ -1,6 +1,7 @@
 # Copyright 2021 Pants project contributors (see CONTRIBUTORS.md).
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 import textwrap
+from pathlib import Path
 
 import pytest
 
@@ -8,16 +9,20 @@ from pants.backend.scala import target_types
 from pants.backend.scala.dependency_inference import scala_parser
 from pants.backend.scala.dependency_inference.scala_parser import (
     AnalyzeScalaSourceRequest,
+    AnalyzeScalaSourcesBatchRequest,
     ScalaImport,
     ScalaProvidedSymbol,
     ScalaSourceDependencyAnalysis,
+    ScalaSourceDependencyAnalysisBatch,
 )
 from pants.backend.scala.target_types import ScalaSourceField, ScalaSourceTarget
 from pants.backend.scala.util_rules import versions
+from pants.backend.scala.util_rules.versions import ScalaVersion
 from pants.build_graph.address import Address
 from pants.core.util_rules import source_files
 from pants.core.util_rules.source_files import SourceFilesRequest
 from pants.engine import process
+from pants.engine.fs import Digest, PathGlobs
 from pants.engine.target import SourcesField
 from pants.jvm import jdk_rules
 from pants.jvm import util_rules as jvm_util_rules
@@ -41,6 +46,8 @@ def rule_runner() -> RuleRunner:
             *versions.rules(),
             QueryRule(AnalyzeScalaSourceRequest, (SourceFilesRequest,)),
             QueryRule(ScalaSourceDependencyAnalysis, (AnalyzeScalaSourceRequest,)),
+            QueryRule(ScalaSourceDependencyAnalysisBatch, (AnalyzeScalaSourcesBatchRequest,)),
+            QueryRule(Digest, (PathGlobs,)),
         ],
         target_types=[ScalaSourceTarget],
     )
@@ -822,3 +829,40 @@ def test_applied_types_to_terms(rule_runner: RuleRunner) -> None:
         "foo.applied",
         "foo.bar",
     ]
+
+
+def test_analyze_batch(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "src/A.scala": "package foo\nimport bar.B\nclass A\n",
+            "src/C.scala": "package foo\nclass C extends A\n",
+            "src/Broken.scala": "package foo\nclass {\n",
+        }
+    )
+    digest = rule_runner.request(Digest, [PathGlobs(["src/*.scala"])])
+    batch = rule_runner.request(
+        ScalaSourceDependencyAnalysisBatch,
+        [AnalyzeScalaSourcesBatchRequest(digest, ScalaVersion.parse("2.13.8"), False)],
+    )
+
+    # Files which fail to parse are omitted, to be analyzed (and fail) on their own.
+    assert set(batch) == {"src/A.scala", "src/C.scala"}
+    assert list(batch["src/A.scala"].all_imports()) == ["bar.B"]
+    assert batch["src/C.scala"].provided_symbols == FrozenOrderedSet(
+        [ScalaProvidedSymbol("foo.C", False)]
+    )
+    # The batched analysis of a file matches its analysis on its own.
+    assert batch["src/C.scala"] == _analyze(rule_runner, "package foo\nclass C extends A\n")
+
+    # The analysis of each file is recorded, so after editing a file, only it is analyzed again.
+    store_dir = Path(rule_runner.pants_workdir, "scala", "source_analysis")
+    assert len(list(store_dir.glob("*/*"))) == 2
+    rule_runner.write_files({"src/C.scala": "package foo\nclass C\n"})
+    digest = rule_runner.request(Digest, [PathGlobs(["src/*.scala"])])
+    rebatch = rule_runner.request(
+        ScalaSourceDependencyAnalysisBatch,
+        [AnalyzeScalaSourcesBatchRequest(digest, ScalaVersion.parse("2.13.8"), False)],
+    )
+    assert set(rebatch) == {"src/A.scala", "src/C.scala"}
+    assert rebatch["src/A.scala"] == batch["src/A.scala"]
+    assert len(list(store_dir.glob("*/*"))) == 3
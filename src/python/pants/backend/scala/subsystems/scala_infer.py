@@ -18,6 +18,21 @@ class ScalaInferSubsystem(Subsystem):
         default=True,
         help="Infer a target's dependencies by parsing consumed types from sources.",
     )
+    batch_by_directory = BoolOption(
+        default=False,
+        advanced=True,
+        help=softwrap(
+            """
+            Analyze all of the `*.scala` files in a directory with a single invocation of the
+            parser, rather than one invocation per file.
+
+            This makes inferring the dependencies of many files much faster when the cache is
+            cold. The analysis of each file is recorded in the `[GLOBAL].pants_workdir`, keyed by
+            the file's path and content, and only the files without a recorded analysis are
+            parsed, so editing one file only analyzes that file again.
+            """
+        ),
+    )
     package_objects = BoolOption(
         default=True,
         help="Add dependency on the package object to every target.",
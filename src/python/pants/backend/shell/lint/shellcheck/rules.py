@@ -7,7 +7,14 @@ from typing import Any
 from pants.backend.shell.lint.shellcheck.skip_field import SkipShellcheckField
 from pants.backend.shell.lint.shellcheck.subsystem import Shellcheck
 from pants.backend.shell.target_types import ShellDependenciesField, ShellSourceField
-from pants.core.goals.lint import LintResult, LintTargetsRequest
+from pants.core.goals.lint import (
+    LintFileCache,
+    LintOutputSplitter,
+    LintResult,
+    LintTargetsRequest,
+    lint_file_cache_keys,
+    load_lint_file_cache,
+)
 from pants.core.goals.resolves import ExportableTool
 from pants.core.util_rules.config_files import ConfigFiles, ConfigFilesRequest
 from pants.core.util_rules.external_tool import DownloadedExternalTool, ExternalToolRequest
@@ -22,6 +29,13 @@ from pants.engine.unions import UnionRule
 from pants.util.logging import LogLevel
 from pants.util.strutil import pluralize
 
+# The default `tty` output format starts the comments on each file with a header, and ends with
+# links to the wiki pages of all of the reported checks.
+_OUTPUT_SPLITTER = LintOutputSplitter(
+    file_header=r"In (?P<path>.+) line \d+:$",
+    ignored=(r"For more information:$", r"  https://www\.shellcheck\.net/wiki/"),
+)
+
 
 @dataclass(frozen=True)
 class ShellcheckFieldSet(FieldSet):
@@ -46,6 +60,7 @@ async def run_shellcheck(
     request: ShellcheckRequest.Batch[ShellcheckFieldSet, Any],
     shellcheck: Shellcheck,
     platform: Platform,
+    lint_file_cache: LintFileCache,
 ) -> LintResult:
     # Shellcheck looks at direct dependencies to make sure that every symbol is defined, so we must
     # include those in the run.
@@ -81,6 +96,53 @@ async def run_shellcheck(
         ConfigFiles, ConfigFilesRequest, shellcheck.config_request(direct_sources.snapshot.dirs)
     )
 
+    files = direct_sources.snapshot.files
+    lookup = None
+    if lint_file_cache.enabled:
+        # The result for each file also depends on the sources of its direct dependencies.
+        sources_per_field_set = await MultiGet(
+            Get(
+                SourceFiles,
+                SourceFilesRequest(
+                    [field_set.sources], for_sources_types=(ShellSourceField,), enable_codegen=True
+                ),
+            )
+            for field_set in request.elements
+        )
+        dependency_sources_per_field_set = await MultiGet(
+            Get(
+                SourceFiles,
+                SourceFilesRequest(
+                    (tgt.get(SourcesField) for tgt in dependencies),
+                    for_sources_types=(ShellSourceField,),
+                    enable_codegen=True,
+                ),
+            )
+            for dependencies in all_dependencies
+        )
+        file_cache_keys = await lint_file_cache_keys(
+            request,
+            direct_sources.snapshot.digest,
+            context=(
+                downloaded_shellcheck.digest.fingerprint,
+                config_files.snapshot.digest.fingerprint,
+                *shellcheck.args,
+            ),
+            dependency_fingerprints={
+                file: field_set_dependency_sources.snapshot.digest.fingerprint
+                for field_set_sources, field_set_dependency_sources in zip(
+                    sources_per_field_set, dependency_sources_per_field_set
+                )
+                for file in field_set_sources.snapshot.files
+            },
+        )
+        lookup = lint_file_cache.lookup(
+            ShellcheckRequest.tool_id, file_cache_keys, _OUTPUT_SPLITTER
+        )
+        files = lookup.files_to_run
+        if not files:
+            return lookup.result(request, None)
+
     input_digest = await Get(
         Digest,
         MergeDigests(
@@ -96,12 +158,14 @@ async def run_shellcheck(
     process_result = await Get(
         FallibleProcessResult,
         Process(
-            argv=[downloaded_shellcheck.exe, *shellcheck.args, *direct_sources.snapshot.files],
+            argv=[downloaded_shellcheck.exe, *shellcheck.args, *files],
             input_digest=input_digest,
-            description=f"Run Shellcheck on {pluralize(len(request.elements), 'file')}.",
+            description=f"Run Shellcheck on {pluralize(len(files), 'file')}.",
             level=LogLevel.DEBUG,
         ),
     )
+    if lookup is not None:
+        return lookup.result(request, process_result)
     return LintResult.create(request, process_result)
 
 
@@ -110,4 +174,5 @@ def rules():
         *collect_rules(),
         *ShellcheckRequest.rules(),
         UnionRule(ExportableTool, Shellcheck),
+        load_lint_file_cache,
     ]
@@ -2,6 +2,10 @@
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 from __future__ import annotations
 
+import hashlib
+import json
+import logging
+import os.path
 from dataclasses import dataclass
 from pathlib import PurePath
 from typing import Iterable, Optional, Sequence
@@ -22,10 +26,18 @@ from pants.base.glob_match_error_behavior import GlobMatchErrorBehavior
 from pants.base.specs import DirGlobSpec, DirLiteralSpec, RawSpecs
 from pants.core.target_types import LockfileTarget
 from pants.engine.addresses import Addresses
-from pants.engine.fs import CreateDigest, Digest, FileContent
+from pants.engine.fs import (
+    CreateDigest,
+    Digest,
+    DigestSubset,
+    FileContent,
+    MergeDigests,
+    PathGlobs,
+    Snapshot,
+)
 from pants.engine.internals.native_engine import Address, AddressInput
 from pants.engine.internals.selectors import Get, MultiGet
-from pants.engine.process import Process, ProcessResult
+from pants.engine.process import FallibleProcessResult, Process, ProcessResult
 from pants.engine.rules import collect_rules, rule
 from pants.engine.target import (
     DependenciesRequest,
@@ -39,12 +51,18 @@ from pants.engine.target import (
     Targets,
 )
 from pants.engine.unions import UnionRule
+from pants.option.global_options import GlobalOptions
+from pants.option.option_types import BoolOption
 from pants.util.dirutil import group_by_dir
+from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
 from pants.util.ordered_set import OrderedSet
 from pants.util.resources import read_resource
+from pants.util.result_store import ResultStore
 from pants.util.strutil import bullet_list, softwrap
 
+logger = logging.getLogger(__name__)
+
 
 class TerraformHcl2Parser(PythonToolRequirementsBase):
     options_scope = "terraform-hcl2-parser"
@@ -57,6 +75,24 @@ class TerraformHcl2Parser(PythonToolRequirementsBase):
 
     default_lockfile_resource = ("pants.backend.terraform", "hcl2.lock")
 
+    batch_by_directory = BoolOption(
+        default=False,
+        advanced=True,
+        help=softwrap(
+            """
+            If true, the sources of a `terraform_module` are parsed along with those of the modules
+            in its sibling directories (i.e. `parent/*/`), by a single parser process, rather than
+            each module being parsed by its own process.
+
+            This reduces the number of processes started when inferring the dependencies of many
+            modules with a cold cache. The result of each module is recorded in the
+            `[GLOBAL].pants_workdir`, keyed by the module's own `.tf` files, and only the modules
+            without a recorded result are parsed, so editing one module only parses that module
+            again.
+            """
+        ),
+    )
+
 
 @dataclass(frozen=True)
 class ParserSetup:
@@ -88,19 +124,41 @@ async def setup_parser(hcl2_parser: TerraformHcl2Parser) -> ParserSetup:
 class ParseTerraformModuleSources:
     sources_digest: Digest
     paths: tuple[str, ...]
+    # If set, the parser outputs the module source paths of each directory as a JSON object.
+    per_directory: bool = False
+
+
+@dataclass(frozen=True)
+class ParseTerraformModuleSourcesBatchRequest:
+    """Parse the sources of many Terraform modules with a single invocation of the parser.
+
+    The result of each directory is recorded in the `pants_workdir`, keyed by the content of its
+    files, and only the directories without a recorded result are parsed.
+    """
+
+    sources_digest: Digest
+    paths: tuple[str, ...]
+
+
+class TerraformModuleSourcesBatch(FrozenDict[str, tuple[str, ...]]):
+    """The local module source paths referenced by the files in each directory of a batch.
+
+    If any of the files could not be parsed, only contains the directories with a recorded result.
+    """
 
 
 @rule
 async def setup_process_for_parse_terraform_module_sources(
     request: ParseTerraformModuleSources, parser: ParserSetup
 ) -> Process:
-    dir_paths = ", ".join(sorted(group_by_dir(request.paths).keys()))
+    dirs = sorted(group_by_dir(request.paths).keys())
+    dir_paths = f"{len(dirs)} directories" if request.per_directory else ", ".join(dirs)
 
     process = await Get(
         Process,
         VenvPexProcess(
             parser.pex,
-            argv=request.paths,
+            argv=(("--per-directory",) if request.per_directory else ()) + request.paths,
             input_digest=request.sources_digest,
             description=f"Parse Terraform module sources: {dir_paths}",
             level=LogLevel.DEBUG,
@@ -109,6 +167,74 @@ async def setup_process_for_parse_terraform_module_sources(
     return process
 
 
+def _module_sources_store(global_options: GlobalOptions) -> ResultStore:
+    return ResultStore(os.path.join(global_options.pants_workdir, "terraform", "module_sources"))
+
+
+def _module_sources_key(parser: ParserSetup, directory: str, directory_digest: Digest) -> str:
+    """The key of the module sources of the `.tf` files in `directory_digest`."""
+    return hashlib.sha256(
+        json.dumps(
+            [parser.pex.digest.fingerprint, directory, directory_digest.fingerprint]
+        ).encode()
+    ).hexdigest()
+
+
+@rule
+async def parse_terraform_module_sources_batch(
+    request: ParseTerraformModuleSourcesBatchRequest,
+    parser: ParserSetup,
+    global_options: GlobalOptions,
+) -> TerraformModuleSourcesBatch:
+    directories = sorted({os.path.dirname(path) for path in request.paths})
+    directory_digests = await MultiGet(
+        Get(
+            Digest,
+            DigestSubset(request.sources_digest, PathGlobs([os.path.join(directory, "*")])),
+        )
+        for directory in directories
+    )
+    keys = {
+        directory: _module_sources_key(parser, directory, directory_digest)
+        for directory, directory_digest in zip(directories, directory_digests)
+    }
+    store = _module_sources_store(global_options)
+    stored = store.get(keys.values())
+    module_sources = {
+        directory: tuple(stored[key]) for directory, key in keys.items() if key in stored
+    }
+    missing = {
+        directory: directory_digest
+        for directory, directory_digest in zip(directories, directory_digests)
+        if directory not in module_sources
+    }
+    if not missing:
+        return TerraformModuleSourcesBatch(module_sources)
+
+    missing_digest = await Get(Digest, MergeDigests(missing.values()))
+    result = await Get(
+        FallibleProcessResult,
+        ParseTerraformModuleSources(
+            missing_digest,
+            tuple(path for path in request.paths if os.path.dirname(path) in missing),
+            per_directory=True,
+        ),
+    )
+    if result.exit_code != 0:
+        # The remaining modules will be parsed on their own, which will surface the error.
+        stderr = result.stderr.decode(errors="replace")
+        logger.debug(f"Batched Terraform module source parsing failed: {stderr}")
+        return TerraformModuleSourcesBatch(module_sources)
+    parsed = {
+        directory: paths
+        for directory, paths in json.loads(result.stdout.decode("utf-8")).items()
+        if directory in missing
+    }
+    store.put({keys[directory]: paths for directory, paths in parsed.items()})
+    module_sources.update((directory, tuple(paths)) for directory, paths in parsed.items())
+    return TerraformModuleSourcesBatch(module_sources)
+
+
 @dataclass(frozen=True)
 class TerraformModuleDependenciesInferenceFieldSet(FieldSet):
     required_fields = (TerraformModuleSourcesField, TerraformDependenciesField)
@@ -227,22 +353,97 @@ def identify_terraform_backend_and_vars(
     return TerraformDeploymentInvocationFiles(backend_targets, vars_targets, lockfile)
 
 
+async def _parse_module_sources_with_siblings(
+    directory: str, paths: Sequence[str], parser: ParserSetup, global_options: GlobalOptions
+) -> tuple[str, ...] | None:
+    """Parse the sources of the module in `directory` along with those of its sibling modules.
+
+    The result of each module is recorded under a key of its own `.tf` files, so a module which did
+    not change is not parsed again. Otherwise, the batch request is identical for every module in
+    the parent directory, so the engine memoizes it, and inferring the dependencies of many modules
+    costs one parser process per parent directory rather than one per module. Only the `.tf` files
+    of directories which own a `terraform_module` are included, since other files are never parsed
+    on their own.
+
+    Returns None if the module's sources are not exactly the `.tf` files in its directory, if it
+    is at the build root, or if the batch could not be parsed.
+    """
+    if not directory:
+        return None
+    siblings = await Get(Snapshot, PathGlobs([os.path.join(os.path.dirname(directory), "*/*.tf")]))
+    if set(paths) != {path for path in siblings.files if os.path.dirname(path) == directory}:
+        logger.debug(
+            f"The sources of the Terraform module in `{directory}` are not the `.tf` files in its "
+            "directory, so they will not be parsed in a batch with its sibling modules."
+        )
+        return None
+
+    directory_digest = await Get(
+        Digest, DigestSubset(siblings.digest, PathGlobs([os.path.join(directory, "*")]))
+    )
+    key = _module_sources_key(parser, directory, directory_digest)
+    stored = _module_sources_store(global_options).get([key])
+    if key in stored:
+        return tuple(stored[key])
+
+    sibling_dirs = sorted({os.path.dirname(path) for path in siblings.files})
+    sibling_targets = await Get(
+        Targets,
+        RawSpecs(
+            dir_globs=tuple(DirGlobSpec(sibling_dir) for sibling_dir in sibling_dirs),
+            unmatched_glob_behavior=GlobMatchErrorBehavior.ignore,
+            description_of_origin="the `terraform_module` dependency inference rule",
+        ),
+    )
+    module_dirs = {
+        tgt.address.spec_path
+        for tgt in sibling_targets
+        if tgt.has_field(TerraformModuleSourcesField)
+    }
+    module_files = tuple(path for path in siblings.files if os.path.dirname(path) in module_dirs)
+    module_digest = await Get(Digest, DigestSubset(siblings.digest, PathGlobs(module_files)))
+    batch = await Get(
+        TerraformModuleSourcesBatch,
+        ParseTerraformModuleSourcesBatchRequest(module_digest, module_files),
+    )
+    if directory not in batch:
+        logger.debug(
+            f"The Terraform module in `{directory}` could not be parsed in a batch with its "
+            "sibling modules, so it will be parsed on its own."
+        )
+        return None
+    return batch[directory]
+
+
 async def _infer_dependencies_from_sources(
     request: InferTerraformModuleDependenciesRequest,
+    hcl2_parser: TerraformHcl2Parser,
+    parser: ParserSetup,
+    global_options: GlobalOptions,
 ) -> list[Address]:
     """Parse the source code for references to other modules."""
     hydrated_sources = await Get(HydratedSources, HydrateSourcesRequest(request.field_set.sources))
     paths = OrderedSet(
         filename for filename in hydrated_sources.snapshot.files if filename.endswith(".tf")
     )
-    result = await Get(
-        ProcessResult,
-        ParseTerraformModuleSources(
-            sources_digest=hydrated_sources.snapshot.digest,
-            paths=tuple(paths),
-        ),
-    )
-    candidate_spec_paths = [line for line in result.stdout.decode("utf-8").split("\n") if line]
+    if not paths:
+        return []
+    candidate_spec_paths = None
+    if hcl2_parser.batch_by_directory:
+        candidate_spec_paths = await _parse_module_sources_with_siblings(
+            request.field_set.address.spec_path, tuple(paths), parser, global_options
+        )
+    if candidate_spec_paths is None:
+        result = await Get(
+            ProcessResult,
+            ParseTerraformModuleSources(
+                sources_digest=hydrated_sources.snapshot.digest,
+                paths=tuple(paths),
+            ),
+        )
+        candidate_spec_paths = tuple(
+            line for line in result.stdout.decode("utf-8").split("\n") if line
+        )
     # For each path, see if there is a `terraform_module` target at the specified spec_path.
     candidate_targets = await Get(
         Targets,
@@ -280,8 +481,13 @@ async def _infer_lockfile(request: InferTerraformModuleDependenciesRequest) -> l
 @rule
 async def infer_terraform_module_dependencies(
     request: InferTerraformModuleDependenciesRequest,
+    hcl2_parser: TerraformHcl2Parser,
+    parser: ParserSetup,
+    global_options: GlobalOptions,
 ) -> InferredDependencies:
-    terraform_module_addresses = await _infer_dependencies_from_sources(request)
+    terraform_module_addresses = await _infer_dependencies_from_sources(
+        request, hcl2_parser, parser, global_options
+    )
     lockfile_address = await _infer_lockfile(request)
 
     return InferredDependencies([*terraform_module_addresses, *lockfile_address])
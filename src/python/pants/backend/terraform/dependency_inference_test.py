@@ -9,9 +9,11 @@ from pants.backend.terraform.dependency_inference import (
     InferTerraformDeploymentDependenciesRequest,
     InferTerraformModuleDependenciesRequest,
     ParseTerraformModuleSources,
+    ParseTerraformModuleSourcesBatchRequest,
     TerraformDeploymentDependenciesInferenceFieldSet,
     TerraformHcl2Parser,
     TerraformModuleDependenciesInferenceFieldSet,
+    TerraformModuleSourcesBatch,
 )
 from pants.backend.terraform.goals.lockfiles import rules as terraform_lockfile_rules
 from pants.backend.terraform.target_types import (
@@ -56,6 +58,7 @@ def rule_runner() -> RuleRunner:
             QueryRule(InferredDependencies, [InferTerraformDeploymentDependenciesRequest]),
             QueryRule(HydratedSources, [HydrateSourcesRequest]),
             QueryRule(ProcessResult, [ParseTerraformModuleSources]),
+            QueryRule(TerraformModuleSourcesBatch, [ParseTerraformModuleSourcesBatchRequest]),
         ],
     )
     rule_runner.set_options(
@@ -65,9 +68,20 @@ def rule_runner() -> RuleRunner:
     return rule_runner
 
 
-def test_dependency_inference_module(rule_runner: RuleRunner) -> None:
+@pytest.mark.parametrize("batch_by_directory", [False, True])
+def test_dependency_inference_module(rule_runner: RuleRunner, batch_by_directory: bool) -> None:
+    if batch_by_directory:
+        rule_runner.set_options(
+            [
+                "--backend-packages=pants.backend.experimental.terraform",
+                "--terraform-hcl2-parser-batch-by-directory",
+            ],
+            env_inherit={"PATH", "PYENV_ROOT", "HOME"},
+        )
     rule_runner.write_files(
         {
+            # Not owned by a `terraform_module`, so not parsed in a batch with its siblings.
+            "src/tf/resources/scratch/broken.tf": "module {",
             "src/tf/modules/foo/BUILD": "terraform_module()\n",
             "src/tf/modules/foo/versions.tf": "",
             "src/tf/modules/foo/bar/BUILD": "terraform_module()\n",
@@ -244,6 +258,49 @@ def test_hcl_parser_wrapper_runs(rule_runner: RuleRunner, major_minor_interprete
     assert lines == {"grok", "foo/hello/world"}
 
 
+def test_parse_module_sources_batch(rule_runner: RuleRunner) -> None:
+    files = {
+        "src/tf/a/main.tf": textwrap.dedent(
+            """\
+            module "b" {
+              source = "../b"
+            }
+            """
+        ),
+        "src/tf/a/other.tf": 'module "c" {\n  source = "./c"\n}\n',
+        "src/tf/b/main.tf": "",
+    }
+    snapshot = rule_runner.make_snapshot(files)
+    batch = rule_runner.request(
+        TerraformModuleSourcesBatch,
+        [ParseTerraformModuleSourcesBatchRequest(snapshot.digest, snapshot.files)],
+    )
+    assert batch == TerraformModuleSourcesBatch(
+        {"src/tf/a": ("src/tf/a/c", "src/tf/b"), "src/tf/b": ()}
+    )
+
+    # The result of each module is recorded, so only the new module is parsed. If it fails to
+    # parse, it is left out of the batch, so that it is parsed on its own.
+    snapshot = rule_runner.make_snapshot({**files, "src/tf/c/main.tf": "module {"})
+    batch = rule_runner.request(
+        TerraformModuleSourcesBatch,
+        [ParseTerraformModuleSourcesBatchRequest(snapshot.digest, snapshot.files)],
+    )
+    assert batch == TerraformModuleSourcesBatch(
+        {"src/tf/a": ("src/tf/a/c", "src/tf/b"), "src/tf/b": ()}
+    )
+
+    # Modules without a recorded result are left out if any file parsed along with them fails.
+    snapshot = rule_runner.make_snapshot(
+        {**files, "src/tf/a/main.tf": "", "src/tf/c/main.tf": "module {"}
+    )
+    batch = rule_runner.request(
+        TerraformModuleSourcesBatch,
+        [ParseTerraformModuleSourcesBatchRequest(snapshot.digest, snapshot.files)],
+    )
+    assert batch == TerraformModuleSourcesBatch({"src/tf/b": ()})
+
+
 def test_generate_lockfile_without_python_backend() -> None:
     """Regression test for https://github.com/pantsbuild/pants/issues/14876."""
     run_pants(
@@ -1,9 +1,10 @@
 # Copyright 2021 Pants project contributors (see CONTRIBUTORS.md).
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 
+import json
 import sys
 from pathlib import PurePath
-from typing import Set
+from typing import Dict, Set
 
 #
 # Note: This file is used as a pex entry point in the execution sandbox.
@@ -57,14 +58,26 @@ def extract_module_source_paths(path: PurePath, raw_content: bytes) -> Set[str]:
 
 
 def main(args):
-    paths = set()
+    # With `--per-directory`, the module source paths are output as a JSON object mapping each
+    # directory containing one of the files to the paths referenced by the files in it.
+    per_directory = bool(args) and args[0] == "--per-directory"
+    if per_directory:
+        args = args[1:]
+
+    paths_by_directory: Dict[str, Set[str]] = {}
     for filename in args:
         with open(filename, "rb") as f:
             content = f.read()
-        paths |= extract_module_source_paths(PurePath(filename).parent, content)
-
-    for path in paths:
-        print(path)
+        directory = PurePath(filename).parent
+        paths_by_directory.setdefault(str(directory), set()).update(
+            extract_module_source_paths(directory, content)
+        )
+
+    if per_directory:
+        print(json.dumps({d: sorted(paths) for d, paths in sorted(paths_by_directory.items())}))
+    else:
+        for path in set().union(*paths_by_directory.values()):
+            print(path)
 
 
 if __name__ == "__main__":
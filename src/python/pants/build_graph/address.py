@@ -38,9 +38,32 @@ from pants.engine.internals.native_engine import (  # noqa: F401
 from pants.engine.internals.native_engine import (  # noqa: F401
     UnsupportedWildcardError as UnsupportedWildcardError,
 )
+from pants.util.interning import InternTable
 from pants.util.strutil import bullet_list, softwrap
 
 
+def _address_key(address: Address) -> tuple:
+    # NB: The `spec` of an address is not unique: e.g. `a/b.py:t` is the spec of both a file
+    # address in `a` and of a target named `t` in `a/b.py`. So the key is made of all of the
+    # components of the address instead.
+    return (
+        address.spec_path,
+        address.target_name,
+        address.generated_name,
+        address.relative_file_path,
+        tuple(sorted(address.parameters.items())),
+    )
+
+
+_INTERNED_ADDRESSES: InternTable[tuple, Address] = InternTable("Address", key=_address_key)
+
+
+def intern_address(address: Address) -> Address:
+    """Return the canonical instance of an address, so that the many equal copies of an address
+    which are held by long-lived values (such as targets and their dependencies) share memory."""
+    return _INTERNED_ADDRESSES.intern(address)
+
+
 @dataclass(frozen=True)
 class BuildFileAddressRequest(EngineAwareParameter):
     """A request to find the BUILD file path for an address."""
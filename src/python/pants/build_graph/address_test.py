@@ -13,6 +13,7 @@ from pants.build_graph.address import (
     InvalidSpecPathError,
     InvalidTargetNameError,
     UnsupportedWildcardError,
+    intern_address,
 )
 
 
@@ -301,6 +302,21 @@ def test_address_equality() -> None:
     )
 
 
+def test_intern_address() -> None:
+    file_address = Address("a", target_name="t", relative_file_path="b.py")
+    assert intern_address(file_address) is file_address
+    assert intern_address(Address("a", target_name="t", relative_file_path="b.py")) is file_address
+
+    # Unequal addresses with the same spec are not interned as each other.
+    target_address = Address("a/b.py", target_name="t")
+    assert target_address.spec == file_address.spec
+    assert intern_address(target_address) is target_address
+
+    parametrized_address = Address("a", target_name="t", parameters={"k": "v"})
+    assert intern_address(parametrized_address) is parametrized_address
+    assert intern_address(Address("a", target_name="t")) != parametrized_address
+
+
 def test_address_spec() -> None:
     def assert_spec(address: Address, *, expected: str, expected_path_spec: str) -> None:
         assert address.spec == expected
@@ -4,9 +4,13 @@
 from __future__ import annotations
 
 import itertools
+import json
 import logging
+import math
 from collections import defaultdict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import PurePath
 from typing import (
     Any,
     Callable,
@@ -42,10 +46,14 @@ from pants.engine.goal import Goal, GoalSubsystem
 from pants.engine.process import FallibleProcessResult, ProcessResult
 from pants.engine.rules import Get, MultiGet, collect_rules, goal_rule, rule
 from pants.engine.unions import UnionMembership, UnionRule, distinct_union_type_per_subclass, union
-from pants.option.option_types import BoolOption
+from pants.option.global_options import GlobalOptions
+from pants.option.option_types import BoolOption, EnumOption
 from pants.util.collections import partition_sequentially
+from pants.util.dirutil import safe_open
 from pants.util.docutil import bin_name
+from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
+from pants.util.memo import memoized_property
 from pants.util.ordered_set import FrozenOrderedSet
 from pants.util.strutil import Simplifier, softwrap
 
@@ -59,6 +67,8 @@ class FixResult(EngineAwareReturnType):
     stdout: str
     stderr: str
     tool_name: str
+    # The execution time of the tool's process, in milliseconds, if it is known.
+    elapsed_ms: int | None = field(default=None, compare=False, hash=False)
 
     @staticmethod
     async def create(
@@ -73,6 +83,7 @@ class FixResult(EngineAwareReturnType):
             stdout=output_simplifier.simplify(process_result.stdout),
             stderr=output_simplifier.simplify(process_result.stderr),
             tool_name=request.tool_name,
+            elapsed_ms=process_result.metadata.total_elapsed_ms,
         )
 
     def __post_init__(self):
@@ -213,6 +224,110 @@ class _FixBatchResult:
         return any(result.did_change for result in self.results)
 
 
+class FixBatching(Enum):
+    """How to size the batches of files which are run through each chain of tools."""
+
+    COUNT = "count"
+    COST = "cost"
+
+
+class FixBatchingOption(EnumOption):
+    """A --batching option to choose how fix/fmt batches are sized."""
+
+    def __new__(cls, lowercase: str):
+        return super().__new__(
+            cls,
+            "--batching",
+            default=FixBatching.COUNT,
+            advanced=True,
+            help=softwrap(
+                f"""
+                How to size the batches of files which are run through the {lowercase}s.
+
+                Each batch runs through all of the {lowercase}s which apply to its files as soon as
+                the previous {lowercase} has finished with it, independently of other batches.
+
+                With `{FixBatching.COUNT.value}`, batches are created at stable boundaries with
+                around `--batch-size` files each.
+
+                With `{FixBatching.COST.value}`, batches of files whose tools are slow (per file)
+                are made smaller, and batches of files whose tools are fast are made larger, so
+                that each batch takes roughly as long as a batch of `--batch-size` files for a
+                tool of average speed. The per-file cost of each tool is measured on every run
+                and recorded in `{FixToolCosts.relpath}` in the `[GLOBAL].pants_workdir`. Sizes
+                are rounded to powers of two, so that batch boundaries (and thus cache keys) only
+                move when a tool's cost changes significantly.
+                """
+            ),
+        )
+
+
+@dataclass(frozen=True)
+class FixToolCosts:
+    """Historical per-file costs of fix/fmt tools in seconds, keyed by tool name."""
+
+    costs: FrozenDict[str, float] = FrozenDict()
+
+    relpath: ClassVar[str] = "fix/tool_costs.json"
+
+    @classmethod
+    def path(cls, global_options: GlobalOptions) -> PurePath:
+        return PurePath(global_options.pants_workdir, cls.relpath)
+
+    @classmethod
+    def load(cls, path: PurePath) -> FixToolCosts:
+        try:
+            with open(path) as fh:
+                data = json.load(fh)
+            return cls(FrozenDict((tool, float(secs)) for tool, secs in data["costs"].items()))
+        except FileNotFoundError:
+            return cls()
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.warning(f"Ignoring the invalid tool cost history file at {path}: {e!r}")
+            return cls()
+
+    def save(self, path: PurePath) -> None:
+        with safe_open(path, "w") as fh:
+            json.dump({"costs": dict(sorted(self.costs.items()))}, fh, indent=2)
+
+    @memoized_property
+    def default(self) -> float | None:
+        """The expected per-file cost of a tool which has no recorded history."""
+        if not self.costs:
+            return None
+        return sum(self.costs.values()) / len(self.costs)
+
+    def batch_size(self, tool_names: Iterable[str], base_size: int) -> int:
+        """The number of files in each batch which runs through the given chain of tools.
+
+        A batch of `base_size` files for a single tool of average cost is the reference: the size
+        is scaled by the ratio of the average cost to the total cost of the chain, rounded to a
+        power of two, and clamped to `[1, 4 * base_size]`.
+        """
+        default = self.default
+        if not default:
+            return base_size
+        chain_cost = sum(self.costs.get(tool_name, default) for tool_name in tool_names)
+        if chain_cost <= 0:
+            return 4 * base_size
+        scale = 2.0 ** round(math.log2(default / chain_cost))
+        return max(1, min(4 * base_size, round(base_size * scale)))
+
+    def updated_with(self, results: Iterable[FixResult]) -> FixToolCosts:
+        """Record the per-file costs of the tools which produced the given results."""
+        elapsed_secs: dict[str, float] = defaultdict(float)
+        num_files: dict[str, int] = defaultdict(int)
+        for result in results:
+            if result.elapsed_ms is None or not result.input.files:
+                continue
+            elapsed_secs[result.tool_name] += result.elapsed_ms / 1000
+            num_files[result.tool_name] += len(result.input.files)
+        costs = dict(self.costs)
+        for tool_name, secs in elapsed_secs.items():
+            costs[tool_name] = secs / num_files[tool_name]
+        return FixToolCosts(FrozenDict(costs))
+
+
 class FixSubsystem(GoalSubsystem):
     name = "fix"
     help = "Autofix source code."
@@ -235,6 +350,7 @@ class FixSubsystem(GoalSubsystem):
         ),
     )
     batch_size = BatchSizeOption(uppercase="Fixer", lowercase="fixer")
+    batching = FixBatchingOption("fixer")
 
 
 class Fix(Goal):
@@ -288,6 +404,7 @@ _GoalT = TypeVar("_GoalT", bound=Goal)
 
 class _BatchableMultiToolGoalSubsystem(_MultiToolGoalSubsystem, Protocol):
     batch_size: BatchSizeOption
+    batching: FixBatchingOption
 
 
 async def _do_fix(
@@ -299,6 +416,7 @@ async def _do_fix(
     specs: Specs,
     workspace: Workspace,
     console: Console,
+    global_options: GlobalOptions,
     make_targets_partition_request_get: Callable[[_TargetPartitioner], Get[Partitions]],
     make_files_partition_request_get: Callable[[_FilePartitioner], Get[Partitions]],
 ) -> _GoalT:
@@ -315,12 +433,20 @@ async def _do_fix(
     if not partitions_by_request_type:
         return goal_cls(exit_code=0)
 
-    def batch_by_size(files: Iterable[str]) -> Iterator[tuple[str, ...]]:
+    cost_history_file = FixToolCosts.path(global_options)
+    tool_costs = (
+        FixToolCosts.load(cost_history_file)
+        if subsystem.batching == FixBatching.COST
+        else FixToolCosts()
+    )
+
+    def batch_by_size(files: Iterable[str], tool_names: Iterable[str]) -> Iterator[tuple[str, ...]]:
+        size_target = tool_costs.batch_size(tool_names, subsystem.batch_size)
         batches = partition_sequentially(
             files,
             key=lambda x: str(x),
-            size_target=subsystem.batch_size,
-            size_max=4 * subsystem.batch_size,
+            size_target=size_target,
+            size_max=4 * size_target,
         )
         for batch in batches:
             yield tuple(batch)
@@ -342,7 +468,8 @@ async def _do_fix(
             files_by_partition_info[deduped_partition_infos].append(file)
 
         for partition_infos, files in files_by_partition_info.items():
-            for batch in batch_by_size(files):
+            tool_names = [request_type.tool_name for request_type, _ in partition_infos]
+            for batch in batch_by_size(files, tool_names):
                 yield _FixBatchRequest(
                     _FixBatchElement(
                         request_type.Batch,
@@ -365,6 +492,9 @@ async def _do_fix(
     await _write_files(workspace, all_results)
     _print_results(console, individual_results)
 
+    if subsystem.batching == FixBatching.COST:
+        tool_costs.updated_with(individual_results).save(cost_history_file)
+
     # Since the rules to produce FixResult should use ProcessResult, rather than
     # FallibleProcessResult, we assume that there were no failures.
     return goal_cls(exit_code=0)
@@ -377,6 +507,7 @@ async def fix(
     fix_subsystem: FixSubsystem,
     workspace: Workspace,
     union_membership: UnionMembership,
+    global_options: GlobalOptions,
 ) -> Fix:
     return await _do_fix(
         sorted(
@@ -400,6 +531,7 @@ async def fix(
         specs,
         workspace,
         console,
+        global_options,
         lambda request_type: Get(Partitions, FixTargetsRequest.PartitionRequest, request_type),
         lambda request_type: Get(Partitions, FixFilesRequest.PartitionRequest, request_type),
     )
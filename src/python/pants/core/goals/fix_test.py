@@ -21,6 +21,7 @@ from pants.core.goals.fix import (
     FixFilesRequest,
     FixResult,
     FixTargetsRequest,
+    FixToolCosts,
     Partitions,
 )
 from pants.core.goals.fix import rules as fix_rules
@@ -328,6 +329,39 @@ def test_batches(capfd) -> None:
     assert capfd.readouterr().err.count("Smalltalk Did Not Change made no changes.") == 1
 
 
+def test_tool_costs(tmp_path: Path) -> None:
+    def result(tool_name: str, num_files: int, elapsed_ms: int | None) -> FixResult:
+        snapshot = Snapshot.create_for_testing([f"f{i}.ext" for i in range(num_files)], [])
+        return FixResult(snapshot, snapshot, "", "", tool_name, elapsed_ms=elapsed_ms)
+
+    # Without any history, batches are not resized.
+    assert FixToolCosts().batch_size(["fast"], 128) == 128
+
+    costs = FixToolCosts().updated_with(
+        [
+            result("fast", 10, 100),
+            result("fast", 30, 300),
+            result("slow", 10, 7000),
+            result("unmeasured", 10, None),
+        ]
+    )
+    assert costs.costs == pytest.approx({"fast": 0.01, "slow": 0.7})
+
+    # The average per-file cost is 0.355s, and sizes are rounded to powers of two.
+    assert costs.batch_size(["fast"], 128) == 512
+    assert costs.batch_size(["slow"], 128) == 64
+    assert costs.batch_size(["fast", "slow"], 128) == 64
+    assert costs.batch_size(["unmeasured"], 128) == 128
+    assert costs.batch_size(["slow"] * 1000, 128) == 1
+
+    history_file = tmp_path / "fix" / "tool_costs.json"
+    costs.save(history_file)
+    assert FixToolCosts.load(history_file) == costs
+    history_file.write_text("not json")
+    assert FixToolCosts.load(history_file) == FixToolCosts()
+    assert FixToolCosts.load(tmp_path / "missing.json") == FixToolCosts()
+
+
 def test_summary() -> None:
     rule_runner = fix_rule_runner(
         target_types=[FortranTarget, SmalltalkTarget],
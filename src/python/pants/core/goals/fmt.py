@@ -7,7 +7,13 @@ import logging
 from typing import Iterable
 
 from pants.base.specs import Specs
-from pants.core.goals.fix import AbstractFixRequest, FixFilesRequest, FixResult, FixTargetsRequest
+from pants.core.goals.fix import (
+    AbstractFixRequest,
+    FixBatchingOption,
+    FixFilesRequest,
+    FixResult,
+    FixTargetsRequest,
+)
 from pants.core.goals.fix import Partitions as Partitions  # re-export
 from pants.core.goals.fix import _do_fix
 from pants.core.goals.multi_tool_goal_helper import BatchSizeOption, OnlyOption
@@ -16,6 +22,7 @@ from pants.engine.fs import Workspace
 from pants.engine.goal import Goal, GoalSubsystem
 from pants.engine.rules import Get, collect_rules, goal_rule
 from pants.engine.unions import UnionMembership, UnionRule, union
+from pants.option.global_options import GlobalOptions
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +66,7 @@ class FmtSubsystem(GoalSubsystem):
 
     only = OnlyOption("formatter", "isort", "shfmt")
     batch_size = BatchSizeOption(uppercase="Formatter", lowercase="formatter")
+    batching = FixBatchingOption("formatter")
 
 
 class Fmt(Goal):
@@ -73,6 +81,7 @@ async def fmt(
     fmt_subsystem: FmtSubsystem,
     workspace: Workspace,
     union_membership: UnionMembership,
+    global_options: GlobalOptions,
 ) -> Fmt:
     return await _do_fix(
         union_membership.get(AbstractFmtRequest),
@@ -83,6 +92,7 @@ async def fmt(
         specs,
         workspace,
         console,
+        global_options,
         lambda request_type: Get(Partitions, FmtTargetsRequest.PartitionRequest, request_type),
         lambda request_type: Get(Partitions, FmtFilesRequest.PartitionRequest, request_type),
     )
@@ -3,10 +3,25 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
+import os
+import re
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import Any, Callable, ClassVar, Iterable, Iterator, Protocol, Sequence, TypeVar, cast
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Iterable,
+    Iterator,
+    Mapping,
+    Protocol,
+    Sequence,
+    TypeVar,
+    cast,
+)
 
 from typing_extensions import final
 
@@ -30,18 +45,29 @@ from pants.core.util_rules.partitions import (
 from pants.engine.console import Console
 from pants.engine.engine_aware import EngineAwareParameter, EngineAwareReturnType
 from pants.engine.environment import EnvironmentName
-from pants.engine.fs import EMPTY_DIGEST, Digest, PathGlobs, SpecsPaths, Workspace
+from pants.engine.fs import (
+    EMPTY_DIGEST,
+    Digest,
+    DigestEntries,
+    FileEntry,
+    PathGlobs,
+    SpecsPaths,
+    Workspace,
+)
 from pants.engine.goal import Goal, GoalSubsystem
 from pants.engine.internals.native_engine import Snapshot
 from pants.engine.process import FallibleProcessResult
-from pants.engine.rules import Get, MultiGet, collect_rules, goal_rule
+from pants.engine.rules import Get, MultiGet, collect_rules, goal_rule, rule
 from pants.engine.target import FieldSet, FilteredTargets
 from pants.engine.unions import UnionMembership, UnionRule, distinct_union_type_per_subclass, union
+from pants.option.global_options import GlobalOptions
 from pants.option.option_types import BoolOption
 from pants.util.collections import partition_sequentially
 from pants.util.docutil import bin_name
+from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
 from pants.util.meta import classproperty
+from pants.util.result_store import ResultStore
 from pants.util.strutil import Simplifier, softwrap
 
 logger = logging.getLogger(__name__)
@@ -59,6 +85,9 @@ class LintResult(EngineAwareReturnType):
     partition_description: str | None = None
     report: Digest = EMPTY_DIGEST
     _render_message: bool = True
+    # The per-file results of the batch, keyed by their `LintFileCache` key, if the linter
+    # supports per-file caching and `[lint].per_file_caching` is enabled.
+    file_results: FrozenDict[str, LintFileResult] = FrozenDict()
 
     @classmethod
     def create(
@@ -109,6 +138,181 @@ class LintResult(EngineAwareReturnType):
         return False
 
 
+@dataclass(frozen=True)
+class LintFileResult:
+    """The part of the result of a linter which concerns a single file."""
+
+    exit_code: int
+    output: str
+
+
+@dataclass(frozen=True)
+class LintOutputSplitter:
+    """Attributes the output of a linter to the files which it ran on.
+
+    Each line which matches `file_header` (whose `path` group must be one of the files) starts the
+    output for that file, and the following lines are attributed to the same file. Lines which
+    match any of the `ignored` patterns, such as summaries, are not attributed to any file.
+    """
+
+    file_header: str = r"(?P<path>[^\s:][^:]*):\d+"
+    ignored: tuple[str, ...] = ()
+
+    def split(self, output: str, files: Iterable[str]) -> dict[str, str] | None:
+        """The output for each file, or None if some of the output could not be attributed."""
+        file_header = re.compile(self.file_header)
+        ignored = [re.compile(pattern) for pattern in self.ignored]
+        outputs: dict[str, list[str]] = {file: [] for file in files}
+        current = None
+        for line in output.splitlines(keepends=True):
+            if any(pattern.match(line) for pattern in ignored):
+                continue
+            match = file_header.match(line)
+            if match:
+                current = os.path.normpath(match.group("path"))
+                if current not in outputs:
+                    return None
+            elif current is None:
+                if line.strip():
+                    return None
+                continue
+            outputs[current].append(line)
+        return {file: "".join(lines) for file, lines in outputs.items()}
+
+
+@dataclass(frozen=True)
+class LintFileCacheLookup:
+    """The files of a lint batch, and which of them have cached results."""
+
+    keys: FrozenDict[str, str]
+    cached: FrozenDict[str, LintFileResult]
+    splitter: LintOutputSplitter
+
+    @property
+    def files_to_run(self) -> tuple[str, ...]:
+        return tuple(file for file in self.keys if file not in self.cached)
+
+    def result(
+        self,
+        request: AbstractLintRequest.Batch,
+        process_result: FallibleProcessResult | None,
+        *,
+        output_simplifier: Simplifier = Simplifier(),
+        report: Digest = EMPTY_DIGEST,
+    ) -> LintResult:
+        """Combine the cached results with the result of running the remaining files, if any."""
+        file_results = dict(self.cached)
+        exit_code = max((result.exit_code for result in self.cached.values()), default=0)
+        stdout = "".join(self.cached[file].output for file in self.keys if file in self.cached)
+        stderr = ""
+        if process_result is not None:
+            fresh_stdout = output_simplifier.simplify(process_result.stdout)
+            stderr = output_simplifier.simplify(process_result.stderr)
+            exit_code = process_result.exit_code or exit_code
+            stdout += fresh_stdout
+            outputs = self.splitter.split(fresh_stdout, self.files_to_run)
+            # If the linter failed without reporting on any file, it did not run successfully, and
+            # nothing can be recorded.
+            if outputs is not None and (process_result.exit_code == 0 or any(outputs.values())):
+                file_results.update(
+                    (file, LintFileResult(process_result.exit_code if output else 0, output))
+                    for file, output in outputs.items()
+                )
+        return LintResult(
+            exit_code=exit_code,
+            stdout=stdout,
+            stderr=stderr,
+            linter_name=request.tool_name,
+            partition_description=request.partition_metadata.description,
+            report=report,
+            file_results=FrozenDict(
+                (self.keys[file], result) for file, result in file_results.items()
+            ),
+        )
+
+
+@dataclass(frozen=True)
+class LintFileCache:
+    """The per-file results of linters from previous runs, if `[lint].per_file_caching` is set.
+
+    Results are kept in a `ResultStore` per tool, keyed by the cache key of each file, which
+    captures the content of the file and of everything else that its result depends on. Looking up
+    the results of a batch only reads the entries of the files in the batch.
+    """
+
+    directory: str | None = None
+
+    # The number of results to keep per tool, beyond which the least recently used are dropped.
+    max_entries: ClassVar[int] = 100_000
+
+    @property
+    def enabled(self) -> bool:
+        return self.directory is not None
+
+    def _store(self, tool_id: str) -> ResultStore:
+        assert self.directory is not None
+        return ResultStore(os.path.join(self.directory, tool_id), max_entries=self.max_entries)
+
+    def lookup(
+        self,
+        tool_id: str,
+        keys: Mapping[str, str],
+        splitter: LintOutputSplitter = LintOutputSplitter(),
+    ) -> LintFileCacheLookup:
+        """Look up the cached results of the tool for the files with the given keys."""
+        cached = {}
+        if keys:
+            for key, value in self._store(tool_id).get(set(keys.values())).items():
+                try:
+                    exit_code, output = value
+                    cached[key] = LintFileResult(int(exit_code), str(output))
+                except (ValueError, TypeError):
+                    logger.warning(f"Ignoring the invalid cached {tool_id} result for key {key}.")
+        return LintFileCacheLookup(
+            keys=FrozenDict(keys),
+            cached=FrozenDict((file, cached[key]) for file, key in keys.items() if key in cached),
+            splitter=splitter,
+        )
+
+    def save(self, tool_id: str, file_results: Mapping[str, LintFileResult]) -> None:
+        """Record the given results, which also marks them as the most recently used."""
+        self._store(tool_id).put(
+            {key: [result.exit_code, result.output] for key, result in file_results.items()}
+        )
+
+
+async def lint_file_cache_keys(
+    request: AbstractLintRequest.Batch,
+    sources_digest: Digest,
+    *,
+    context: Iterable[str],
+    dependency_fingerprints: Mapping[str, str] = FrozenDict(),
+) -> dict[str, str]:
+    """Compute the `LintFileCache` key of each file in `sources_digest`.
+
+    The `context` must capture everything other than the file itself which the result for the file
+    depends on, e.g. the digests of the tool and its config files and the tool's arguments. If the
+    result for a file also depends on the content of other files, a fingerprint of those should be
+    provided in `dependency_fingerprints`.
+    """
+    entries = await Get(DigestEntries, Digest, sources_digest)
+    prefix = [request.tool_name, request.partition_metadata.description, *context]
+    return {
+        entry.path: hashlib.sha256(
+            json.dumps(
+                [
+                    *prefix,
+                    entry.path,
+                    entry.file_digest.fingerprint,
+                    dependency_fingerprints.get(entry.path, ""),
+                ]
+            ).encode()
+        ).hexdigest()
+        for entry in entries
+        if isinstance(entry, FileEntry)
+    }
+
+
 @union
 class AbstractLintRequest:
     """Base class for plugin types wanting to be run as part of `lint`.
@@ -265,6 +469,30 @@ class LintSubsystem(GoalSubsystem):
         ),
     )
     batch_size = BatchSizeOption(uppercase="Linter", lowercase="linter")
+    per_file_caching = BoolOption(
+        default=False,
+        advanced=True,
+        help=softwrap(
+            """
+            If true, record the results of linters which support it (currently `flake8`,
+            `pylint`, `ruff check` and `shellcheck`) per file, in the `[GLOBAL].pants_workdir`.
+
+            When a batch of files is linted again, the results of the files which did not change
+            (and whose dependencies and tool configuration did not change) are replayed, and the
+            linter only runs on the remaining files. This makes the result of a single edit cheap
+            to compute, even when the edit changes the boundaries of batches.
+
+            Reports are only written for the files which were actually linted, and the results
+            of checks which span multiple files (such as Pylint's `duplicate-code`) may be replayed
+            from runs with a different batch of files.
+            """
+        ),
+    )
+
+    def file_cache_dir(self, global_options: GlobalOptions) -> str | None:
+        if not self.per_file_caching:
+            return None
+        return os.path.join(global_options.pants_workdir, "lint", "file_results")
 
 
 class Lint(Goal):
@@ -404,6 +632,7 @@ async def lint(
     lint_subsystem: LintSubsystem,
     union_membership: UnionMembership,
     dist_dir: DistDir,
+    lint_file_cache: LintFileCache,
 ) -> Lint:
     lint_request_types = union_membership.get(AbstractLintRequest)
     target_partitioners = union_membership.get(LintTargetsRequest.PartitionRequest)
@@ -490,6 +719,15 @@ async def lint(
     for result in all_batch_results:
         results_by_tool[result.linter_name].append(result)
 
+    if lint_file_cache.enabled:
+        file_results_by_tool_id: dict[str, dict[str, LintFileResult]] = defaultdict(dict)
+        for batch, result in zip(batches, all_batch_results):
+            tool_id = core_request_types_by_batch_type[type(batch)].tool_id
+            file_results_by_tool_id[tool_id].update(result.file_results)
+        for tool_id, file_results in file_results_by_tool_id.items():
+            if file_results:
+                lint_file_cache.save(tool_id, file_results)
+
     write_reports(
         results_by_tool,
         workspace,
@@ -506,5 +744,12 @@ async def lint(
     return Lint(_get_error_code(all_batch_results))
 
 
+@rule
+async def load_lint_file_cache(
+    lint_subsystem: LintSubsystem, global_options: GlobalOptions
+) -> LintFileCache:
+    return LintFileCache(lint_subsystem.file_cache_dir(global_options))
+
+
 def rules():
     return collect_rules()
@@ -17,7 +17,10 @@ from pants.core.goals.fmt import FmtFilesRequest, FmtTargetsRequest
 from pants.core.goals.lint import (
     AbstractLintRequest,
     Lint,
+    LintFileCache,
+    LintFileResult,
     LintFilesRequest,
+    LintOutputSplitter,
     LintResult,
     LintSubsystem,
     LintTargetsRequest,
@@ -29,8 +32,14 @@ from pants.core.util_rules.environments import EnvironmentNameRequest
 from pants.core.util_rules.partitions import PartitionerType, _EmptyMetadata
 from pants.engine.addresses import Address
 from pants.engine.environment import EnvironmentName
-from pants.engine.fs import PathGlobs, SpecsPaths, Workspace
+from pants.engine.fs import EMPTY_DIGEST, EMPTY_FILE_DIGEST, PathGlobs, SpecsPaths, Workspace
 from pants.engine.internals.native_engine import EMPTY_SNAPSHOT, Snapshot
+from pants.engine.platform import Platform
+from pants.engine.process import (
+    FallibleProcessResult,
+    ProcessExecutionEnvironment,
+    ProcessResultMetadata,
+)
 from pants.engine.rules import QueryRule
 from pants.engine.target import Field, FieldSet, FilteredTargets, MultipleSourcesField, Target
 from pants.engine.unions import UnionMembership
@@ -38,6 +47,7 @@ from pants.option.option_types import SkipOption
 from pants.option.subsystem import Subsystem
 from pants.testutil.option_util import create_goal_subsystem
 from pants.testutil.rule_runner import MockGet, RuleRunner, mock_console, run_rule_with_mocks
+from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
 from pants.util.meta import classproperty
 
@@ -359,6 +369,7 @@ def run_lint_rule(
                 lint_subsystem,
                 union_membership,
                 DistDir(relpath=Path("dist")),
+                LintFileCache(),
             ],
             mock_gets=[
                 MockGet(
@@ -660,3 +671,78 @@ def test_streaming_output_partitions() -> None:
 
         """
     )
+
+
+def test_output_splitter() -> None:
+    splitter = LintOutputSplitter(ignored=(r"Found \d+ error",))
+    output = dedent(
+        """\
+        a.py:1:1: E1 first
+          context for the first
+        b.py:2:1: E2 second
+        a.py:3:1: E3 third
+        Found 3 errors.
+        """
+    )
+    assert splitter.split(output, ["a.py", "b.py", "c.py"]) == {
+        "a.py": "a.py:1:1: E1 first\n  context for the first\na.py:3:1: E3 third\n",
+        "b.py": "b.py:2:1: E2 second\n",
+        "c.py": "",
+    }
+    # Output for an unknown file, or which precedes the output of any file, can't be attributed.
+    assert splitter.split(output, ["a.py"]) is None
+    assert splitter.split("Traceback (most recent call last):\n", ["a.py"]) is None
+    assert splitter.split("\n", ["a.py"]) == {"a.py": ""}
+
+
+def test_file_cache(tmp_path: Path, monkeypatch) -> None:
+    cache = LintFileCache(str(tmp_path))
+    batch = SuccessfulRequest.Batch("linter", ("a.py", "b.py"), _EmptyMetadata())
+    keys = {"a.py": "key-a", "b.py": "key-b"}
+
+    lookup = cache.lookup("linter", keys)
+    assert lookup.files_to_run == ("a.py", "b.py")
+    result = lookup.result(
+        batch,
+        FallibleProcessResult(
+            stdout=b"b.py:1:1: E1 bad\n",
+            stdout_digest=EMPTY_FILE_DIGEST,
+            stderr=b"",
+            stderr_digest=EMPTY_FILE_DIGEST,
+            exit_code=1,
+            output_digest=EMPTY_DIGEST,
+            metadata=ProcessResultMetadata(
+                0,
+                ProcessExecutionEnvironment(
+                    environment_name=None,
+                    platform=Platform.create_for_localhost().value,
+                    docker_image=None,
+                    remote_execution=False,
+                    remote_execution_extra_platform_properties=[],
+                    execute_in_workspace=False,
+                ),
+                "ran_locally",
+                0,
+            ),
+        ),
+    )
+    assert result.exit_code == 1
+    assert result.file_results == FrozenDict(
+        {"key-a": LintFileResult(0, ""), "key-b": LintFileResult(1, "b.py:1:1: E1 bad\n")}
+    )
+    cache.save("linter", result.file_results)
+
+    # Only the file whose key changed runs again, and the result of the other is replayed.
+    lookup = cache.lookup("linter", {"a.py": "key-a2", "b.py": "key-b"})
+    assert lookup.files_to_run == ("a.py",)
+    assert lookup.cached == FrozenDict({"b.py": LintFileResult(1, "b.py:1:1: E1 bad\n")})
+    replayed = cache.lookup("linter", keys).result(batch, None)
+    assert (replayed.exit_code, replayed.stdout) == (1, "b.py:1:1: E1 bad\n")
+
+    # The least recently used results are dropped beyond the maximum number of entries.
+    monkeypatch.setattr(LintFileCache, "max_entries", 1)
+    cache.save("linter", {"key-a": LintFileResult(0, "")})
+    assert cache.lookup("linter", keys).files_to_run == ("b.py",)
+
+    (tmp_path / "linter" / "ke" / "key-b").write_text("not json")
+    assert cache.lookup("linter", keys).cached == FrozenDict()
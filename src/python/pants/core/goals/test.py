@@ -6,6 +6,7 @@ from __future__ import annotations
 import itertools
 import json
 import logging
+import math
 import os
 import shlex
 from abc import ABC, ABCMeta
@@ -60,10 +61,19 @@ from pants.engine.target import (
     parse_shard_spec,
 )
 from pants.engine.unions import UnionMembership, UnionRule, distinct_union_type_per_subclass, union
-from pants.option.option_types import BoolOption, EnumOption, IntOption, StrListOption, StrOption
-from pants.util.collections import partition_sequentially
+from pants.option.global_options import GlobalOptions
+from pants.option.option_types import (
+    BoolOption,
+    EnumOption,
+    FloatOption,
+    IntOption,
+    StrListOption,
+    StrOption,
+)
+from pants.util.collections import partition_by_weight, partition_sequentially
 from pants.util.dirutil import safe_open
 from pants.util.docutil import bin_name
+from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
 from pants.util.memo import memoized, memoized_property
 from pants.util.meta import classproperty
@@ -284,6 +294,25 @@ class ShowOutput(Enum):
     NONE = "none"
 
 
+class TestBatching(Enum):
+    """How to divide each partition of tests into batches."""
+
+    COUNT = "count"
+    DURATION = "duration"
+    RUNTIME = "runtime"
+
+    __test__ = False
+
+
+class TestShardStrategy(Enum):
+    """How to divide test targets between shards."""
+
+    COUNT = "count"
+    DURATION = "duration"
+
+    __test__ = False
+
+
 @dataclass(frozen=True)
 class TestDebugRequest:
     process: InteractiveProcess
@@ -591,9 +620,26 @@ class TestSubsystem(GoalSubsystem):
             Useful for splitting large numbers of test files across multiple machines in CI.
             For example, you can run three shards with `--shard=0/3`, `--shard=1/3`, `--shard=2/3`.
 
-            Note that the shards are roughly equal in size as measured by number of files.
-            No attempt is made to consider the size of different files, the time they have
-            taken to run in the past, or other such sophisticated measures.
+            By default, the shards are roughly equal in size as measured by number of files.
+            See `--shard-strategy` to instead balance the shards by historical test durations.
+            """
+        ),
+    )
+    shard_strategy = EnumOption(
+        default=TestShardStrategy.COUNT,
+        help=softwrap(
+            f"""
+            How to divide test targets between shards when `--shard` is set.
+
+            With `{TestShardStrategy.COUNT.value}`, targets are assigned to shards by a hash of
+            their address, so shards have roughly equal numbers of targets.
+
+            With `{TestShardStrategy.DURATION.value}`, targets are assigned to shards so that each
+            shard has roughly the same total expected runtime, based on the durations recorded in
+            `--duration-history-file`. Targets without a recorded duration are assumed to take the
+            average recorded duration. Every shard must see the same history file for the shards to
+            be disjoint, so in CI, restore the same copy of the file on every machine before running
+            any shard.
             """
         ),
     )
@@ -663,6 +709,60 @@ class TestSubsystem(GoalSubsystem):
             """
         ),
     )
+    batching = EnumOption(
+        default=TestBatching.COUNT,
+        advanced=True,
+        help=softwrap(
+            f"""
+            How to divide the compatible tests of batch-enabled test runners into batches.
+
+            With `{TestBatching.COUNT.value}`, batches are created at stable boundaries with
+            around `--batch-size` files each, which maximizes cache hit rates.
+
+            With `{TestBatching.DURATION.value}`, each partition is split into the same number of
+            batches, but files are assigned to batches so that each batch has roughly the same
+            total expected runtime, based on the durations recorded in `--duration-history-file`.
+            This avoids a single batch of slow tests dominating the runtime, at the cost of less
+            stable cache keys.
+
+            With `{TestBatching.RUNTIME.value}`, test runners which can estimate the runtime of
+            their tests (currently only `pytest`) size their partitions so that each batch runs for
+            around `--batch-runtime-target` seconds: partitions of slow tests are split, and fast
+            tests are combined into batches of up to twice `--batch-size` files. Other test runners
+            split partitions as with `{TestBatching.COUNT.value}`, but only once they exceed twice
+            `--batch-size` files.
+            """
+        ),
+    )
+    batch_runtime_target = FloatOption(
+        default=60.0,
+        advanced=True,
+        help=softwrap(
+            f"""
+            The target expected runtime, in seconds, of each batch of tests when
+            `--batching={TestBatching.RUNTIME.value}` is set.
+
+            Larger values amortize the startup cost of each test process over more tests, while
+            smaller values allow for more parallelism between batches.
+            """
+        ),
+    )
+    _duration_history_file = StrOption(
+        default=str(PurePath("{workdir}", "test", "durations.json")),
+        advanced=True,
+        help=softwrap(
+            f"""
+            Path to a JSON file of historical test durations per test target, relative to the
+            build root.
+
+            When `--batching={TestBatching.DURATION.value}`,
+            `--batching={TestBatching.RUNTIME.value}` or `--shard-strategy={TestShardStrategy.DURATION.value}` is set, this file is read to
+            estimate test runtimes, and is updated with the durations of the tests that were run.
+
+            The string `{{workdir}}` will be replaced with the value of `[GLOBAL].pants_workdir`.
+            """
+        ),
+    )
 
     show_rerun_command = BoolOption(
         default="CI" in os.environ,
@@ -700,6 +800,16 @@ class TestSubsystem(GoalSubsystem):
     def report_dir(self, distdir: DistDir) -> PurePath:
         return PurePath(self._report_dir.format(distdir=distdir.relpath))
 
+    def duration_history_file(self, global_options: GlobalOptions) -> PurePath:
+        return PurePath(self._duration_history_file.format(workdir=global_options.pants_workdir))
+
+    @property
+    def uses_durations(self) -> bool:
+        return (
+            self.batching in (TestBatching.DURATION, TestBatching.RUNTIME)
+            or self.shard_strategy == TestShardStrategy.DURATION
+        )
+
 
 class Test(Goal):
     subsystem_cls = TestSubsystem
@@ -802,6 +912,7 @@ async def _get_test_batches(
     targets_to_field_sets: TargetRootsToFieldSets,
     local_environment_name: ChosenLocalEnvironmentName,
     test_subsystem: TestSubsystem,
+    durations: TestDurations,
 ) -> list[TestRequest.Batch]:
     def partitions_get(request_type: type[TestRequest]) -> Get[Partitions]:
         partition_type = cast(TestRequest, request_type)
@@ -824,18 +935,39 @@ async def _get_test_batches(
         partitions_get(request_type) for request_type in core_request_types
     )
 
+    def batch_key(element: Any) -> str:
+        return str(element.address) if isinstance(element, FieldSet) else str(element)
+
+    def split_partition(elements: Sequence[Any]) -> Iterable[list[Any]]:
+        if test_subsystem.batching == TestBatching.RUNTIME:
+            # Partitioners which support this mode have already sized their partitions by runtime.
+            if len(elements) <= 2 * test_subsystem.batch_size:
+                return [list(elements)]
+        if test_subsystem.batching != TestBatching.DURATION:
+            return partition_sequentially(
+                elements,
+                key=batch_key,
+                size_target=test_subsystem.batch_size,
+                size_max=2 * test_subsystem.batch_size,
+            )
+        batches = partition_by_weight(
+            elements,
+            key=batch_key,
+            weight=lambda x: (
+                durations.expected(x.address) if isinstance(x, FieldSet) else durations.default
+            ),
+            num_partitions=math.ceil(len(elements) / max(1, test_subsystem.batch_size)) or 1,
+            size_max=2 * test_subsystem.batch_size,
+        )
+        return (batch for batch in batches if batch)
+
     return [
         request_type.Batch(
             cast(TestRequest, request_type).tool_name, tuple(batch), partition.metadata
         )
         for request_type, partitions in zip(core_request_types, all_partitions)
         for partition in partitions
-        for batch in partition_sequentially(
-            partition.elements,
-            key=lambda x: str(x.address) if isinstance(x, FieldSet) else str(x),
-            size_target=test_subsystem.batch_size,
-            size_max=2 * test_subsystem.batch_size,
-        )
+        for batch in split_partition(partition.elements)
     ]
 
 
@@ -879,6 +1011,84 @@ async def _run_debug_tests(
     return Test(exit_code)
 
 
+@dataclass(frozen=True)
+class TestDurations(EngineAwareReturnType):
+    """Historical test durations in seconds, keyed by the address spec of each test target."""
+
+    durations: FrozenDict[str, float] = FrozenDict()
+
+    __test__ = False
+
+    def cacheable(self) -> bool:
+        # The history file is updated outside of the engine's view at the end of each run.
+        return False
+
+    @classmethod
+    def load(cls, path: PurePath) -> TestDurations:
+        try:
+            with open(path) as fh:
+                data = json.load(fh)
+            return cls(FrozenDict((spec, float(secs)) for spec, secs in data["durations"].items()))
+        except FileNotFoundError:
+            return cls()
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.warning(f"Ignoring the invalid test duration history file at {path}: {e!r}")
+            return cls()
+
+    def save(self, path: PurePath) -> None:
+        with safe_open(path, "w") as fh:
+            json.dump({"durations": dict(sorted(self.durations.items()))}, fh, indent=2)
+
+    @memoized_property
+    def default(self) -> float:
+        """The expected duration of a test which has no recorded history."""
+        if not self.durations:
+            return 1.0
+        return sum(self.durations.values()) / len(self.durations)
+
+    def expected(self, address: Address) -> float:
+        return self.durations.get(address.spec, self.default)
+
+    def updated_with(self, results: Iterable[TestResult]) -> TestDurations:
+        """Record the durations of the given results.
+
+        The elapsed time of a batched result is divided evenly between its addresses.
+        """
+        durations = dict(self.durations)
+        for result in results:
+            if result.exit_code is None or result.result_metadata is None:
+                continue
+            total_elapsed_ms = result.result_metadata.total_elapsed_ms
+            if total_elapsed_ms is None:
+                continue
+            secs = total_elapsed_ms / 1000 / len(result.addresses)
+            for address in result.addresses:
+                durations[address.spec] = secs
+        return TestDurations(FrozenDict(durations))
+
+    def shard(
+        self, targets_to_field_sets: TargetRootsToFieldSets, shard: int, num_shards: int
+    ) -> TargetRootsToFieldSets:
+        """Select the targets belonging to the given shard, balancing expected runtime."""
+        shards = partition_by_weight(
+            targets_to_field_sets.mapping.items(),
+            key=lambda item: item[0].address.spec,
+            weight=lambda item: self.expected(item[0].address),
+            num_partitions=num_shards,
+        )
+        return TargetRootsToFieldSets(dict(shards[shard]))
+
+
+@rule
+async def load_test_durations(
+    test_subsystem: TestSubsystem, global_options: GlobalOptions
+) -> TestDurations:
+    """Load the test duration history, for use by partitioners which estimate test runtimes."""
+    if not test_subsystem.uses_durations:
+        return TestDurations()
+    return TestDurations.load(test_subsystem.duration_history_file(global_options))
+
+
 def _save_test_result_info_report_file(run_id: RunId, results: dict[str, dict]) -> None:
     """Save a JSON file with the information about the test results."""
     timestamp = datetime.now().strftime("%Y_%m_%d_%H_%M_%S")
@@ -897,6 +1107,7 @@ async def run_tests(
     distdir: DistDir,
     run_id: RunId,
     local_environment_name: ChosenLocalEnvironmentName,
+    global_options: GlobalOptions,
 ) -> Test:
     if test_subsystem.debug_adapter:
         goal_description = f"`{test_subsystem.name} --debug-adapter`"
@@ -908,7 +1119,17 @@ async def run_tests(
         goal_description = f"The `{test_subsystem.name}` goal"
         no_applicable_targets_behavior = NoApplicableTargetsBehavior.warn
 
+    duration_history_file = test_subsystem.duration_history_file(global_options)
+    durations = (
+        TestDurations.load(duration_history_file)
+        if test_subsystem.uses_durations
+        else TestDurations()
+    )
+
     shard, num_shards = parse_shard_spec(test_subsystem.shard, "the [test].shard option")
+    shard_by_duration = (
+        num_shards > 0 and test_subsystem.shard_strategy == TestShardStrategy.DURATION
+    )
     targets_to_valid_field_sets = await Get(
         TargetRootsToFieldSets,
         TargetRootsToFieldSetsRequest(
@@ -916,9 +1137,14 @@ async def run_tests(
             goal_description=goal_description,
             no_applicable_targets_behavior=no_applicable_targets_behavior,
             shard=shard,
-            num_shards=num_shards,
+            # When sharding by duration, we select the shard ourselves below.
+            num_shards=-1 if shard_by_duration else num_shards,
         ),
     )
+    if shard_by_duration:
+        targets_to_valid_field_sets = durations.shard(
+            targets_to_valid_field_sets, shard, num_shards
+        )
 
     request_types = union_membership.get(TestRequest)
     test_batches = await _get_test_batches(
@@ -926,6 +1152,7 @@ async def run_tests(
         targets_to_valid_field_sets,
         local_environment_name,
         test_subsystem,
+        durations,
     )
 
     environment_names = await MultiGet(
@@ -1058,6 +1285,9 @@ async def run_tests(
     if test_subsystem.experimental_report_test_result_info:
         _save_test_result_info_report_file(run_id, test_result_info)
 
+    if test_subsystem.uses_durations:
+        durations.updated_with(results).save(duration_history_file)
+
     return Test(exit_code)
 
 
@@ -27,11 +27,14 @@ from pants.core.goals.test import (
     RuntimePackageDependenciesField,
     ShowOutput,
     Test,
+    TestBatching,
     TestDebugAdapterRequest,
     TestDebugRequest,
+    TestDurations,
     TestFieldSet,
     TestRequest,
     TestResult,
+    TestShardStrategy,
     TestSubsystem,
     TestTimeoutField,
     _format_test_rerun_command,
@@ -76,6 +79,7 @@ from pants.engine.target import (
     TargetRootsToFieldSetsRequest,
 )
 from pants.engine.unions import UnionMembership
+from pants.option.global_options import GlobalOptions
 from pants.option.option_types import SkipOption
 from pants.option.subsystem import Subsystem
 from pants.testutil.option_util import create_goal_subsystem, create_subsystem
@@ -87,6 +91,7 @@ from pants.testutil.rule_runner import (
     mock_console,
     run_rule_with_mocks,
 )
+from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
 
 
@@ -275,6 +280,11 @@ def run_test_rule(
     valid_targets: bool = True,
     show_rerun_command: bool = False,
     run_id: RunId = RunId(999),
+    shard: str = "",
+    shard_strategy: TestShardStrategy = TestShardStrategy.COUNT,
+    batching: TestBatching = TestBatching.COUNT,
+    batch_size: int = 1,
+    duration_history_file: str = "{workdir}/test/durations.json",
 ) -> tuple[int, str]:
     test_subsystem = create_goal_subsystem(
         TestSubsystem,
@@ -287,8 +297,11 @@ def run_test_rule(
         xml_dir=None,
         output=output,
         extra_env_vars=[],
-        shard="",
-        batch_size=1,
+        shard=shard,
+        shard_strategy=shard_strategy,
+        batching=batching,
+        batch_size=batch_size,
+        duration_history_file=duration_history_file,
         show_rerun_command=show_rerun_command,
     )
     debug_adapter_subsystem = create_subsystem(
@@ -356,6 +369,7 @@ def run_test_rule(
                 DistDir(relpath=Path("dist")),
                 run_id,
                 ChosenLocalEnvironmentName(EnvironmentName(None)),
+                create_subsystem(GlobalOptions, pants_workdir=rule_runner.pants_workdir),
             ],
             mock_gets=[
                 MockGet(
@@ -645,6 +659,96 @@ def test_report_dir(rule_runner: PythonRuleRunner) -> None:
     assert f"Wrote test reports to {report_dir}" in stderr
 
 
+def test_durations_updated_with() -> None:
+    addr1 = Address("", target_name="t1")
+    addr2 = Address("", target_name="t2")
+    addr3 = Address("", target_name="t3")
+    durations = TestDurations(FrozenDict({addr3.spec: 5.0})).updated_with(
+        [
+            make_test_result(
+                [addr1, addr2],
+                exit_code=0,
+                result_metadata=make_process_result_metadata("ran", total_elapsed_ms=3000),
+            ),
+            # No tests found, so no duration is recorded.
+            make_test_result([Address("", target_name="t4")], exit_code=None),
+        ]
+    )
+    assert durations == TestDurations(
+        FrozenDict({addr1.spec: 1.5, addr2.spec: 1.5, addr3.spec: 5.0})
+    )
+    assert durations.default == 8.0 / 3
+    assert durations.expected(Address("", target_name="unknown")) == 8.0 / 3
+
+
+def test_durations_load_and_save(tmp_path: Path) -> None:
+    path = tmp_path / "durations.json"
+    assert TestDurations.load(path) == TestDurations()
+
+    durations = TestDurations(FrozenDict({"//:t1": 1.5}))
+    durations.save(path)
+    assert TestDurations.load(path) == durations
+
+    path.write_text("not json")
+    assert TestDurations.load(path) == TestDurations()
+
+
+def test_durations_shard() -> None:
+    slow = make_target(Address("", target_name="slow"))
+    fast = [make_target(Address("", target_name=f"fast{i}")) for i in range(4)]
+    durations = TestDurations(
+        FrozenDict({slow.address.spec: 40.0, **{t.address.spec: 10.0 for t in fast}})
+    )
+    targets_to_field_sets = TargetRootsToFieldSets(
+        {tgt: [MockTestFieldSet.create(tgt)] for tgt in [slow, *fast]}
+    )
+    shards = [durations.shard(targets_to_field_sets, i, 2).targets for i in range(2)]
+    assert shards == [(slow,), tuple(fast)]
+
+
+@pytest.mark.parametrize("batching", [TestBatching.DURATION, TestBatching.RUNTIME])
+def test_duration_history_recorded(rule_runner: PythonRuleRunner, batching: TestBatching) -> None:
+    addr1 = Address("", target_name="t1")
+    addr2 = Address("", target_name="t2")
+    exit_code, _ = run_test_rule(
+        rule_runner,
+        request_type=SuccessfulRequest,
+        targets=[make_target(addr1), make_target(addr2)],
+        batching=batching,
+    )
+    assert exit_code == 0
+    durations = TestDurations.load(Path(rule_runner.pants_workdir, "test", "durations.json"))
+    assert durations == TestDurations(FrozenDict({addr1.spec: 0.999, addr2.spec: 0.999}))
+
+
+def test_shard_by_duration(rule_runner: PythonRuleRunner) -> None:
+    slow = Address("", target_name="slow")
+    fast = [Address("", target_name=f"fast{i}") for i in range(3)]
+    history_file = Path(rule_runner.build_root, "durations.json")
+    history = TestDurations(FrozenDict({slow.spec: 30.0, **{addr.spec: 10.0 for addr in fast}}))
+
+    def run_shard(shard: str) -> str:
+        # Every shard must see the same history, so restore it before each run.
+        history.save(history_file)
+        _, stderr = run_test_rule(
+            rule_runner,
+            request_type=SuccessfulRequest,
+            targets=[make_target(addr) for addr in [slow, *fast]],
+            shard=shard,
+            shard_strategy=TestShardStrategy.DURATION,
+            duration_history_file=str(history_file),
+        )
+        return stderr
+
+    stderr = run_shard("0/2")
+    assert slow.spec in stderr
+    assert not any(addr.spec in stderr for addr in fast)
+
+    stderr = run_shard("1/2")
+    assert slow.spec not in stderr
+    assert all(addr.spec in stderr for addr in fast)
+
+
 def test_coverage(rule_runner: PythonRuleRunner) -> None:
     addr1 = Address("", target_name="t1")
     addr2 = Address("", target_name="t2")
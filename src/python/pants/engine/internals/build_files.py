@@ -23,6 +23,7 @@ from pants.build_graph.address import (
     BuildFileAddressRequest,
     MaybeAddress,
     ResolveError,
+    intern_address,
 )
 from pants.engine.engine_aware import EngineAwareParameter
 from pants.engine.env_vars import CompleteEnvironmentVars, EnvironmentVars, EnvironmentVarsRequest
@@ -169,10 +170,12 @@ async def maybe_resolve_address(address_input: AddressInput) -> MaybeAddress:
         # It is an address in the root directory.
         is_file, is_dir = False, True
 
+    # NB: Resolved addresses are held by many long-lived values (e.g. the dependencies of each
+    # target), so equal addresses share a single instance.
     if is_file:
-        return MaybeAddress(address_input.file_to_address())
+        return MaybeAddress(intern_address(address_input.file_to_address()))
     if is_dir:
-        return MaybeAddress(address_input.dir_to_address())
+        return MaybeAddress(intern_address(address_input.dir_to_address()))
     spec = address_input.path_component
     if address_input.target_component:
         spec += f":{address_input.target_component}"
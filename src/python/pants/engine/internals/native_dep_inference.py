@@ -18,6 +18,13 @@ class NativeParsedPythonDependencies:
         object.__setattr__(self, "string_candidates", FrozenDict(string_candidates))
 
 
+class NativeParsedPythonDependenciesBatch(FrozenDict[str, NativeParsedPythonDependencies]):
+    """The parsed dependencies of each Python file in a digest, keyed by path.
+
+    Files that could not be parsed are omitted.
+    """
+
+
 @dataclass(frozen=True)
 class ParsedJavascriptDependencyCandidate:
     file_imports: frozenset[str]
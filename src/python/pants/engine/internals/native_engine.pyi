@@ -579,6 +579,9 @@ async def parse_dockerfile_info(
 async def parse_python_deps(
     deps_request: NativeDependenciesRequest,
 ) -> NativeParsedPythonDependencies: ...
+async def parse_python_deps_batch(
+    deps_request: NativeDependenciesRequest,
+) -> dict[str, NativeParsedPythonDependencies]: ...
 async def parse_javascript_deps(
     deps_request: NativeDependenciesRequest,
 ) -> NativeParsedJavascriptDependencies: ...
@@ -727,7 +730,8 @@ class InferenceMetadata:
 class NativeDependenciesRequest:
     """A request to parse the dependencies of a file.
 
-    * The `digest` is expected to contain exactly one source file.
+    * The `digest` is expected to contain exactly one source file, except for batched
+      parsers (such as `parse_python_deps_batch`), which parse every file in it.
     * Depending on the implementation, a `metadata` structure
       can be passed. It will be supplied to the native parser, and
       it will be incorporated into the cache key.
@@ -875,6 +879,7 @@ def session_wait_for_tail_tasks(
     scheduler: PyScheduler, session: PySession, timeout: float
 ) -> None: ...
 def graph_len(scheduler: PyScheduler) -> int: ...
+def graph_evict_unused(scheduler: PyScheduler, keep_runs: int) -> int: ...
 def graph_visualize(scheduler: PyScheduler, session: PySession, path: str) -> None: ...
 def graph_invalidate_paths(scheduler: PyScheduler, paths: Iterable[str]) -> int: ...
 def graph_invalidate_all_paths(scheduler: PyScheduler) -> int: ...
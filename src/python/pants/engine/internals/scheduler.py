@@ -315,6 +315,13 @@ class Scheduler:
     def graph_len(self) -> int:
         return native_engine.graph_len(self.py_scheduler)
 
+    def evict_unused_graph_nodes(self, keep_runs: int) -> int:
+        """Evict the values of Nodes which were not used in the most recent `keep_runs` runs.
+
+        Returns the number of Nodes which were evicted.
+        """
+        return native_engine.graph_evict_unused(self.py_scheduler, keep_runs)
+
     def execution_add_root_select(
         self, execution_request: PyExecutionRequest, subject_or_params: Any | Params, product: type
     ) -> None:
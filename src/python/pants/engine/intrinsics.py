@@ -28,6 +28,7 @@ from pants.engine.internals.native_dep_inference import (
     NativeParsedDockerfileInfo,
     NativeParsedJavascriptDependencies,
     NativeParsedPythonDependencies,
+    NativeParsedPythonDependenciesBatch,
 )
 from pants.engine.internals.native_engine import NativeDependenciesRequest, task_side_effected
 from pants.engine.internals.session import RunId, SessionValues
@@ -192,6 +193,15 @@ async def parse_python_deps(
     return await native_engine.parse_python_deps(deps_request)
 
 
+@rule
+async def parse_python_deps_batch(
+    deps_request: NativeDependenciesRequest,
+) -> NativeParsedPythonDependenciesBatch:
+    return NativeParsedPythonDependenciesBatch(
+        await native_engine.parse_python_deps_batch(deps_request)
+    )
+
+
 @rule
 async def parse_javascript_deps(
     deps_request: NativeDependenciesRequest,
@@ -10,6 +10,7 @@ import glob as glob_stdlib
 import itertools
 import logging
 import os.path
+import sys
 import textwrap
 import zlib
 from abc import ABC, ABCMeta, abstractmethod
@@ -44,6 +45,7 @@ from typing import (
 from typing_extensions import Self, final
 
 from pants.base.deprecated import warn_or_error
+from pants.build_graph.address import intern_address
 from pants.engine.addresses import Address, Addresses, UnparsedAddressInputs, assert_single_address
 from pants.engine.collection import Collection
 from pants.engine.engine_aware import EngineAwareParameter
@@ -69,6 +71,7 @@ from pants.util.collections import ensure_list, ensure_str_list
 from pants.util.dirutil import fast_relpath
 from pants.util.docutil import bin_name, doc_url
 from pants.util.frozendict import FrozenDict
+from pants.util.interning import record_sharing
 from pants.util.memo import memoized_classproperty, memoized_method, memoized_property
 from pants.util.ordered_set import FrozenOrderedSet
 from pants.util.strutil import bullet_list, help_text, pluralize, softwrap
@@ -244,6 +247,85 @@ class FieldDefaults:
 _F = TypeVar("_F", bound=Field)
 
 
+class _FieldLayout:
+    """The field types of a target type, in alias order, shared by all targets of that type."""
+
+    __slots__ = ("field_types", "indexes", "aliases_to_field_types", "dict_size")
+
+    def __init__(self, field_types: Iterable[type[Field]]) -> None:
+        self.field_types = tuple(sorted(field_types, key=attrgetter("alias")))
+        self.indexes = {field_type: i for i, field_type in enumerate(self.field_types)}
+        self.aliases_to_field_types = Target._get_field_aliases_to_field_types(self.field_types)
+        # The size of the dict which each target would otherwise hold.
+        self.dict_size = sys.getsizeof(dict.fromkeys(self.field_types))
+
+
+class _FieldValues(FrozenDict[Type[Field], Field]):
+    """The fields of a target, stored as a tuple in the order of its type's `_FieldLayout`.
+
+    This behaves like any other `FrozenDict`, but doesn't hold a dict per target.
+    """
+
+    __slots__ = ("_layout", "values_tuple")
+
+    def __init__(self, layout: _FieldLayout, values: tuple[Field, ...]) -> None:
+        # NB: `FrozenDict.__init__` is not called, since it would build a dict.
+        self._layout = layout
+        self.values_tuple = values
+        self._hash = self._calculate_hash()
+
+    @property  # type: ignore[override]
+    def _data(self) -> dict[type[Field], Field]:  # type: ignore[override]
+        return dict(zip(self._layout.field_types, self.values_tuple))
+
+    def _calculate_hash(self) -> int:
+        h = 0
+        # NB: This must match `FrozenDict._calculate_hash`, since the two may compare equal.
+        for pair in zip(self._layout.field_types, self.values_tuple):
+            h ^= hash(pair)
+        return h
+
+    def __getitem__(self, k: type[Field]) -> Field:
+        return self.values_tuple[self._layout.indexes[k]]
+
+    def __contains__(self, k: Any) -> bool:
+        return k in self._layout.indexes
+
+    def __len__(self) -> int:
+        return len(self.values_tuple)
+
+    def __iter__(self) -> Iterator[type[Field]]:
+        return iter(self._layout.field_types)
+
+    def __eq__(self, other: Any) -> Any:
+        if isinstance(other, _FieldValues) and other._layout is self._layout:
+            return self.values_tuple == other.values_tuple
+        return super().__eq__(other)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+
+# Fields without a value which don't depend on the target which they belong to, by type. These
+# are the large majority of the fields of most targets.
+_SHARED_DEFAULT_FIELDS: dict[type[Field], Field] = {}
+
+
+def _default_field(field_type: type[_F], address: Address) -> tuple[_F, bool]:
+    """The field of the given type for a target which does not set it, and whether that instance
+    is shared with other targets.
+
+    An `AsyncFieldMixin` stores its address, so it is never shared.
+    """
+    shared = _SHARED_DEFAULT_FIELDS.get(field_type)
+    if shared is not None:
+        return cast(_F, shared), True
+    field = field_type(NO_VALUE, address)
+    if not issubclass(field_type, AsyncFieldMixin):
+        _SHARED_DEFAULT_FIELDS.setdefault(field_type, field)
+    return field, False
+
+
 @dataclass(frozen=True)
 class Target:
     """A Target represents an addressable set of metadata.
@@ -322,6 +404,7 @@ class Target:
         if origin_sources_blocks:
             _validate_origin_sources_blocks(origin_sources_blocks)
 
+        address = intern_address(address)
         object.__setattr__(
             self, "residence_dir", residence_dir if residence_dir is not None else address.spec_path
         )
@@ -359,9 +442,9 @@ class Target:
         *,
         ignore_unrecognized_fields: bool,
     ) -> FrozenDict[type[Field], Field]:
-        all_field_types = self.class_field_types(union_membership)
-        field_values = {}
-        aliases_to_field_types = self._get_field_aliases_to_field_types(all_field_types)
+        layout = self._field_layout(union_membership)
+        field_values: dict[type[Field], Field] = {}
+        aliases_to_field_types = layout.aliases_to_field_types
 
         for alias, value in unhydrated_values.items():
             if alias not in aliases_to_field_types:
@@ -385,16 +468,31 @@ class Target:
             field_values[field_type] = field_type(value, address)
 
         # For undefined fields, mark the raw value as missing.
-        for field_type in all_field_types:
-            if field_type in field_values:
-                continue
-            field_values[field_type] = field_type(NO_VALUE, address)
-        return FrozenDict(
-            sorted(
-                field_values.items(),
-                key=lambda field_type_to_val_pair: field_type_to_val_pair[0].alias,
-            )
+        shared_defaults = 0
+        shared_defaults_size = 0
+        values = []
+        for field_type in layout.field_types:
+            field = field_values.get(field_type)
+            if field is None:
+                field, shared = _default_field(field_type, address)
+                if shared:
+                    shared_defaults += 1
+                    shared_defaults_size += sys.getsizeof(field)
+            values.append(field)
+
+        result = _FieldValues(layout, tuple(values))
+        if shared_defaults:
+            record_sharing("Field (default value)", shared_defaults_size, shared_defaults)
+        record_sharing(
+            "Target field values (layout)", layout.dict_size - sys.getsizeof(result.values_tuple)
         )
+        return result
+
+    @final
+    @classmethod
+    @memoized_method
+    def _field_layout(cls, union_membership: UnionMembership | None) -> _FieldLayout:
+        return _FieldLayout(cls.class_field_types(union_membership))
 
     @final
     @classmethod
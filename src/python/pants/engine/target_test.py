@@ -476,6 +476,43 @@ def test_target_residence_dir() -> None:
     )
 
 
+def test_target_compact_representation() -> None:
+    class AsyncField(StringField, AsyncFieldMixin):
+        alias = "async_field"
+
+    class CompactTarget(Target):
+        alias = "compact"
+        core_fields = (FortranVersion, FortranExtensions, AsyncField)
+
+    tgt1 = CompactTarget({"version": "dev0"}, Address("dir", target_name="t1"))
+    tgt2 = CompactTarget({}, Address("dir", target_name="t2"))
+
+    # Equal addresses share an instance.
+    assert CompactTarget({}, Address("dir", target_name="t2")).address is tgt2.address
+
+    # Unset fields share an instance, unless they store their address.
+    assert tgt1[FortranExtensions] is tgt2[FortranExtensions]
+    assert tgt1[FortranVersion] != tgt2[FortranVersion]
+    assert tgt1[AsyncField] is not tgt2[AsyncField]
+    assert tgt2[AsyncField].address == tgt2.address
+
+    # The field values behave like (and are equal to) any other `FrozenDict`.
+    expected = FrozenDict(
+        {
+            AsyncField: AsyncField(None, tgt1.address),
+            FortranExtensions: FortranExtensions(None, tgt1.address),
+            FortranVersion: FortranVersion("dev0", tgt1.address),
+        }
+    )
+    assert tgt1.field_values == expected
+    assert expected == tgt1.field_values
+    assert hash(tgt1.field_values) == hash(expected)
+    assert list(tgt1.field_values) == [AsyncField, FortranExtensions, FortranVersion]
+    assert tgt1.field_values.get(UnrelatedField) is None
+    assert UnrelatedField not in tgt1.field_values
+    assert len(tgt1.field_values) == 3
+
+
 # -----------------------------------------------------------------------------------------------
 # Test CoarsenedTarget
 # -----------------------------------------------------------------------------------------------
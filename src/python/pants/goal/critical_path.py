@@ -0,0 +1,244 @@
+# Copyright 2024 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+from pants.engine.internals.scheduler import Workunit
+
+# The workunits which each occupy one slot of `[GLOBAL].process_execution_local_parallelism`.
+LOCAL_PROCESS_WORKUNIT_NAMES = frozenset(
+    ("run_local_process", "run_local_process_via_docker", "run_nailgun_process")
+)
+
+
+@dataclass(frozen=True)
+class WorkunitSpan:
+    """The timing of a completed workunit, in seconds since the epoch."""
+
+    span_id: str
+    parent_ids: tuple[str, ...]
+    name: str
+    description: str | None
+    start: float
+    end: float
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+    @classmethod
+    def from_workunit(cls, workunit: Workunit) -> WorkunitSpan | None:
+        if "duration_secs" not in workunit:
+            return None
+        start = workunit["start_secs"] + workunit["start_nanos"] / 1_000_000_000
+        duration = workunit["duration_secs"] + workunit["duration_nanos"] / 1_000_000_000
+        return cls(
+            span_id=workunit["span_id"],
+            parent_ids=tuple(workunit.get("parent_ids", ())),
+            name=workunit["name"],
+            description=workunit.get("description"),
+            start=start,
+            end=start + duration,
+        )
+
+
+@dataclass(frozen=True)
+class ParallelismSample:
+    """The average number of local processes which ran during a slice of the run."""
+
+    offset: float
+    duration: float
+    achieved: float
+    available: int
+
+
+def _covered_length(intervals: Iterable[tuple[float, float]]) -> float:
+    """The total length covered by the union of the given intervals."""
+    total = 0.0
+    covered_until = float("-inf")
+    for start, end in sorted(intervals):
+        if end <= start or end <= covered_until:
+            continue
+        total += end - max(start, covered_until)
+        covered_until = end
+    return total
+
+
+class WorkunitGraph:
+    """The DAG of the completed workunits of a run, reconstructed from their parent ids."""
+
+    def __init__(self) -> None:
+        self._spans: dict[str, WorkunitSpan] = {}
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+    def add(self, workunits: Iterable[Workunit]) -> None:
+        for workunit in workunits:
+            span = WorkunitSpan.from_workunit(workunit)
+            if span is not None:
+                self._spans[span.span_id] = span
+
+    def _children(self) -> dict[str, list[WorkunitSpan]]:
+        children: dict[str, list[WorkunitSpan]] = defaultdict(list)
+        for span in self._spans.values():
+            for parent_id in span.parent_ids:
+                if parent_id in self._spans:
+                    children[parent_id].append(span)
+        return children
+
+    def _roots(self) -> list[WorkunitSpan]:
+        return [
+            span
+            for span in self._spans.values()
+            if not any(parent_id in self._spans for parent_id in span.parent_ids)
+        ]
+
+    def critical_path(self) -> list[WorkunitSpan]:
+        """The chain of workunits which bounded the wall-clock time of the run.
+
+        Starting from the root workunit which finished last, this repeatedly follows the child
+        workunit which finished last, since its parent could not finish before it did.
+        """
+        roots = self._roots()
+        if not roots:
+            return []
+        children = self._children()
+
+        def last_to_finish(spans: Iterable[WorkunitSpan]) -> WorkunitSpan:
+            return max(spans, key=lambda span: (span.end, span.duration, span.span_id))
+
+        path = [last_to_finish(roots)]
+        visited = {path[0].span_id}
+        while True:
+            candidates = [
+                child
+                for child in children.get(path[-1].span_id, ())
+                if child.span_id not in visited
+            ]
+            if not candidates:
+                return path
+            path.append(last_to_finish(candidates))
+            visited.add(path[-1].span_id)
+
+    def self_times(self) -> dict[str, float]:
+        """The total time spent in workunits of each name, excluding time spent in their children.
+
+        Sorted from the largest to the smallest total.
+        """
+        children = self._children()
+        totals: dict[str, float] = defaultdict(float)
+        for span in self._spans.values():
+            covered = _covered_length(
+                (max(child.start, span.start), min(child.end, span.end))
+                for child in children.get(span.span_id, ())
+            )
+            totals[span.name] += max(0.0, span.duration - covered)
+        return dict(sorted(totals.items(), key=lambda item: (-item[1], item[0])))
+
+    def parallelism(self, available: int, *, num_samples: int = 20) -> list[ParallelismSample]:
+        """The number of local processes which ran over the course of the run, in `num_samples`
+        equal slices of time."""
+        if not self._spans:
+            return []
+        run_start = min(span.start for span in self._spans.values())
+        run_end = max(span.end for span in self._spans.values())
+        width = (run_end - run_start) / num_samples
+        if width <= 0:
+            return []
+        processes = [
+            span for span in self._spans.values() if span.name in LOCAL_PROCESS_WORKUNIT_NAMES
+        ]
+
+        samples = []
+        for i in range(num_samples):
+            sample_start = run_start + i * width
+            sample_end = sample_start + width
+            busy = sum(
+                max(0.0, min(span.end, sample_end) - max(span.start, sample_start))
+                for span in processes
+            )
+            samples.append(
+                ParallelismSample(
+                    offset=sample_start - run_start,
+                    duration=width,
+                    achieved=busy / width,
+                    available=available,
+                )
+            )
+        return samples
+
+    def chrome_trace(self, *, available: int | None = None) -> dict[str, Any]:
+        """Render the workunits in the Chrome trace event format, which is understood by
+        `chrome://tracing` and https://ui.perfetto.dev.
+
+        Workunits are laid out on as few threads as possible, such that the workunits on each
+        thread nest. Workunits on the critical path are in the `critical_path` category, and the
+        number of running local processes is rendered as a counter.
+        """
+        if not self._spans:
+            return {"traceEvents": [], "displayTimeUnit": "ms"}
+        run_start = min(span.start for span in self._spans.values())
+        critical_path = {span.span_id for span in self.critical_path()}
+
+        def micros(secs: float) -> int:
+            return round((secs - run_start) * 1_000_000)
+
+        events: list[dict[str, Any]] = []
+        # For each thread, a stack of the end times of the workunits which are open on it.
+        threads: list[list[float]] = []
+        for span in sorted(
+            self._spans.values(), key=lambda span: (span.start, -span.end, span.span_id)
+        ):
+            for tid, open_ends in enumerate(threads):
+                while open_ends and open_ends[-1] <= span.start:
+                    open_ends.pop()
+                if not open_ends or span.end <= open_ends[-1]:
+                    break
+            else:
+                tid, open_ends = len(threads), []
+                threads.append(open_ends)
+            open_ends.append(span.end)
+
+            args = {"span_id": span.span_id}
+            if span.description:
+                args["description"] = span.description
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": "critical_path" if span.span_id in critical_path else "workunit",
+                    "ph": "X",
+                    "ts": micros(span.start),
+                    "dur": micros(span.end) - micros(span.start),
+                    "pid": 1,
+                    "tid": tid,
+                    "args": args,
+                }
+            )
+
+        changes: dict[float, int] = defaultdict(int)
+        for span in self._spans.values():
+            if span.name in LOCAL_PROCESS_WORKUNIT_NAMES:
+                changes[span.start] += 1
+                changes[span.end] -= 1
+        running = 0
+        for timestamp, change in sorted(changes.items()):
+            running += change
+            counter_args = {"running": running}
+            if available is not None:
+                counter_args["available"] = available
+            events.append(
+                {
+                    "name": "local processes",
+                    "ph": "C",
+                    "ts": micros(timestamp),
+                    "pid": 1,
+                    "args": counter_args,
+                }
+            )
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
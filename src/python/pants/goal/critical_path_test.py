@@ -0,0 +1,93 @@
+# Copyright 2024 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import pytest
+
+from pants.goal.critical_path import WorkunitGraph
+
+
+def workunit(span_id: str, name: str, start: float, end: float, *parent_ids: str) -> dict:
+    return {
+        "span_id": span_id,
+        "parent_ids": parent_ids,
+        "name": name,
+        "start_secs": int(start),
+        "start_nanos": round((start % 1) * 1_000_000_000),
+        "duration_secs": int(end - start),
+        "duration_nanos": round(((end - start) % 1) * 1_000_000_000),
+    }
+
+
+@pytest.fixture
+def graph() -> WorkunitGraph:
+    # A goal which runs two processes concurrently, one of which is requested (and awaited) by
+    # two rules.
+    graph = WorkunitGraph()
+    graph.add(
+        [
+            workunit("root", "goal", 0, 10),
+            workunit("a", "rule_a", 1, 4, "root"),
+            workunit("b", "rule_b", 2, 9, "root"),
+            workunit("p1", "run_local_process", 1, 3, "a"),
+            workunit("p2", "run_local_process", 3, 8, "a", "b"),
+            # A workunit which is still running has no duration, and is ignored.
+            {"span_id": "running", "parent_ids": ("root",), "name": "x", "start_secs": 5},
+        ]
+    )
+    return graph
+
+
+def test_critical_path(graph: WorkunitGraph) -> None:
+    assert [span.span_id for span in graph.critical_path()] == ["root", "b", "p2"]
+    assert WorkunitGraph().critical_path() == []
+
+
+def test_self_times(graph: WorkunitGraph) -> None:
+    assert graph.self_times() == pytest.approx(
+        {
+            "run_local_process": 7.0,
+            "goal": 2.0,
+            "rule_b": 2.0,
+            "rule_a": 0.0,
+        }
+    )
+
+
+def test_parallelism(graph: WorkunitGraph) -> None:
+    samples = graph.parallelism(available=4, num_samples=5)
+    assert [sample.offset for sample in samples] == pytest.approx([0, 2, 4, 6, 8])
+    assert [sample.achieved for sample in samples] == pytest.approx([0.5, 1, 1, 1, 0])
+    assert {sample.available for sample in samples} == {4}
+
+
+def test_chrome_trace(graph: WorkunitGraph) -> None:
+    events = graph.chrome_trace(available=4)["traceEvents"]
+    spans = {event["args"]["span_id"]: event for event in events if event["ph"] == "X"}
+    assert spans["b"] == {
+        "name": "rule_b",
+        "cat": "critical_path",
+        "ph": "X",
+        "ts": 2_000_000,
+        "dur": 7_000_000,
+        "pid": 1,
+        "tid": 1,
+        "args": {"span_id": "b"},
+    }
+    # Workunits on the same thread must nest.
+    assert {span_id: event["tid"] for span_id, event in spans.items()} == {
+        "root": 0,
+        "a": 0,
+        "p1": 0,
+        "b": 1,
+        "p2": 1,
+    }
+    assert spans["a"]["cat"] == "workunit"
+
+    counters = [(event["ts"], event["args"]) for event in events if event["ph"] == "C"]
+    assert counters == [
+        (1_000_000, {"running": 1, "available": 4}),
+        (3_000_000, {"running": 1, "available": 4}),
+        (8_000_000, {"running": 0, "available": 4}),
+    ]
@@ -4,14 +4,21 @@
 from __future__ import annotations
 
 import base64
+import bisect
 import datetime
 import json
 import logging
+import os
+import socket
+import threading
+import time
 from collections import Counter
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Optional, TypedDict
+from typing import Mapping, Optional, TypedDict
+
+import psutil
 
 from pants.engine.internals.scheduler import Workunit
 from pants.engine.rules import collect_rules, rule
@@ -22,16 +29,27 @@ from pants.engine.streaming_workunit_handler import (
     WorkunitsCallbackFactoryRequest,
 )
 from pants.engine.unions import UnionRule
-from pants.option.option_types import BoolOption, EnumOption, StrOption
+from pants.goal.critical_path import WorkunitGraph
+from pants.option.global_options import GlobalOptions
+from pants.option.option_types import BoolOption, EnumOption, FloatOption, StrOption
 from pants.option.subsystem import Subsystem
 from pants.util.collections import deep_getsizeof
 from pants.util.dirutil import safe_open
+from pants.util.interning import sharing_stats
 from pants.util.strutil import softwrap
 
 logger = logging.getLogger(__name__)
 
 HISTOGRAM_PERCENTILES = [25, 50, 75, 90, 95, 99]
 
+# The number of workunit names to report the self time of.
+_MAX_SELF_TIMES = 20
+# The width of the bars which show the local process parallelism of a run.
+_PARALLELISM_BAR_WIDTH = 40
+
+# The upper bounds (in seconds) of the buckets of the workunit duration histograms.
+DURATION_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0)
+
 
 class CounterObject(TypedDict):
     name: str
@@ -54,12 +72,34 @@ class ObservationHistogramObject(TypedDict):
     sum: int
 
 
+class CriticalPathEntryObject(TypedDict):
+    name: str
+    description: str | None
+    start: float
+    duration: float
+
+
+class SelfTimeObject(TypedDict):
+    name: str
+    seconds: float
+
+
+class ParallelismObject(TypedDict):
+    offset: float
+    duration: float
+    achieved: float
+    available: int
+
+
 class StatsObject(TypedDict, total=False):
     timestamp: str
     command: str
     counters: list[CounterObject]
     memory_summary: list[MemorySummaryObject]
     observation_histograms: list[ObservationHistogramObject]
+    critical_path: list[CriticalPathEntryObject]
+    self_times: list[SelfTimeObject]
+    parallelism: list[ParallelismObject]
 
 
 class StatsOutputFormat(Enum):
@@ -99,6 +139,11 @@ class StatsAggregatorSubsystem(Subsystem):
             Keys are the total size in bytes, the count, and the name. Note that the total size
             is for all instances added together, so you can use total_size // count to get the
             average size.
+
+            Entries named `(saved by sharing) ...` instead report the number of values (such as
+            addresses and default field values) which shared an existing equal instance rather
+            than being stored separately, and the approximate number of bytes which that saved,
+            over the lifetime of the Pants process.
             """
         ),
         advanced=True,
@@ -112,6 +157,59 @@ class StatsAggregatorSubsystem(Subsystem):
         default=StatsOutputFormat.text,
         help="Output format for reporting stats.",
     )
+    openmetrics_output = StrOption(
+        default=None,
+        metavar="<path>",
+        advanced=True,
+        help=softwrap(
+            """
+            While Pants runs, periodically write stats in the OpenMetrics text format to this
+            file, e.g. for Prometheus' textfile collector. The file is replaced atomically. To
+            instead send the stats to a listening Unix domain socket, prefix its path with
+            `unix:`.
+
+            The stats are a histogram of the durations of workunits by name, the counters
+            reported by `--stats-log`, the resident memory of the Pants process and the number of
+            nodes in the rule graph. They are updated as each workunit completes, and accumulate
+            for the lifetime of the process, i.e. across runs when using `pantsd`. Unlike
+            `--stats-memory-summary`, they are cheap to compute.
+            """
+        ),
+    )
+    openmetrics_interval = FloatOption(
+        default=15.0,
+        advanced=True,
+        help="How often, in seconds, to write stats to `--stats-openmetrics-output`.",
+    )
+    critical_path = BoolOption(
+        default=False,
+        advanced=True,
+        help=softwrap(
+            """
+            At the end of the Pants run, report what bounded its wall-clock time: the critical
+            path through the workunits of the run, the total time spent in each kind of workunit
+            excluding its children (i.e. its "self time"), and how many of the
+            `[GLOBAL].process_execution_local_parallelism` slots for local processes were used
+            over the course of the run.
+
+            The workunits which are analyzed are those at or above
+            `[GLOBAL].streaming_workunits_level`.
+            """
+        ),
+    )
+    trace_output = StrOption(
+        default=None,
+        metavar="<path>",
+        advanced=True,
+        help=softwrap(
+            """
+            At the end of the Pants run, write its workunits to this file in the Chrome trace
+            event format, which can be viewed with https://ui.perfetto.dev or
+            `chrome://tracing`. Workunits on the critical path (see `--stats-critical-path`) are
+            in the `critical_path` category.
+            """
+        ),
+    )
 
 
 def _log_or_write_to_file_plain(output_file: Optional[str], lines: list[str]) -> None:
@@ -141,6 +239,107 @@ def _log_or_write_to_file_json(output_file: Optional[str], stats_object: StatsOb
     logger.info(f"Wrote Pants stats to {output_file}")
 
 
+def _openmetrics_labels(**labels: str) -> str:
+    escaped = (
+        (key, value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for key, value in labels.items()
+    )
+    return "{" + ",".join(f'{key}="{value}"' for key, value in escaped) + "}"
+
+
+class OpenMetricsAggregator:
+    """Accumulates stats for the lifetime of the process, in memory proportional to the number of
+    distinct workunit names, and renders them in the OpenMetrics text format.
+
+    See https://github.com/OpenObservability/OpenMetrics/blob/main/specification/OpenMetrics.md.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # Per workunit name: the count of observations in each bucket (the last being +Inf), and
+        # the sum of the observations.
+        self._buckets: dict[str, list[int]] = {}
+        self._sums: Counter[str] = Counter()
+        # The counters of the runs which have finished, and of the current run.
+        self._finished_counters: Counter[str] = Counter()
+        self._current_counters: Mapping[str, int] = {}
+        self._gauges: dict[str, int] = {}
+
+    def observe_workunits(self, workunits: tuple[Workunit, ...]) -> None:
+        with self._lock:
+            for workunit in workunits:
+                if "duration_secs" not in workunit:
+                    continue
+                duration = workunit["duration_secs"] + workunit["duration_nanos"] / 1_000_000_000
+                name = workunit["name"]
+                buckets = self._buckets.get(name)
+                if buckets is None:
+                    buckets = self._buckets[name] = [0] * (len(DURATION_BUCKETS) + 1)
+                buckets[bisect.bisect_left(DURATION_BUCKETS, duration)] += 1
+                self._sums[name] += duration
+
+    def update_counters(self, counters: Mapping[str, int], *, finished: bool) -> None:
+        with self._lock:
+            if finished:
+                self._finished_counters.update(counters)
+                self._current_counters = {}
+            else:
+                self._current_counters = counters
+
+    def update_gauges(self, **gauges: int) -> None:
+        with self._lock:
+            self._gauges.update(gauges)
+
+    def render(self) -> str:
+        with self._lock:
+            lines = [
+                "# TYPE pants_workunit_duration_seconds histogram",
+                "# UNIT pants_workunit_duration_seconds seconds",
+                "# HELP pants_workunit_duration_seconds The duration of completed workunits.",
+            ]
+            for name, buckets in sorted(self._buckets.items()):
+                cumulative = 0
+                for bound, count in zip((*DURATION_BUCKETS, "+Inf"), buckets):
+                    cumulative += count
+                    labels = _openmetrics_labels(name=name, le=str(bound))
+                    lines.append(f"pants_workunit_duration_seconds_bucket{labels} {cumulative}")
+                labels = _openmetrics_labels(name=name)
+                lines.append(f"pants_workunit_duration_seconds_count{labels} {cumulative}")
+                lines.append(f"pants_workunit_duration_seconds_sum{labels} {self._sums[name]}")
+
+            counters = self._finished_counters + Counter(self._current_counters)
+            lines.extend(
+                [
+                    "# TYPE pants_counter counter",
+                    "# HELP pants_counter The counters reported by `--stats-log`.",
+                    *(
+                        f"pants_counter_total{_openmetrics_labels(name=name)} {count}"
+                        for name, count in sorted(counters.items())
+                    ),
+                ]
+            )
+            for name, value in sorted(self._gauges.items()):
+                lines.extend([f"# TYPE pants_{name} gauge", f"pants_{name} {value}"])
+            lines.append("# EOF")
+            return "\n".join(lines) + "\n"
+
+    def write(self, output: str) -> None:
+        content = self.render().encode()
+        if output.startswith("unix:"):
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.connect(output[len("unix:") :])
+                sock.sendall(content)
+            return
+        tmp_output = f"{output}.tmp"
+        with safe_open(tmp_output, "wb") as fh:
+            fh.write(content)
+        os.replace(tmp_output, output)
+
+
+# Shared by all runs in the process, so that the stats accumulate across runs in pantsd.
+_openmetrics_aggregator = OpenMetricsAggregator()
+
+
 class StatsAggregatorCallback(WorkunitsCallback):
     def __init__(
         self,
@@ -150,6 +349,11 @@ class StatsAggregatorCallback(WorkunitsCallback):
         output_file: Optional[str],
         has_histogram_module: bool,
         format: StatsOutputFormat,
+        openmetrics_output: Optional[str] = None,
+        openmetrics_interval: float = 15.0,
+        critical_path: bool = False,
+        trace_output: Optional[str] = None,
+        local_parallelism: int = 1,
     ) -> None:
         super().__init__()
         self.log = log
@@ -157,12 +361,106 @@ class StatsAggregatorCallback(WorkunitsCallback):
         self.output_file = output_file
         self.has_histogram_module = has_histogram_module
         self.format = format
+        self.openmetrics_output = openmetrics_output
+        self.openmetrics_interval = openmetrics_interval
+        self._openmetrics_last_write = time.monotonic()
+        self.critical_path = critical_path
+        self.trace_output = trace_output
+        self.local_parallelism = local_parallelism
+        self._workunit_graph = WorkunitGraph()
 
     @property
     def can_finish_async(self) -> bool:
         # We need to finish synchronously for access to the console.
         return False
 
+    def _stream_openmetrics(
+        self,
+        completed_workunits: tuple[Workunit, ...],
+        finished: bool,
+        context: StreamingWorkunitContext,
+    ) -> None:
+        assert self.openmetrics_output is not None
+        _openmetrics_aggregator.observe_workunits(completed_workunits)
+        now = time.monotonic()
+        if not finished and now - self._openmetrics_last_write < self.openmetrics_interval:
+            return
+        self._openmetrics_last_write = now
+
+        _openmetrics_aggregator.update_counters(context.get_metrics(), finished=finished)
+        _openmetrics_aggregator.update_gauges(
+            resident_memory_bytes=psutil.Process().memory_info().rss,
+            graph_nodes=context._scheduler.scheduler.graph_len(),
+        )
+        try:
+            _openmetrics_aggregator.write(self.openmetrics_output)
+        except OSError as e:
+            logger.debug(f"Failed to write stats to {self.openmetrics_output}: {e!r}")
+
+    def _output_critical_path(self) -> None:
+        graph = self._workunit_graph
+        critical_path = graph.critical_path()
+        self_times = list(graph.self_times().items())[:_MAX_SELF_TIMES]
+        parallelism = graph.parallelism(self.local_parallelism)
+        run_start = critical_path[0].start if critical_path else 0.0
+
+        if StatsOutputFormat.jsonlines == self.format:
+            stats_object: StatsObject = {
+                "critical_path": [
+                    {
+                        "name": span.name,
+                        "description": span.description,
+                        "start": round(span.start - run_start, 3),
+                        "duration": round(span.duration, 3),
+                    }
+                    for span in critical_path
+                ],
+                "self_times": [
+                    {"name": name, "seconds": round(secs, 3)} for name, secs in self_times
+                ],
+                "parallelism": [
+                    {
+                        "offset": round(sample.offset, 3),
+                        "duration": round(sample.duration, 3),
+                        "achieved": round(sample.achieved, 2),
+                        "available": sample.available,
+                    }
+                    for sample in parallelism
+                ],
+            }
+            _log_or_write_to_file_json(self.output_file, stats_object)
+            return
+
+        output_lines = ["Critical path (start offset, duration, workunit):"]
+        output_lines.extend(
+            f"  {span.start - run_start:9.3f}s {span.duration:9.3f}s  {span.name}"
+            + (f" ({span.description})" if span.description else "")
+            for span in critical_path
+        )
+        output_lines.append("Self time by workunit name:")
+        output_lines.extend(f"  {secs:9.3f}s  {name}" for name, secs in self_times)
+        if parallelism:
+            utilization = sum(sample.achieved for sample in parallelism) / (
+                len(parallelism) * self.local_parallelism
+            )
+            output_lines.append(
+                f"Local process parallelism (average utilization {utilization:.0%} of "
+                f"{self.local_parallelism} slots):"
+            )
+            output_lines.extend(
+                f"  {sample.offset:9.3f}s  {sample.achieved:6.2f}  "
+                + "#" * round(_PARALLELISM_BAR_WIDTH * sample.achieved / sample.available)
+                for sample in parallelism
+            )
+        _log_or_write_to_file_plain(self.output_file, output_lines)
+
+    def _write_trace(self) -> None:
+        assert self.trace_output is not None
+        trace = self._workunit_graph.chrome_trace(available=self.local_parallelism)
+        with safe_open(self.trace_output, "w") as fh:
+            json.dump(trace, fh)
+        logger.info(f"Wrote a trace of the workunits of this run to {self.trace_output}")
+
     def _output_stats_in_plain_text(self, context: StreamingWorkunitContext):
         output_lines = []
         if self.output_file:
@@ -205,6 +503,10 @@ class StatsAggregatorCallback(WorkunitsCallback):
             entries.extend(
                 (size, count, f"(native) {name}") for name, (count, size) in rust_sizes.items()
             )
+            entries.extend(
+                (stats.bytes_saved, stats.count, f"(saved by sharing) {name}")
+                for name, stats in sharing_stats().items()
+            )
             memory_lines = "\n".join(
                 f"  {size}\t\t{count}\t\t{name}" for size, count, name in sorted(entries)
             )
@@ -286,6 +588,10 @@ class StatsAggregatorCallback(WorkunitsCallback):
             entries.extend(
                 (size, count, f"(native) {name}") for name, (count, size) in rust_sizes.items()
             )
+            entries.extend(
+                (stats.bytes_saved, stats.count, f"(saved by sharing) {name}")
+                for name, stats in sharing_stats().items()
+            )
             memory_lines: list[MemorySummaryObject] = [
                 {"bytes": size, "count": count, "name": name}
                 for size, count, name in sorted(entries)
@@ -340,7 +646,18 @@ class StatsAggregatorCallback(WorkunitsCallback):
         finished: bool,
         context: StreamingWorkunitContext,
     ) -> None:
-        if not finished:
+        if self.openmetrics_output:
+            self._stream_openmetrics(completed_workunits, finished, context)
+
+        if self.critical_path or self.trace_output:
+            self._workunit_graph.add(completed_workunits)
+            if finished:
+                if self.critical_path:
+                    self._output_critical_path()
+                if self.trace_output:
+                    self._write_trace()
+
+        if not finished or not (self.log or self.memory):
             return
 
         if StatsOutputFormat.text == self.format:
@@ -356,7 +673,9 @@ class StatsAggregatorCallbackFactoryRequest:
 
 @rule
 def construct_callback(
-    _: StatsAggregatorCallbackFactoryRequest, subsystem: StatsAggregatorSubsystem
+    _: StatsAggregatorCallbackFactoryRequest,
+    subsystem: StatsAggregatorSubsystem,
+    global_options: GlobalOptions,
 ) -> WorkunitsCallbackFactory:
     has_histogram_module = False
     if subsystem.log:
@@ -380,8 +699,19 @@ def construct_callback(
                 output_file=subsystem.output_file,
                 has_histogram_module=has_histogram_module,
                 format=subsystem.format,
+                openmetrics_output=subsystem.openmetrics_output,
+                openmetrics_interval=subsystem.openmetrics_interval,
+                critical_path=subsystem.critical_path,
+                trace_output=subsystem.trace_output,
+                local_parallelism=max(1, global_options.process_execution_local_parallelism),
+            )
+            if (
+                subsystem.log
+                or subsystem.memory_summary
+                or subsystem.openmetrics_output
+                or subsystem.critical_path
+                or subsystem.trace_output
             )
-            if subsystem.log or subsystem.memory_summary
             else None
         )
     )
@@ -125,3 +125,29 @@ def test_writing_to_output_file_json() -> None:
 
             for field in ("bytes", "count", "name"):
                 assert obj["memory_summary"][0].get(field) is not None
+
+
+def test_openmetrics_output() -> None:
+    with setup_tmpdir({}) as tmpdir:
+        output = Path(tmpdir, "metrics.txt")
+        run_pants([f"--stats-openmetrics-output={output}", "roots"]).assert_success()
+        content = output.read_text()
+    assert "# TYPE pants_workunit_duration_seconds histogram" in content
+    assert re.search(r"pants_counter_total\{name=\"\w+\"\} \d", content)
+    assert re.search(r"pants_resident_memory_bytes \d", content)
+    assert content.endswith("# EOF\n")
+
+
+def test_critical_path() -> None:
+    with setup_tmpdir({}) as tmpdir:
+        trace_file = Path(tmpdir, "trace.json")
+        result = run_pants(["--stats-critical-path", f"--stats-trace-output={trace_file}", "roots"])
+        result.assert_success()
+        trace = json.loads(trace_file.read_text())
+
+    assert "Critical path (start offset, duration, workunit):" in result.stderr
+    assert "Self time by workunit name:" in result.stderr
+    assert "Local process parallelism" in result.stderr
+    events = trace["traceEvents"]
+    assert events
+    assert any(event["cat"] == "critical_path" for event in events if event["ph"] == "X")
@@ -0,0 +1,52 @@
+# Copyright 2024 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from pants.goal.stats_aggregator import OpenMetricsAggregator
+
+
+def workunit(name: str, duration: float) -> dict:
+    return {
+        "name": name,
+        "duration_secs": int(duration),
+        "duration_nanos": int((duration % 1) * 1_000_000_000),
+    }
+
+
+def test_openmetrics_aggregator(tmp_path: Path) -> None:
+    aggregator = OpenMetricsAggregator()
+    aggregator.observe_workunits(
+        (
+            workunit("fast", 0.002),
+            workunit("fast", 0.003),
+            workunit("slow", 400),
+            # Started workunits have no duration, and are ignored.
+            {"name": "fast"},
+        )
+    )
+    aggregator.update_counters({"local_cache_requests": 3}, finished=True)
+    aggregator.update_counters(
+        {"local_cache_requests": 2, "remote_cache_requests": 1}, finished=False
+    )
+    aggregator.update_gauges(graph_nodes=10)
+
+    output = tmp_path / "metrics.txt"
+    aggregator.write(str(output))
+    lines = output.read_text().splitlines()
+
+    assert 'pants_workunit_duration_seconds_bucket{name="fast",le="0.001"} 0' in lines
+    assert 'pants_workunit_duration_seconds_bucket{name="fast",le="0.005"} 2' in lines
+    assert 'pants_workunit_duration_seconds_bucket{name="fast",le="+Inf"} 2' in lines
+    assert 'pants_workunit_duration_seconds_count{name="fast"} 2' in lines
+    assert 'pants_workunit_duration_seconds_bucket{name="slow",le="300.0"} 0' in lines
+    assert 'pants_workunit_duration_seconds_bucket{name="slow",le="+Inf"} 1' in lines
+    assert 'pants_workunit_duration_seconds_sum{name="slow"} 400.0' in lines
+    # Counters of finished runs accumulate with those of the current run.
+    assert 'pants_counter_total{name="local_cache_requests"} 5' in lines
+    assert 'pants_counter_total{name="remote_cache_requests"} 1' in lines
+    assert "pants_graph_nodes 10" in lines
+    assert lines[-1] == "# EOF"
+    assert not (tmp_path / "metrics.txt.tmp").exists()
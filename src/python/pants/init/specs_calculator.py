@@ -4,6 +4,7 @@
 import logging
 from typing import cast
 
+from pants.backend.project_info.dependents import DependenciesIndex
 from pants.base.glob_match_error_behavior import GlobMatchErrorBehavior
 from pants.base.specs import AddressLiteralSpec, FileLiteralSpec, RawSpecs, Specs
 from pants.base.specs_parser import SpecsParser
@@ -18,7 +19,7 @@ from pants.engine.rules import QueryRule
 from pants.option.options import Options
 from pants.option.options_bootstrapper import OptionsBootstrapper
 from pants.util.frozendict import FrozenDict
-from pants.vcs.changed import ChangedAddresses, ChangedOptions, ChangedRequest
+from pants.vcs.changed import ChangedAddresses, ChangedOptions, ChangedRequest, DependentsOption
 from pants.vcs.git import GitWorktreeRequest, MaybeGitWorktree
 from pants.vcs.hunk import TextBlocks
 
@@ -108,6 +109,15 @@ def calculate_specs(
     )
     logger.debug("changed addresses: %s", changed_addresses)
 
+    dependents_index_file = options.for_scope("dependents").index_file
+    if changed_options.dependents != DependentsOption.NONE and dependents_index_file:
+        # The index was already computed in order to find the dependents, so persist it for the
+        # next run.
+        (dependents_index,) = session.product_request(
+            DependenciesIndex, [Params(options_bootstrapper, bootstrap_environment)]
+        )
+        cast(DependenciesIndex, dependents_index).write(dependents_index_file)
+
     address_literal_specs = []
     for address in cast(ChangedAddresses, changed_addresses):
         address_input = AddressInput.parse(address.spec, description_of_origin="`--changed-since`")
@@ -142,6 +152,7 @@ def calculate_specs(
 def rules():
     return [
         QueryRule(ChangedAddresses, [ChangedRequest, EnvironmentName]),
+        QueryRule(DependenciesIndex, [EnvironmentName]),
         QueryRule(GitBinary, [EnvironmentName]),
         QueryRule(MaybeGitWorktree, [GitWorktreeRequest, GitBinary, EnvironmentName]),
         QueryRule(FilesWithSourceBlocks, [EnvironmentName]),
@@ -22,7 +22,7 @@ from pants.jvm.target_types import (
     JvmResolveField,
 )
 from pants.util.docutil import bin_name
-from pants.util.frozendict import FrozenDict
+from pants.util.frozendict import FrozenDict, LargeFrozenDict
 from pants.util.logging import LogLevel
 from pants.util.ordered_set import FrozenOrderedSet, OrderedSet
 
@@ -269,7 +269,7 @@ def find_all_jvm_provides_fields(targets: AllTargets) -> AllJvmTypeProvidingTarg
     )
 
 
-class ThirdPartySymbolMapping(FrozenDict[_ResolveName, FrozenTrieNode]):
+class ThirdPartySymbolMapping(LargeFrozenDict[_ResolveName, FrozenTrieNode]):
     """The third party symbols provided by all `jvm_artifact` targets."""
 
 
@@ -348,9 +348,7 @@ async def compute_java_third_party_symbol_mapping(
                 mapping.insert(provides_type, [], first_party=True, recursive=False)
 
     return ThirdPartySymbolMapping(
-        FrozenDict(
-            (resolve_name, FrozenTrieNode(mapping)) for resolve_name, mapping in mappings.items()
-        )
+        (resolve_name, FrozenTrieNode(mapping)) for resolve_name, mapping in mappings.items()
     )
 
 
@@ -20,7 +20,7 @@ from pants.jvm.dependency_inference.artifact_mapper import (
 )
 from pants.jvm.subsystems import JvmSubsystem
 from pants.jvm.target_types import JvmProvidesTypesField, JvmResolveField
-from pants.util.frozendict import FrozenDict
+from pants.util.frozendict import FrozenDict, LargeFrozenDict
 from pants.util.logging import LogLevel
 from pants.util.ordered_set import FrozenOrderedSet
 
@@ -50,7 +50,7 @@ class FirstPartyMappingRequest:
     """
 
 
-class SymbolMap(FrozenDict[_ResolveName, FrozenTrieNode]):
+class SymbolMap(LargeFrozenDict[_ResolveName, FrozenTrieNode]):
     """The first party symbols provided by a single inference implementation."""
 
 
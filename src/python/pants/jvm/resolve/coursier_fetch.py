@@ -13,9 +13,11 @@ from collections import defaultdict
 from dataclasses import dataclass
 from itertools import chain
 from typing import TYPE_CHECKING, Any, FrozenSet, Iterable, Iterator, List, Tuple
+from urllib.parse import urlparse
 
 import toml
 
+from pants.base.exceptions import EngineError
 from pants.base.glob_match_error_behavior import GlobMatchErrorBehavior
 from pants.core.goals.generate_lockfiles import DEFAULT_TOOL_LOCKFILE, GenerateLockfilesSubsystem
 from pants.core.util_rules.source_files import SourceFiles, SourceFilesRequest
@@ -27,8 +29,10 @@ from pants.engine.fs import (
     Digest,
     DigestContents,
     DigestSubset,
+    DownloadFile,
     FileContent,
     FileDigest,
+    FileEntry,
     MergeDigests,
     PathGlobs,
     RemovePrefix,
@@ -52,7 +56,7 @@ from pants.jvm.resolve.common import (
     GatherJvmCoordinatesRequest,
 )
 from pants.jvm.resolve.coordinate import Coordinate, Coordinates
-from pants.jvm.resolve.coursier_setup import Coursier, CoursierFetchProcess
+from pants.jvm.resolve.coursier_setup import Coursier, CoursierFetchProcess, CoursierSubsystem
 from pants.jvm.resolve.key import CoursierResolveKey
 from pants.jvm.resolve.lockfile_metadata import JVMLockfileMetadata, LockfileContext
 from pants.jvm.subsystems import JvmSubsystem
@@ -563,11 +567,43 @@ class ResolvedClasspathEntries(Collection[ClasspathEntry]):
     """A collection of resolved classpath entries."""
 
 
+def _direct_download_urls(entry: CoursierLockfileEntry, repos: Iterable[str]) -> tuple[str, ...]:
+    """The URLs from which the artifact of the entry may be downloaded without Coursier, in order of
+    preference.
+
+    The content of a download is verified against the digest in the lockfile, so it doesn't matter
+    which repository Coursier originally fetched the artifact from.
+    """
+    if entry.pants_address:
+        return ()
+    if entry.remote_url:
+        return (entry.remote_url,)
+    coord = entry.coord
+    if coord.version.endswith("-SNAPSHOT"):
+        # Snapshots are published under timestamped file names, which only Coursier can resolve.
+        return ()
+    _, ext = os.path.splitext(entry.file_name)
+    classifier = f"-{coord.classifier}" if coord.classifier else ""
+    path = "/".join(
+        (
+            *coord.group.split("."),
+            coord.artifact,
+            coord.version,
+            f"{coord.artifact}-{coord.version}{classifier}{ext}",
+        )
+    )
+    return tuple(
+        f"{repo.rstrip('/')}/{path}"
+        for repo in repos
+        if urlparse(repo).scheme in ("http", "https", "file")
+    )
+
+
 @rule
 async def coursier_fetch_one_coord(
-    request: CoursierLockfileEntry,
+    request: CoursierLockfileEntry, coursier_subsystem: CoursierSubsystem
 ) -> ClasspathEntry:
-    """Run `coursier fetch --intransitive` to fetch a single artifact.
+    """Fetch a single artifact, directly or with `coursier fetch --intransitive`.
 
     This rule exists to permit efficient subsetting of a "global" classpath
     in the form of a lockfile.  Callers can determine what subset of dependencies
@@ -582,8 +618,28 @@ async def coursier_fetch_one_coord(
     removed, `coursier fetch` will re-download the artifact, and this rule will
     confirm that what was downloaded matches exactly (by content digest) what
     was specified in the lockfile (what Coursier originally downloaded).
+
+    If `[coursier].download_directly` is enabled, the artifact is first downloaded directly (and
+    verified in the same way), and Coursier only runs if that fails.
     """
 
+    if coursier_subsystem.download_directly:
+        for url in _direct_download_urls(request, coursier_subsystem.repos):
+            try:
+                await Get(Digest, DownloadFile(url, request.file_digest))
+            except EngineError as e:
+                logger.debug(f"Failed to download {url} directly, falling back to Coursier: {e}")
+                continue
+            # The download is named after the URL, so create the classpath entry by digest, with
+            # the same name that Coursier's would have.
+            classpath_dest_name = classpath_dest_filename(
+                request.coord.to_coord_str(), request.file_name
+            )
+            digest = await Get(
+                Digest, CreateDigest([FileEntry(classpath_dest_name, request.file_digest)])
+            )
+            return ClasspathEntry(digest=digest, filenames=(classpath_dest_name,))
+
     # Prepare any URL- or JAR-specifying entries for use with Coursier
     req: ArtifactRequirement
     if request.pants_address:
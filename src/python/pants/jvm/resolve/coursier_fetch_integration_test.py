@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import textwrap
 
 import pytest
@@ -443,6 +444,37 @@ def test_fetch_one_coord_with_no_deps(rule_runner: RuleRunner) -> None:
     )
 
 
+def test_fetch_one_coord_directly(rule_runner: RuleRunner) -> None:
+    # An artifact which only exists in a local repository, and so can't be fetched by Coursier
+    # (which would also require a JDK) from the default repositories.
+    content = b"not really a jar"
+    rule_runner.write_files({"repo/org/example/lib/1.0/lib-1.0.jar": content})
+    rule_runner.set_options(
+        [f"--coursier-repos=['file://{rule_runner.build_root}/repo']"],
+        env_inherit=PYTHON_BOOTSTRAP_ENV,
+    )
+    file_digest = FileDigest(hashlib.sha256(content).hexdigest(), len(content))
+    classpath_entry = rule_runner.request(
+        ClasspathEntry,
+        [
+            CoursierLockfileEntry(
+                coord=Coordinate(group="org.example", artifact="lib", version="1.0"),
+                file_name="org.example_lib_1.0.jar",
+                direct_dependencies=Coordinates([]),
+                dependencies=Coordinates([]),
+                file_digest=file_digest,
+            )
+        ],
+    )
+    assert classpath_entry.filenames == ("org.example_lib_1.0.jar",)
+    assert (
+        rule_runner.request(
+            FileDigest, [ExtractFileDigest(classpath_entry.digest, "org.example_lib_1.0.jar")]
+        )
+        == file_digest
+    )
+
+
 @maybe_skip_jdk_test
 def test_fetch_one_coord_with_transitive_deps(rule_runner: RuleRunner) -> None:
     junit_coord = Coordinate(group="junit", artifact="junit", version="4.13.2")
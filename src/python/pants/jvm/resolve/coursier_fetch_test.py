@@ -11,8 +11,13 @@ from pants.backend.java.target_types import JavaSourcesGeneratorTarget
 from pants.backend.java.target_types import rules as target_types_rules
 from pants.core.util_rules import config_files, source_files
 from pants.engine.addresses import Address, Addresses
-from pants.jvm.resolve.coordinate import Coordinate
-from pants.jvm.resolve.coursier_fetch import NoCompatibleResolve
+from pants.engine.fs import FileDigest
+from pants.jvm.resolve.coordinate import Coordinate, Coordinates
+from pants.jvm.resolve.coursier_fetch import (
+    CoursierLockfileEntry,
+    NoCompatibleResolve,
+    _direct_download_urls,
+)
 from pants.jvm.resolve.coursier_fetch import rules as coursier_fetch_rules
 from pants.jvm.resolve.key import CoursierResolveKey
 from pants.jvm.target_types import DeployJarTarget, JvmArtifactTarget
@@ -124,3 +129,45 @@ def test_no_matching_for_leaf(rule_runner: RuleRunner) -> None:
 )
 def test_from_coord_str(coord_str: str, expected: Coordinate) -> None:
     assert Coordinate.from_coord_str(coord_str) == expected
+
+
+def test_direct_download_urls() -> None:
+    def entry(coord: Coordinate, file_name: str, **kwargs) -> CoursierLockfileEntry:
+        return CoursierLockfileEntry(
+            coord=coord,
+            file_name=file_name,
+            direct_dependencies=Coordinates(),
+            dependencies=Coordinates(),
+            file_digest=FileDigest("abc", 1),
+            **kwargs,
+        )
+
+    repos = ["https://repo1.example.com/maven2/", "file:///srv/maven", "ivy2Local"]
+    assert _direct_download_urls(
+        entry(
+            Coordinate("org.hamcrest", "hamcrest-core", "1.3"), "org.hamcrest_hamcrest-core_1.3.jar"
+        ),
+        repos,
+    ) == (
+        "https://repo1.example.com/maven2/org/hamcrest/hamcrest-core/1.3/hamcrest-core-1.3.jar",
+        "file:///srv/maven/org/hamcrest/hamcrest-core/1.3/hamcrest-core-1.3.jar",
+    )
+    assert _direct_download_urls(
+        entry(
+            Coordinate("io.grpc", "protoc-gen-grpc-java", "1.48.0", "exe", "linux-x86_64"),
+            "io.grpc_protoc-gen-grpc-java_exe_linux-x86_64_1.48.0.exe",
+        ),
+        repos[:1],
+    ) == (
+        "https://repo1.example.com/maven2/io/grpc/protoc-gen-grpc-java/1.48.0/"
+        "protoc-gen-grpc-java-1.48.0-linux-x86_64.exe",
+    )
+
+    # Snapshots and local jars are left to Coursier, and explicit URLs are used as is.
+    snapshot = Coordinate("ex", "ex", "1.0-SNAPSHOT")
+    assert _direct_download_urls(entry(snapshot, "ex_ex_1.0-SNAPSHOT.jar"), repos) == ()
+    coord = Coordinate("ex", "ex", "1.0")
+    assert _direct_download_urls(entry(coord, "ex_ex_1.0.jar", pants_address="//:jar"), repos) == ()
+    assert _direct_download_urls(
+        entry(coord, "ex_ex_1.0.jar", remote_url="https://example.com/ex.jar"), repos
+    ) == ("https://example.com/ex.jar",)
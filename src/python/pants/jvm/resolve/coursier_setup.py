@@ -24,7 +24,7 @@ from pants.engine.platform import Platform
 from pants.engine.process import Process
 from pants.engine.rules import Get, MultiGet, collect_rules, rule
 from pants.engine.unions import UnionRule
-from pants.option.option_types import StrListOption, StrOption
+from pants.option.option_types import BoolOption, StrListOption, StrOption
 from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
 from pants.util.memo import memoized_property
@@ -156,6 +156,28 @@ class CoursierSubsystem(TemplatedExternalTool):
         ),
     )
 
+    download_directly = BoolOption(
+        default=False,
+        advanced=True,
+        help=softwrap(
+            """
+            If true, download the artifact of each lockfile entry directly from the URL that
+            the `[coursier].repos` (or the `url` field of its `jvm_artifact`) imply for it, and
+            verify it against the digest in the lockfile, rather than starting Coursier to fetch
+            each artifact.
+
+            Coursier is still used for artifacts which are provided by a `jar` field, for
+            snapshot versions, and for artifacts which cannot be downloaded from any of those
+            URLs, e.g. because a repository requires credentials which only Coursier is
+            configured with.
+
+            Direct downloads do not use Coursier's mirror or credential configuration. If the
+            repositories are not reachable directly (e.g. when they are only available through a
+            mirror), each artifact first fails to download, with retries, before falling back to
+            Coursier, so only enable this if the `[coursier].repos` can be reached directly.
+            """
+        ),
+    )
     jvm_index = StrOption(
         default="",
         help=softwrap(
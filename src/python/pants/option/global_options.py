@@ -1162,6 +1162,27 @@ class BootstrapOptions:
             """
         ),
     )
+    pantsd_soft_max_memory_usage = MemorySizeOption(
+        advanced=True,
+        default=None,
+        help=softwrap(
+            """
+            A soft limit on the memory usage of the pantsd process, which should be lower than
+            `[GLOBAL].pantsd_max_memory_usage`.
+
+            When the soft limit is exceeded, the daemon evicts the in-memory results of work
+            which was not used by the most recent runs, until it is back under the limit. Unlike
+            exceeding `[GLOBAL].pantsd_max_memory_usage`, this does not restart the daemon, so
+            results used by recent runs stay cached. Evictions are reported in the
+            `graph_evictions` and `graph_nodes_evicted` counters of the next run.
+
+            You can suffix with `GiB`, `MiB`, `KiB`, or `B` to indicate the unit, e.g.
+            `2GiB` or `2.12GiB`. A bare number will be in bytes.
+
+            If unset, the daemon only restarts when it exceeds the maximum memory usage.
+            """
+        ),
+    )
 
     # These facilitate configuring the native engine.
     print_stacktrace = BoolOption(
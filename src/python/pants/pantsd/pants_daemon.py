@@ -115,6 +115,7 @@ class PantsDaemon(PantsDaemonProcessManager):
             ),
             pid=os.getpid(),
             max_memory_usage_in_bytes=bootstrap_options.pantsd_max_memory_usage,
+            soft_max_memory_usage_in_bytes=bootstrap_options.pantsd_soft_max_memory_usage,
         )
 
         store_gc_service = StoreGCService(
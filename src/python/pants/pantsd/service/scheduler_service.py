@@ -27,6 +27,12 @@ class SchedulerService(PantsService):
     INVALIDATION_POLL_INTERVAL = 0.5
     # A grace period after startup that we will wait before enforcing our pid.
     PIDFILE_GRACE_PERIOD = 5
+    # When over the soft memory limit, the number of most recent runs whose graph Nodes are kept
+    # by each successive eviction: each is more aggressive than the last.
+    EVICTION_KEEP_RUNS = (8, 4, 2, 1)
+    # The minimum interval between evictions: freed memory is not necessarily returned to the OS
+    # immediately, and each eviction walks the entire graph.
+    EVICTION_INTERVAL = 30
 
     def __init__(
         self,
@@ -37,6 +43,7 @@ class SchedulerService(PantsService):
         pidfile: str,
         pid: int,
         max_memory_usage_in_bytes: int,
+        soft_max_memory_usage_in_bytes: Optional[int] = None,
     ) -> None:
         """
         :param graph_scheduler: The GraphScheduler instance for graph construction.
@@ -48,6 +55,9 @@ class SchedulerService(PantsService):
         :param pid: This processes' pid.
         :param max_memory_usage_in_bytes: The maximum memory usage of the process: the service will
                                           shut down if it observes more than this amount in use.
+        :param soft_max_memory_usage_in_bytes: A soft limit on the memory usage of the process: the
+                                               service will evict unused graph Nodes if it observes
+                                               more than this amount in use.
         """
         super().__init__()
         self._graph_helper = graph_scheduler
@@ -70,6 +80,8 @@ class SchedulerService(PantsService):
         self._pidfile = pidfile
         self._pid = pid
         self._max_memory_usage_in_bytes = max_memory_usage_in_bytes
+        self._soft_max_memory_usage_in_bytes = soft_max_memory_usage_in_bytes
+        self._next_eviction_time = 0.0
 
     def _get_snapshot(self, globs: Tuple[str, ...], poll: bool) -> Optional[Snapshot]:
         """Returns a Snapshot of the input globs.
@@ -115,10 +127,13 @@ class SchedulerService(PantsService):
         if int(pid_from_file) != self._pid:
             raise Exception(f"Another instance of pantsd is running at {pid_from_file}")
 
+    def _memory_usage_in_bytes(self) -> int:
+        return cast(int, psutil.Process(self._pid).memory_info()[0])
+
     def _check_memory_usage(self):
-        memory_usage_in_bytes = psutil.Process(self._pid).memory_info()[0]
+        memory_usage_in_bytes = self._memory_usage_in_bytes()
+        bytes_per_mib = 1_048_576
         if memory_usage_in_bytes > self._max_memory_usage_in_bytes:
-            bytes_per_mib = 1_048_576
             raise Exception(
                 softwrap(
                     f"""
@@ -128,6 +143,33 @@ class SchedulerService(PantsService):
                     """
                 )
             )
+        soft_limit = self._soft_max_memory_usage_in_bytes
+        if soft_limit is None or memory_usage_in_bytes <= soft_limit:
+            return
+        now = time.time()
+        if now < self._next_eviction_time:
+            return
+        self._next_eviction_time = now + self.EVICTION_INTERVAL
+
+        # Evict progressively more recently used graph Nodes until we are back under the soft
+        # limit. The Nodes used by the most recent run are never evicted.
+        evicted = 0
+        for keep_runs in self.EVICTION_KEEP_RUNS:
+            evicted += self._scheduler.evict_unused_graph_nodes(keep_runs)
+            memory_usage_in_bytes = self._memory_usage_in_bytes()
+            if memory_usage_in_bytes <= soft_limit:
+                break
+        if not evicted:
+            return
+        self._logger.info(
+            softwrap(
+                f"""
+                pantsd exceeded the `--pantsd-soft-max-memory-usage` limit of
+                {soft_limit / bytes_per_mib:.2f} MiB: evicted {evicted} unused graph nodes, and is
+                now using {memory_usage_in_bytes / bytes_per_mib:.2f} MiB.
+                """
+            )
+        )
 
     def _check_invalidation_watcher_liveness(self):
         self._scheduler.check_invalidation_watcher_liveness()
@@ -0,0 +1,65 @@
+# Copyright 2024 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+import os
+
+import pytest
+
+from pants.engine.fs import PathGlobs, Snapshot
+from pants.init.engine_initializer import GraphScheduler
+from pants.pantsd.service.scheduler_service import SchedulerService
+from pants.testutil.rule_runner import RuleRunner
+
+
+def test_check_memory_usage() -> None:
+    rule_runner = RuleRunner()
+    rule_runner.write_files({"a.txt": "a"})
+    snapshot = rule_runner.request(Snapshot, [PathGlobs(["a.txt"])])
+    # Begin a later run, so that the Nodes of the earlier run are no longer the most recently used.
+    rule_runner.new_session("later_run")
+
+    scheduler = rule_runner.scheduler.scheduler
+    service = SchedulerService(
+        graph_scheduler=GraphScheduler(scheduler, goal_map={}),
+        build_root=rule_runner.build_root,
+        invalidation_globs=(),
+        pidfile=os.path.join(rule_runner.build_root, "pid"),
+        pid=os.getpid(),
+        max_memory_usage_in_bytes=200,
+        soft_max_memory_usage_in_bytes=100,
+    )
+    memory_usage_in_bytes = 50
+    service._memory_usage_in_bytes = lambda: memory_usage_in_bytes  # type: ignore[method-assign]
+    evicted = []
+    evict_unused_graph_nodes = scheduler.evict_unused_graph_nodes
+
+    def record_eviction(keep_runs: int) -> int:
+        evicted.append(evict_unused_graph_nodes(keep_runs))
+        return evicted[-1]
+
+    scheduler.evict_unused_graph_nodes = record_eviction  # type: ignore[method-assign]
+
+    # Under the soft limit, nothing is evicted.
+    service._check_memory_usage()
+    assert evicted == []
+
+    # Over the soft limit, the nodes of the earlier run are evicted, and each eviction is
+    # progressively more aggressive.
+    memory_usage_in_bytes = 150
+    service._check_memory_usage()
+    assert len(evicted) == len(SchedulerService.EVICTION_KEEP_RUNS)
+    assert sum(evicted) > 0
+
+    # Evictions are rate limited.
+    service._check_memory_usage()
+    assert len(evicted) == len(SchedulerService.EVICTION_KEEP_RUNS)
+
+    # Evictions are reported in the metrics of the next run, and evicted nodes are recomputed.
+    rule_runner.new_session("after_eviction")
+    assert rule_runner.request(Snapshot, [PathGlobs(["a.txt"])]) == snapshot
+    assert rule_runner.scheduler.get_metrics()["graph_evictions"] > 0
+
+    # Over the hard limit, the service restarts.
+    memory_usage_in_bytes = 250
+    with pytest.raises(Exception, match="pantsd-max-memory-usage"):
+        service._check_memory_usage()
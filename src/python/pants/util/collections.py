@@ -6,6 +6,7 @@ from __future__ import annotations
 import collections
 import collections.abc
 import gc
+import heapq
 import math
 from sys import getsizeof
 from typing import Any, Callable, Iterable, Iterator, MutableMapping, TypeVar
@@ -150,3 +151,82 @@ def partition_sequentially(
             yield emit_batch()
     if batch:
         yield emit_batch()
+
+
+def partition_by_weight(
+    items: Iterable[_T],
+    *,
+    key: Callable[[_T], str],
+    weight: Callable[[_T], float],
+    num_partitions: int,
+    size_max: int | None = None,
+) -> list[list[_T]]:
+    """Deterministically partitions the given items into `num_partitions` lists of roughly equal
+    total weight.
+
+    Uses the "longest processing time first" heuristic: items are visited in descending order of
+    weight (with ties broken by `key`), and each is assigned to the partition with the lowest total
+    weight so far (with ties broken by partition index). Partitions which already contain
+    `size_max` items are not assigned any more items, so `num_partitions * size_max` must be at
+    least the number of items.
+
+    Unlike `partition_sequentially`, adding or removing a single item may cause many partitions to
+    change, so this should be preferred only when balancing weight matters more than stability.
+
+    The items in each returned partition are sorted by `key`. Some partitions may be empty.
+    """
+    if num_partitions < 1:
+        raise ValueError(f"The number of partitions must be positive, but was {num_partitions}.")
+
+    keyed_items = sorted(((-weight(item), key(item), item) for item in items), key=lambda t: t[:2])
+    if size_max is not None and len(keyed_items) > num_partitions * size_max:
+        raise ValueError(
+            softwrap(
+                f"""
+                Cannot partition {len(keyed_items)} items into {num_partitions} partitions of at
+                most {size_max} items each.
+                """
+            )
+        )
+
+    partitions: list[list[tuple[str, _T]]] = [[] for _ in range(num_partitions)]
+    # A heap of `(total weight, partition index)` for the partitions which are not yet full.
+    heap = [(0.0, i) for i in range(num_partitions)]
+    for neg_weight, item_key, item in keyed_items:
+        total, index = heapq.heappop(heap)
+        partitions[index].append((item_key, item))
+        if size_max is None or len(partitions[index]) < size_max:
+            heapq.heappush(heap, (total - neg_weight, index))
+
+    return [[item for _, item in sorted(partition, key=lambda t: t[0])] for partition in partitions]
+
+
+def partition_by_weight_target(
+    items: Iterable[_T],
+    *,
+    key: Callable[[_T], str],
+    weight: Callable[[_T], float],
+    weight_target: float,
+    size_max: int | None = None,
+) -> Iterator[list[_T]]:
+    """Partitions the given items into sequential batches of around `weight_target` total weight.
+
+    Items are sorted by `key`, and a batch is emitted as soon as its total weight reaches
+    `weight_target` (or it contains `size_max` items), so heavy items end up in small batches and
+    light items are combined into larger ones. An item heavier than `weight_target` is always
+    placed in a batch of its own.
+    """
+    batch: list[_T] = []
+    batch_weight = 0.0
+    for _, item in sorted(((key(item), item) for item in items), key=lambda t: t[0]):
+        item_weight = weight(item)
+        if batch and batch_weight + item_weight > weight_target and item_weight >= weight_target:
+            yield batch
+            batch, batch_weight = [], 0.0
+        batch.append(item)
+        batch_weight += item_weight
+        if batch_weight >= weight_target or (size_max and len(batch) >= size_max):
+            yield batch
+            batch, batch_weight = [], 0.0
+    if batch:
+        yield batch
@@ -12,6 +12,8 @@ from pants.util.collections import (
     assert_single_element,
     ensure_list,
     ensure_str_list,
+    partition_by_weight,
+    partition_by_weight_target,
     partition_sequentially,
     recursively_update,
 )
@@ -107,3 +109,60 @@ def test_partition_sequentially(size_target: int) -> None:
     for to_add in [item for i, item in enumerate(all_items) if i % 2 == 1]:
         updated_partitions = partitioned_buckets([to_add, *base_items])
         assert 1 <= len(base_partitions ^ updated_partitions) <= 4
+
+
+def test_partition_by_weight() -> None:
+    weights = {"a": 10.0, "b": 6.0, "c": 5.0, "d": 4.0, "e": 1.0}
+    partitions = partition_by_weight(weights, key=str, weight=weights.__getitem__, num_partitions=2)
+    assert partitions == [["a", "d"], ["b", "c", "e"]]
+    assert [sum(weights[item] for item in p) for p in partitions] == [14.0, 12.0]
+
+    # Ties are broken deterministically, regardless of input order.
+    assert partition_by_weight(
+        ["y", "x", "z"], key=str, weight=lambda _: 1.0, num_partitions=2
+    ) == [["x", "z"], ["y"]]
+
+    # More partitions than items leaves some partitions empty.
+    assert partition_by_weight(["x"], key=str, weight=lambda _: 1.0, num_partitions=3) == [
+        ["x"],
+        [],
+        [],
+    ]
+
+
+def test_partition_by_weight_size_max() -> None:
+    weights = {"a": 100.0, "b": 1.0, "c": 1.0, "d": 1.0, "e": 1.0}
+    partitions = partition_by_weight(
+        weights, key=str, weight=weights.__getitem__, num_partitions=2, size_max=3
+    )
+    assert partitions == [["a", "e"], ["b", "c", "d"]]
+
+    with pytest.raises(ValueError):
+        partition_by_weight(
+            weights, key=str, weight=weights.__getitem__, num_partitions=2, size_max=2
+        )
+    with pytest.raises(ValueError):
+        partition_by_weight(weights, key=str, weight=weights.__getitem__, num_partitions=0)
+
+
+def test_partition_by_weight_target() -> None:
+    weights = {"a": 1.0, "b": 1.0, "c": 5.0, "d": 1.0, "e": 3.0, "f": 0.5}
+
+    def partition(weight_target: float, size_max: int | None = None) -> list[list[str]]:
+        return list(
+            partition_by_weight_target(
+                reversed(weights),
+                key=str,
+                weight=weights.__getitem__,
+                weight_target=weight_target,
+                size_max=size_max,
+            )
+        )
+
+    # Light items are combined, and items heavier than the target get a batch of their own.
+    assert partition(3.0) == [["a", "b"], ["c"], ["d"], ["e"], ["f"]]
+    assert partition(100.0) == [["a", "b", "c", "d", "e", "f"]]
+    assert partition(100.0, size_max=4) == [["a", "b", "c", "d"], ["e", "f"]]
+    assert (
+        list(partition_by_weight_target([], key=str, weight=lambda _: 1.0, weight_target=1.0)) == []
+    )
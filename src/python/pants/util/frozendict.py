@@ -3,7 +3,9 @@
 
 from __future__ import annotations
 
-from typing import Any, Callable, Iterable, Iterator, Mapping, TypeVar, cast, overload
+from typing import Any, Callable, Hashable, Iterable, Iterator, Mapping, TypeVar, cast, overload
+
+from typing_extensions import Self
 
 from pants.util.memo import memoized_method
 from pants.util.strutil import softwrap
@@ -20,6 +22,9 @@ class FrozenDict(Mapping[K, V]):
     are not safe to use.
     """
 
+    # NB: Many of these are held by long-lived values, so they avoid the memory of a `__dict__`.
+    __slots__ = ("_data", "_hash")
+
     @overload
     def __init__(self, __items: Iterable[tuple[K, V]], **kwargs: V) -> None:
         ...
@@ -173,3 +178,100 @@ class LazyFrozenDict(FrozenDict[K, V]):
     @memoized_method
     def _get_value(self, k: K) -> V:
         return cast("Callable[[], V]", self._data[k])()
+
+
+class LargeFrozenDict(FrozenDict[K, V]):
+    """A `FrozenDict` for mappings with very many items, such as those which cover every target or
+    module in a repository.
+
+    Unlike a `FrozenDict`, the hash is computed lazily on first use (which means that unhashable
+    values are not detected at construction time), and comparing an instance to itself is O(1).
+
+    Since the hash of a `FrozenDict` combines the hashes of its items with xor, `updated` creates
+    a new instance which shares the already computed hash, adjusted for only the changed items.
+
+    If the mapping is derived deterministically from some content, a hashable `content_digest` of
+    that content may be provided. The hash is then computed from the digest rather than from the
+    items, and two instances which both have a digest are equal if and only if their digests are.
+    An instance with a digest should therefore only be compared to other instances with a digest.
+    """
+
+    __slots__ = ("_content_digest",)
+
+    def __init__(
+        self,
+        *item: Mapping[K, V] | Iterable[tuple[K, V]],
+        content_digest: Hashable | None = None,
+        **kwargs: V,
+    ) -> None:
+        if len(item) > 1:
+            raise ValueError(
+                f"{type(self).__name__} was called with {len(item)} positional arguments but it expects one."
+            )
+        self._data = dict(item[0]) if item else dict()
+        self._data.update(**kwargs)
+        self._content_digest = content_digest
+        self._hash: int | None = None  # type: ignore[assignment]
+
+    @property
+    def content_digest(self) -> Hashable | None:
+        return self._content_digest
+
+    def updated(
+        self,
+        changes: Mapping[K, V] | None = None,
+        *,
+        removed: Iterable[K] = (),
+        content_digest: Hashable | None = None,
+    ) -> Self:
+        """Return a copy with the given keys removed and then the given items added or replaced.
+
+        If the hash of this instance was already computed from its items, the hash of the copy is
+        computed from only the changed items.
+        """
+        data = dict(self._data)
+        h = self._hash if self._content_digest is None else None
+        for k in removed:
+            if k in data:
+                v = data.pop(k)
+                if h is not None:
+                    h ^= hash((k, v))
+        for k, v in (changes or {}).items():
+            if h is not None:
+                if k in data:
+                    h ^= hash((k, data[k]))
+                h ^= hash((k, v))
+            data[k] = v
+
+        result = self.__class__.__new__(self.__class__)
+        result._data = data
+        result._content_digest = content_digest
+        result._hash = h if content_digest is None else None  # type: ignore[assignment]
+        return result
+
+    def __hash__(self) -> int:
+        # NB: Concurrent callers may both compute the hash, but will compute the same value.
+        if self._hash is None:
+            self._hash = (
+                hash(self._content_digest)
+                if self._content_digest is not None
+                else self._calculate_hash()
+            )
+        return self._hash
+
+    def __eq__(self, other: Any) -> Any:
+        if self is other:
+            return True
+        if isinstance(other, LargeFrozenDict):
+            if self._content_digest is not None and other._content_digest is not None:
+                return self._content_digest == other._content_digest
+            # A cheap negative check, when both hashes are already known.
+            if (
+                self._hash is not None
+                and other._hash is not None
+                and self._content_digest is None
+                and other._content_digest is None
+                and self._hash != other._hash
+            ):
+                return False
+        return super().__eq__(other)
@@ -7,7 +7,7 @@ from typing import DefaultDict
 
 import pytest
 
-from pants.util.frozendict import FrozenDict, LazyFrozenDict
+from pants.util.frozendict import FrozenDict, LargeFrozenDict, LazyFrozenDict
 
 
 def test_flexible_constructor() -> None:
@@ -198,6 +198,35 @@ def test_lazy_frozen_dict() -> None:
     assert hash(ld1) == hashvalue
 
 
+def test_large_frozen_dict() -> None:
+    # The hash is lazy, so unhashable values are only detected when it is first used.
+    unhashable = LargeFrozenDict({"a": []})
+    with pytest.raises(TypeError):
+        hash(unhashable)
+
+    d = LargeFrozenDict({"a": 0, "b": 1})
+    assert d == d
+    assert d == FrozenDict({"a": 0, "b": 1})
+    assert FrozenDict({"a": 0, "b": 1}) == d
+    assert hash(d) == hash(FrozenDict({"a": 0, "b": 1}))
+
+    updated = d.updated({"b": 2, "c": 3}, removed=["a", "missing"])
+    assert type(updated) is LargeFrozenDict
+    assert updated == {"b": 2, "c": 3}
+    assert hash(updated) == hash(FrozenDict({"b": 2, "c": 3}))
+    assert d == {"a": 0, "b": 1}
+    assert d != updated
+    assert LargeFrozenDict().updated({"a": 0, "b": 1}) == d
+
+    # With a content digest, the digest alone determines the hash and equality.
+    d1 = LargeFrozenDict({"a": 0}, content_digest="digest1")
+    assert d1 == LargeFrozenDict({"a": 0}, content_digest="digest1")
+    assert hash(d1) == hash(LargeFrozenDict({"a": 0}, content_digest="digest1"))
+    assert d1 != LargeFrozenDict({"a": 0}, content_digest="digest2")
+    assert d1.updated({"b": 1}, content_digest="digest3").content_digest == "digest3"
+    assert d1.updated({"b": 1}).content_digest is None
+
+
 def test_frozendict_dot_frozen() -> None:
     a = {1: 2}
     b = FrozenDict(a)
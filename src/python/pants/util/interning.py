@@ -0,0 +1,74 @@
+# Copyright 2024 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+"""Sharing of equal immutable instances, to reduce the resident memory of long-lived processes."""
+
+from __future__ import annotations
+
+import sys
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import Callable, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass
+class SharingStats:
+    """The number of instances which were shared rather than duplicated, and the bytes saved."""
+
+    count: int = 0
+    bytes_saved: int = 0
+
+
+_stats: dict[str, SharingStats] = {}
+_stats_lock = threading.Lock()
+
+
+def record_sharing(name: str, bytes_saved: int, count: int = 1) -> None:
+    """Record that `count` instances of the kind `name` were shared, saving `bytes_saved`."""
+    with _stats_lock:
+        stats = _stats.setdefault(name, SharingStats())
+        stats.count += count
+        stats.bytes_saved += bytes_saved
+
+
+def sharing_stats() -> dict[str, SharingStats]:
+    """A snapshot of the sharing recorded since the process started, by kind of instance."""
+    with _stats_lock:
+        return {name: SharingStats(s.count, s.bytes_saved) for name, s in sorted(_stats.items())}
+
+
+def reset_sharing_stats() -> None:
+    with _stats_lock:
+        _stats.clear()
+
+
+class InternTable(Generic[K, V]):
+    """Canonicalizes equal instances of an immutable type, without keeping them alive.
+
+    The values must support weak references.
+    """
+
+    def __init__(self, name: str, key: Callable[[V], K]) -> None:
+        self._name = name
+        self._key = key
+        self._instances: weakref.WeakValueDictionary[K, V] = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._instances)
+
+    def intern(self, value: V) -> V:
+        """Return the canonical instance which is equal to `value`, which might be `value`."""
+        key = self._key(value)
+        with self._lock:
+            existing = self._instances.get(key)
+            if existing is None:
+                self._instances[key] = value
+                return value
+        if existing is not value:
+            record_sharing(self._name, sys.getsizeof(value))
+        return existing
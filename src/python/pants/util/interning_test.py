@@ -0,0 +1,36 @@
+# Copyright 2024 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import gc
+
+from pants.util.interning import InternTable, reset_sharing_stats, sharing_stats
+
+
+class Value:
+    def __init__(self, key: str) -> None:
+        self.key = key
+
+
+def test_intern_table() -> None:
+    reset_sharing_stats()
+    table: InternTable[str, Value] = InternTable("Value", key=lambda value: value.key)
+
+    a1, a2, b = Value("a"), Value("a"), Value("b")
+    assert table.intern(a1) is a1
+    assert table.intern(a2) is a1
+    assert table.intern(a1) is a1
+    assert table.intern(b) is b
+    assert len(table) == 2
+
+    stats = sharing_stats()["Value"]
+    assert stats.count == 1
+    assert stats.bytes_saved > 0
+
+    # Interned values are not kept alive by the table.
+    del a1, a2
+    gc.collect()
+    assert len(table) == 1
+    a3 = Value("a")
+    assert table.intern(a3) is a3
@@ -0,0 +1,82 @@
+# Copyright 2024 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Iterable, Mapping
+
+from pants.util.dirutil import safe_mkdir
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ResultStore:
+    """A persistent store of JSON values, keyed by a digest of everything that the value depends on.
+
+    Each value is stored in a file of its own, in a subdirectory named after the first two
+    characters of its key, so that reading or writing some values only touches their own files,
+    however many values the store holds. Once a subdirectory holds more than its share of
+    `max_entries`, its least recently used values are dropped.
+    """
+
+    directory: str
+    max_entries: int = 100_000
+
+    # The number of subdirectories which the keys are spread over, assuming hexadecimal keys.
+    _SHARDS = 256
+
+    def _shard(self, key: str) -> str:
+        if not key or os.sep in key or key.startswith("."):
+            raise ValueError(f"Invalid result store key: {key!r}")
+        return os.path.join(self.directory, key[:2])
+
+    def get(self, keys: Iterable[str]) -> dict[str, Any]:
+        """The stored values of those of the keys which have one, which are marked as used."""
+        values = {}
+        for key in keys:
+            path = os.path.join(self._shard(key), key)
+            try:
+                with open(path) as fh:
+                    values[key] = json.load(fh)
+                os.utime(path)
+            except FileNotFoundError:
+                continue
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring the invalid result store entry at {path}: {e!r}")
+        return values
+
+    def put(self, values: Mapping[str, Any]) -> None:
+        """Store the given values, replacing any previous values for their keys."""
+        keys_by_shard = defaultdict(list)
+        for key in values:
+            keys_by_shard[self._shard(key)].append(key)
+        for shard, keys in keys_by_shard.items():
+            safe_mkdir(shard)
+            for key in keys:
+                # Write atomically, since concurrent runs might be reading the entry.
+                tmp_path = os.path.join(shard, f".{key}.{os.getpid()}.tmp")
+                with open(tmp_path, "w") as fh:
+                    json.dump(values[key], fh)
+                os.replace(tmp_path, os.path.join(shard, key))
+            self._trim(shard)
+
+    def _trim(self, shard: str) -> None:
+        max_shard_entries = max(1, self.max_entries // self._SHARDS)
+        try:
+            entries = [entry for entry in os.scandir(shard) if not entry.name.startswith(".")]
+            if len(entries) <= max_shard_entries:
+                return
+            mtimes = {entry.path: entry.stat().st_mtime_ns for entry in entries}
+        except FileNotFoundError:
+            return
+        for path in sorted(mtimes, key=mtimes.__getitem__)[: len(mtimes) - max_shard_entries]:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,44 @@
+# Copyright 2024 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from pants.util.result_store import ResultStore
+
+
+def test_get_and_put(tmp_path: Path) -> None:
+    store = ResultStore(str(tmp_path))
+    assert store.get(["aa01", "ab02"]) == {}
+
+    store.put({"aa01": [0, "ok"], "ab02": {"x": 1}})
+    assert store.get(["aa01", "ab02", "ac03"]) == {"aa01": [0, "ok"], "ab02": {"x": 1}}
+    assert sorted(os.listdir(tmp_path)) == ["aa", "ab"]
+
+    store.put({"aa01": [1, "bad"]})
+    assert store.get(["aa01"]) == {"aa01": [1, "bad"]}
+
+    (tmp_path / "ab" / "ab02").write_text("not json")
+    assert store.get(["ab02"]) == {}
+
+
+def test_least_recently_used_are_dropped(tmp_path: Path) -> None:
+    store = ResultStore(str(tmp_path), max_entries=2 * 256)
+    store.put({"aa01": 1, "aa02": 2})
+    os.utime(tmp_path / "aa" / "aa01", ns=(0, 0))
+    os.utime(tmp_path / "aa" / "aa02", ns=(0, 0))
+    # Reading an entry marks it as used.
+    assert store.get(["aa01"]) == {"aa01": 1}
+
+    store.put({"aa03": 3, "ab01": 4})
+    assert store.get(["aa01", "aa02", "aa03", "ab01"]) == {"aa01": 1, "aa03": 3, "ab01": 4}
+
+
+@pytest.mark.parametrize("key", ["", "a/b", ".hidden"])
+def test_invalid_keys(tmp_path: Path, key: str) -> None:
+    with pytest.raises(ValueError):
+        ResultStore(str(tmp_path)).get([key])
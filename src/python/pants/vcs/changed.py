@@ -16,14 +16,14 @@ from pants.engine.internals.graph import Owners, OwnersRequest
 from pants.engine.internals.mapper import SpecsFilter
 from pants.engine.rules import Get, collect_rules, rule
 from pants.engine.target import UnexpandedTargets
-from pants.option.option_types import EnumOption, StrOption
+from pants.option.option_types import BoolOption, EnumOption, StrOption
 from pants.option.option_value_container import OptionValueContainer
 from pants.option.subsystem import Subsystem
 from pants.util.docutil import doc_url
 from pants.util.frozendict import FrozenDict
 from pants.util.ordered_set import FrozenOrderedSet
-from pants.util.strutil import help_text
-from pants.vcs.git import GitWorktree
+from pants.util.strutil import help_text, softwrap
+from pants.vcs.git import GitDiff, GitWorktree
 from pants.vcs.hunk import Hunk, TextBlocks
 
 
@@ -111,10 +111,18 @@ class ChangedOptions:
     since: str | None
     diffspec: str | None
     dependents: DependentsOption
+    single_diff: bool = False
+    cache_diff: bool = False
 
     @classmethod
     def from_options(cls, options: OptionValueContainer) -> ChangedOptions:
-        return cls(options.since, options.diffspec, options.dependents)
+        return cls(
+            options.since,
+            options.diffspec,
+            options.dependents,
+            options.single_diff,
+            options.cache_diff,
+        )
 
     @property
     def provided(self) -> bool:
@@ -126,6 +134,8 @@ class ChangedOptions:
             return git_worktree.changes_in(self.diffspec, relative_to=get_buildroot())
 
         changes_since = self.since or git_worktree.current_rev_identifier
+        if self.single_diff:
+            return set(self._diff(git_worktree, changes_since).files)
         return git_worktree.changed_files(
             from_commit=changes_since,
             include_untracked=True,
@@ -140,6 +150,9 @@ class ChangedOptions:
         More info on unified diff: https://www.gnu.org/software/diffutils/manual/html_node/Detailed-Unified.html
         """
         changes_since = self.since or git_worktree.current_rev_identifier
+        if self.single_diff:
+            hunks = self._diff(git_worktree, changes_since).hunks
+            return {path: hunks[path] for path in paths if path in hunks}
         return git_worktree.changed_files_lines(
             paths,
             from_commit=changes_since,
@@ -147,6 +160,14 @@ class ChangedOptions:
             relative_to=get_buildroot(),
         )
 
+    def _diff(self, git_worktree: GitWorktree, changes_since: str) -> GitDiff:
+        return git_worktree.diff(
+            from_commit=changes_since,
+            include_untracked=True,
+            relative_to=get_buildroot(),
+            cache=self.cache_diff,
+        )
+
 
 class Changed(Subsystem):
     options_scope = "changed"
@@ -170,6 +191,37 @@ class Changed(Subsystem):
         default=DependentsOption.NONE,
         help="Include direct or transitive dependents of changed targets.",
     )
+    single_diff = BoolOption(
+        default=False,
+        advanced=True,
+        help=softwrap(
+            """
+            Find the changed files and their changed lines with a single `git diff` of the
+            worktree against the merge-base of `--changed-since` and HEAD (plus `git ls-files` to
+            find untracked files), rather than separately diffing committed and uncommitted
+            changes for each.
+
+            Files whose committed changes have since been reverted in the worktree are not
+            considered changed in this mode.
+
+            Requires git 2.30 or later.
+            """
+        ),
+    )
+    cache_diff = BoolOption(
+        default=False,
+        advanced=True,
+        help=softwrap(
+            """
+            With `--changed-single-diff`, reuse the changes computed by a previous run in the
+            same `pantsd` process as long as HEAD, the refs and the Git index are unchanged, rather
+            than invoking `git` again.
+
+            Unstaged edits to files which had not already changed will not be noticed until the
+            index is next written, e.g. by `git add` or `git status`.
+            """
+        ),
+    )
 
 
 def rules():
@@ -19,11 +19,29 @@ from pants.core.util_rules.system_binaries import GitBinary, GitBinaryException,
 from pants.engine.engine_aware import EngineAwareReturnType
 from pants.engine.rules import collect_rules, rule
 from pants.util.contextutil import pushd
+from pants.util.frozendict import FrozenDict
 from pants.vcs.hunk import Hunk, TextBlock
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class GitDiff:
+    """The files that have changed in a worktree, and the hunks that have changed in each of them.
+
+    A file with no textual hunks (e.g. an empty or binary file, or a mode change) has a single
+    empty hunk.
+    """
+
+    files: frozenset[str]
+    hunks: FrozenDict[str, tuple[Hunk, ...]]
+
+
+# The most recently computed diffs, keyed by the state of the repository that they were computed
+# from. This lives for as long as the process does, so that it is reused across runs in pantsd.
+_diff_cache: dict[tuple, GitDiff] = {}
+
+
 class GitWorktree(EngineAwareReturnType):
     """Implements a safe wrapper for un-sandboxed access to Git in the user's working copy.
 
@@ -160,6 +178,110 @@ class GitWorktree(EngineAwareReturnType):
 
         return result
 
+    def diff(
+        self,
+        from_commit: str | None = None,
+        include_untracked: bool = False,
+        relative_to: PurePath | str | None = None,
+        cache: bool = False,
+    ) -> GitDiff:
+        """Compute the changed files and their hunks with a single `git diff`.
+
+        Unlike `changed_files` and `changed_files_lines`, this diffs the worktree directly against
+        the merge-base of `from_commit` and HEAD, so that both committed and uncommitted changes
+        are found (and their hunks are relative to the current content of each file) with one
+        invocation. Untracked files still need to be listed with `git ls-files`, but their hunks
+        are computed without invoking git. Requires git 2.30 or later.
+
+        If `cache` is set, the result is reused for as long as neither HEAD, the refs nor the
+        index change. Note that this means that unstaged edits to files which had not already
+        changed are not noticed until the index is next written (e.g. by `git add` or
+        `git status`).
+        """
+        relative_to = PurePath(relative_to) if relative_to is not None else self.worktree
+        cache_key = (
+            self._diff_cache_key(from_commit, include_untracked, relative_to) if cache else None
+        )
+        if cache_key is not None and cache_key in _diff_cache:
+            return _diff_cache[cache_key]
+
+        rel_suffix = ["--", str(relative_to)]
+        hunks = self._diff_parser.parse_unified_diff(
+            self._git(
+                "diff",
+                "--unified=0",
+                "--no-color",
+                "--no-ext-diff",
+                "--no-renames",
+                *(["--merge-base", from_commit] if from_commit else ["HEAD"]),
+                *rel_suffix,
+            )
+        )
+        if include_untracked:
+            untracked_files = self._git(
+                "ls-files", "--other", "--exclude-standard", "--full-name", *rel_suffix
+            ).splitlines()
+            for file in untracked_files:
+                hunks[file] = self._untracked_file_hunks(file)
+
+        # git will report changed files relative to the worktree: re-relativize to relative_to
+        relative_hunks = {
+            self._fix_git_relative_path(file, relative_to): file_hunks
+            for file, file_hunks in hunks.items()
+        }
+        result = GitDiff(frozenset(relative_hunks), FrozenDict(relative_hunks))
+        if cache_key is not None:
+            _diff_cache.clear()
+            _diff_cache[cache_key] = result
+        return result
+
+    def _untracked_file_hunks(self, file: str) -> tuple[Hunk, ...]:
+        """The hunks that `git diff --no-index /dev/null <file>` would report."""
+        path = self.worktree / file
+        if path.is_symlink():
+            # git diffs the target of a symlink as a single line of text.
+            return (Hunk(left=TextBlock(start=0, count=0), right=TextBlock(start=1, count=1)),)
+        content = path.read_bytes()
+        if not content or b"\0" in content:
+            return (Hunk(left=None, right=TextBlock(start=0, count=0)),)
+        count = content.count(b"\n") + (0 if content.endswith(b"\n") else 1)
+        return (Hunk(left=TextBlock(start=0, count=0), right=TextBlock(start=1, count=count)),)
+
+    def _diff_cache_key(
+        self, from_commit: str | None, include_untracked: bool, relative_to: PurePath
+    ) -> tuple | None:
+        """A key for the state of the repository, or None if it cannot be determined."""
+
+        def mtime(path: PurePath) -> int | None:
+            try:
+                return os.stat(path).st_mtime_ns
+            except FileNotFoundError:
+                return None
+
+        try:
+            head = Path(self._gitdir, "HEAD").read_text().strip()
+        except OSError:
+            # E.g. a linked worktree, where `.git` is a file.
+            return None
+        refs = [head[len("ref: ") :]] if head.startswith("ref: ") else []
+        if from_commit:
+            refs.extend(
+                os.path.join(prefix, from_commit)
+                for prefix in ("", "refs/heads", "refs/remotes", "refs/tags")
+            )
+        return (
+            self.worktree,
+            self._gitdir,
+            head,
+            mtime(self._gitdir / "index"),
+            mtime(self._gitdir / "packed-refs"),
+            mtime(self._gitdir / "FETCH_HEAD"),
+            tuple(mtime(self._gitdir / ref) for ref in refs),
+            from_commit,
+            include_untracked,
+            relative_to,
+        )
+
     def _git(self, *args: str) -> str:
         """Run unsandboxed git command."""
         return self._git_binary._invoke_unsandboxed(self._create_git_cmdline(args))
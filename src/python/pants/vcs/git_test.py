@@ -18,8 +18,10 @@ from pants.engine.rules import Get, rule
 from pants.testutil.rule_runner import QueryRule, RuleRunner, run_rule_with_mocks
 from pants.util.contextutil import environment_as, pushd
 from pants.util.dirutil import touch
+from pants.util.frozendict import FrozenDict
 from pants.vcs.git import (
     DiffParser,
+    GitDiff,
     GitWorktree,
     GitWorktreeRequest,
     MaybeGitWorktree,
@@ -143,8 +145,8 @@ def git(
         yield MutatingGitWorktree(binary=GitBinary(path="git"), gitdir=gitdir, worktree=worktree)
 
 
-# This way we can make sure that `git.changed_files` and
-# `git.changed_files_lines` behave identically.
+# This way we can make sure that `git.changed_files`, `git.changed_files_lines` and `git.diff`
+# behave identically.
 parametrize_changed_files = pytest.mark.parametrize(
     "name,changed,expected",
     [
@@ -160,6 +162,11 @@ parametrize_changed_files = pytest.mark.parametrize(
             ),
             lambda files: files,
         ),
+        (
+            "diff",
+            lambda git: git.diff,
+            lambda files: GitDiff(frozenset(files), FrozenDict(files)),
+        ),
     ],
 )
 
@@ -227,6 +234,22 @@ def test_integration(
     assert expected({}) == changed(git)(relative_to="non-existent")
 
 
+def test_diff_cache(worktree: Path, readme_file: Path, git: MutatingGitWorktree) -> None:
+    diff = git.diff(from_commit="HEAD^", cache=True)
+    assert diff.files == {"README"}
+    assert git.diff(from_commit="HEAD^", cache=True) is diff
+    assert git.diff(from_commit="HEAD^", cache=False) is not diff
+
+    # Writing the index invalidates the cache.
+    (worktree / "INSTALL").write_text("make install")
+    git.add(worktree / "INSTALL")
+    assert git.diff(from_commit="HEAD^", cache=True).files == {"README", "INSTALL"}
+
+    # As does moving HEAD.
+    git.commit("Add INSTALL.")
+    assert git.diff(from_commit="HEAD", cache=True).files == set()
+
+
 def test_detect_worktree(tmp_path: Path, origin: PurePath, git: MutatingGitWorktree) -> None:
     clone = tmp_path / "clone"
     clone.mkdir()
@@ -234,6 +234,10 @@ pub(crate) struct Entry<N: Node> {
     node: Arc<N>,
 
     state: Arc<Mutex<EntryState<N>>>,
+
+    // The RunId of the most recent run which requested this Node, used to select
+    // least-recently-used Nodes for eviction under memory pressure.
+    last_used_run: Arc<atomic::AtomicU32>,
 }
 
 impl<N: Node> Entry<N> {
@@ -246,9 +250,14 @@ impl<N: Node> Entry<N> {
         Entry {
             node: Arc::new(node),
             state: Arc::new(Mutex::new(EntryState::initial())),
+            last_used_run: Arc::new(atomic::AtomicU32::new(0)),
         }
     }
 
+    pub(crate) fn last_used_run(&self) -> u32 {
+        self.last_used_run.load(atomic::Ordering::Relaxed)
+    }
+
     pub fn node(&self) -> &N {
         &self.node
     }
@@ -467,6 +476,8 @@ impl<N: Node> Entry<N> {
         context: &Context<N>,
         entry_id: EntryId,
     ) -> BoxFuture<NodeResult<N>> {
+        self.last_used_run
+            .fetch_max(context.run_id().0, atomic::Ordering::Relaxed);
         let mut state = self.state.lock();
 
         // First check whether the Node is already complete, or is currently running: in both of these
@@ -777,6 +788,44 @@ impl<N: Node> Entry<N> {
         };
     }
 
+    ///
+    /// Evicts the result (and any previous result) of this Node to free memory, forcing it to be
+    /// recomputed from scratch the next time it is requested. Returns false without changing
+    /// anything if the Node is currently Running.
+    ///
+    /// Because an evicted Node cannot be cleaned, the caller must evict all of its dependents too,
+    /// and must remove its outbound edges from the graph.
+    ///
+    pub(crate) fn evict(&mut self) -> bool {
+        let mut state = self.state.lock();
+
+        let (run_token, generation) = match *state {
+            EntryState::NotStarted {
+                run_token,
+                generation,
+                ..
+            }
+            | EntryState::Completed {
+                run_token,
+                generation,
+                ..
+            } => (run_token, generation),
+            EntryState::Running { .. } => return false,
+        };
+
+        test_trace_log!("Evicting node {:?}", self.node);
+
+        // Swap in a state with a new RunToken value and no previous result: the next run will
+        // compute a new Generation, so any stale observers will also re-run.
+        *state = EntryState::NotStarted {
+            run_token: run_token.next(),
+            generation,
+            pollers: Vec::new(),
+            previous_result: None,
+        };
+        true
+    }
+
     ///
     /// Dirties this Node, which will cause it to examine its dependencies the next time it is
     /// requested, and re-run if any of them have changed generations.
@@ -10,6 +10,7 @@ use crate::entry::{Entry, Generation, RunToken};
 use std::collections::VecDeque;
 use std::fs::File;
 use std::io::{self, BufWriter, Write};
+use std::mem;
 use std::path::Path;
 use std::sync::{Arc, Weak};
 use std::time::Duration;
@@ -38,6 +39,15 @@ pub struct InvalidationResult {
     pub dirtied: usize,
 }
 
+///
+/// Counts of evictions (see `Graph::evict_unused`) which have not yet been reported.
+///
+#[derive(Clone, Copy, Debug, Default, Eq, PartialEq)]
+pub struct EvictionCounts {
+    pub evictions: u64,
+    pub nodes_evicted: u64,
+}
+
 type Nodes<N> = HashMap<N, EntryId>;
 
 struct InnerGraph<N: Node> {
@@ -288,6 +298,64 @@ impl<N: Node> InnerGraph<N> {
         invalidation_result
     }
 
+    ///
+    /// Evicts the values of all Nodes which were not requested during the most recent `keep_runs`
+    /// runs, and which are not dependencies of a Node which was (or which is currently Running).
+    ///
+    /// Because everything reachable from a kept Node is kept, the evicted Nodes are closed under
+    /// dependents: no remaining Node can have observed the Generation of an evicted Node, so
+    /// evicted Nodes can be recomputed from scratch without affecting the cleaning of others.
+    ///
+    fn evict_unused(&mut self, keep_runs: u32) -> usize {
+        let cutoff = self.run_id_generator.saturating_sub(keep_runs);
+        let recent_ids = self
+            .pg
+            .node_indices()
+            .filter(|&id| {
+                let entry = self.unsafe_entry_for_id(id);
+                entry.last_used_run() >= cutoff || entry.is_running()
+            })
+            .collect();
+        let mut kept = self.pg.visit_map();
+        for id in self.walk(recent_ids, Direction::Outgoing, |_| false) {
+            kept.visit(id);
+        }
+
+        let mut evicted_ids: HashSet<EntryId> = HashSet::default();
+        let mut evicted_count = 0;
+        for id in self.pg.node_indices() {
+            if kept.is_visited(&id) {
+                continue;
+            }
+            if let Some(entry) = self.pg.node_weight_mut(id) {
+                let was_started = entry.is_started();
+                if entry.evict() {
+                    evicted_ids.insert(id);
+                    if was_started {
+                        evicted_count += 1;
+                    }
+                }
+            }
+        }
+
+        // If nothing was evicted, avoid scanning all edges in `retain_edges`.
+        if evicted_ids.is_empty() {
+            return 0;
+        }
+
+        // Remove the outbound edges of evicted entries. Their inbound edges are all from other
+        // evicted entries, so this removes those too.
+        self.pg.retain_edges(|pg, edge| {
+            if let Some((src, _)) = pg.edge_endpoints(edge) {
+                !evicted_ids.contains(&src)
+            } else {
+                true
+            }
+        });
+
+        evicted_count
+    }
+
     fn visualize(&self, roots: &[N], path: &Path, context: &Context<N>) -> io::Result<()> {
         let file = File::create(path)?;
         let mut f = BufWriter::new(file);
@@ -366,6 +434,7 @@ pub struct Graph<N: Node> {
     inner: Arc<Mutex<InnerGraph<N>>>,
     invalidation_delay: Duration,
     executor: Executor,
+    unreported_evictions: Arc<Mutex<EvictionCounts>>,
 }
 
 impl<N: Node> Graph<N> {
@@ -388,6 +457,7 @@ impl<N: Node> Graph<N> {
             inner,
             invalidation_delay,
             executor,
+            unreported_evictions: Arc::default(),
         }
     }
 
@@ -628,6 +698,32 @@ impl<N: Node> Graph<N> {
         inner.clear()
     }
 
+    ///
+    /// Evicts the values of Nodes which were not used during the most recent `keep_runs` runs (and
+    /// which are not dependencies of Nodes which were) to free memory, and returns the number of
+    /// Nodes which were evicted.
+    ///
+    pub fn evict_unused(&self, keep_runs: u32) -> usize {
+        let evicted = {
+            let mut inner = self.inner.lock();
+            inner.evict_unused(keep_runs)
+        };
+        if evicted > 0 {
+            let mut unreported = self.unreported_evictions.lock();
+            unreported.evictions += 1;
+            unreported.nodes_evicted += evicted as u64;
+        }
+        evicted
+    }
+
+    ///
+    /// Returns the evictions which have happened since the last call, so that each eviction is
+    /// reported exactly once.
+    ///
+    pub fn take_unreported_evictions(&self) -> EvictionCounts {
+        mem::take(&mut *self.unreported_evictions.lock())
+    }
+
     pub fn invalidate_from_roots<P: Fn(&N) -> bool>(
         &self,
         log_dirtied: bool,
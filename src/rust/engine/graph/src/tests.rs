@@ -16,7 +16,7 @@ use task_executor::Executor;
 use tokio::time::{error::Elapsed, sleep, timeout};
 
 use crate::context::Context;
-use crate::{Graph, InvalidationResult, Node, NodeError};
+use crate::{EvictionCounts, Graph, InvalidationResult, Node, NodeError};
 
 fn empty_graph() -> Arc<Graph<TNode>> {
     Arc::new(Graph::new(Executor::new()))
@@ -194,6 +194,47 @@ async fn invalidate_with_changed_dependencies() {
     );
 }
 
+#[tokio::test]
+async fn evict_unused() {
+    let graph = empty_graph();
+    let context = graph.context(TContext::new());
+
+    // Create three nodes.
+    assert_eq!(
+        graph.create(TNode::new(2), &context).await,
+        Ok(vec![T(0, 0), T(1, 0), T(2, 0)])
+    );
+
+    // Request only the bottom Node in a later run.
+    let context = graph.context(TContext::new());
+    assert_eq!(
+        graph.create(TNode::new(0), &context).await,
+        Ok(vec![T(0, 0)])
+    );
+    assert_eq!(context.runs(), vec![]);
+
+    // Keeping only the most recent run evicts the middle and upper Nodes, and each eviction is
+    // reported once.
+    assert_eq!(graph.evict_unused(1), 2);
+    assert_eq!(
+        graph.take_unreported_evictions(),
+        EvictionCounts {
+            evictions: 1,
+            nodes_evicted: 2,
+        }
+    );
+    assert_eq!(graph.take_unreported_evictions(), EvictionCounts::default());
+    assert_eq!(graph.evict_unused(1), 0);
+
+    // Confirm that the evicted Nodes re-run, but the bottom Node does not.
+    let context = graph.context(TContext::new());
+    assert_eq!(
+        graph.create(TNode::new(2), &context).await,
+        Ok(vec![T(0, 0), T(1, 0), T(2, 0)])
+    );
+    assert_eq!(context.runs(), vec![TNode::new(2), TNode::new(1)]);
+}
+
 // Historically flaky: https://github.com/pantsbuild/pants/issues/10839
 #[tokio::test]
 async fn invalidate_randomly() {
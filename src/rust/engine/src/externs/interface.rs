@@ -122,6 +122,7 @@ fn native_engine(py: Python, m: &Bound<'_, PyModule>) -> PyO3Result<()> {
     m.add_function(wrap_pyfunction!(graph_invalidate_all_paths, m)?)?;
     m.add_function(wrap_pyfunction!(graph_invalidate_all, m)?)?;
     m.add_function(wrap_pyfunction!(graph_len, m)?)?;
+    m.add_function(wrap_pyfunction!(graph_evict_unused, m)?)?;
     m.add_function(wrap_pyfunction!(graph_visualize, m)?)?;
 
     m.add_function(wrap_pyfunction!(nailgun_server_create, m)?)?;
@@ -1355,6 +1356,13 @@ fn graph_len(py: Python, py_scheduler: &Bound<'_, PyScheduler>) -> u64 {
         .enter(|| py.allow_threads(|| core.graph.len() as u64))
 }
 
+#[pyfunction]
+fn graph_evict_unused(py: Python, py_scheduler: &Bound<'_, PyScheduler>, keep_runs: u32) -> u64 {
+    let core = &py_scheduler.borrow().0.core;
+    core.executor
+        .enter(|| py.allow_threads(|| core.graph.evict_unused(keep_runs) as u64))
+}
+
 #[pyfunction]
 fn graph_visualize(
     py: Python<'_>,
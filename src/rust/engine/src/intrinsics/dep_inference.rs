@@ -10,6 +10,7 @@ use dep_inference::javascript::ParsedJavascriptDependencies;
 use dep_inference::python::ParsedPythonDependencies;
 use dep_inference::{dockerfile, javascript, python};
 use fs::{DirectoryDigest, Entry, SymlinkBehavior};
+use futures::future;
 use grpc_util::prost::MessageExt;
 use hashing::Digest;
 use protos::gen::pants::cache::{
@@ -30,6 +31,7 @@ use crate::{externs, Core};
 pub fn register(_py: Python, m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(parse_dockerfile_info, m)?)?;
     m.add_function(wrap_pyfunction!(parse_python_deps, m)?)?;
+    m.add_function(wrap_pyfunction!(parse_python_deps_batch, m)?)?;
     m.add_function(wrap_pyfunction!(parse_javascript_deps, m)?)?;
 
     Ok(())
@@ -70,6 +72,44 @@ impl PreparedInferenceRequest {
         })
     }
 
+    /// Prepare one request per file in the request's digest, for batched inference.
+    ///
+    /// Each request is identical to the one that `prepare` would create for a digest containing
+    /// only that file, so batched and unbatched inference share cache entries.
+    pub async fn prepare_all(
+        deps_request: Value,
+        store: &Store,
+        impl_hash: &str,
+    ) -> NodeResult<Vec<Self>> {
+        let PyNativeDependenciesRequest {
+            directory_digest,
+            metadata,
+        } = Python::with_gil(|py| deps_request.bind(py).extract())?;
+
+        let mut files = Vec::new();
+        store.load_digest_trie(directory_digest).await?.walk(
+            SymlinkBehavior::Oblivious,
+            &mut |node_path, entry| {
+                if let Entry::File(file) = entry {
+                    files.push((node_path.display().to_string(), file.digest()));
+                }
+            },
+        );
+
+        Ok(files
+            .into_iter()
+            .map(|(str_path, digest)| Self {
+                digest,
+                inner: DependencyInferenceRequest {
+                    input_file_path: str_path,
+                    input_file_digest: Some(digest.into()),
+                    metadata: metadata.clone(),
+                    impl_hash: impl_hash.to_string(),
+                },
+            })
+            .collect())
+    }
+
     pub async fn read_digest(&self, store: &Store) -> NodeResult<String> {
         let bytes = store
             .load_file_bytes_with(self.digest, |bytes| Vec::from(bytes))
@@ -219,6 +259,80 @@ fn parse_python_deps(deps_request: Value) -> PyGeneratorResponseNativeCall {
     })
 }
 
+#[pyfunction]
+fn parse_python_deps_batch(deps_request: Value) -> PyGeneratorResponseNativeCall {
+    PyGeneratorResponseNativeCall::new(async move {
+        let context = task_get_context();
+
+        let core = &context.core;
+        let store = core.store();
+        let prepared_inference_requests =
+            PreparedInferenceRequest::prepare_all(deps_request, &store, python::IMPL_HASH).await?;
+        in_workunit!(
+            "parse_python_dependencies_batch",
+            Level::Debug,
+            desc = Some(format!(
+                "Determine Python dependencies for {} files",
+                prepared_inference_requests.len()
+            )),
+            |_workunit| async move {
+                let store = &store;
+                let results = future::try_join_all(prepared_inference_requests.into_iter().map(
+                    |prepared_inference_request| async move {
+                        let path = prepared_inference_request.inner.input_file_path.clone();
+                        let result: NodeResult<ParsedPythonDependencies> =
+                            get_or_create_inferred_dependencies(
+                                core,
+                                store,
+                                prepared_inference_request,
+                                |content, request| {
+                                    python::get_dependencies(
+                                        content,
+                                        request.inner.input_file_path.into(),
+                                    )
+                                },
+                            )
+                            .await;
+                        match result {
+                            Ok(result) => Ok(Some((path, result))),
+                            // A file that can't be parsed is left out of the batch rather than
+                            // failing it: callers fall back to parsing that file on its own, which
+                            // reports the error against the file's owner.
+                            Err(Failure::Throw { .. }) => {
+                                log::debug!("Failed to parse {path} in a batch of Python files.");
+                                Ok(None)
+                            }
+                            Err(err) => Err(err),
+                        }
+                    },
+                ))
+                .await?;
+
+                Python::with_gil(|py| {
+                    store_dict(
+                        py,
+                        results.into_iter().flatten().map(|(path, result)| {
+                            (
+                                path.into_py(py).into(),
+                                externs::unsafe_call(
+                                    py,
+                                    core.types.parsed_python_deps_result,
+                                    &[
+                                        result.imports.to_object(py).into(),
+                                        result.string_candidates.to_object(py).into(),
+                                    ],
+                                ),
+                            )
+                        }),
+                    )
+                    .map_err(|e| Failure::from_py_err_with_gil(py, e))
+                })
+            }
+        )
+        .await
+    })
+}
+
 #[pyfunction]
 fn parse_javascript_deps(deps_request: Value) -> PyGeneratorResponseNativeCall {
     PyGeneratorResponseNativeCall::new(async move {
@@ -21,7 +21,7 @@ use task_executor::{Executor, TailTasks};
 use tokio::signal::unix::{signal, SignalKind};
 use tokio::task::JoinHandle;
 use ui::ConsoleUI;
-use workunit_store::{format_workunit_duration_ms, RunId, WorkunitStore};
+use workunit_store::{format_workunit_duration_ms, Metric, RunId, WorkunitStore};
 
 // When enabled, the interval at which all stragglers that have been running for longer than a
 // threshold should be logged. The threshold might become configurable, but this might not need
@@ -174,6 +174,12 @@ impl Session {
         core.sessions.add(&handle)?;
         let run_id = core.graph.generate_run_id();
         let preceding_graph_size = core.graph.len();
+        // Report any graph evictions which happened between runs in this run's metrics.
+        let evictions = core.graph.take_unreported_evictions();
+        if evictions.evictions > 0 {
+            workunit_store.increment_counter(Metric::GraphEvictions, evictions.evictions);
+            workunit_store.increment_counter(Metric::GraphNodesEvicted, evictions.nodes_evicted);
+        }
         Ok(Session {
             handle,
             state: Arc::new(SessionState {
@@ -68,6 +68,10 @@ pub enum Metric {
     DockerExecutionRequests,
     DockerExecutionSuccesses,
     DockerExecutionErrors,
+    /// Number of times that pantsd evicted unused nodes from the graph under memory pressure.
+    GraphEvictions,
+    /// Total number of graph nodes evicted by those evictions.
+    GraphNodesEvicted,
 }
 
 impl Metric {